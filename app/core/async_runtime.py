@@ -0,0 +1,161 @@
+"""
+Worker-level asyncio runtime for Celery tasks.
+
+태스크마다 ``asyncio.run`` 을 호출하면 이벤트 루프를 만들고 닫는 비용에 더해, 루프에
+묶인 Motor 클라이언트 / HTTP 커넥션 풀 / async Redis 클라이언트도 매번 새로 만들어야
+합니다. 워커 프로세스가 뜰 때 (``worker_process_init``) 전용 스레드에서 루프 하나를
+돌리고, 코루틴 태스크는 ``run_async`` 로 그 루프에 제출합니다. 자원은 이 루프에서 처음
+쓰일 때 만들어져 프로세스가 끝날 때 (``worker_process_shutdown``) 한 번 닫힙니다.
+
+prefork / solo / threads 풀 모두 같은 방식으로 동작하며, 시그널이 없는 환경 (eager
+모드, 스크립트, 테스트) 에서는 첫 ``run_async`` 호출 때 런타임이 시작됩니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Optional, TypeVar
+
+from .config import settings
+from .database import DatabaseManager
+from .http import close_http_client, get_http_client
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncRuntime:
+    """One event loop (in a daemon thread) plus the loop-bound clients of a worker process"""
+
+    def __init__(self, name: str = "celery-async-runtime", shutdown_timeout: float = 10.0):
+        self.name = name
+        self.shutdown_timeout = shutdown_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._db_manager = DatabaseManager()
+        self._redis: Any = None
+        self.tasks_run = 0
+
+    @property
+    def running(self) -> bool:
+        # fork 된 자식은 부모의 루프 스레드를 물려받지 못하므로 pid 까지 확인
+        return self._loop is not None and self._pid == os.getpid() and self._loop.is_running()
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        return self._loop if self.running else None
+
+    def start(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _serve() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=_serve, name=self.name, daemon=True)
+            thread.start()
+            ready.wait()
+            self._loop, self._thread, self._pid = loop, thread, os.getpid()
+            # 다른 루프 / 부모 프로세스에서 만든 클라이언트는 재사용하지 않음
+            self._db_manager = DatabaseManager()
+            self._redis = None
+            self.tasks_run = 0
+            logger.info("Async runtime started in pid %d", self._pid)
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """코루틴을 런타임 루프에서 실행하고 결과를 기다림 (태스크 스레드는 블록)"""
+        if self._thread is not None and threading.current_thread() is self._thread:
+            raise RuntimeError("AsyncRuntime.run() called from the runtime loop; await the coroutine instead")
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            result = future.result(timeout)
+        except BaseException:
+            # soft time limit / timeout 으로 대기가 끊기면 코루틴도 취소
+            future.cancel()
+            raise
+        self.tasks_run += 1
+        return result
+
+    async def database(self) -> Any:
+        """프로세스 공유 Motor database (런타임 루프 안에서 호출)"""
+        return await self._db_manager.get_async_database()
+
+    def http_client(self) -> Any:
+        """프로세스 공유 httpx.AsyncClient (런타임 루프 안에서 호출)"""
+        return get_http_client()
+
+    def redis(self) -> Any:
+        """프로세스 공유 async Redis 클라이언트 (redis-py 가 없으면 None)"""
+        if self._redis is None:
+            try:
+                import redis.asyncio as aioredis  # type: ignore
+            except Exception:  # pragma: no cover - optional dependency
+                return None
+            self._redis = aioredis.from_url(settings.redis_url, socket_connect_timeout=2.0, socket_timeout=2.0)
+        return self._redis
+
+    async def _close_resources(self) -> None:
+        await self._db_manager.close_async_connection()
+        await close_http_client()
+        if self._redis is not None:
+            client, self._redis = self._redis, None
+            await client.aclose()
+
+    def stop(self) -> None:
+        with self._lock:
+            if not self.running:
+                self._loop = self._thread = self._pid = None
+                return
+            loop, thread = self._loop, self._thread
+            try:
+                asyncio.run_coroutine_threadsafe(self._close_resources(), loop).result(self.shutdown_timeout)
+            except Exception as e:
+                logger.warning("Async runtime resources did not close cleanly: %s", e)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(self.shutdown_timeout)
+            if not loop.is_running():
+                loop.close()
+            logger.info("Async runtime stopped after %d tasks", self.tasks_run)
+            self._loop = self._thread = self._pid = None
+
+
+worker_runtime = AsyncRuntime()
+
+
+def run_async(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """``asyncio.run`` 대신 Celery 태스크에서 사용"""
+    return worker_runtime.run(coro, timeout)
+
+
+async def get_worker_database() -> Any:
+    return await worker_runtime.database()
+
+
+def _start_runtime(**kwargs: Any) -> None:
+    worker_runtime.start()
+
+
+def _stop_runtime(**kwargs: Any) -> None:
+    worker_runtime.stop()
+
+
+def install_worker_hooks() -> None:
+    """워커 프로세스 수명에 런타임을 연결 (중복 호출해도 한 번만 연결)"""
+    from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+
+    worker_process_init.connect(_start_runtime, weak=False, dispatch_uid="async-runtime-start")
+    worker_process_shutdown.connect(_stop_runtime, weak=False, dispatch_uid="async-runtime-stop")
+    # solo / threads 풀은 worker_process_* 가 없음 -> 첫 태스크에서 시작, 워커 종료 시 정리
+    worker_shutdown.connect(_stop_runtime, weak=False, dispatch_uid="async-runtime-stop-main")
@@ -9,8 +9,23 @@ from datetime import timedelta
 import os
 import logging
 from celery import Celery
+from kombu import Exchange, Queue
 from celery.signals import task_prerun, task_postrun, task_failure, task_retry
 from .config import settings
+from .async_runtime import install_worker_hooks
+from .task_queues import (
+    INGESTION_QUEUE,
+    MAINTENANCE_QUEUE,
+    ANALYTICS_QUEUE,
+    PRIORITY_LEVELS,
+    PRIORITY_SEP,
+    PRIORITY_STEPS,
+    QUEUE_PROFILES,
+    TaskAnnotations,
+    build_task_routes,
+    install_queue_hooks,
+    route_for,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,84 +69,80 @@ class CeleryConfig:
     broker_heartbeat = 120
     broker_pool_limit = 10
     
-    # Task routing
-    task_routes = {
-        "app.domains.announcements.tasks.*": {"queue": "announcements"},
-        "app.domains.businesses.tasks.*": {"queue": "businesses"},
-        "app.domains.contents.tasks.*": {"queue": "contents"},
-        "app.domains.statistics.tasks.*": {"queue": "statistics"},
-        "app.shared.classification.tasks.*": {"queue": "classification"},
-        "app.core.tasks.*": {"queue": "system"},
-        "app.scheduler.monitoring_tasks.*": {"queue": "monitoring"},
+    # Task routing: 워크로드별 전용 큐 (app/core/task_queues.py)
+    task_routes = build_task_routes(QUEUE_PROFILES)
+    task_queues = [Queue(profile.name, Exchange(profile.name), routing_key=profile.name) for profile in QUEUE_PROFILES]
+    
+    # Queue configuration (라우팅되지 않은 태스크는 유지보수 큐로)
+    task_default_queue = MAINTENANCE_QUEUE
+    task_default_exchange = MAINTENANCE_QUEUE
+    task_default_routing_key = MAINTENANCE_QUEUE
+    task_default_priority = PRIORITY_LEVELS["medium"]
+    
+    # Redis 브로커 우선순위: 0-9 각각 별도 리스트, 숫자가 낮을수록 먼저 소비
+    broker_transport_options = {
+        "priority_steps": PRIORITY_STEPS,
+        "sep": PRIORITY_SEP,
+        "queue_order_strategy": "priority",
+        "visibility_timeout": 3600,  # 가장 긴 time limit (1800s) 보다 길게
     }
-    # Conditionally add alerts routing to avoid importing tasks when disabled
-    if settings.alerts_enabled:
-        task_routes.update({
-            "app.domains.alerts.tasks.match_and_enqueue": {"queue": settings.alerts_match_queue},
-            "app.domains.alerts.tasks.send_notification": {"queue": settings.alerts_notify_queue},
-            "app.domains.alerts.tasks.digest_daily": {"queue": settings.alerts_digest_queue},
-        })
-    
-    # Queue configuration
-    task_default_queue = "default"
-    task_default_exchange = "default"
-    task_default_routing_key = "default"
     
     # Advanced queue settings
     task_queue_ha_policy = "all"
     task_queue_max_priority = 10
     
     # Beat schedule (enhanced)
+    # priority 는 지정하지 않음 -> task_routes 의 큐/태스크 우선순위를 따름
     beat_schedule = {
         # Data collection tasks
         "fetch-announcements-daily": {
             "task": "app.domains.announcements.tasks.fetch_announcements_comprehensive",
             "schedule": timedelta(hours=1),  # Every 1 hour
-            "options": {"queue": "announcements", "priority": 5},
+            "options": {"queue": INGESTION_QUEUE},
         },
         "fetch-businesses-daily": {
             "task": "app.domains.businesses.tasks.fetch_businesses_comprehensive",
             "schedule": timedelta(hours=8),  # Every 8 hours
-            "options": {"queue": "businesses", "priority": 4},
+            "options": {"queue": INGESTION_QUEUE},
         },
         "fetch-contents-daily": {
             "task": "app.domains.contents.tasks.fetch_contents_comprehensive",
             "schedule": timedelta(hours=12),  # Every 12 hours
-            "options": {"queue": "contents", "priority": 4},
+            "options": {"queue": INGESTION_QUEUE},
         },
         "fetch-statistics-daily": {
             "task": "app.domains.statistics.tasks.fetch_statistics_comprehensive",
             "schedule": timedelta(days=1),  # Daily
-            "options": {"queue": "statistics", "priority": 3},
+            "options": {"queue": INGESTION_QUEUE},
         },
         
         # Maintenance tasks
         "cleanup-old-tasks": {
             "task": "app.core.tasks.cleanup_old_task_results",
             "schedule": timedelta(hours=24),  # Daily
-            "options": {"queue": "system", "priority": 2},
+            "options": {"queue": MAINTENANCE_QUEUE},
         },
         "health-check": {
             "task": "app.core.tasks.system_health_check",
             "schedule": timedelta(minutes=15),  # Every 15 minutes
-            "options": {"queue": "monitoring", "priority": 7},
+            "options": {"queue": MAINTENANCE_QUEUE},
         },
         "generate-statistics": {
             "task": "app.core.tasks.generate_system_statistics",
             "schedule": timedelta(hours=4),  # Every 4 hours
-            "options": {"queue": "system", "priority": 3},
+            "options": {"queue": ANALYTICS_QUEUE},
         },
         
         # Data validation tasks
         "validate-data-integrity": {
             "task": "app.core.tasks.validate_data_integrity",
             "schedule": timedelta(hours=12),  # Twice daily
-            "options": {"queue": "system", "priority": 6},
+            "options": {"queue": MAINTENANCE_QUEUE},
         },
         "classification-codes-validation": {
             "task": "app.shared.classification.tasks.validate_classification_usage",
             "schedule": timedelta(days=1),  # Daily
-            "options": {"queue": "classification", "priority": 3},
+            "options": {"queue": ANALYTICS_QUEUE},
         },
     }
     if settings.alerts_enabled:
@@ -140,19 +151,42 @@ class CeleryConfig:
             "alerts-digest-daily": {
                 "task": "app.domains.alerts.tasks.digest_daily",
                 "schedule": timedelta(days=1),
-                "options": {"queue": settings.alerts_digest_queue, "priority": 2},
+                "options": {"queue": settings.alerts_digest_queue},
             },
             # Match recent announcements every 15 minutes (canary friendly)
             "alerts-match-announcements-15m": {
                 "task": "app.domains.alerts.tasks.match_and_enqueue",
                 "schedule": timedelta(minutes=15),
-                "options": {"queue": settings.alerts_match_queue, "priority": 5},
+                "options": {"queue": settings.alerts_match_queue},
                 "args": ("announcements", 15),
             },
+            # Batched delivery of queued notifications
+            "alerts-deliver-notifications-1m": {
+                "task": "app.domains.alerts.tasks.deliver_notifications",
+                "schedule": timedelta(minutes=1),
+                "options": {"queue": settings.alerts_notify_queue, "expires": 55},
+            },
+            # Deadline reminders: refresh buckets hourly (full pass daily), dispatch the due bucket
+            "alerts-materialize-reminders-1h": {
+                "task": "app.domains.alerts.tasks.materialize_deadline_reminders",
+                "schedule": timedelta(hours=1),
+                "options": {"queue": settings.alerts_digest_queue},
+                "args": (75,),
+            },
+            "alerts-materialize-reminders-daily": {
+                "task": "app.domains.alerts.tasks.materialize_deadline_reminders",
+                "schedule": timedelta(days=1),
+                "options": {"queue": settings.alerts_digest_queue},
+            },
+            "alerts-dispatch-reminders-15m": {
+                "task": "app.domains.alerts.tasks.dispatch_deadline_reminders",
+                "schedule": timedelta(minutes=15),
+                "options": {"queue": settings.alerts_notify_queue, "expires": 840},
+            },
         })
     
-    # Task annotation settings
-    task_annotations = {
+    # Task annotation settings (큐 프로필의 time limit 위에 태스크별 설정)
+    task_annotations = TaskAnnotations({
         "*": {
             "rate_limit": "100/m",  # 100 tasks per minute default
         },
@@ -165,7 +199,11 @@ class CeleryConfig:
             "rate_limit": "20/m",  # 20 per minute for monitoring
             "time_limit": 300,  # 5 minutes
         },
-    }
+        # 실시간 알림은 전역 토큰 버킷(alerts_global_rps)으로 제한 -> 워커 rate limit 해제
+        "app.domains.alerts.tasks.send_notification": {
+            "rate_limit": None,
+        },
+    })
     
     # Error handling settings
     task_reject_on_worker_lost = True
@@ -236,6 +274,11 @@ def create_celery_app() -> Celery:
 def setup_signal_handlers(celery_app: Celery) -> None:
     """Set up Celery signal handlers for monitoring and logging."""
     
+    # 워커 프로세스당 이벤트 루프 / Motor / HTTP 풀 하나 (태스크마다 asyncio.run 하지 않음)
+    install_worker_hooks()
+    # 큐 지연 (발행 시각 헤더) / 큐별 처리량 카운터
+    install_queue_hooks()
+    
     @task_prerun.connect
     def task_prerun_handler(sender=None, task_id=None, task=None, args=None, kwargs=None, **kwds):
         """Handle task pre-run signal."""
@@ -268,9 +311,11 @@ def get_task_info(task_name: str) -> Dict[str, Any]:
     Returns:
         Dictionary with task information
     """
+    route = route_for(task_name, CeleryConfig.task_routes)
     return {
         "name": task_name,
-        "queue": CeleryConfig.task_routes.get(task_name, {}).get("queue", "default"),
+        "queue": route["queue"],
+        "priority": route.get("priority"),
         "annotations": CeleryConfig.task_annotations.get(task_name, {}),
         "schedule": None,  # Would be populated from beat_schedule if task is scheduled
     }
@@ -283,20 +328,25 @@ def get_queue_info() -> Dict[str, Any]:
     Returns:
         Dictionary with queue information
     """
-    queues = set()
-    
-    # Extract queues from routing
-    for route_config in CeleryConfig.task_routes.values():
-        if "queue" in route_config:
-            queues.add(route_config["queue"])
-    
-    # Add default queue
-    queues.add(CeleryConfig.task_default_queue)
+    profiles = [
+        {
+            "name": profile.name,
+            "workload": profile.workload,
+            "priority": profile.priority,
+            "concurrency": profile.concurrency,
+            "prefetch_multiplier": profile.prefetch_multiplier,
+            "soft_time_limit": profile.soft_time_limit,
+            "time_limit": profile.time_limit,
+            "worker_command": profile.worker_command(),
+        }
+        for profile in QUEUE_PROFILES
+    ]
     
     return {
-        "total_queues": len(queues),
-        "queues": list(queues),
+        "total_queues": len(profiles),
+        "queues": [profile["name"] for profile in profiles],
         "default_queue": CeleryConfig.task_default_queue,
+        "profiles": profiles,
     }
 
 
@@ -310,12 +360,14 @@ def get_schedule_info() -> Dict[str, Any]:
     scheduled_tasks = []
     
     for task_name, schedule_config in CeleryConfig.beat_schedule.items():
+        route = route_for(schedule_config["task"], CeleryConfig.task_routes)
+        options = schedule_config.get("options", {})
         scheduled_tasks.append({
             "name": task_name,
             "task": schedule_config["task"],
             "schedule": str(schedule_config["schedule"]),
-            "queue": schedule_config.get("options", {}).get("queue", "default"),
-            "priority": schedule_config.get("options", {}).get("priority", 5),
+            "queue": options.get("queue", route["queue"]),
+            "priority": options.get("priority", route.get("priority")),
         })
     
     return {
@@ -0,0 +1,261 @@
+"""
+Response compression with br/zstd/gzip negotiation.
+
+Replaces ``GZipMiddleware``: the encoding is negotiated from
+``Accept-Encoding`` (q-values honoured, server preference br > zstd > gzip on
+ties) and the compression level is tuned to the body size - small bodies get a
+stronger level because it is cheap, large bodies a faster one.
+
+Responses that already carry ``Content-Encoding`` (e.g. precompressed cache
+hits) pass through untouched, so cached bodies are never compressed twice.
+
+Brotli and zstandard are optional; without them only gzip is offered.
+"""
+
+import gzip
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    brotli = None  # type: ignore
+
+try:
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore
+
+
+# 서버 선호 순서 (q 값이 같을 때 앞쪽 우선)
+_PREFERENCE: Tuple[str, ...] = ("br", "zstd", "gzip")
+
+AVAILABLE_ENCODINGS: Tuple[str, ...] = tuple(
+    enc for enc in _PREFERENCE
+    if enc == "gzip"
+    or (enc == "br" and brotli is not None)
+    or (enc == "zstd" and zstandard is not None)
+)
+
+# (body size upper bound, level) - 작은 본문은 높은 레벨, 큰 본문은 빠른 레벨
+_LEVELS: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    "br": ((32 * 1024, 5), (256 * 1024, 4), (1 << 62, 3)),
+    "zstd": ((32 * 1024, 6), (256 * 1024, 3), (1 << 62, 1)),
+    "gzip": ((32 * 1024, 6), (256 * 1024, 5), (1 << 62, 4)),
+}
+
+# 캐시에 한 번 압축해 두고 여러 번 서빙하는 경우 더 높은 레벨 사용
+_PRECOMPRESS_LEVELS: Dict[str, int] = {"br": 9, "zstd": 12, "gzip": 9}
+
+# 압축 효과가 없거나 스트리밍이 깨지는 타입
+_SKIP_CONTENT_TYPES: Tuple[str, ...] = ("text/event-stream", "image/", "video/", "audio/", "application/zip")
+
+
+def negotiate_encoding(
+    accept_encoding: Optional[str],
+    available: Tuple[str, ...] = AVAILABLE_ENCODINGS
+) -> Optional[str]:
+    """
+    Pick the best content coding for an ``Accept-Encoding`` header.
+
+    Returns:
+        Encoding name or None for identity
+    """
+    if not accept_encoding:
+        return None
+
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.strip().partition(";")
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        qualities[token.strip()] = q
+
+    wildcard = qualities.get("*")
+    best: Optional[str] = None
+    best_q = 0.0
+    for enc in available:
+        q = qualities.get(enc, wildcard if wildcard is not None else 0.0)
+        if q > best_q:
+            best, best_q = enc, q
+    return best
+
+
+def compression_level(encoding: str, size: int, precompress: bool = False) -> int:
+    """Compression level for ``encoding`` tuned to the body size."""
+    if precompress:
+        return _PRECOMPRESS_LEVELS[encoding]
+    for limit, level in _LEVELS[encoding]:
+        if size <= limit:
+            return level
+    return _LEVELS[encoding][-1][1]
+
+
+def compress(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """One-shot compression of a complete body."""
+    if level is None:
+        level = compression_level(encoding, len(body))
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(body)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=level, mtime=0)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def decompress(body: bytes, encoding: str) -> bytes:
+    """Inverse of ``compress`` (e.g. to rewrite a precompressed body)."""
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(body)
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+class _StreamCompressor:
+    """Incremental compressor with a uniform compress/flush interface."""
+
+    def __init__(self, encoding: str, level: int):
+        if encoding == "br":
+            self._obj = brotli.Compressor(quality=level)
+            self._compress: Callable[[bytes], bytes] = self._obj.process
+            self._flush: Callable[[], bytes] = self._obj.flush
+            self._finish: Callable[[], bytes] = self._obj.finish
+        elif encoding == "zstd":
+            self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+            self._compress = self._obj.compress
+            self._flush = lambda: self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+            self._finish = self._obj.flush
+        else:
+            self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._compress = self._obj.compress
+            self._flush = lambda: self._obj.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = self._obj.flush
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._compress(data) + self._flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compress(data) + self._finish()
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware negotiating br/zstd/gzip per request.
+
+    Args:
+        app: ASGI app
+        minimum_size: Bodies smaller than this are sent uncompressed
+        encodings: Encodings to offer (defaults to all available)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        encodings: Optional[List[str]] = None
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = tuple(
+            enc for enc in AVAILABLE_ENCODINGS if encodings is None or enc in encodings
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.initial_message: Optional[Message] = None
+        self.started = False
+        self.passthrough = False
+        self.compressor: Optional[_StreamCompressor] = None
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # 본문 첫 청크를 보고 압축 여부를 결정하므로 헤더 전송을 지연
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = (
+                "content-encoding" in headers
+                or content_type.startswith(_SKIP_CONTENT_TYPES)
+            )
+            return
+
+        if message_type != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.passthrough:
+            if not self.started:
+                self.started = True
+                await self._send(self.initial_message)
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            if not more_body:
+                if len(body) < self.minimum_size:
+                    await self._send(self.initial_message)
+                    await self._send(message)
+                    return
+                body = compress(body, self.encoding)
+                headers["Content-Encoding"] = self.encoding
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+                await self._send(self.initial_message)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+
+            # 스트리밍 응답: 크기를 알 수 없으므로 중간 레벨로 점진 압축
+            self.compressor = _StreamCompressor(
+                self.encoding, compression_level(self.encoding, 256 * 1024)
+            )
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            await self._send(self.initial_message)
+
+        if self.compressor is None:
+            await self._send(message)
+            return
+
+        if more_body:
+            await self._send({"type": "http.response.body", "body": self.compressor.chunk(body), "more_body": True})
+        else:
+            await self._send({"type": "http.response.body", "body": self.compressor.finish(body)})
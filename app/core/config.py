@@ -7,6 +7,7 @@ class Settings(BaseSettings):
     # Database
     mongodb_url: str = Field(default="mongodb://localhost:27017", description="MongoDB connection URL")
     database_name: str = Field(default="korea_public_api", min_length=1, description="MongoDB database name")
+    mongodb_apply_indexes_on_startup: bool = Field(default=True, description="Apply the declarative index registry once at startup")
     
     # API Keys
     public_data_api_key: str = Field(..., min_length=10, description="Public data API key")
@@ -28,18 +29,77 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
 
+    # Domain event stream (Redis Streams)
+    event_stream_enabled: bool = Field(default=True, description="Publish ingestion domain events to the Redis Stream")
+    event_stream_name: str = Field(default="domain-events", description="Redis Stream key for domain events")
+    event_stream_maxlen: int = Field(default=100000, gt=0, description="Approximate MAXLEN trim for the event stream")
+
+    # Checkpointed bulk collection jobs (app.shared.jobs)
+    collection_job_lease_seconds: int = Field(default=300, gt=0, description="Claimed page ranges are reclaimable after this long without a checkpoint")
+    collection_job_chunk_pages: int = Field(default=20, gt=0, le=1000, description="Pages per claimable range in bulk collection jobs")
+    job_progress_stream_maxlen: int = Field(default=1000, gt=0, description="Approximate MAXLEN of each job progress stream")
+    job_progress_ttl_seconds: int = Field(default=86400, gt=0, description="Job progress streams expire this long after the last event")
+    job_progress_heartbeat_ms: int = Field(default=15000, gt=0, description="SSE keep-alive interval (XREAD block timeout)")
+    job_progress_idle_timeout_seconds: float = Field(default=600.0, gt=0, description="SSE progress streams close after this long without events")
+
+    # Single-flight tasks (app.core.distributed_lock)
+    task_singleton_enabled: bool = Field(default=True, description="Coalesce duplicate runs of @singleton_task Celery tasks through a Redis lease")
+    task_lock_ttl_seconds: int = Field(default=120, gt=0, description="Lease TTL while a singleton task runs (renewed every ttl/3)")
+    task_lock_dispatch_ttl_seconds: int = Field(default=900, gt=0, description="Lease TTL held for a dispatched singleton task until a worker starts it")
+
     # Rate limit
     rl_per_minute: int = Field(default=100, gt=0, le=10000, description="Requests per minute limit")
     rl_per_hour: int = Field(default=3000, gt=0, le=100000, description="Requests per hour limit")
+    rate_limit_backend: str = Field(default="auto", pattern=r"^(auto|redis|memory)$", description="auto: Redis if reachable at startup, otherwise in-memory")
     
     # Logging
     log_level: str = "INFO"
+    log_queue_enabled: bool = Field(default=True, description="Route log records through QueueHandler/QueueListener")
+    log_rate_limit_per_second: float = Field(default=50.0, ge=0, description="Per-logger INFO/DEBUG records per second (0 disables)")
+    log_rate_limit_burst: int = Field(default=200, gt=0, description="Per-logger burst allowance for the log rate cap")
+    log_span_sample_rate: float = Field(default=0.01, ge=0, le=1, description="Sampling ratio for DEBUG timing spans")
+    server_timing_enabled: bool = Field(default=False, description="Expose per-stage request timings as a Server-Timing header (leaks internal timings; enable for staging/debugging only)")
+    
+    # Routers (app.core.router_registry) - 목록에 없는 라우터 모듈은 import 하지 않음
+    enabled_routers: list[str] = Field(
+        default_factory=lambda: [
+            "announcements", "businesses", "contents", "users", "data_requests",
+            "classification", "keys", "usage", "task_management", "data_sources",
+            "alerts", "versioned_announcements", "versioned_businesses",
+        ],
+        description="Routers to import and mount (alerts additionally requires alerts_enabled)"
+    )
     
+    # Startup / warm-up (lifespan)
+    startup_connect_timeout_seconds: float = Field(default=10.0, gt=0, description="Per-dependency timeout for concurrent startup connections")
+    startup_index_timeout_seconds: float = Field(default=300.0, gt=0, description="Timeout for applying MongoDB indexes at startup, separate from the connect timeout")
+    startup_warmup_enabled: bool = Field(default=True, description="Warm caches after startup; readiness is reported once warm-up finishes")
+    startup_warmup_timeout_seconds: float = Field(default=30.0, gt=0, description="Per-step timeout for cache warm-up")
+    warmup_announcement_pages: int = Field(default=3, ge=0, le=20, description="Number of default announcement list pages to pre-render into the cache")
+    warmup_announcement_page_size: int = Field(default=20, ge=1, le=100, description="Page size used for announcement list warm-up")
+    
+    # Shared outbound HTTP client pool
+    http_client_max_connections: int = Field(default=100, ge=1, description="Max connections in the shared async HTTP client")
+    http_client_max_keepalive: int = Field(default=20, ge=0, description="Max idle keep-alive connections in the shared async HTTP client")
+    http_client_timeout_seconds: float = Field(default=30.0, gt=0, description="Default timeout for the shared async HTTP client")
+    
+    # Response compression
+    compression_minimum_size: int = Field(default=500, ge=0, description="Bodies smaller than this are sent uncompressed")
+
     # JWT Authentication  
     jwt_secret_key: str = Field(default_factory=lambda: secrets.token_urlsafe(32), min_length=32, description="JWT secret key")
     jwt_algorithm: str = Field(default="HS256", pattern=r"^HS256|HS384|HS512|RS256|RS384|RS512$", description="JWT algorithm")
     jwt_access_token_expire_minutes: int = Field(default=120, gt=0, le=1440, description="JWT access token expiry in minutes")
     jwt_refresh_token_expire_days: int = Field(default=7, gt=0, le=30, description="JWT refresh token expiry in days")
+    auth_blacklist_negative_ttl_seconds: float = Field(default=2.0, ge=0, le=60, description="Local cache TTL for tokens confirmed not blacklisted (0 disables)")
+    # Password hashing (bcrypt cost + bounded worker pool)
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31, description="bcrypt cost; hashes with a different cost are rehashed on login")
+    password_hash_workers: int = Field(default=2, gt=0, le=32, description="Worker threads dedicated to password hashing")
+    password_hash_max_pending: int = Field(default=32, gt=0, description="Queued + running hash operations before shedding load")
+    password_hash_retry_after_seconds: int = Field(default=1, gt=0, description="Retry-After sent with 503 when the hash pool is saturated")
+    auth_user_cache_ttl_seconds: float = Field(default=30.0, ge=0, le=600, description="TTL of the (sub, iat) authenticated user cache (0 disables)")
+    preference_cache_ttl_seconds: float = Field(default=60.0, ge=0, le=3600, description="TTL of the per-user settings/notification preference cache (0 disables)")
+    preference_cache_max_entries: int = Field(default=20000, gt=0, description="Max cached preference documents per process")
     
     # Google OAuth 2.0
     google_client_id: Optional[str] = None
@@ -47,6 +107,10 @@ class Settings(BaseSettings):
     # 개발/도커 경로는 API prefix(`/api/v1`) 포함 콜백 사용
     google_redirect_uri: str = "http://localhost:8000/api/v1/auth/google/callback"
     google_scope: str = "openid email profile"
+    google_discovery_url: str = Field(default="https://accounts.google.com/.well-known/openid-configuration", description="OpenID Connect discovery document")
+    google_oidc_cache_ttl_seconds: int = Field(default=3600, gt=0, description="Discovery/JWKS cache TTL when Google sends no Cache-Control max-age")
+    google_id_token_leeway_seconds: int = Field(default=60, ge=0, le=300, description="Clock skew allowed when verifying Google ID tokens")
+    oauth_state_memory_max_entries: int = Field(default=10000, gt=0, description="Cap on in-memory OAuth states used when Redis is unavailable")
     
     # Frontend CORS
     frontend_url: str = Field(default="http://localhost:3000", description="Frontend application URL")
@@ -106,6 +170,38 @@ class Settings(BaseSettings):
         le=10000,
         description="Global notifications send rate per second"
     )
+    alerts_delivery_batch_size: int = Field(default=100, gt=0, le=1000, description="Notifications claimed per delivery batch")
+    alerts_delivery_lease_seconds: int = Field(default=300, gt=0, description="Claimed notifications are reclaimable after this long")
+    alerts_delivery_idle_seconds: float = Field(default=5.0, gt=0, description="Delivery worker sleep when no notifications are pending")
+    alerts_delivery_max_batches: int = Field(default=50, gt=0, description="Batches drained per deliver_notifications task run")
+    alerts_delivery_time_budget_seconds: float = Field(
+        default=40.0,
+        gt=0,
+        description="deliver_notifications / dispatch_deadline_reminders stop claiming batches after this long (below the alerts.notify soft time limit)",
+    )
+    alerts_digest_concurrency: int = Field(default=8, gt=0, le=128, description="Daily digests rendered/sent concurrently")
+    alerts_reminder_horizon_days: int = Field(default=14, gt=0, le=90, description="Deadlines this far ahead are materialized into reminder buckets")
+    alerts_reminder_catchup_hours: int = Field(default=6, ge=0, le=72, description="Missed reminder buckets still dispatched this many hours late")
+    alerts_stream_group: str = Field(default="alerts-matcher", description="Redis Stream consumer group for event-driven alert matching")
+    alerts_stream_batch_size: int = Field(default=100, gt=0, le=1000, description="Events read per XREADGROUP call")
+    alerts_stream_block_ms: int = Field(default=5000, ge=0, description="XREADGROUP block timeout")
+    alerts_stream_claim_idle_ms: int = Field(default=60000, gt=0, description="Pending events idle this long are reclaimed from dead consumers")
+    alerts_stream_max_deliveries: int = Field(default=5, gt=0, description="Events delivered this many times move to the dead-letter stream")
+    alerts_matcher_refresh_seconds: float = Field(default=60.0, gt=0, description="Long-lived matchers reload subscriptions after this long")
+
+    # Outbound email (dev: log only, smtp: persistent SMTP session per worker)
+    email_provider: str = Field(default="dev", pattern=r"^(dev|smtp)$", description="EmailClient provider")
+    smtp_host: str = Field(default="localhost", description="SMTP server host")
+    smtp_port: int = Field(default=587, gt=0, le=65535, description="SMTP server port")
+    smtp_username: Optional[str] = None
+    smtp_password: Optional[str] = None
+    smtp_use_tls: bool = Field(default=True, description="Upgrade the SMTP session with STARTTLS")
+    smtp_timeout_seconds: float = Field(default=10.0, gt=0, description="SMTP socket timeout")
+    smtp_from_email: str = Field(default="noreply@example.com", description="Envelope/From address for outbound email")
+    smtp_from_name: str = Field(default="한국 공공데이터 플랫폼", description="Display name on the default From header")
+    email_template_cache_dir: Optional[str] = Field(default=None, description="Jinja bytecode cache directory (None = system temp dir)")
+    email_render_workers: int = Field(default=4, gt=0, le=64, description="Thread pool size for email template rendering")
+    email_render_batch_size: int = Field(default=50, gt=0, description="Emails rendered per thread-pool job in EmailService.send_many")
     
     @validator('allowed_origins')
     def validate_origins(cls, v, values):
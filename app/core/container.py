@@ -2,14 +2,18 @@
 Dependency Injection Container implementation.
 
 Provides a flexible dependency injection system supporting:
-- Singleton and transient lifetimes
+- Singleton, scoped (per request) and transient lifetimes
 - Interface binding
 - Factory methods
 - Circular dependency detection
 """
 
 import inspect
-from typing import TypeVar, Type, Any, Dict, Callable, Optional, get_type_hints
+import threading
+import typing
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import TypeVar, Type, Any, Dict, Callable, Iterator, Optional, Tuple, get_type_hints
 from enum import Enum
 from functools import wraps
 import logging
@@ -18,6 +22,11 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# 요청 스코프 인스턴스 저장소 (DIScopeMiddleware 가 요청마다 새 dict 로 설정)
+_scope_var: ContextVar[Optional[Dict[Type, Any]]] = ContextVar("di_scope", default=None)
+# 순환 의존성 감지용 해석 스택 (동시 요청 간 공유되지 않도록 컨텍스트별로 유지)
+_resolution_var: ContextVar[Tuple[Type, ...]] = ContextVar("di_resolution_stack", default=())
+
 
 class Lifetime(Enum):
     """Service lifetime enumeration"""
@@ -65,8 +74,11 @@ class DIContainer:
     def __init__(self):
         self._bindings: Dict[Type, ServiceBinding] = {}
         self._singletons: Dict[Type, Any] = {}
-        self._scoped_instances: Dict[Type, Any] = {}
-        self._resolution_stack: list = []
+        # 싱글톤 최초 생성 경쟁 방지 (스레드풀에서 동기 의존성이 동시에 해석됨)
+        self._singleton_lock = threading.RLock()
+        self._signatures: Dict[Callable, Tuple[inspect.Parameter, ...]] = {}
+        # lifetime 별 인스턴스 생성 횟수 (요청당 할당 측정용)
+        self.created_counts: Dict[str, int] = {lifetime.value: 0 for lifetime in Lifetime}
     
     def register_singleton(self, service_type: Type[T], implementation: Type[T] = None) -> 'DIContainer':
         """Register a service as singleton"""
@@ -124,42 +136,49 @@ class DIContainer:
     
     def resolve(self, service_type: Type[T]) -> T:
         """Resolve a service instance"""
+        # Fast path: 이미 생성된 싱글톤은 순환 검사 없이 반환
+        instance = self._singletons.get(service_type)
+        if instance is not None:
+            return instance
+        
+        stack = _resolution_var.get()
         # Check for circular dependencies
-        if service_type in self._resolution_stack:
-            cycle = " -> ".join([t.__name__ for t in self._resolution_stack]) + f" -> {service_type.__name__}"
+        if service_type in stack:
+            cycle = " -> ".join([_type_name(t) for t in stack]) + f" -> {_type_name(service_type)}"
             raise CircularDependencyError(f"Circular dependency detected: {cycle}")
         
+        token = _resolution_var.set(stack + (service_type,))
         try:
-            self._resolution_stack.append(service_type)
             return self._resolve_internal(service_type)
         finally:
-            self._resolution_stack.remove(service_type)
+            _resolution_var.reset(token)
     
     def _resolve_internal(self, service_type: Type[T]) -> T:
         """Internal resolve implementation"""
         # Check if service is registered
-        if service_type not in self._bindings:
-            raise ServiceNotFoundError(f"Service {service_type.__name__} is not registered")
-        
-        binding = self._bindings[service_type]
+        binding = self._bindings.get(service_type)
+        if binding is None:
+            raise ServiceNotFoundError(f"Service {_type_name(service_type)} is not registered")
         
         # Handle singleton lifetime
         if binding.lifetime == Lifetime.SINGLETON:
-            if service_type in self._singletons:
+            instance = self._singletons.get(service_type)
+            if instance is not None:
+                return instance
+            with self._singleton_lock:
+                if service_type not in self._singletons:
+                    self._singletons[service_type] = self._create_instance(binding)
                 return self._singletons[service_type]
-            
-            instance = self._create_instance(binding)
-            self._singletons[service_type] = instance
-            return instance
         
         # Handle scoped lifetime
         elif binding.lifetime == Lifetime.SCOPED:
-            if service_type in self._scoped_instances:
-                return self._scoped_instances[service_type]
-            
-            instance = self._create_instance(binding)
-            self._scoped_instances[service_type] = instance
-            return instance
+            scope = _scope_var.get()
+            if scope is None:
+                # 활성 스코프 밖(백그라운드 작업 등)에서는 공유하지 않고 매번 생성
+                return self._create_instance(binding)
+            if service_type not in scope:
+                scope[service_type] = self._create_instance(binding)
+            return scope[service_type]
         
         # Handle transient lifetime
         else:
@@ -171,6 +190,8 @@ class DIContainer:
         if binding.instance is not None:
             return binding.instance
         
+        self.created_counts[binding.lifetime.value] += 1
+        
         # Use factory method
         if binding.factory is not None:
             return self._invoke_factory(binding.factory)
@@ -181,47 +202,85 @@ class DIContainer:
         
         raise ValueError(f"Invalid binding configuration for {binding.service_type.__name__}")
     
+    def _parameters(self, func: Callable) -> Tuple[inspect.Parameter, ...]:
+        """Annotated parameters of ``func`` (cached; inspect.signature 는 호출마다 비쌈)"""
+        params = self._signatures.get(func)
+        if params is None:
+            params = tuple(
+                param for name, param in inspect.signature(func).parameters.items()
+                if name != 'self' and param.annotation != inspect.Parameter.empty
+            )
+            self._signatures[func] = params
+        return params
+    
     def _invoke_factory(self, factory: Callable) -> Any:
         """Invoke factory method with dependency injection"""
-        signature = inspect.signature(factory)
         kwargs = {}
         
-        for param_name, param in signature.parameters.items():
-            if param.annotation != inspect.Parameter.empty:
-                dependency = self.resolve(param.annotation)
-                kwargs[param_name] = dependency
+        for param in self._parameters(factory):
+            kwargs[param.name] = self.resolve(param.annotation)
         
         return factory(**kwargs)
     
     def _create_from_class(self, implementation: Type) -> Any:
         """Create instance from class with constructor injection"""
-        signature = inspect.signature(implementation.__init__)
         kwargs = {}
         
-        for param_name, param in signature.parameters.items():
-            if param_name == 'self':
+        for param in self._parameters(implementation.__init__):
+            annotation = self._unwrap_optional(param.annotation)
+            # Unregistered primitives (str, bool, ...) with defaults are left to the constructor
+            if annotation not in self._bindings and param.default != inspect.Parameter.empty:
                 continue
-            
-            if param.annotation != inspect.Parameter.empty:
-                # Try to resolve the dependency
-                try:
-                    dependency = self.resolve(param.annotation)
-                    kwargs[param_name] = dependency
-                except ServiceNotFoundError:
-                    # If dependency is not registered and has default value, use default
-                    if param.default != inspect.Parameter.empty:
-                        continue
-                    # If no default and Optional, pass None
-                    if hasattr(param.annotation, '__origin__') and param.annotation.__origin__ is type(Optional[int].__origin__):
-                        kwargs[param_name] = None
-                        continue
-                    raise
+            # Try to resolve the dependency
+            try:
+                kwargs[param.name] = self.resolve(annotation)
+            except ServiceNotFoundError:
+                # If dependency is not registered and has default value, use default
+                if param.default != inspect.Parameter.empty:
+                    continue
+                # If no default and Optional, pass None
+                if hasattr(param.annotation, '__origin__') and param.annotation.__origin__ is type(Optional[int].__origin__):
+                    kwargs[param.name] = None
+                    continue
+                raise
         
         return implementation(**kwargs)
     
+    def _unwrap_optional(self, annotation: Any) -> Any:
+        """``Optional[X]`` -> ``X`` when X is registered"""
+        if typing.get_origin(annotation) is typing.Union:
+            candidates = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+            if len(candidates) == 1 and candidates[0] in self._bindings:
+                return candidates[0]
+        return annotation
+    
+    def begin_scope(self) -> Token:
+        """Start a new request scope in the current context"""
+        return _scope_var.set({})
+    
+    def end_scope(self, token: Token) -> None:
+        """Dispose the scope started by ``begin_scope``"""
+        scope = _scope_var.get()
+        _scope_var.reset(token)
+        if scope:
+            for instance in scope.values():
+                _dispose(instance)
+            scope.clear()
+    
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """Request scope context manager"""
+        token = self.begin_scope()
+        try:
+            yield
+        finally:
+            self.end_scope(token)
+    
     def clear_scoped(self):
         """Clear scoped instances (for request scope management)"""
-        self._scoped_instances.clear()
+        scope = _scope_var.get()
+        if scope is not None:
+            scope.clear()
         logger.debug("Cleared scoped instances")
     
     def is_registered(self, service_type: Type) -> bool:
@@ -253,6 +312,20 @@ class DIContainer:
         return result
 
 
+def _type_name(service_type: Any) -> str:
+    return getattr(service_type, "__name__", repr(service_type))
+
+
+def _dispose(instance: Any) -> None:
+    """스코프 종료 시 동기 close() 가 있으면 호출"""
+    close = getattr(instance, "close", None)
+    if callable(close) and not inspect.iscoroutinefunction(close):
+        try:
+            close()
+        except Exception as e:
+            logger.debug(f"Scoped instance close failed: {e}")
+
+
 # Global container instance
 container = DIContainer()
 
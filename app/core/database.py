@@ -6,6 +6,7 @@ async support, and health monitoring for improved performance.
 """
 
 import asyncio
+import threading
 from typing import Optional, Any, Dict
 import logging
 import time
@@ -16,6 +17,7 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ServerSelectionTimeoutError, ConnectionFailure
 
 from .config import settings
+from .timing import MongoTimingListener
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +33,8 @@ class DatabaseManager:
         self._connection_healthy = False
         self._last_health_check = 0
         self._health_check_interval = 30  # seconds
+        # lifespan 의 동시 연결 단계와 첫 요청의 lazy 연결이 겹쳐도 클라이언트는 하나만 생성
+        self._sync_lock = threading.RLock()
     
     def _get_sync_client_options(self) -> Dict[str, Any]:
         """Get optimized connection options for sync client"""
@@ -54,6 +58,9 @@ class DatabaseManager:
             # Read preferences
             "readPreference": "primaryPreferred",
             "maxStalenessSeconds": 120,
+            
+            # Request-scoped query timing (Server-Timing / stage histograms)
+            "event_listeners": [MongoTimingListener()],
         }
     
     def _get_async_client_options(self) -> Dict[str, Any]:
@@ -82,6 +89,10 @@ class DatabaseManager:
     
     def connect_sync(self) -> None:
         """Create synchronous MongoDB connection with optimized settings"""
+        with self._sync_lock:
+            self._connect_sync()
+    
+    def _connect_sync(self) -> None:
         try:
             options = self._get_sync_client_options()
             self.sync_client = pymongo.MongoClient(settings.mongodb_url, **options)
@@ -137,7 +148,9 @@ class DatabaseManager:
     def get_database(self):
         """Get synchronous database instance"""
         if self.database is None:
-            self.connect_sync()
+            with self._sync_lock:
+                if self.database is None:
+                    self._connect_sync()
         return self.database
     
     async def get_async_database(self):
@@ -102,15 +102,16 @@ class ScopedDependencyManager:
     
     def __init__(self, container: DIContainer):
         self.container = container
+        self._token = None
     
     def __enter__(self):
-        # Clear any existing scoped instances
-        self.container.clear_scoped()
+        # Open a fresh scope bound to the current context
+        self._token = self.container.begin_scope()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Clean up scoped instances after request
-        self.container.clear_scoped()
+        # Dispose scoped instances after request
+        self.container.end_scope(self._token)
 
 
 def get_scoped_dependency_manager() -> ScopedDependencyManager:
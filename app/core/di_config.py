@@ -45,10 +45,17 @@ def configure_dependencies() -> DIContainer:
     container.register_singleton(ContentService)
     container.register_singleton(UserService)
     
-    # Register API clients as singletons
+    # Register API clients as singletons (재시도 전략/세션을 프로세스 단위로 재사용)
     from ..shared.clients.kstartup_api_client import KStartupAPIClient
     container.register_singleton(KStartupAPIClient)
     
+    # Batch services keep per-run state (progress_callback) -> one per request
+    from ..domains.announcements.batch_service import AnnouncementBatchService
+    from ..domains.businesses.batch_service import BusinessBatchService
+    
+    container.register_scoped(AnnouncementBatchService)
+    container.register_scoped(BusinessBatchService)
+    
     return container
 
 
@@ -0,0 +1,395 @@
+"""
+Redis lease locks with fencing tokens, and single-flight Celery tasks.
+
+Beat 스케줄, ``/fetch`` 엔드포인트, ``task_management_api.execute_task``,
+``batch_collect_announcements`` 가 같은 무거운 수집/통계 작업을 동시에 시작할 수 있었고
+중복 실행을 막는 장치가 없었습니다.
+
+- 획득: Lua 스크립트 한 번으로 비어 있으면 ``SET PX`` + 락 이름별 단조 증가 fencing token
+  (``INCR``). 값은 ``"<token>|<owner>"``. 같은 owner (예: 재전달된 같은 Celery task id,
+  디스패치 시 미리 잡아 둔 락) 는 새 token 으로 다시 획득합니다.
+- 갱신: 보유 중에는 데몬 스레드가 ``ttl/3`` 마다 소유를 확인하고 ``PEXPIRE`` 합니다.
+  갱신에 실패하면 ``lost`` 가 켜지고, 워커가 죽으면 ttl 후 자동으로 풀립니다.
+- 해제: 소유를 확인한 뒤에만 ``DEL`` (만료 후 다른 owner 가 잡은 락은 건드리지 않음).
+- 합류: ``join()`` 은 같은 owner 가 이미 보유 중이면 token 을 바꾸지 않고 같은 lease 를
+  함께 갱신합니다 (한 작업을 나눠 처리하는 여러 워커).
+- fencing: 오래 멈췄다 깨어난 이전 보유자는 ``is_current()`` 가 False 이므로 보호 대상에
+  쓰기 전에 ``ensure_lease()`` 로 확인하고, lease 를 잃었으면 ``LeaseLost`` 로 중단합니다.
+
+``@singleton_task`` 는 bound Celery 태스크를 락으로 감싸, 같은 락을 다른 작업이 잡고 있으면
+실행하지 않고 ``{"status": "coalesced", "job_id": <실행 중인 작업 ID>}`` 를 반환합니다.
+실행 중에는 ``active_lease()`` 로 lease 를 꺼내 수집 코드에 넘기고, 수집 코드가
+``LeaseLost`` 로 중단하면 ``{"status": "lease_lost"}`` 를 반환합니다 (재시도하지 않음).
+API 는 ``dispatch_singleton`` 으로 보내기 전에 락을 잡아 중복 요청을 실행 중인 작업 ID 로
+합칩니다.
+
+Redis 를 쓸 수 없으면 경고 후 락 없이 실행합니다 (수집 누락보다 중복 실행이 낫습니다).
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Tuple
+
+from .config import settings
+
+try:
+    import redis  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    redis = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+LOCK_PREFIX = "lock"
+
+# KEYS[1]=lock, KEYS[2]=fence counter; ARGV: owner, ttl_ms[, join]
+_ACQUIRE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current then
+  local sep = string.find(current, '|', 1, true)
+  if not sep or string.sub(current, sep + 1) ~= ARGV[1] then
+    return {0, current}
+  end
+  if ARGV[3] == '1' then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return {1, current}
+  end
+end
+local value = redis.call('INCR', KEYS[2]) .. '|' .. ARGV[1]
+redis.call('SET', KEYS[1], value, 'PX', ARGV[2])
+return {1, value}
+"""
+
+# KEYS[1]=lock; ARGV: expected value, ttl_ms
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS[1]=lock; ARGV: expected value
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass(frozen=True)
+class LeaseHolder:
+    owner: str
+    token: int
+
+    @classmethod
+    def parse(cls, value: Any) -> Optional["LeaseHolder"]:
+        if value is None:
+            return None
+        if isinstance(value, bytes):
+            value = value.decode()
+        token, _, owner = str(value).partition("|")
+        try:
+            return cls(owner=owner, token=int(token))
+        except ValueError:
+            return None
+
+    @property
+    def value(self) -> str:
+        return f"{self.token}|{self.owner}"
+
+
+class LeaseNotAcquired(Exception):
+    """다른 owner 가 락을 보유 중"""
+
+    def __init__(self, name: str, holder: Optional[LeaseHolder]):
+        self.name = name
+        self.holder = holder
+        super().__init__(f"Lock '{name}' is held by {holder.owner if holder else 'unknown'}")
+
+
+class LeaseLost(Exception):
+    """보호 대상에 쓰기 전 확인했을 때 lease 가 더 이상 최신이 아님 (fencing)"""
+
+    def __init__(self, name: str, token: Optional[int]):
+        self.name = name
+        self.token = token
+        super().__init__(f"Lock '{name}' is no longer held (token {token})")
+
+
+_client: Any = None
+
+
+def get_lock_client() -> Any:
+    """락용 sync Redis 클라이언트 (redis-py 가 없으면 None)"""
+    global _client
+    if _client is None and redis is not None:
+        _client = redis.from_url(settings.redis_url, socket_connect_timeout=2.0, socket_timeout=2.0)
+    return _client
+
+
+class RedisLease:
+    """Lease on ``lock:<name>`` with a fencing token and optional background renewal"""
+
+    def __init__(self, name: str, owner: Optional[str] = None, ttl: Optional[int] = None, client: Any = None):
+        self.name = name
+        self.key = f"{LOCK_PREFIX}:{name}"
+        self.fence_key = f"{LOCK_PREFIX}:fence:{name}"
+        self.owner = owner or uuid.uuid4().hex
+        self.ttl = ttl or settings.task_lock_ttl_seconds
+        self.client = client if client is not None else get_lock_client()
+        self.token: Optional[int] = None
+        # 획득 실패 시 현재 보유자
+        self.holder: Optional[LeaseHolder] = None
+        self.lost = False
+        # Redis 장애로 락 없이 실행 중
+        self.degraded = False
+        self._value: Optional[str] = None
+        self._stop = threading.Event()
+        self._renewer: Optional[threading.Thread] = None
+
+    @property
+    def _ttl_ms(self) -> int:
+        return int(self.ttl * 1000)
+
+    def acquire(self, join: bool = False) -> bool:
+        if self.client is None:
+            self.degraded = True
+            return True
+        args = [self.owner, self._ttl_ms] + (["1"] if join else [])
+        try:
+            acquired, value = self.client.register_script(_ACQUIRE_SCRIPT)(
+                keys=[self.key, self.fence_key], args=args
+            )
+        except Exception as e:
+            logger.warning(f"Lock '{self.name}' unavailable, running without it: {e}")
+            self.degraded = True
+            return True
+        holder = LeaseHolder.parse(value)
+        if not int(acquired):
+            self.holder = holder
+            return False
+        self._value = holder.value if holder else None
+        self.token = holder.token if holder else None
+        self.lost = False
+        return True
+
+    def join(self) -> bool:
+        """같은 owner 의 lease 에 합류 (보유자가 없으면 새로 획득)"""
+        return self.acquire(join=True)
+
+    def renew(self) -> bool:
+        if self.degraded or self._value is None:
+            return not self.lost
+        try:
+            renewed = self.client.register_script(_RENEW_SCRIPT)(keys=[self.key], args=[self._value, self._ttl_ms])
+        except Exception as e:
+            # 일시적 오류: 다음 주기에 다시 시도 (ttl 안에 복구되면 유지)
+            logger.warning(f"Lock '{self.name}' renewal failed: {e}")
+            return True
+        if not int(renewed):
+            self.lost = True
+            logger.error(f"Lock '{self.name}' lost by {self.owner} (token {self.token})")
+        return not self.lost
+
+    def is_current(self) -> bool:
+        """fencing: 이 lease 가 아직 최신 보유자인지"""
+        if self.degraded:
+            return True
+        if self._value is None or self.lost:
+            return False
+        try:
+            return LeaseHolder.parse(self.client.get(self.key)) == LeaseHolder.parse(self._value)
+        except Exception:
+            return not self.lost
+
+    def ensure_current(self) -> None:
+        if not self.is_current():
+            raise LeaseLost(self.name, self.token)
+
+    def release(self) -> None:
+        self.stop_renewal()
+        if self.degraded or self._value is None:
+            return
+        try:
+            self.client.register_script(_RELEASE_SCRIPT)(keys=[self.key], args=[self._value])
+        except Exception as e:
+            logger.warning(f"Lock '{self.name}' release failed (expires in {self.ttl}s): {e}")
+        self._value = None
+
+    def stop_renewal(self) -> None:
+        """갱신만 멈춤 (락은 ttl 후 만료, 함께 보유 중인 다른 워커가 있으면 그쪽이 유지)"""
+        self._stop.set()
+        if self._renewer is not None and self._renewer is not threading.current_thread():
+            self._renewer.join(timeout=1.0)
+        self._renewer = None
+
+    def start_renewal(self) -> None:
+        if self.degraded or self._renewer is not None:
+            return
+        self._stop.clear()
+        self._renewer = threading.Thread(target=self._renew_loop, name=f"lease-{self.name}", daemon=True)
+        self._renewer.start()
+
+    def _renew_loop(self) -> None:
+        interval = max(self.ttl / 3, 0.05)
+        while not self._stop.wait(interval):
+            if not self.renew():
+                return
+
+    def __enter__(self) -> "RedisLease":
+        if not self.acquire():
+            raise LeaseNotAcquired(self.name, self.holder)
+        self.start_renewal()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.release()
+
+
+def ensure_lease(lease: Optional[RedisLease]) -> None:
+    """쓰기 전 fencing 확인 (lease 없이 실행 중이면 통과)"""
+    if lease is not None:
+        lease.ensure_current()
+
+
+def current_holder(name: str, client: Any = None) -> Optional[LeaseHolder]:
+    client = client if client is not None else get_lock_client()
+    if client is None:
+        return None
+    try:
+        return LeaseHolder.parse(client.get(f"{LOCK_PREFIX}:{name}"))
+    except Exception as e:
+        logger.warning(f"Lock '{name}' holder lookup failed: {e}")
+        return None
+
+
+@contextmanager
+def single_flight(name: str, owner: Optional[str] = None, ttl: Optional[int] = None) -> Iterator[RedisLease]:
+    """블록이 끝날 때까지 락 보유 (보유자가 있으면 ``LeaseNotAcquired``)"""
+    with RedisLease(name, owner=owner, ttl=ttl) as lease:
+        yield lease
+
+
+@asynccontextmanager
+async def single_flight_async(name: str, owner: Optional[str] = None, ttl: Optional[int] = None) -> AsyncIterator[RedisLease]:
+    """``single_flight`` 의 async 버전 (Redis 호출은 스레드에서 실행)"""
+    lease = RedisLease(name, owner=owner, ttl=ttl)
+    if not await asyncio.to_thread(lease.acquire):
+        raise LeaseNotAcquired(name, lease.holder)
+    lease.start_renewal()
+    try:
+        yield lease
+    finally:
+        await asyncio.to_thread(lease.release)
+
+
+# -----------------------------
+# Single-flight Celery tasks
+# -----------------------------
+
+# task name -> (lock name, key function)
+SINGLETON_TASKS: Dict[str, Tuple[str, Optional[Callable[..., Any]]]] = {}
+
+_active_lease: contextvars.ContextVar[Optional[RedisLease]] = contextvars.ContextVar("active_lease", default=None)
+
+
+def active_lease() -> Optional[RedisLease]:
+    """실행 중인 ``@singleton_task`` 의 lease (수집 코드에 넘겨 쓰기 전에 확인)"""
+    return _active_lease.get()
+
+
+def singleton_lock_name(task_name: str, args: Any = None, kwargs: Optional[Dict[str, Any]] = None) -> str:
+    lock, key = SINGLETON_TASKS.get(task_name, (task_name, None))
+    suffix = key(*(args or ()), **(kwargs or {})) if key else None
+    return f"{lock}:{suffix}" if suffix else lock
+
+
+def singleton_task(
+    lock: Optional[str] = None,
+    key: Optional[Callable[..., Any]] = None,
+    ttl: Optional[int] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Allow one run at a time for a bound Celery task (``@celery_app.task(bind=True)`` 아래에 사용)
+
+    Args:
+        lock: 락 이름 (기본: 태스크 이름). 같은 데이터를 수집하는 여러 태스크가 공유할 수 있음
+        key: 태스크 인자 -> 락 이름 접미사 (인자별로 따로 실행할 때)
+        ttl: lease 초 (보유 중 자동 갱신, 워커가 죽으면 이 시간 후 해제)
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        # Celery 기본 태스크 이름과 같은 규칙
+        task_name = f"{func.__module__}.{func.__name__}"
+        SINGLETON_TASKS[task_name] = (lock or task_name, key)
+
+        @functools.wraps(func)
+        def wrapper(task: Any, *args: Any, **kwargs: Any) -> Any:
+            if not settings.task_singleton_enabled:
+                return func(task, *args, **kwargs)
+            name = singleton_lock_name(task_name, args, kwargs)
+            lease = RedisLease(name, owner=getattr(task.request, "id", None), ttl=ttl)
+            if not lease.acquire():
+                job_id = lease.holder.owner if lease.holder else None
+                logger.info(f"{task_name}: '{name}' already running as {job_id}, coalescing")
+                return {
+                    "status": "coalesced",
+                    "job_id": job_id,
+                    "lock": name,
+                    "message": f"Already running as {job_id}",
+                }
+            lease.start_renewal()
+            active = _active_lease.set(lease)
+            try:
+                result = func(task, *args, **kwargs)
+            except LeaseLost as e:
+                # 다른 owner 가 락을 가져감: 재시도하면 중복 실행이 되므로 그대로 종료
+                logger.error(f"{task_name}: {e}, stopped before writing")
+                return {"status": "lease_lost", "lock": name, "token": e.token, "message": str(e)}
+            finally:
+                _active_lease.reset(active)
+                lease.release()
+            if lease.lost:
+                logger.error(f"{task_name}: '{name}' was lost while running (token {lease.token})")
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def running_job(task_name: str, args: Any = None, kwargs: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """같은 singleton 락을 보유한 (실행 중이거나 대기 중인) 작업 ID"""
+    if task_name not in SINGLETON_TASKS or not settings.task_singleton_enabled:
+        return None
+    holder = current_holder(singleton_lock_name(task_name, args, kwargs))
+    return holder.owner if holder else None
+
+
+def dispatch_singleton(task: Any, args: Any = None, kwargs: Optional[Dict[str, Any]] = None, **options: Any) -> Tuple[str, bool]:
+    """singleton 태스크를 보내기 전에 락을 미리 잡음 -> (작업 ID, 새로 시작했는지)
+
+    작업 ID 를 owner 로 락을 잡은 뒤 같은 ID 로 보내므로, 워커는 같은 owner 로 락을 이어받고
+    그 사이 들어온 중복 요청은 이 작업 ID 를 돌려받습니다. 큐 대기 중에는
+    ``task_lock_dispatch_ttl_seconds`` 동안 유지됩니다.
+    """
+    if task.name not in SINGLETON_TASKS or not settings.task_singleton_enabled:
+        return task.apply_async(args=args, kwargs=kwargs, **options).id, True
+    task_id = options.pop("task_id", None) or str(uuid.uuid4())
+    lease = RedisLease(
+        singleton_lock_name(task.name, args, kwargs),
+        owner=task_id,
+        ttl=settings.task_lock_dispatch_ttl_seconds,
+    )
+    if not lease.acquire():
+        return (lease.holder.owner if lease.holder else task_id), False
+    try:
+        task.apply_async(args=args, kwargs=kwargs, task_id=task_id, **options)
+    except Exception:
+        lease.release()
+        raise
+    return task_id, True
@@ -0,0 +1,44 @@
+"""
+Shared outbound HTTP client.
+
+요청마다 ``httpx.AsyncClient`` 를 만들면 매번 TCP/TLS 핸드셰이크가 발생합니다.
+프로세스당 하나의 클라이언트를 공유해 커넥션 풀을 재사용하며, lifespan
+시작 시 생성하고 종료 시 닫습니다.
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공유 AsyncClient (닫혀 있으면 새로 생성)"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.http_client_timeout_seconds, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=settings.http_client_max_connections,
+                max_keepalive_connections=settings.http_client_max_keepalive,
+                keepalive_expiry=30.0,
+            ),
+        )
+        logger.debug("Shared HTTP client created")
+    return _client
+
+
+async def close_http_client() -> None:
+    """공유 AsyncClient 종료 (lifespan shutdown)"""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        if not client.is_closed:
+            await client.aclose()
+        logger.info("Shared HTTP client closed")
@@ -0,0 +1,306 @@
+"""
+Declarative MongoDB index registry.
+
+각 도메인은 ``app/domains/<domain>/indexes.py`` 에서 필요한 인덱스를
+``index_registry.register(...)`` 로 선언하고, 인덱스 생성은 애플리케이션
+시작(lifespan) 또는 배포 스크립트(``scripts/optimize_indexes.py``)에서
+한 번만 수행합니다. 요청 경로에서는 절대 실행하지 않습니다.
+
+적용은 멱등적입니다: 컬렉션별로 ``list_indexes`` 를 한 번 읽어 선언과
+비교한 뒤 누락된 인덱스만 ``create_indexes`` 한 번으로 생성합니다. 일괄 생성이
+실패하면 인덱스별 ``create_index`` 로 재시도하고 실패한 선언만 errors 에 남깁니다.
+키는 같지만 옵션이 다른 인덱스(mismatched)와 선언되지 않은 인덱스(extra)는
+자동으로 삭제하지 않고 drift 리포트로만 보고합니다.
+"""
+
+import importlib
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from pymongo import IndexModel, TEXT
+
+logger = logging.getLogger(__name__)
+
+# 인덱스를 선언하는 도메인 (app/domains/<name>/indexes.py)
+DOMAIN_INDEX_MODULES: Tuple[str, ...] = (
+    "users",
+    "alerts",
+    "announcements",
+    "businesses",
+    "contents",
+    "statistics",
+)
+
+# 옵션 비교 대상 (background 등 서버가 무시하는 옵션은 제외)
+_COMPARED_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "partialFilterExpression")
+_FLAG_OPTIONS = ("unique", "sparse")
+
+KeySpec = Union[str, Sequence[Tuple[str, Any]]]
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """Single index declaration"""
+
+    collection: str
+    keys: Tuple[Tuple[str, Any], ...]
+    name: str
+    options: Tuple[Tuple[str, Any], ...] = ()
+
+    @classmethod
+    def build(cls, collection: str, keys: KeySpec, name: Optional[str] = None, **options: Any) -> "IndexSpec":
+        if isinstance(keys, str):
+            keys = [(keys, 1)]
+        key_tuple = tuple((str(k), v) for k, v in keys)
+        if not key_tuple:
+            raise ValueError(f"Index on {collection} must declare at least one key")
+        return cls(
+            collection=collection,
+            keys=key_tuple,
+            name=name or _default_index_name(key_tuple),
+            options=tuple(sorted(options.items())),
+        )
+
+    @property
+    def is_text(self) -> bool:
+        return any(direction == TEXT for _, direction in self.keys)
+
+    @property
+    def option_map(self) -> Dict[str, Any]:
+        return dict(self.options)
+
+    def to_model(self) -> IndexModel:
+        return IndexModel(list(self.keys), name=self.name, **self.option_map)
+
+    def describe(self) -> Dict[str, Any]:
+        return {"name": self.name, "key": dict(self.keys), **self.option_map}
+
+
+def _default_index_name(keys: Iterable[Tuple[str, Any]]) -> str:
+    """MongoDB 기본 이름 규칙 (``field_direction`` 을 ``_`` 로 연결)"""
+    return "_".join(f"{k}_{v}" for k, v in keys)
+
+
+@dataclass
+class CollectionDrift:
+    """Drift of one collection against its declarations"""
+
+    collection: str
+    missing: List[Dict[str, Any]] = field(default_factory=list)
+    mismatched: List[Dict[str, Any]] = field(default_factory=list)
+    extra: List[str] = field(default_factory=list)
+    created: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def has_drift(self) -> bool:
+        return bool(self.missing or self.mismatched or self.extra or self.errors)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "collection": self.collection,
+            "missing": self.missing,
+            "mismatched": self.mismatched,
+            "extra": self.extra,
+            "created": self.created,
+            "errors": self.errors,
+        }
+
+
+@dataclass
+class IndexDriftReport:
+    """Result of comparing (and optionally applying) the registry"""
+
+    collections: List[CollectionDrift] = field(default_factory=list)
+
+    @property
+    def has_drift(self) -> bool:
+        return any(c.has_drift for c in self.collections)
+
+    @property
+    def created(self) -> List[str]:
+        return [f"{c.collection}.{name}" for c in self.collections for name in c.created]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "has_drift": self.has_drift,
+            "created": self.created,
+            "collections": [c.to_dict() for c in self.collections if c.has_drift or c.created],
+        }
+
+    def log(self, log: logging.Logger = logger) -> None:
+        if self.created:
+            log.info(f"MongoDB 인덱스 생성: {', '.join(self.created)}")
+        for drift in self.collections:
+            if drift.mismatched:
+                log.warning(f"[{drift.collection}] 옵션이 다른 인덱스: {drift.mismatched}")
+            if drift.missing:
+                log.warning(f"[{drift.collection}] 누락된 인덱스: {[m['name'] for m in drift.missing]}")
+            if drift.extra:
+                log.info(f"[{drift.collection}] 선언되지 않은 인덱스: {drift.extra}")
+            for error in drift.errors:
+                log.error(f"[{drift.collection}] 인덱스 적용 실패: {error}")
+
+
+class IndexRegistry:
+    """Per-domain index declarations"""
+
+    def __init__(self):
+        self._specs: Dict[str, List[IndexSpec]] = {}
+
+    def register(self, domain: str, *specs: IndexSpec) -> None:
+        """도메인 인덱스 선언 (같은 이름의 재등록은 교체)"""
+        declared = self._specs.setdefault(domain, [])
+        for spec in specs:
+            declared[:] = [
+                s for s in declared
+                if not (s.collection == spec.collection and s.name == spec.name)
+            ]
+            declared.append(spec)
+
+    def domains(self) -> List[str]:
+        return list(self._specs)
+
+    def specs(self, domains: Optional[Iterable[str]] = None) -> List[IndexSpec]:
+        selected = self._specs if domains is None else {d: self._specs.get(d, []) for d in domains}
+        return [spec for specs in selected.values() for spec in specs]
+
+    def by_collection(self, domains: Optional[Iterable[str]] = None) -> Dict[str, List[IndexSpec]]:
+        grouped: Dict[str, List[IndexSpec]] = {}
+        for spec in self.specs(domains):
+            grouped.setdefault(spec.collection, []).append(spec)
+        return grouped
+
+    def clear(self) -> None:
+        self._specs.clear()
+
+
+index_registry = IndexRegistry()
+_domains_loaded = False
+
+
+def load_domain_indexes(modules: Sequence[str] = DOMAIN_INDEX_MODULES) -> IndexRegistry:
+    """도메인 인덱스 선언 모듈 import (최초 1회)"""
+    global _domains_loaded
+    if not _domains_loaded:
+        for name in modules:
+            importlib.import_module(f"app.domains.{name}.indexes")
+        _domains_loaded = True
+    return index_registry
+
+
+def _matches(spec: IndexSpec, existing: Mapping[str, Any]) -> bool:
+    """선언과 기존 인덱스가 같은 키를 가지는지"""
+    key = dict(existing.get("key", {}))
+    if spec.is_text:
+        # 텍스트 인덱스는 서버에 {_fts: "text", _ftsx: 1} 로 저장됨
+        return "_fts" in key
+    return list(key.items()) == list(spec.keys)
+
+
+def _option_differences(spec: IndexSpec, existing: Mapping[str, Any]) -> Dict[str, Any]:
+    expected = spec.option_map
+    differences = {}
+    for option in _COMPARED_OPTIONS:
+        want, have = expected.get(option), existing.get(option)
+        if option in _FLAG_OPTIONS:
+            want, have = bool(want), bool(have)
+        if want != have:
+            differences[option] = {"expected": want, "actual": have}
+    if spec.is_text:
+        fields = {k for k, direction in spec.keys if direction == TEXT}
+        weights = set(existing.get("weights", {}))
+        if fields != weights:
+            differences["weights"] = {"expected": sorted(fields), "actual": sorted(weights)}
+    return differences
+
+
+def diff_collection(collection: str, specs: Sequence[IndexSpec], existing: Sequence[Mapping[str, Any]]) -> CollectionDrift:
+    """``list_indexes`` 결과와 선언 비교"""
+    drift = CollectionDrift(collection=collection)
+    claimed = set()
+    for spec in specs:
+        found = next((idx for idx in existing if idx.get("name") not in claimed and _matches(spec, idx)), None)
+        if found is None:
+            drift.missing.append(spec.describe())
+            continue
+        claimed.add(found.get("name"))
+        differences = _option_differences(spec, found)
+        if differences:
+            drift.mismatched.append({"name": found.get("name"), "declared": spec.name, "differences": differences})
+    drift.extra = [
+        idx["name"] for idx in existing
+        if idx.get("name") != "_id_" and idx.get("name") not in claimed
+    ]
+    return drift
+
+
+def _missing_specs(specs: Sequence[IndexSpec], drift: CollectionDrift) -> List[IndexSpec]:
+    missing = {m["name"] for m in drift.missing}
+    return [spec for spec in specs if spec.name in missing]
+
+
+def _mark_created(drift: CollectionDrift) -> None:
+    """생성된 인덱스를 missing 에서 제외 (실패한 선언만 남김)"""
+    created = set(drift.created)
+    drift.missing = [m for m in drift.missing if m["name"] not in created]
+
+
+def apply_indexes(db, domains: Optional[Iterable[str]] = None, create_missing: bool = True) -> IndexDriftReport:
+    """Compare the registry with ``db`` (pymongo) and create missing indexes.
+
+    ``create_missing=False`` 는 drift 확인만 수행합니다.
+    """
+    registry = load_domain_indexes()
+    report = IndexDriftReport()
+    for collection, specs in registry.by_collection(domains).items():
+        try:
+            existing = list(db[collection].list_indexes())
+        except Exception as e:
+            report.collections.append(CollectionDrift(collection=collection, errors=[str(e)]))
+            continue
+        drift = diff_collection(collection, specs, existing)
+        to_create = _missing_specs(specs, drift)
+        if create_missing and to_create:
+            try:
+                drift.created = db[collection].create_indexes([spec.to_model() for spec in to_create])
+            except Exception as e:
+                # 한 선언이 실패해도 나머지 인덱스는 생성되도록 개별 생성으로 재시도
+                logger.warning(f"[{collection}] create_indexes 실패, 개별 생성으로 재시도: {e}")
+                for spec in to_create:
+                    try:
+                        drift.created.append(db[collection].create_index(list(spec.keys), name=spec.name, **spec.option_map))
+                    except Exception as spec_error:
+                        drift.errors.append(f"{spec.name}: {spec_error}")
+            _mark_created(drift)
+        report.collections.append(drift)
+    return report
+
+
+async def apply_indexes_async(db, domains: Optional[Iterable[str]] = None, create_missing: bool = True) -> IndexDriftReport:
+    """``apply_indexes`` for a motor database"""
+    registry = load_domain_indexes()
+    report = IndexDriftReport()
+    for collection, specs in registry.by_collection(domains).items():
+        try:
+            existing = await db[collection].list_indexes().to_list(length=None)
+        except Exception as e:
+            report.collections.append(CollectionDrift(collection=collection, errors=[str(e)]))
+            continue
+        drift = diff_collection(collection, specs, existing)
+        to_create = _missing_specs(specs, drift)
+        if create_missing and to_create:
+            try:
+                drift.created = await db[collection].create_indexes([spec.to_model() for spec in to_create])
+            except Exception as e:
+                # 한 선언이 실패해도 나머지 인덱스는 생성되도록 개별 생성으로 재시도
+                logger.warning(f"[{collection}] create_indexes 실패, 개별 생성으로 재시도: {e}")
+                for spec in to_create:
+                    try:
+                        drift.created.append(await db[collection].create_index(list(spec.keys), name=spec.name, **spec.option_map))
+                    except Exception as spec_error:
+                        drift.errors.append(f"{spec.name}: {spec_error}")
+            _mark_created(drift)
+        report.collections.append(drift)
+    return report
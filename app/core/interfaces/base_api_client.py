@@ -24,6 +24,7 @@ from ...shared.exceptions.data_exceptions import (
     DataValidationError,
 )
 from ...core.request_context import get_request_id
+from ...core.timing import timed
 from .retry_strategies import (
     RetryStrategy,
     ExponentialBackoffStrategy,
@@ -176,13 +177,15 @@ class BaseAPIClient(ABC, Generic[T]):
             def _op() -> httpx.Response:
                 return self._make_request_with_retry(request_params)
             operation_name = f"{request_params.get('method', 'REQUEST')} {request_params.get('url', 'unknown')}"
-            response = self.retry_executor.execute_sync(_op, operation_name)
+            with timed("api"):
+                response = self.retry_executor.execute_sync(_op, operation_name)
             
             # Step 4: Post-process response (hook method)
             processed_response = self._postprocess_response(response)
             
             # Step 5: Transform to domain model (hook method)
-            return self._transform_response(processed_response)
+            with timed("api_parse"):
+                return self._transform_response(processed_response)
             
         except (DataParsingError, DataTransformationError, DataValidationError):
             raise
@@ -316,13 +319,15 @@ class BaseAPIClient(ABC, Generic[T]):
             request_params = self.auth_strategy.apply_auth(request_params)
             
             # Step 3: Make async HTTP request with retry logic
-            response = await self._make_async_request_with_retry(request_params)
+            with timed("api"):
+                response = await self._make_async_request_with_retry(request_params)
             
             # Step 4: Post-process response (hook method)
             processed_response = self._postprocess_response(response)
             
             # Step 5: Transform to domain model (hook method)
-            return self._transform_response(processed_response)
+            with timed("api_parse"):
+                return self._transform_response(processed_response)
             
         except (DataParsingError, DataTransformationError, DataValidationError):
             raise
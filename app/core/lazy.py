@@ -0,0 +1,74 @@
+"""
+Lazy import helpers.
+
+무거운 모듈(라우터, 이메일/Jinja 템플릿, OAuth 클라이언트 등)을 실제로
+활성화되었거나 처음 사용될 때까지 import 하지 않기 위한 도구입니다.
+"""
+
+import importlib
+import threading
+from typing import Any
+
+
+def import_string(path: str) -> Any:
+    """``"package.module:attr"`` (또는 ``"package.module"``) 를 import"""
+    module_path, _, attr = path.partition(":")
+    module = importlib.import_module(module_path)
+    if not attr:
+        return module
+    target: Any = module
+    for part in attr.split("."):
+        target = getattr(target, part)
+    return target
+
+
+class LazyObject:
+    """Proxy that imports ``path`` on first attribute access or call.
+
+    속성 설정/삭제도 대상 객체로 전달되므로 ``unittest.mock.patch`` 로
+    ``module.lazy_obj.method`` 를 패치하는 기존 코드도 그대로 동작합니다.
+    모듈만 캐시하고 속성은 매번 조회하므로 원본 모듈의 속성을 패치해도
+    프록시가 이전 객체를 붙잡고 있지 않습니다.
+    """
+
+    __slots__ = ("_lazy_path", "_lazy_module", "_lazy_lock")
+
+    def __init__(self, path: str):
+        object.__setattr__(self, "_lazy_path", path)
+        object.__setattr__(self, "_lazy_module", None)
+        object.__setattr__(self, "_lazy_lock", threading.Lock())
+
+    def _resolve(self) -> Any:
+        module_path, _, attr = object.__getattribute__(self, "_lazy_path").partition(":")
+        module = object.__getattribute__(self, "_lazy_module")
+        if module is None:
+            with object.__getattribute__(self, "_lazy_lock"):
+                module = object.__getattribute__(self, "_lazy_module")
+                if module is None:
+                    module = importlib.import_module(module_path)
+                    object.__setattr__(self, "_lazy_module", module)
+        target: Any = module
+        for part in filter(None, attr.split(".")):
+            target = getattr(target, part)
+        return target
+
+    @property
+    def is_loaded(self) -> bool:
+        return object.__getattribute__(self, "_lazy_module") is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._resolve(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        path = object.__getattribute__(self, "_lazy_path")
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyObject {path} ({state})>"
@@ -7,21 +7,26 @@ performance monitoring, and correlation tracking for improved observability.
 
 import logging
 import logging.handlers
-import json
+import atexit
+import copy
+import queue
+import random
 import sys
 import time
 import os
 import threading
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
 from enum import Enum
 from pathlib import Path
 from functools import wraps
 import traceback
 import uuid
 
+import orjson
+
 from .config import settings
+from .request_context import get_request_id
 
 class LogLevel(Enum):
     """Extended log levels"""
@@ -34,32 +39,6 @@ class LogLevel(Enum):
     SECURITY = 35  # Custom security level
 
 
-@dataclass
-class LogEntry:
-    """Structured log entry"""
-    timestamp: str
-    level: str
-    logger_name: str
-    message: str
-    correlation_id: Optional[str] = None
-    request_id: Optional[str] = None
-    user_id: Optional[str] = None
-    session_id: Optional[str] = None
-    component: Optional[str] = None
-    operation: Optional[str] = None
-    duration_ms: Optional[float] = None
-    status_code: Optional[int] = None
-    client_ip: Optional[str] = None
-    user_agent: Optional[str] = None
-    extra: Optional[Dict[str, Any]] = None
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        result = asdict(self)
-        # Remove None values to reduce log size
-        return {k: v for k, v in result.items() if v is not None}
-
-
 class CorrelationContext:
     """Thread-local correlation context"""
     
@@ -102,33 +81,55 @@ class CorrelationContext:
                 delattr(self._storage, attr)
 
 
+# Attributes every LogRecord carries; anything else was passed via ``extra``
+_RESERVED_RECORD_ATTRS = frozenset(
+    logging.LogRecord('', 0, '', 0, '', (), None).__dict__
+) | {'message', 'asctime', 'getMessage', '_log_context'}
+
+
+def _capture_context() -> Dict[str, Optional[str]]:
+    """Snapshot correlation/request context on the emitting thread"""
+    context = correlation_context.get_request_context()
+    context['correlation_id'] = correlation_context.get_correlation_id()
+    if not context.get('request_id'):
+        context['request_id'] = get_request_id()
+    return context
+
+
 class StructuredFormatter(logging.Formatter):
-    """JSON formatter for structured logging"""
+    """JSON formatter for structured logging (orjson, no intermediate dataclass)"""
     
     def __init__(self, include_extra: bool = True):
         super().__init__()
         self.include_extra = include_extra
-        self.correlation_context = correlation_context
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON"""
-        # Get correlation context
-        correlation_id = self.correlation_context.get_correlation_id()
-        request_context = self.correlation_context.get_request_context()
+        # Context is captured at enqueue time when records go through the queue
+        context = getattr(record, '_log_context', None) or _capture_context()
+        
+        entry: Dict[str, Any] = {
+            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger_name': record.name,
+            'message': record.getMessage(),
+        }
+        for key in ('correlation_id', 'request_id', 'user_id', 'session_id', 'client_ip', 'user_agent'):
+            value = context.get(key)
+            if value is not None:
+                entry[key] = value
         
         # Extract extra fields
         extra = {}
         if self.include_extra:
             extra = {
                 key: value for key, value in record.__dict__.items()
-                if key not in {
-                    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                    'filename', 'module', 'lineno', 'funcName', 'created',
-                    'msecs', 'relativeCreated', 'thread', 'threadName',
-                    'processName', 'process', 'getMessage', 'exc_info',
-                    'exc_text', 'stack_info', 'message'
-                }
+                if key not in _RESERVED_RECORD_ATTRS
             }
+        for key in ('component', 'operation', 'duration_ms', 'status_code'):
+            value = extra.pop(key, None)
+            if value is not None:
+                entry[key] = value
         
         # Handle exception info
         if record.exc_info:
@@ -137,27 +138,95 @@ class StructuredFormatter(logging.Formatter):
                 'message': str(record.exc_info[1]),
                 'traceback': traceback.format_exception(*record.exc_info)
             }
+        elif record.exc_text:
+            extra['exception'] = {'traceback': record.exc_text}
+        
+        if extra:
+            entry['extra'] = extra
+        
+        return orjson.dumps(entry, default=str).decode()
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that defers formatting to the listener thread
+    
+    The default ``prepare`` formats every record on the calling thread. Here we
+    only resolve the message, capture the request context and flatten exception
+    info, so the request path pays for a queue put and nothing else. Like the
+    stdlib ``prepare`` it works on a copy, leaving the caller's record (still
+    seen by other handlers) untouched.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record._log_context = _capture_context()
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = ''.join(traceback.format_exception(*record.exc_info))
+            record.exc_info = None
+        return record
+
+
+class LoggerRateLimitFilter(logging.Filter):
+    """Per-logger token bucket so a hot route cannot flood log I/O
+    
+    Records at ``exempt_level`` and above always pass. Suppressed records are
+    counted and reported on the next record that gets through.
+    """
+    
+    def __init__(self, rate_per_second: float, burst: int, exempt_level: int = logging.WARNING):
+        super().__init__()
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.exempt_level = exempt_level
+        # logger name -> [tokens, last_refill, suppressed]
+        self._buckets: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.exempt_level:
+            return True
         
-        # Create structured log entry
-        log_entry = LogEntry(
-            timestamp=datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
-            level=record.levelname,
-            logger_name=record.name,
-            message=record.getMessage(),
-            correlation_id=correlation_id,
-            request_id=request_context.get('request_id'),
-            user_id=request_context.get('user_id'),
-            session_id=request_context.get('session_id'),
-            client_ip=request_context.get('client_ip'),
-            user_agent=request_context.get('user_agent'),
-            component=extra.pop('component', None),
-            operation=extra.pop('operation', None),
-            duration_ms=extra.pop('duration_ms', None),
-            status_code=extra.pop('status_code', None),
-            extra=extra if extra else None
-        )
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(record.name)
+            if bucket is None:
+                bucket = self._buckets[record.name] = [float(self.burst), now, 0]
+            
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate_per_second)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                bucket[2] += 1
+                return False
+            
+            bucket[0] = tokens - 1
+            suppressed = int(bucket[2])
+            bucket[2] = 0
         
-        return json.dumps(log_entry.to_dict(), ensure_ascii=False, default=str)
+        if suppressed:
+            record.suppressed_records = suppressed
+        return True
+
+
+def log_span(logger: logging.Logger, operation: str, duration_ms: float,
+             sample_rate: Optional[float] = None, **fields: Any) -> None:
+    """Emit a sampled DEBUG span for per-stage timings
+    
+    Costs a level check when DEBUG is off and a random draw when the span is
+    not sampled, so it is safe to call on hot paths.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    rate = settings.log_span_sample_rate if sample_rate is None else sample_rate
+    if rate < 1.0 and random.random() >= rate:
+        return
+    logger.debug(
+        f"span {operation}",
+        extra={'operation': operation, 'duration_ms': round(duration_ms, 3), **fields}
+    )
 
 
 class MetricsCollector:
@@ -302,6 +371,7 @@ class LoggingManager:
         self.log_dir = Path("logs")
         self.metrics_collector = MetricsCollector()
         self.handlers: List[logging.Handler] = []
+        self.listener: Optional[logging.handlers.QueueListener] = None
     
     def setup_logging(self, 
                      log_level: str = "INFO",
@@ -310,8 +380,15 @@ class LoggingManager:
                      backup_count: int = 5,
                      enable_console: bool = True,
                      enable_file: bool = True,
-                     enable_json: bool = True) -> None:
-        """Setup comprehensive logging configuration"""
+                     enable_json: bool = True,
+                     enable_queue: bool = True,
+                     rate_limit_per_second: float = 0,
+                     rate_limit_burst: int = 100) -> None:
+        """Setup comprehensive logging configuration
+        
+        With ``enable_queue`` the root logger only gets a ``ContextQueueHandler``;
+        formatting and file/console I/O run on a ``QueueListener`` thread.
+        """
         
         if self.configured:
             return
@@ -326,6 +403,7 @@ class LoggingManager:
         
         # Clear existing handlers
         root_logger.handlers.clear()
+        sinks: List[logging.Handler] = []
         
         # Console handler
         if enable_console:
@@ -338,7 +416,7 @@ class LoggingManager:
                         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
                     )
                 )
-            root_logger.addHandler(console_handler)
+            sinks.append(console_handler)
             self.handlers.append(console_handler)
         
         # File handlers
@@ -351,7 +429,7 @@ class LoggingManager:
                 encoding='utf-8'
             )
             app_handler.setFormatter(StructuredFormatter())
-            root_logger.addHandler(app_handler)
+            sinks.append(app_handler)
             self.handlers.append(app_handler)
             
             # Error log
@@ -363,7 +441,7 @@ class LoggingManager:
             )
             error_handler.setLevel(logging.ERROR)
             error_handler.setFormatter(StructuredFormatter())
-            root_logger.addHandler(error_handler)
+            sinks.append(error_handler)
             self.handlers.append(error_handler)
             
             # Security log
@@ -375,7 +453,7 @@ class LoggingManager:
             )
             security_handler.addFilter(lambda record: record.levelname == 'SECURITY')
             security_handler.setFormatter(StructuredFormatter())
-            root_logger.addHandler(security_handler)
+            sinks.append(security_handler)
             self.handlers.append(security_handler)
             
             # Access log (for HTTP requests)
@@ -387,12 +465,28 @@ class LoggingManager:
             )
             access_handler.addFilter(lambda record: hasattr(record, 'request_id'))
             access_handler.setFormatter(StructuredFormatter())
-            root_logger.addHandler(access_handler)
+            sinks.append(access_handler)
             self.handlers.append(access_handler)
         
         # Add custom security level
         logging.addLevelName(LogLevel.SECURITY.value, 'SECURITY')
         
+        if enable_queue:
+            queue_handler = ContextQueueHandler(queue.Queue(-1))
+            self.listener = logging.handlers.QueueListener(
+                queue_handler.queue, *sinks, respect_handler_level=True
+            )
+            self.listener.start()
+            atexit.register(self.close)
+            entry_handlers: List[logging.Handler] = [queue_handler]
+        else:
+            entry_handlers = sinks
+        
+        for handler in entry_handlers:
+            if rate_limit_per_second > 0:
+                handler.addFilter(LoggerRateLimitFilter(rate_limit_per_second, rate_limit_burst))
+            root_logger.addHandler(handler)
+        
         self.configured = True
         logging.info("Logging system initialized")
     
@@ -413,7 +507,10 @@ class LoggingManager:
         return self.metrics_collector.get_metrics()
     
     def close(self):
-        """Close all handlers"""
+        """Stop the queue listener (flushing pending records) and close all handlers"""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
         for handler in self.handlers:
             handler.close()
         self.handlers.clear()
@@ -490,7 +587,10 @@ def setup_logging():
         log_dir="logs",
         enable_console=settings.debug,
         enable_file=True,
-        enable_json=True
+        enable_json=True,
+        enable_queue=settings.log_queue_enabled,
+        rate_limit_per_second=settings.log_rate_limit_per_second,
+        rate_limit_burst=settings.log_rate_limit_burst
     )
 
 # Convenience functions
@@ -1,9 +1,12 @@
 from typing import Optional
 import asyncio
-from typing import Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 from fastapi import FastAPI
 
+if TYPE_CHECKING:  # pragma: no cover
+    from app.core.task_queues import QueueStats
+
 try:
     from prometheus_fastapi_instrumentator import Instrumentator
     from prometheus_fastapi_instrumentator.metrics import (
@@ -16,9 +19,9 @@ except Exception:  # pragma: no cover - optional dependency
     default = request_size = response_size = None  # type: ignore
 
 try:
-    from prometheus_client import Gauge  # type: ignore
+    from prometheus_client import Gauge, Histogram  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
-    Gauge = None  # type: ignore
+    Gauge = Histogram = None  # type: ignore
 
 
 def init_metrics(app: FastAPI, enabled: bool = True, endpoint: str = "/metrics") -> Optional[object]:
@@ -34,7 +37,7 @@ def init_metrics(app: FastAPI, enabled: bool = True, endpoint: str = "/metrics")
             should_group_status_codes=True,
             should_ignore_untemplated=True,
             should_respect_env_var=True,
-            excluded_handlers={"/health", "/docs", "/redoc", "/openapi.json"},
+            excluded_handlers={"/health", "/health/ready", "/docs", "/redoc", "/openapi.json"},
             env_var_name="ENABLE_METRICS",
         )
         .add(default())
@@ -46,6 +49,33 @@ def init_metrics(app: FastAPI, enabled: bool = True, endpoint: str = "/metrics")
     return instr
 
 
+# -----------------------------
+# Per-request stage timings
+# -----------------------------
+
+if Histogram is not None:
+    REQUEST_STAGE_HISTOGRAM = Histogram(
+        "korea_request_stage_duration_seconds",
+        "Time spent per request stage (db, cache_get, cache_set, api, serialize, ...)",
+        ["handler", "stage"],
+        buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+else:  # pragma: no cover
+    REQUEST_STAGE_HISTOGRAM = None  # type: ignore
+
+
+def observe_request_stages(handler: str, stages: Dict[str, float]) -> None:
+    """Feed one request's stage totals (milliseconds) into the stage histogram.
+
+    ``handler`` must be the route template, never the raw path, to keep label
+    cardinality bounded.
+    """
+    if REQUEST_STAGE_HISTOGRAM is None:
+        return
+    for stage, duration_ms in stages.items():
+        REQUEST_STAGE_HISTOGRAM.labels(handler=handler, stage=stage).observe(duration_ms / 1000)
+
+
 # -----------------------------
 # Celery runtime metrics (poll)
 # -----------------------------
@@ -68,34 +98,85 @@ if Gauge is not None:
         "korea_celery_queues_total",
         "Total configured Celery queues",
     )
+    # Per-queue gauges; label cardinality is bounded by the configured queue topology
+    CELERY_QUEUE_LENGTH_GAUGE = Gauge(
+        "korea_celery_queue_length",
+        "Messages waiting in a Celery queue",
+        ["queue", "workload"],
+    )
+    CELERY_QUEUE_LAG_GAUGE = Gauge(
+        "korea_celery_queue_lag_seconds",
+        "Age of the oldest waiting message in a Celery queue",
+        ["queue", "workload"],
+    )
+    CELERY_QUEUE_THROUGHPUT_GAUGE = Gauge(
+        "korea_celery_queue_throughput_per_minute",
+        "Tasks completed per minute from a Celery queue (recent window)",
+        ["queue", "workload"],
+    )
 else:  # pragma: no cover
     CELERY_WORKERS_GAUGE = None  # type: ignore
     CELERY_ACTIVE_TASKS_GAUGE = None  # type: ignore
     CELERY_SCHEDULED_TASKS_GAUGE = None  # type: ignore
     CELERY_QUEUES_GAUGE = None  # type: ignore
+    CELERY_QUEUE_LENGTH_GAUGE = None  # type: ignore
+    CELERY_QUEUE_LAG_GAUGE = None  # type: ignore
+    CELERY_QUEUE_THROUGHPUT_GAUGE = None  # type: ignore
+
+
+def _inspect_celery_runtime() -> Tuple[int, int, int, int]:
+    """Blocking broker round trips for Celery runtime stats."""
+    from app.core.celery_config import celery_app, get_queue_info  # local import to avoid cycles
+
+    inspect = celery_app.control.inspect(timeout=10)
+    active = inspect.active() or {}
+    scheduled = inspect.scheduled() or {}
+
+    workers = len(active)
+    active_tasks = sum(len(tasks) for tasks in active.values()) if active else 0
+    scheduled_tasks = sum(len(tasks) for tasks in scheduled.values()) if scheduled else 0
+    queue_info = get_queue_info() or {}
+    queues = int(queue_info.get("total_queues", 0))
+
+    return workers, active_tasks, scheduled_tasks, queues
 
 
 async def _collect_celery_runtime() -> Tuple[int, int, int, int]:
     """Collect basic Celery runtime stats.
 
+    inspect() blocks on broker replies, so it runs in a worker thread to keep
+    the event loop responsive.
+
     Returns: (workers, active_tasks, scheduled_tasks, queues)
     """
     try:
-        from app.core.celery_config import celery_app, get_queue_info  # local import to avoid cycles
+        return await asyncio.to_thread(_inspect_celery_runtime)
+    except Exception:
+        return 0, 0, 0, 0
 
-        inspect = celery_app.control.inspect(timeout=10)
-        active = inspect.active() or {}
-        scheduled = inspect.scheduled() or {}
 
-        workers = len(active)
-        active_tasks = sum(len(tasks) for tasks in active.values()) if active else 0
-        scheduled_tasks = sum(len(tasks) for tasks in scheduled.values()) if scheduled else 0
-        queue_info = get_queue_info() or {}
-        queues = int(queue_info.get("total_queues", 0))
+def _read_queue_stats() -> List["QueueStats"]:
+    """Blocking broker reads for per-queue length / lag / throughput."""
+    from app.core.task_queues import collect_queue_stats, get_stats_client  # local import to avoid cycles
 
-        return workers, active_tasks, scheduled_tasks, queues
+    client = get_stats_client()
+    return collect_queue_stats(client) if client is not None else []
+
+
+async def collect_queue_stats_async() -> List["QueueStats"]:
+    """Per-queue stats off the event loop (empty when the broker is unreachable)."""
+    try:
+        return await asyncio.to_thread(_read_queue_stats)
     except Exception:
-        return 0, 0, 0, 0
+        return []
+
+
+def _set_queue_gauges(stats: List["QueueStats"]) -> None:
+    for queue in stats:
+        labels = {"queue": queue.name, "workload": queue.workload}
+        CELERY_QUEUE_LENGTH_GAUGE.labels(**labels).set(queue.length)
+        CELERY_QUEUE_LAG_GAUGE.labels(**labels).set(queue.lag_seconds)
+        CELERY_QUEUE_THROUGHPUT_GAUGE.labels(**labels).set(queue.throughput_per_minute)
 
 
 async def poll_celery_metrics(stop_event: asyncio.Event, interval_seconds: int = 15) -> None:
@@ -104,12 +185,15 @@ async def poll_celery_metrics(stop_event: asyncio.Event, interval_seconds: int =
         return
 
     while not stop_event.is_set():
-        workers, active_tasks, scheduled_tasks, queues = await _collect_celery_runtime()
+        (workers, active_tasks, scheduled_tasks, queues), queue_stats = await asyncio.gather(
+            _collect_celery_runtime(), collect_queue_stats_async()
+        )
         try:
             CELERY_WORKERS_GAUGE.set(workers)
             CELERY_ACTIVE_TASKS_GAUGE.set(active_tasks)
             CELERY_SCHEDULED_TASKS_GAUGE.set(scheduled_tasks)
             CELERY_QUEUES_GAUGE.set(queues)
+            _set_queue_gauges(queue_stats)
         except Exception:
             # Best-effort metrics; ignore update errors
             pass
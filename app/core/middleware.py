@@ -15,7 +15,11 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 from .rate_limit import RedisRateLimitMiddleware  # optional redis-backed limiter
 from .request_context import set_request_id, clear_request_context
+from .timing import start_request_timing, reset_request_timing, get_request_timings
+from .metrics import observe_request_stages
+from .logging_config import log_span
 from .config import settings
+from .container import get_container
 
 from ..shared.exceptions import DataValidationError, KoreanPublicAPIError
 from ..shared.schemas import ErrorResponse
@@ -40,8 +44,9 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
         # 요청 시작 시간 기록
         start_time = time.time()
         
-        # 요청 로깅
-        logger.info(f"Request: {request.method} {request.url.path}")
+        # 요청당 INFO 로그는 완료 시 1줄만 남김 (시작 로그는 DEBUG)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Request: {request.method} {request.url.path}")
         
         try:
             # 요청 본문은 소비하지 않고 메타만 기록
@@ -187,6 +192,16 @@ class ResponseValidationMiddleware(BaseHTTPMiddleware):
         if request.url.path in ["/docs", "/redoc", "/openapi.json"]:
             return response
         
+        # 이미 압축된 본문 (사전 압축 캐시 응답) 은 JSON 으로 읽을 수 없으므로 그대로 전달
+        if "content-encoding" in response.headers:
+            return response
+        
+        # 스트리밍 응답 (SSE 등) 은 끝까지 읽으면 버퍼링되므로 그대로 전달
+        # (Content-Length 가 없으면 StreamingResponse)
+        content_type = response.headers.get("content-type", "")
+        if content_type.startswith("text/event-stream") or "content-length" not in response.headers:
+            return response
+        
         # 응답 본문 읽기
         if hasattr(response, "body_iterator"):
             body = b""
@@ -227,7 +242,7 @@ class ResponseValidationMiddleware(BaseHTTPMiddleware):
                     media_type=response.media_type
                 )
                 
-            except json.JSONDecodeError:
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 # JSON이 아닌 응답은 그대로 반환
                 return Response(
                     content=body,
@@ -362,6 +377,43 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class RateLimitBackendMiddleware:
+    """settings.rate_limit_backend 에 따라 Redis/메모리 레이트리밋 중 하나로 위임
+
+    백엔드 선택(Redis 연결 확인)은 import 시점이 아니라 미들웨어 스택이
+    만들어지는 애플리케이션 시작 시 한 번 수행됩니다.
+    auto: Redis 연결 가능하면 분산 레이트리밋, 아니면 프로세스 메모리 레이트리밋
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        backend: str = "auto",
+        redis_url: Optional[str] = None,
+        calls_per_minute: int = 60,
+        calls_per_hour: int = 1000,
+    ):
+        self.backend = "memory"
+        delegate: Optional[ASGIApp] = None
+        if backend in ("auto", "redis") and redis_url:
+            redis_limiter = RedisRateLimitMiddleware(
+                app,
+                redis_url=redis_url,
+                calls_per_minute=calls_per_minute,
+                calls_per_hour=calls_per_hour,
+            )
+            if redis_limiter.client is not None or backend == "redis":
+                delegate = redis_limiter
+                self.backend = "redis"
+        if delegate is None:
+            delegate = RateLimitMiddleware(app, calls_per_minute=calls_per_minute, calls_per_hour=calls_per_hour)
+        self.delegate = delegate
+        logger.info(f"Rate limit backend: {self.backend}")
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.delegate(scope, receive, send)
+
+
 class HealthCheckMiddleware(BaseHTTPMiddleware):
     """헬스체크 미들웨어"""
     
@@ -400,4 +452,62 @@ class RequestIdMiddleware(BaseHTTPMiddleware):
         # 응답 헤더에 반영
         response.headers[self.HEADER_NAME] = request_id
         clear_request_context()
-        return response
\ No newline at end of file
+        return response
+
+
+class ServerTimingMiddleware(BaseHTTPMiddleware):
+    """요청 단위 타이밍 수집기를 바인딩하고 Server-Timing 헤더/스테이지 히스토그램으로 내보내는 미들웨어
+
+    - 저장소(MongoDB 커맨드), 캐시, 외부 API, 직렬화 구간이 contextvar 수집기에 span을 기록
+    - 응답 시 `Server-Timing` 헤더 추가 (settings.server_timing_enabled)
+    - 라우트 템플릿 단위로 Prometheus 히스토그램에 단계별 시간 기록
+    """
+
+    HEADER_NAME = "Server-Timing"
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        token = start_request_timing()
+        try:
+            response = await call_next(request)
+            timings = get_request_timings()
+
+            stages = timings.stages()
+            route = request.scope.get("route")
+            handler = getattr(route, "path", None) or "unmatched"
+            observe_request_stages(handler, stages)
+
+            if settings.server_timing_enabled:
+                response.headers[self.HEADER_NAME] = timings.server_timing_header()
+
+            if stages:
+                log_span(
+                    logger, handler, timings.elapsed_ms(),
+                    **{f"{stage}_ms": round(duration, 3) for stage, duration in stages.items()}
+                )
+            return response
+        finally:
+            reset_request_timing(token)
+
+
+
+class DIScopeMiddleware:
+    """DI 컨테이너의 요청 스코프를 요청마다 열고 닫는 pure ASGI 미들웨어
+
+    스코프는 contextvar 로 전파되므로 스레드풀에서 실행되는 동기 의존성과
+    BaseHTTPMiddleware 하위 태스크에서도 같은 요청의 scoped 인스턴스를 공유합니다.
+    스트리밍 응답이 끝난 뒤에 스코프를 닫습니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        container = get_container()
+        token = container.begin_scope()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            container.end_scope(token)
@@ -0,0 +1,138 @@
+"""
+Per-user preference cache shared by the users and alerts domains.
+
+``user_settings`` (users) 와 ``notification_preferences`` (alerts) 문서는
+요청마다, 그리고 알림 판단마다 한 번씩 읽히지만 거의 바뀌지 않습니다.
+프로세스 단위 TTL/LRU 캐시에 ``(namespace, user_id)`` 로 보관하고,
+저장소의 쓰기 경로에서 write-through 로 갱신합니다.
+
+- 문서가 없는 사용자도 캐시합니다 (negative caching, ``None``).
+- 읽을 때마다 복사본을 돌려주므로 호출자가 결과를 수정해도 캐시는 안전합니다.
+- 다른 워커 프로세스는 TTL 내에 수렴합니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .config import settings
+
+CacheKey = Tuple[str, Hashable]
+
+_MISSING = object()
+
+
+def copy_value(value: Any) -> Any:
+    """dict/list 만 재귀적으로 복사 (datetime 등 불변 값은 공유)"""
+    if isinstance(value, dict):
+        return {k: copy_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_value(v) for v in value]
+    return value
+
+
+class PreferenceCache:
+    """Bounded TTL/LRU cache of per-user preference documents"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 20000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def _lookup(self, key: CacheKey, now: float) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if now > expires_at:
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def get(self, namespace: str, user_id: Any) -> Tuple[bool, Any]:
+        """Returns ``(found, value)``; ``value`` may be ``None`` for a cached miss"""
+        if not self.enabled or user_id is None:
+            return False, None
+        with self._lock:
+            value = self._lookup((namespace, user_id), time.monotonic())
+        if value is _MISSING:
+            return False, None
+        return True, copy_value(value)
+
+    def get_many(self, namespace: str, user_ids: Iterable[Any]) -> Tuple[Dict[Any, Any], List[Any]]:
+        """Returns ``(hits, misses)`` - misses keep the input order, without duplicates"""
+        hits: Dict[Any, Any] = {}
+        misses: List[Any] = []
+        seen = set()
+        unique = [uid for uid in user_ids if uid is not None and not (uid in seen or seen.add(uid))]
+        if not self.enabled:
+            return hits, unique
+        now = time.monotonic()
+        with self._lock:
+            for user_id in unique:
+                value = self._lookup((namespace, user_id), now)
+                if value is _MISSING:
+                    misses.append(user_id)
+                else:
+                    hits[user_id] = value
+        return {uid: copy_value(v) for uid, v in hits.items()}, misses
+
+    def set(self, namespace: str, user_id: Any, value: Optional[Any]) -> None:
+        if not self.enabled or user_id is None:
+            return
+        key = (namespace, user_id)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, copy_value(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def set_many(self, namespace: str, values: Dict[Any, Optional[Any]]) -> None:
+        for user_id, value in values.items():
+            self.set(namespace, user_id, value)
+
+    def merge(self, namespace: str, user_id: Any, changes: Dict[str, Any]) -> bool:
+        """Write-through: 캐시된 문서에 변경분을 반영 (캐시에 없거나 ``None`` 이면 무효화)"""
+        if not self.enabled or user_id is None:
+            return False
+        key = (namespace, user_id)
+        with self._lock:
+            current = self._lookup(key, time.monotonic())
+            if not isinstance(current, dict):
+                self._entries.pop(key, None)
+                return False
+            updated = dict(current)
+            updated.update(copy_value(changes))
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, updated)
+            return True
+
+    def invalidate(self, user_id: Any, namespace: Optional[str] = None) -> None:
+        """``namespace`` 가 없으면 해당 사용자의 모든 네임스페이스를 제거"""
+        if user_id is None:
+            return
+        with self._lock:
+            if namespace is not None:
+                self._entries.pop((namespace, user_id), None)
+                return
+            for key in [k for k in self._entries if k[1] == user_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+preference_cache = PreferenceCache(
+    settings.preference_cache_ttl_seconds,
+    max_entries=settings.preference_cache_max_entries,
+)
@@ -37,7 +37,7 @@ class RedisRateLimitMiddleware(BaseHTTPMiddleware):
         self.client: Optional["redis.Redis"] = None
         if redis is not None:
             try:
-                self.client = redis.from_url(redis_url, decode_responses=True)
+                self.client = redis.from_url(redis_url, decode_responses=True, socket_connect_timeout=2)
                 # basic ping test
                 self.client.ping()
                 logger.info("RedisRateLimitMiddleware connected to Redis")
@@ -0,0 +1,99 @@
+"""
+Settings-driven router registry.
+
+라우터 모듈은 ``settings.enabled_routers`` 에 포함된 경우에만 import 됩니다.
+비활성화된 도메인(예: 작업 관리 API → Celery 앱, 분류 체계 스키마)은
+API 프로세스의 import 그래프에서 완전히 빠집니다.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Tuple
+
+from fastapi import APIRouter, FastAPI
+
+from .lazy import import_string
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    """Router declaration
+
+    ``target`` 은 ``"module:attr"`` 형식이며 attr 이 APIRouter 가 아니면
+    인자 없이 호출해 라우터를 얻습니다(팩토리). ``feature_flag`` 는 추가로
+    True 여야 하는 설정 이름입니다. ``optional`` 라우터는 로드 실패 시
+    경고만 남기고 건너뜁니다.
+    """
+
+    name: str
+    target: str
+    prefix: str = "/api/v1"
+    feature_flag: Optional[str] = None
+    optional: bool = False
+
+    def load(self) -> APIRouter:
+        router: Any = import_string(self.target)
+        if not isinstance(router, APIRouter):
+            router = router()
+        return router
+
+
+# 등록 순서 = 기존 include 순서 (경로 매칭 우선순위 유지)
+ROUTERS: Tuple[RouterSpec, ...] = (
+    RouterSpec("announcements", "app.domains.announcements.router:router"),
+    RouterSpec("businesses", "app.domains.businesses.router:router"),
+    RouterSpec("contents", "app.domains.contents.router:router"),
+    RouterSpec("users", "app.domains.users.router:router"),
+    RouterSpec("data_requests", "app.domains.data_requests.router:router"),
+    RouterSpec("classification", "app.shared.classification.router:router"),
+    RouterSpec("keys", "app.domains.keys.router:router"),
+    RouterSpec("usage", "app.domains.usage.router:router"),
+    RouterSpec("task_management", "app.scheduler.task_management_api:get_task_management_router", prefix=""),
+    RouterSpec("data_sources", "app.domains.data_sources.router:router"),
+    RouterSpec(
+        "alerts", "app.domains.alerts.versioned_router:get_v1_router",
+        prefix="/api", feature_flag="alerts_enabled", optional=True,
+    ),
+    RouterSpec(
+        "versioned_announcements",
+        "app.domains.announcements.versioned_router:create_versioned_announcement_router",
+        prefix="/api", optional=True,
+    ),
+    RouterSpec(
+        "versioned_businesses",
+        "app.domains.businesses.versioned_router:create_versioned_business_router",
+        prefix="/api", optional=True,
+    ),
+)
+
+
+def enabled_router_specs(settings: Any, specs: Iterable[RouterSpec] = ROUTERS) -> List[RouterSpec]:
+    """설정에서 활성화된 라우터 선언 (등록 순서 유지)"""
+    enabled = set(settings.enabled_routers)
+    return [
+        spec for spec in specs
+        if spec.name in enabled and (spec.feature_flag is None or getattr(settings, spec.feature_flag, False))
+    ]
+
+
+def include_enabled_routers(app: FastAPI, settings: Any, specs: Iterable[RouterSpec] = ROUTERS) -> List[str]:
+    """활성화된 라우터만 import 하여 등록하고 등록된 이름 목록을 반환"""
+    specs = list(specs)
+    unknown = set(settings.enabled_routers) - {spec.name for spec in specs}
+    if unknown:
+        logger.warning(f"Unknown routers in enabled_routers: {sorted(unknown)}")
+
+    mounted = []
+    for spec in enabled_router_specs(settings, specs):
+        try:
+            app.include_router(spec.load(), prefix=spec.prefix)
+        except Exception as e:
+            if not spec.optional:
+                raise
+            logger.warning(f"Failed to mount {spec.name} router: {e}")
+            continue
+        mounted.append(spec.name)
+    logger.info(f"Routers mounted: {', '.join(mounted)}")
+    return mounted
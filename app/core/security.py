@@ -5,44 +5,195 @@ Provides JWT token generation/verification and password hashing utilities
 for both local and OAuth authentication flows.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+import asyncio
 import secrets
 import time
 import threading
 import json
+from collections import OrderedDict
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from passlib.hash import bcrypt
 import redis
 import logging
 from .config import settings
+from .timing import timed
+
+try:
+    import redis.asyncio as aioredis  # type: ignore
+except Exception:  # pragma: no cover - optional in older redis-py
+    aioredis = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
-# Thread-safe in-memory fallback store for OAuth state when Redis is unavailable
-_oauth_state_memory_store: dict[str, dict[str, Any]] = {}
-_oauth_state_memory_expiry: dict[str, float] = {}
-_oauth_memory_lock = threading.RLock()
+class _BoundedTTLStore:
+    """
+    Thread-safe use-once TTL map with a hard size cap.
+    
+    OAuth state 는 모두 같은 TTL 로 저장되므로 삽입 순서가 곧 만료 순서입니다.
+    저장할 때마다 가장 오래된 쪽에서 만료되었거나 상한을 넘는 항목만 제거하므로
+    전체 스캔 없이 O(1) (amortized) 로 크기가 유지됩니다.
+    """
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.values: "OrderedDict[str, Any]" = OrderedDict()
+        self.expiry: Dict[str, float] = {}
+        self.lock = threading.RLock()
+    
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        now = time.time()
+        with self.lock:
+            self.values.pop(key, None)
+            self.values[key] = value
+            self.expiry[key] = now + float(ttl_seconds)
+            self._evict(now)
+    
+    def pop(self, key: str) -> Tuple[bool, Any]:
+        """(found_and_fresh, value) - 만료 여부와 관계없이 항목은 제거"""
+        with self.lock:
+            exp = self.expiry.pop(key, None)
+            value = self.values.pop(key, None)
+        if exp is None or time.time() > exp:
+            return False, None
+        return True, value
+    
+    def _evict(self, now: float) -> int:
+        evicted = 0
+        while self.values:
+            oldest = next(iter(self.values))
+            if len(self.values) <= self.max_entries and self.expiry.get(oldest, 0) > now:
+                break
+            self.values.popitem(last=False)
+            self.expiry.pop(oldest, None)
+            evicted += 1
+        return evicted
+    
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self.lock:
+            expired = [key for key, exp in self.expiry.items() if now > exp]
+            for key in expired:
+                self.values.pop(key, None)
+                self.expiry.pop(key, None)
+        return len(expired)
+    
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+# Bounded in-memory fallback store for OAuth state when Redis is unavailable
+_oauth_state_memory = _BoundedTTLStore(settings.oauth_state_memory_max_entries)
+_oauth_state_memory_store = _oauth_state_memory.values
+_oauth_state_memory_expiry = _oauth_state_memory.expiry
+_oauth_memory_lock = _oauth_state_memory.lock
+
 
-# Cleanup task for memory store
 def _cleanup_expired_oauth_states():
     """Clean up expired OAuth states from memory store"""
-    current_time = time.time()
-    with _oauth_memory_lock:
-        expired_keys = [
-            key for key, exp_time in _oauth_state_memory_expiry.items() 
-            if current_time > exp_time
-        ]
-        for key in expired_keys:
-            _oauth_state_memory_store.pop(key, None)
-            _oauth_state_memory_expiry.pop(key, None)
-        
-        if expired_keys:
-            logger.info(f"Cleaned up {len(expired_keys)} expired OAuth states from memory")
+    removed = _oauth_state_memory.purge_expired()
+    if removed:
+        logger.info(f"Cleaned up {removed} expired OAuth states from memory")
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# min/max rounds를 기본값과 같게 두어, 비용(rounds)을 바꾸면 기존 해시가
+# needs_update 대상이 되고 로그인 시 투명하게 재해싱됨
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.bcrypt_rounds,
+    bcrypt__min_rounds=settings.bcrypt_rounds,
+    bcrypt__max_rounds=settings.bcrypt_rounds
+)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the password hashing queue is full"""
+    
+    def __init__(self, retry_after: int):
+        super().__init__("Password hashing capacity exceeded")
+        self.retry_after = retry_after
+
+
+class PasswordHashPool:
+    """
+    Bounded worker pool for bcrypt hashing/verification.
+    
+    bcrypt takes ~100-300ms of CPU per call; running it inline in async
+    handlers stalls the event loop. Work goes to a small dedicated thread pool
+    (bcrypt releases the GIL) and the number of queued + running operations is
+    capped so a login burst is shed with PasswordHasherBusy instead of piling
+    up behind the workers.
+    """
+    
+    def __init__(
+        self,
+        context: CryptContext,
+        max_workers: int,
+        max_pending: int,
+        retry_after: int = 1
+    ):
+        self.context = context
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def pending(self) -> int:
+        return self._pending
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="password-hash"
+                    )
+        return self._executor
+    
+    async def run(self, func, *args):
+        """Run a hashing callable in the pool, shedding load when saturated"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise PasswordHasherBusy(self.retry_after)
+            self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            with timed("password_hash"):
+                return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+    
+    async def hash(self, password: str) -> str:
+        return await self.run(self.context.hash, password)
+    
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self.run(self.context.verify, password, hashed_password)
+    
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify and return a replacement hash if the stored one is outdated"""
+        return await self.run(self.context.verify_and_update, password, hashed_password)
+    
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hash_pool = PasswordHashPool(
+    pwd_context,
+    max_workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+    retry_after=settings.password_hash_retry_after_seconds
+)
 
 # Redis client for token blacklist (tuned for fast-fail if Redis is down)
 redis_client = redis.from_url(
@@ -56,6 +207,79 @@ redis_client = redis.from_url(
 )
 
 
+# Async Redis client for the per-request blacklist check (created lazily on
+# first use so it binds to the serving event loop)
+_async_redis_client = None
+
+
+def get_async_redis_client():
+    """Shared async Redis client for authentication lookups"""
+    global _async_redis_client
+    if _async_redis_client is None:
+        if aioredis is None:
+            raise RuntimeError("redis.asyncio is not available")
+        _async_redis_client = aioredis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_connect_timeout=2.0,
+            socket_timeout=2.0,
+            retry_on_timeout=True,
+            max_connections=20,
+            health_check_interval=30
+        )
+    return _async_redis_client
+
+
+class _BlacklistNegativeCache:
+    """
+    Short-lived local cache of token IDs known NOT to be blacklisted.
+    
+    Saves a Redis round trip for repeated requests with the same token.
+    The TTL bounds how long another process's logout can go unnoticed here;
+    logouts in this process evict the entry immediately.
+    """
+    
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def contains(self, token_id: str) -> bool:
+        if self.ttl_seconds <= 0:
+            return False
+        expires_at = self._entries.get(token_id)
+        if expires_at is None:
+            return False
+        if time.monotonic() > expires_at:
+            with self._lock:
+                self._entries.pop(token_id, None)
+            return False
+        return True
+    
+    def add(self, token_id: str) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                now = time.monotonic()
+                self._entries = {k: v for k, v in self._entries.items() if v > now}
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+            self._entries[token_id] = time.monotonic() + self.ttl_seconds
+    
+    def discard(self, token_id: str) -> None:
+        with self._lock:
+            self._entries.pop(token_id, None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+blacklist_negative_cache = _BlacklistNegativeCache(settings.auth_blacklist_negative_ttl_seconds)
+
+
 class SecurityManager:
     """Centralized security management for authentication"""
     
@@ -75,6 +299,22 @@ class SecurityManager:
         """Verify a password against its hash"""
         return pwd_context.verify(plain_password, hashed_password)
     
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password in the bounded worker pool"""
+        return await password_hash_pool.hash(password)
+    
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password in the bounded worker pool"""
+        return await password_hash_pool.verify(plain_password, hashed_password)
+    
+    async def verify_and_update_password_async(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verify a password; also returns a new hash when cost parameters changed"""
+        return await password_hash_pool.verify_and_update(plain_password, hashed_password)
+    
     def create_access_token(
         self, 
         data: Dict[str, Any], 
@@ -123,18 +363,35 @@ class SecurityManager:
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
     
-    def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
-        """Verify and decode a JWT token"""
+    def decode_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """Decode and validate a JWT once (signature/exp), without blacklist lookup"""
         try:
-            # Check if token is blacklisted
-            if self.is_token_blacklisted(token):
-                return None
-            
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
+            return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
         except JWTError:
             return None
     
+    def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """Verify and decode a JWT token"""
+        payload = self.decode_token(token)
+        if payload is None:
+            return None
+        # Check if token is blacklisted (reuses the decoded payload)
+        if self._is_blacklisted(payload.get('jti', token)):
+            return None
+        return payload
+    
+    async def verify_token_async(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Request-path token verification: decode once, then check the blacklist
+        through the async Redis client backed by the local negative cache
+        """
+        payload = self.decode_token(token)
+        if payload is None:
+            return None
+        if await self.is_blacklisted_async(payload.get('jti', token)):
+            return None
+        return payload
+    
     def blacklist_token(self, token: str, expire_seconds: Optional[int] = None) -> bool:
         """Add token to blacklist (Redis with fallback)"""
         try:
@@ -148,6 +405,7 @@ class SecurityManager:
                 expire_seconds = max(0, int((expire_time - datetime.now(timezone.utc)).total_seconds()))
             
             redis_client.setex(f"blacklist:{token_id}", expire_seconds, "1")
+            blacklist_negative_cache.discard(token_id)
             logger.info(f"Token blacklisted successfully: {token_id[:8]}...")
             return True
         except Exception as e:
@@ -159,14 +417,34 @@ class SecurityManager:
         try:
             # Extract JTI from token for lookup
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            token_id = payload.get('jti', token)
+        except Exception as e:
+            return self._on_blacklist_error(e)
+        return self._is_blacklisted(payload.get('jti', token))
+    
+    def _is_blacklisted(self, token_id: str) -> bool:
+        try:
             return redis_client.exists(f"blacklist:{token_id}") > 0
         except Exception as e:
-            if self.fail_close_on_blacklist_error:
-                logger.error(f"Blacklist check failed; denying token due to fail-close policy: {str(e)}")
-                return True
-            logger.warning(f"Failed to check blacklist, allowing token: {str(e)}")
-            return False  # Fail open for availability
+            return self._on_blacklist_error(e)
+    
+    async def is_blacklisted_async(self, token_id: str) -> bool:
+        """Async blacklist lookup by token ID with local negative caching"""
+        if blacklist_negative_cache.contains(token_id):
+            return False
+        try:
+            revoked = await get_async_redis_client().exists(f"blacklist:{token_id}") > 0
+        except Exception as e:
+            return self._on_blacklist_error(e)
+        if not revoked:
+            blacklist_negative_cache.add(token_id)
+        return revoked
+    
+    def _on_blacklist_error(self, error: Exception) -> bool:
+        if self.fail_close_on_blacklist_error:
+            logger.error(f"Blacklist check failed; denying token due to fail-close policy: {str(error)}")
+            return True
+        logger.warning(f"Failed to check blacklist, allowing token: {str(error)}")
+        return False  # Fail open for availability
     
     def generate_state_token(self) -> str:
         """Generate a secure state token for OAuth CSRF protection"""
@@ -180,19 +458,17 @@ class SecurityManager:
             return True
         except Exception as e:
             logger.warning(f"Redis unavailable, using memory fallback: {str(e)}")
-            # Fallback: store in process memory with TTL (thread-safe)
-            try:
-                with _oauth_memory_lock:
-                    _oauth_state_memory_store[state] = data
-                    _oauth_state_memory_expiry[state] = time.time() + float(expire_seconds)
-                    # Clean up expired entries periodically
-                    if len(_oauth_state_memory_store) % 10 == 0:  # Every 10th store
-                        _cleanup_expired_oauth_states()
-                logger.debug(f"OAuth state stored in memory: {state[:8]}...")
-                return True
-            except Exception as mem_e:
-                logger.error(f"Failed to store OAuth state in memory: {str(mem_e)}")
-                return False
+            return self._store_oauth_state_memory(state, data, expire_seconds)
+    
+    async def store_oauth_state_async(self, state: str, data: Dict[str, Any], expire_seconds: int = 600) -> bool:
+        """Async variant of store_oauth_state (non-blocking Redis client)"""
+        try:
+            await get_async_redis_client().setex(f"oauth_state:{state}", expire_seconds, json.dumps(data))
+            logger.debug(f"OAuth state stored in Redis: {state[:8]}...")
+            return True
+        except Exception as e:
+            logger.warning(f"Redis unavailable, using memory fallback: {str(e)}")
+            return self._store_oauth_state_memory(state, data, expire_seconds)
     
     def get_oauth_state(self, state: str) -> Optional[Dict[str, Any]]:
         """Retrieve and delete OAuth state data. Supports in-memory fallback."""
@@ -206,27 +482,43 @@ class SecurityManager:
                 return json.loads(data)
         except Exception as e:
             logger.warning(f"Redis lookup failed, trying memory fallback: {str(e)}")
-
-        # Fallback to memory store (thread-safe)
+        
+        return self._pop_oauth_state_memory(state)
+    
+    async def get_oauth_state_async(self, state: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_oauth_state - GET+DEL in one round trip (use-once)"""
+        try:
+            key = f"oauth_state:{state}"
+            async with get_async_redis_client().pipeline(transaction=True) as pipe:
+                pipe.get(key)
+                pipe.delete(key)
+                data, _ = await pipe.execute()
+            if data:
+                logger.debug(f"OAuth state retrieved from Redis: {state[:8]}...")
+                return json.loads(data)
+        except Exception as e:
+            logger.warning(f"Redis lookup failed, trying memory fallback: {str(e)}")
+        
+        return self._pop_oauth_state_memory(state)
+    
+    def _store_oauth_state_memory(self, state: str, data: Dict[str, Any], expire_seconds: int) -> bool:
+        # 상한이 있는 TTL 저장소: 만료/초과 항목은 저장 시점에 오래된 순서로 제거
+        try:
+            _oauth_state_memory.set(state, data, expire_seconds)
+            logger.debug(f"OAuth state stored in memory: {state[:8]}...")
+            return True
+        except Exception as mem_e:
+            logger.error(f"Failed to store OAuth state in memory: {str(mem_e)}")
+            return False
+    
+    def _pop_oauth_state_memory(self, state: str) -> Optional[Dict[str, Any]]:
         try:
-            with _oauth_memory_lock:
-                exp = _oauth_state_memory_expiry.get(state)
-                if exp is None:
-                    return None
-                    
-                current_time = time.time()
-                if current_time > exp:
-                    # Expired; cleanup
-                    _oauth_state_memory_expiry.pop(state, None)
-                    _oauth_state_memory_store.pop(state, None)
-                    logger.debug(f"OAuth state expired in memory: {state[:8]}...")
-                    return None
-                    
-                data = _oauth_state_memory_store.pop(state, None)
-                _oauth_state_memory_expiry.pop(state, None)
-                logger.debug(f"OAuth state retrieved from memory: {state[:8]}...")
-                # Ensure dict is returned
-                return data if isinstance(data, dict) else None
+            found, data = _oauth_state_memory.pop(state)
+            if not found:
+                return None
+            logger.debug(f"OAuth state retrieved from memory: {state[:8]}...")
+            # Ensure dict is returned
+            return data if isinstance(data, dict) else None
         except Exception as e:
             logger.error(f"Memory store lookup failed: {str(e)}")
             return None
@@ -246,6 +538,24 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return security.verify_password(plain_password, hashed_password)
 
 
+async def get_password_hash_async(password: str) -> str:
+    """Convenience function for pooled password hashing"""
+    return await security.hash_password_async(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Convenience function for pooled password verification"""
+    return await security.verify_password_async(plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Convenience function for pooled verification with rehash detection"""
+    return await security.verify_and_update_password_async(plain_password, hashed_password)
+
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """Convenience function for access token creation"""
     return security.create_access_token(data, expires_delta)
@@ -261,6 +571,16 @@ def verify_token(token: str) -> Optional[Dict[str, Any]]:
     return security.verify_token(token)
 
 
+async def verify_token_async(token: str) -> Optional[Dict[str, Any]]:
+    """Convenience function for request-path token verification"""
+    return await security.verify_token_async(token)
+
+
+def decode_token(token: str) -> Optional[Dict[str, Any]]:
+    """Convenience function for decoding without blacklist lookup"""
+    return security.decode_token(token)
+
+
 def blacklist_token(token: str, expire_seconds: Optional[int] = None) -> bool:
     """Convenience function for token blacklisting"""
     return security.blacklist_token(token, expire_seconds)
@@ -0,0 +1,303 @@
+"""
+Concurrent startup and cache warm-up for the FastAPI lifespan.
+
+시작 단계는 두 단계로 나뉩니다.
+
+1. connect: MongoDB(sync/Motor), Redis 풀, 공유 HTTP 풀, DI 컨테이너를
+   동시에 준비합니다. 각 단계는 개별 타임아웃을 가지며, 실패해도
+   (``required`` 가 아니면) 기존처럼 경고 후 계속 진행합니다.
+   MongoDB 가 연결되면 선언된 인덱스를 별도 단계(``mongodb_indexes``)로
+   적용하며, connect 타임아웃 대신 ``startup_index_timeout_seconds`` 를 씁니다.
+2. warm-up: 기본 공고 목록 페이지, 분류 코드 테이블, Google OIDC
+   discovery/JWKS 를 미리 적재합니다.
+   lifespan 이 요청을 받기 시작한 뒤 백그라운드로 실행되며, 끝나야
+   ``readiness`` 가 ready 로 바뀝니다 (``/health/ready``).
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+StepFactory = Callable[[], Awaitable[Any]]
+
+
+class StartupError(RuntimeError):
+    """Raised when a required startup step fails"""
+
+
+@dataclass
+class StepResult:
+    """Outcome of a single startup / warm-up step"""
+    name: str
+    ok: bool
+    duration_ms: float
+    detail: Optional[Any] = None
+    error: Optional[str] = None
+
+
+class ReadinessState:
+    """Process readiness (liveness 는 /health, 트래픽 수신 여부는 여기)"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.ready = False
+        self.phase = "starting"
+        self.steps: Dict[str, StepResult] = {}
+        self.started_at: Optional[datetime] = None
+        self.ready_at: Optional[datetime] = None
+
+    def begin(self) -> None:
+        self.reset()
+        self.started_at = datetime.utcnow()
+
+    def record(self, phase: str, results: Iterable[StepResult]) -> None:
+        self.phase = phase
+        for result in results:
+            self.steps[result.name] = result
+
+    def mark_ready(self) -> None:
+        self.ready = True
+        self.phase = "ready"
+        self.ready_at = datetime.utcnow()
+
+    def mark_stopping(self) -> None:
+        self.ready = False
+        self.phase = "stopping"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": "ready" if self.ready else self.phase,
+            "ready": self.ready,
+            "started_at": self.started_at.isoformat() + "Z" if self.started_at else None,
+            "ready_at": self.ready_at.isoformat() + "Z" if self.ready_at else None,
+            "steps": {name: asdict(result) for name, result in self.steps.items()},
+        }
+
+
+readiness = ReadinessState()
+
+
+async def run_steps(
+    steps: Mapping[str, StepFactory],
+    timeout: float,
+    required: Iterable[str] = ()
+) -> List[StepResult]:
+    """
+    단계들을 동시에 실행 (단계별 타임아웃)
+
+    Raises:
+        StartupError: ``required`` 단계가 실패하거나 타임아웃된 경우
+    """
+
+    async def _run(name: str, factory: StepFactory) -> StepResult:
+        start = time.perf_counter()
+        try:
+            detail = await asyncio.wait_for(factory(), timeout)
+            result = StepResult(name, True, 0.0, detail=detail)
+        except asyncio.TimeoutError:
+            result = StepResult(name, False, 0.0, error=f"timed out after {timeout:g}s")
+        except Exception as e:
+            result = StepResult(name, False, 0.0, error=str(e))
+        result.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+        if result.ok:
+            logger.info(f"Startup step '{name}' completed in {result.duration_ms}ms")
+        else:
+            logger.warning(f"Startup step '{name}' failed after {result.duration_ms}ms: {result.error}")
+        return result
+
+    results = await asyncio.gather(*(_run(name, factory) for name, factory in steps.items()))
+
+    failed_required = [r for r in results if not r.ok and r.name in set(required)]
+    if failed_required:
+        raise StartupError(", ".join(f"{r.name}: {r.error}" for r in failed_required))
+    return list(results)
+
+
+# --- connect phase ---------------------------------------------------------
+
+async def _connect_mongo() -> str:
+    from .database import connect_to_mongo
+
+    await asyncio.to_thread(connect_to_mongo)
+    return "connected"
+
+
+async def _connect_mongo_async() -> str:
+    from .database import connect_to_mongo_async
+
+    await connect_to_mongo_async()
+    return "connected"
+
+
+async def _connect_redis() -> str:
+    from .security import get_async_redis_client
+
+    await get_async_redis_client().ping()
+    return "connected"
+
+
+async def _create_http_pool() -> str:
+    from .http import get_http_client
+
+    get_http_client()
+    return "created"
+
+
+async def _configure_container() -> int:
+    from .container import setup_container
+    from .di_config import configure_dependencies, validate_container_setup
+
+    def _configure() -> int:
+        container = configure_dependencies()
+        setup_container(container)
+        if settings.debug:
+            validation_results = validate_container_setup(container)
+            failed = [name for name, result in validation_results.items() if result["status"] == "error"]
+            for name in failed:
+                logger.error(f"{name}: {validation_results[name]['error']}")
+        return len(container.list_registrations())
+
+    return await asyncio.to_thread(_configure)
+
+
+def connect_steps() -> Dict[str, StepFactory]:
+    return {
+        "mongodb": _connect_mongo,
+        "mongodb_async": _connect_mongo_async,
+        "redis": _connect_redis,
+        "http_pool": _create_http_pool,
+        "container": _configure_container,
+    }
+
+
+# --- index phase -----------------------------------------------------------
+
+async def _apply_mongo_indexes() -> List[str]:
+    from .database import get_database
+    from .indexes import apply_indexes
+
+    report = await asyncio.to_thread(apply_indexes, get_database())
+    report.log(logger)
+    return report.created
+
+
+def index_steps(connected: Optional[Iterable[str]] = None) -> Dict[str, StepFactory]:
+    """선언된 인덱스를 시작 시 한 번만 적용 (요청 경로에서는 실행하지 않음, MongoDB 연결 후에만)"""
+    if not settings.mongodb_apply_indexes_on_startup:
+        return {}
+    if connected is not None and "mongodb" not in set(connected):
+        logger.warning("Skipping MongoDB index application: MongoDB is not connected")
+        return {}
+    return {"mongodb_indexes": _apply_mongo_indexes}
+
+
+# --- warm-up phase ---------------------------------------------------------
+
+async def _warm_announcement_lists() -> int:
+    from .compression import negotiate_encoding
+    from .container import get_container
+    from ..domains.announcements.router import warm_announcement_list_cache
+    from ..domains.announcements.service import AnnouncementService
+
+    # 브라우저 기본 Accept-Encoding 기준 압축본까지 함께 적재
+    encoding = negotiate_encoding("gzip, deflate, br, zstd")
+
+    def _warm() -> int:
+        # 싱글톤 해석이 동기 DB 연결을 만들 수 있으므로 스레드에서 실행
+        service = get_container().resolve(AnnouncementService)
+        return warm_announcement_list_cache(
+            service,
+            settings.warmup_announcement_pages,
+            settings.warmup_announcement_page_size,
+            encoding,
+        )
+
+    return await asyncio.to_thread(_warm)
+
+
+async def _warm_classification_tables() -> int:
+    from ..shared.classification.services import classification_service
+
+    return await classification_service.warm_cache()
+
+
+async def _warm_google_oidc() -> int:
+    from ..shared.clients.google_oauth_client import google_oauth_client
+
+    return await google_oauth_client.warm_cache()
+
+
+def warmup_steps(connected: Optional[Iterable[str]] = None) -> Dict[str, StepFactory]:
+    """활성화된 도메인의 warm-up 단계 (``connected`` 가 주어지면 DB 연결 실패 시 DB 단계 제외)"""
+    enabled = set(settings.enabled_routers)
+    db_ready = connected is None or "mongodb" in set(connected)
+    steps: Dict[str, StepFactory] = {}
+    if "announcements" in enabled and settings.warmup_announcement_pages > 0:
+        if db_ready:
+            steps["announcement_lists"] = _warm_announcement_lists
+        else:
+            # 서비스가 DB 오류를 빈 결과로 돌려주므로 빈 페이지를 캐시하지 않도록 건너뜀
+            logger.warning("Skipping announcement list warm-up: MongoDB is not connected")
+    if "classification" in enabled:
+        steps["classification_tables"] = _warm_classification_tables
+    if "users" in enabled and settings.google_client_id:
+        steps["google_oidc"] = _warm_google_oidc
+    return steps
+
+
+# --- orchestration ---------------------------------------------------------
+
+async def start_dependencies() -> List[StepResult]:
+    """connect 단계 (lifespan 에서 yield 전에 await)"""
+    readiness.begin()
+    results = await run_steps(
+        connect_steps(),
+        timeout=settings.startup_connect_timeout_seconds,
+        required=("container",),
+    )
+    # 인덱스 생성은 컬렉션 크기에 비례하므로 connect 타임아웃과 별도 타임아웃으로 실행
+    index_results = await run_steps(
+        index_steps([r.name for r in results if r.ok]),
+        timeout=settings.startup_index_timeout_seconds,
+    )
+    readiness.record("warming", results + index_results)
+    return results + index_results
+
+
+async def warm_up(connected: Optional[Iterable[str]] = None) -> List[StepResult]:
+    """warm-up 단계 - 완료(성공/실패 무관) 시 ready 로 전환"""
+    results: List[StepResult] = []
+    try:
+        if settings.startup_warmup_enabled:
+            results = await run_steps(warmup_steps(connected), timeout=settings.startup_warmup_timeout_seconds)
+            readiness.record("warming", results)
+    finally:
+        readiness.mark_ready()
+        logger.info("Application ready")
+    return results
+
+
+async def stop_dependencies() -> None:
+    """lifespan 종료 시 연결/풀 정리"""
+    from .database import close_mongo_connection, close_mongo_connection_async
+    from .http import close_http_client
+
+    readiness.mark_stopping()
+    for name, close in (
+        ("mongodb", lambda: asyncio.to_thread(close_mongo_connection)),
+        ("mongodb_async", close_mongo_connection_async),
+        ("http_pool", close_http_client),
+    ):
+        try:
+            await close()
+        except Exception as e:
+            logger.error(f"{name} 종료 중 오류: {e}")
@@ -0,0 +1,363 @@
+"""
+Celery queue topology: dedicated queues per workload.
+
+수집 (ingestion), 실시간 알림, 다이제스트, 분석, 유지보수 작업이 같은 큐를 쓰면 긴
+``fetch_announcements_comprehensive`` 실행이 ``send_notification`` 을 막습니다. 워크로드
+마다 큐를 나누고, 큐마다 전용 워커 (concurrency / prefetch / time limit) 와 기본 브로커
+우선순위를 둡니다.
+
+Redis 브로커 우선순위는 **숫자가 낮을수록 먼저** 처리됩니다 (0 = 최우선).
+
+워커 실행 명령은 ``python -m app.core.task_queues`` 로 출력할 수 있습니다. 큐의 time limit 은
+``TaskAnnotations`` 로 태스크 자체에도 적용되므로, 여러 큐를 소비하는 워커에서도 큐마다 지켜집니다.
+
+큐 지표 (Redis 브로커 기준):
+- length: 대기 메시지 수 (우선순위별 리스트 합)
+- lag_seconds: 가장 오래 기다린 메시지의 대기 시간 (발행 시 ``sent_at`` 헤더 기록)
+- throughput_per_minute: 최근 ``THROUGHPUT_WINDOW_MINUTES`` 동안 분당 완료 수
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import settings
+
+try:
+    import redis  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    redis = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+INGESTION_QUEUE = "ingestion"
+ANALYTICS_QUEUE = "analytics"
+MAINTENANCE_QUEUE = "maintenance"
+
+# kombu Redis transport: 우선순위마다 별도 리스트 (0 은 큐 이름 그대로)
+PRIORITY_STEPS = list(range(10))
+PRIORITY_SEP = "\x06\x16"
+
+# API 의 TaskPriority -> 브로커 우선순위
+PRIORITY_LEVELS = {"critical": 0, "high": 2, "medium": 5, "low": 8}
+
+SENT_AT_HEADER = "sent_at"
+THROUGHPUT_KEY_PREFIX = "celery:queue:done"
+THROUGHPUT_WINDOW_MINUTES = 5
+
+
+@dataclass(frozen=True)
+class QueueProfile:
+    """One queue and the worker settings that consume it"""
+
+    name: str
+    workload: str
+    priority: int
+    concurrency: int
+    prefetch_multiplier: int
+    soft_time_limit: int
+    time_limit: int
+    # 이 큐로 보낼 태스크 (정확한 이름 또는 glob)
+    tasks: Tuple[str, ...]
+    # 큐 기본값과 다른 우선순위를 쓰는 태스크
+    task_priorities: Dict[str, int] = field(default_factory=dict)
+
+    def worker_command(self, app: str = "app.core.celery_config") -> str:
+        return (
+            f"celery -A {app} worker -Q {self.name} -n {self.name}@%h"
+            f" --concurrency={self.concurrency} --prefetch-multiplier={self.prefetch_multiplier}"
+            f" --soft-time-limit={self.soft_time_limit} --time-limit={self.time_limit}"
+        )
+
+
+def _alert_profiles() -> List[QueueProfile]:
+    return [
+        QueueProfile(
+            name=settings.alerts_notify_queue,
+            workload="realtime_alerts",
+            priority=0,
+            concurrency=4,
+            prefetch_multiplier=1,
+            # 배치 작업은 alerts_delivery_time_budget_seconds 가 지나면 새 batch 를 claim 하지 않음
+            soft_time_limit=60,
+            time_limit=120,
+            tasks=(
+                "app.domains.alerts.tasks.send_notification",
+                "app.domains.alerts.tasks.deliver_notifications",
+                "app.domains.alerts.tasks.dispatch_deadline_reminders",
+            ),
+            task_priorities={
+                "app.domains.alerts.tasks.deliver_notifications": 1,
+                "app.domains.alerts.tasks.dispatch_deadline_reminders": 2,
+            },
+        ),
+        QueueProfile(
+            name=settings.alerts_match_queue,
+            workload="realtime_alerts",
+            priority=1,
+            concurrency=2,
+            prefetch_multiplier=1,
+            soft_time_limit=240,
+            time_limit=300,
+            tasks=("app.domains.alerts.tasks.match_and_enqueue",),
+        ),
+        QueueProfile(
+            name=settings.alerts_digest_queue,
+            workload="digests",
+            priority=4,
+            concurrency=2,
+            prefetch_multiplier=1,
+            soft_time_limit=1500,
+            time_limit=1800,
+            tasks=(
+                "app.domains.alerts.tasks.digest_daily",
+                "app.domains.alerts.tasks.materialize_deadline_reminders",
+            ),
+        ),
+    ]
+
+
+def build_queue_profiles() -> List[QueueProfile]:
+    """설정된 큐 목록 (알림 기능이 꺼져 있으면 알림 큐 제외)"""
+    profiles = _alert_profiles() if settings.alerts_enabled else []
+    profiles += [
+        QueueProfile(
+            name=INGESTION_QUEUE,
+            workload="ingestion",
+            priority=5,
+            concurrency=2,
+            prefetch_multiplier=1,
+            soft_time_limit=1500,
+            time_limit=1800,
+            tasks=(
+                "app.domains.*.tasks.fetch_*",
+                "app.domains.announcements.tasks.sync_announcement_data_task",
+                "app.scheduler.tasks.*",
+            ),
+        ),
+        QueueProfile(
+            name=ANALYTICS_QUEUE,
+            workload="analytics",
+            priority=7,
+            concurrency=1,
+            prefetch_multiplier=1,
+            soft_time_limit=900,
+            time_limit=1200,
+            tasks=(
+                "app.domains.*.tasks.generate_*",
+                "app.domains.contents.tasks.update_content_metrics",
+                "app.core.tasks.generate_system_statistics",
+                "app.core.tasks.send_daily_report",
+                "app.shared.classification.tasks.*",
+                "app.scheduler.monitoring_tasks.generate_monitoring_report",
+            ),
+        ),
+        QueueProfile(
+            name=MAINTENANCE_QUEUE,
+            workload="maintenance",
+            priority=6,
+            concurrency=1,
+            prefetch_multiplier=1,
+            soft_time_limit=600,
+            time_limit=900,
+            tasks=(
+                "app.domains.*.tasks.validate_*",
+                "app.domains.*.tasks.cleanup_*",
+                "app.core.tasks.*",
+                "app.scheduler.monitoring_tasks.*",
+            ),
+            task_priorities={"app.core.tasks.system_health_check": 3},
+        ),
+    ]
+    return profiles
+
+
+QUEUE_PROFILES: List[QueueProfile] = build_queue_profiles()
+
+
+def build_task_routes(profiles: Optional[List[QueueProfile]] = None) -> Dict[str, Dict[str, Any]]:
+    """Celery ``task_routes`` (정확한 이름이 glob 보다 우선, glob 은 선언 순서대로 매칭)"""
+    exact: Dict[str, Dict[str, Any]] = {}
+    globs: Dict[str, Dict[str, Any]] = {}
+    for profile in profiles or QUEUE_PROFILES:
+        # 우선순위만 다른 태스크는 glob 으로 매칭되더라도 정확한 이름으로 먼저 등록
+        for pattern in (*profile.task_priorities, *profile.tasks):
+            target = globs if "*" in pattern else exact
+            target.setdefault(pattern, {
+                "queue": profile.name,
+                "routing_key": profile.name,
+                "priority": profile.task_priorities.get(pattern, profile.priority),
+            })
+    return {**exact, **globs}
+
+
+def route_for(task_name: str, routes: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """태스크가 보내질 큐/우선순위 (Celery MapRoute 와 같은 순서로 매칭)"""
+    from celery.app.routes import MapRoute
+
+    route = MapRoute(routes if routes is not None else build_task_routes())(task_name)
+    return dict(route) if route else {"queue": MAINTENANCE_QUEUE, "priority": PRIORITY_LEVELS["medium"]}
+
+
+def get_profile(queue_name: str) -> Optional[QueueProfile]:
+    return next((p for p in QUEUE_PROFILES if p.name == queue_name), None)
+
+
+class TaskAnnotations:
+    """Celery ``task_annotations``: 라우팅되는 큐의 time limit + 태스크별 설정
+
+    ``overrides`` 는 기존 dict 형식 (정확한 태스크 이름 / ``"*"``) 이며 큐 프로필 값보다
+    우선합니다. Celery 는 dict 설정을 정확한 이름으로만 매칭하므로 glob 라우팅을 따르려면
+    ``annotate`` 를 가진 객체가 필요합니다.
+    """
+
+    def __init__(self, overrides: Dict[str, Dict[str, Any]], profiles: Optional[List[QueueProfile]] = None):
+        self.overrides = overrides
+        self.profiles = profiles if profiles is not None else QUEUE_PROFILES
+        self._routes = build_task_routes(self.profiles)
+
+    def get(self, task_name: str, default: Any = None) -> Any:
+        from celery.app.routes import MapRoute
+
+        route = MapRoute(self._routes)(task_name)
+        profile = next((p for p in self.profiles if route and p.name == route["queue"]), None)
+        annotation = dict(self.overrides.get(task_name, {}))
+        if profile is not None:
+            annotation = {"soft_time_limit": profile.soft_time_limit, "time_limit": profile.time_limit, **annotation}
+        return annotation or default
+
+    def annotate(self, task: Any) -> Optional[Dict[str, Any]]:
+        return self.get(task.name)
+
+    def annotate_any(self) -> Optional[Dict[str, Any]]:
+        default = self.overrides.get("*")
+        return dict(default) if default else None
+
+
+# -----------------------------
+# Queue lag / throughput (Redis broker)
+# -----------------------------
+
+@dataclass
+class QueueStats:
+    name: str
+    workload: str
+    priority: int
+    length: int = 0
+    lag_seconds: float = 0.0
+    throughput_per_minute: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def priority_keys(queue_name: str) -> List[str]:
+    return [queue_name if pri == 0 else f"{queue_name}{PRIORITY_SEP}{pri}" for pri in PRIORITY_STEPS]
+
+
+def _minute(ts: float) -> int:
+    return int(ts // 60)
+
+
+def throughput_key(queue_name: str, minute: int) -> str:
+    return f"{THROUGHPUT_KEY_PREFIX}:{queue_name}:{minute}"
+
+
+def _sent_at(raw: Any) -> Optional[float]:
+    if not raw:
+        return None
+    try:
+        value = json.loads(raw).get("headers", {}).get(SENT_AT_HEADER)
+        return float(value) if value is not None else None
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def collect_queue_stats(
+    client: Any,
+    profiles: Optional[List[QueueProfile]] = None,
+    now: Optional[float] = None,
+) -> List[QueueStats]:
+    """큐별 대기 수 / 지연 / 처리량을 파이프라인 두 번으로 읽음 (블로킹, to_thread 에서 호출)"""
+    profiles = profiles or QUEUE_PROFILES
+    now = time.time() if now is None else now
+    minutes = [_minute(now) - i for i in range(THROUGHPUT_WINDOW_MINUTES)]
+
+    pipe = client.pipeline(transaction=False)
+    for profile in profiles:
+        for key in priority_keys(profile.name):
+            pipe.llen(key)
+        # BRPOP 으로 꺼내므로 가장 오래된 메시지는 리스트 끝
+        for key in priority_keys(profile.name):
+            pipe.lindex(key, -1)
+        pipe.mget([throughput_key(profile.name, m) for m in minutes])
+    results = pipe.execute()
+
+    stats: List[QueueStats] = []
+    width = 2 * len(PRIORITY_STEPS) + 1
+    for i, profile in enumerate(profiles):
+        chunk = results[i * width:(i + 1) * width]
+        lengths, oldest, done = chunk[:len(PRIORITY_STEPS)], chunk[len(PRIORITY_STEPS):-1], chunk[-1]
+        sent = [ts for ts in (_sent_at(raw) for raw in oldest) if ts is not None]
+        stats.append(QueueStats(
+            name=profile.name,
+            workload=profile.workload,
+            priority=profile.priority,
+            length=sum(int(n or 0) for n in lengths),
+            lag_seconds=round(max(0.0, now - min(sent)), 3) if sent else 0.0,
+            throughput_per_minute=sum(int(n or 0) for n in done or []) / THROUGHPUT_WINDOW_MINUTES,
+        ))
+    return stats
+
+
+_stats_client: Any = None
+
+
+def get_stats_client() -> Any:
+    """큐 지표용 sync Redis 클라이언트 (redis-py 가 없으면 None)"""
+    global _stats_client
+    if _stats_client is None and redis is not None:
+        _stats_client = redis.from_url(settings.redis_url, socket_connect_timeout=2.0, socket_timeout=2.0)
+    return _stats_client
+
+
+# -----------------------------
+# Signal hooks
+# -----------------------------
+
+def stamp_sent_at(headers: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
+    """before_task_publish: 큐 지연 계산용 발행 시각"""
+    if headers is not None:
+        headers.setdefault(SENT_AT_HEADER, time.time())
+
+
+def record_task_done(task: Any = None, **kwargs: Any) -> None:
+    """task_postrun: 큐별 분 단위 완료 카운터 (실패해도 태스크에는 영향 없음)"""
+    try:
+        queue = (getattr(task.request, "delivery_info", None) or {}).get("routing_key")
+        client = get_stats_client()
+        if not queue or client is None:
+            return
+        key = throughput_key(queue, _minute(time.time()))
+        pipe = client.pipeline(transaction=False)
+        pipe.incr(key)
+        pipe.expire(key, (THROUGHPUT_WINDOW_MINUTES + 1) * 60)
+        pipe.execute()
+    except Exception as e:
+        logger.debug("Queue throughput counter not updated: %s", e)
+
+
+def install_queue_hooks() -> None:
+    from celery.signals import before_task_publish, task_postrun
+
+    before_task_publish.connect(stamp_sent_at, weak=False, dispatch_uid="queue-sent-at")
+    task_postrun.connect(record_task_done, weak=False, dispatch_uid="queue-throughput")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for queue_profile in QUEUE_PROFILES:
+        print(f"# {queue_profile.workload}\n{queue_profile.worker_command()}")
@@ -6,13 +6,15 @@ Provides Celery tasks for system maintenance, monitoring, and data integrity.
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-import asyncio
 import logging
 from celery import Task
 from celery.exceptions import Retry
 
 from .celery_config import celery_app
 from .database import get_database
+from .async_runtime import run_async
+from .distributed_lock import singleton_task
+from .indexes import apply_indexes
 from ..shared.schemas import DataCollectionResult
 from ..domains.announcements.service import AnnouncementService
 from ..domains.businesses.service import BusinessService
@@ -97,7 +99,7 @@ def system_health_check(self) -> Dict[str, Any]:
             health_results["redis"] = {"status": "unhealthy", "error": str(e)}
         
         # Check service health
-        services_health = asyncio.run(_check_services_health())
+        services_health = run_async(_check_services_health())
         health_results.update(services_health)
         
         # Determine overall health
@@ -143,6 +145,7 @@ async def _check_services_health() -> Dict[str, Any]:
 
 
 @celery_app.task(bind=True, base=CallbackTask, max_retries=2, default_retry_delay=600)
+@singleton_task()
 def generate_system_statistics(self) -> Dict[str, Any]:
     """
     Generate comprehensive system statistics.
@@ -158,7 +161,7 @@ def generate_system_statistics(self) -> Dict[str, Any]:
         }
         
         # Get database statistics
-        db_stats = asyncio.run(_get_database_statistics())
+        db_stats = run_async(_get_database_statistics())
         stats["database"] = db_stats
         
         # Get task statistics
@@ -271,7 +274,7 @@ def validate_data_integrity(self) -> Dict[str, Any]:
         }
         
         # Run data validation for each domain
-        domain_results = asyncio.run(_validate_domain_data())
+        domain_results = run_async(_validate_domain_data())
         validation_results.update(domain_results)
         
         # Determine overall integrity status
@@ -360,50 +363,24 @@ def backup_critical_data(self) -> Dict[str, Any]:
 @celery_app.task(bind=True, base=CallbackTask, max_retries=2, default_retry_delay=600)
 def optimize_database_indexes(self) -> Dict[str, Any]:
     """
-    Optimize database indexes for better performance.
-    
-    Analyzes query patterns and optimizes indexes accordingly.
+    Apply the declarative index registry and report drift.
+
+    선언된 인덱스 중 누락된 것만 생성하며(멱등), 옵션이 다른 인덱스와
+    선언되지 않은 인덱스는 삭제하지 않고 결과에 보고합니다.
     """
     try:
         logger.info("Starting database index optimization")
         
+        report = apply_indexes(get_database())
+        report.log(logger)
+        
         optimization_results = {
             "timestamp": datetime.utcnow().isoformat(),
             "task": "optimize_database_indexes",
+            **report.to_dict(),
+            "status": "completed",
         }
         
-        db = get_database()
-        collections_optimized = []
-        
-        # Optimize indexes for each collection
-        collection_names = ["announcements", "businesses", "contents", "statistics"]
-        
-        for collection_name in collection_names:
-            try:
-                collection = db[collection_name]
-                
-                # Get current indexes
-                current_indexes = list(collection.list_indexes())
-                
-                # Create recommended indexes if they don't exist
-                # This is domain-specific and would be customized
-                
-                collections_optimized.append({
-                    "collection": collection_name,
-                    "current_indexes": len(current_indexes),
-                    "status": "optimized"
-                })
-                
-            except Exception as e:
-                collections_optimized.append({
-                    "collection": collection_name,
-                    "status": "error",
-                    "error": str(e)
-                })
-        
-        optimization_results["collections"] = collections_optimized
-        optimization_results["status"] = "completed"
-        
         logger.info("Database index optimization completed")
         return optimization_results
         
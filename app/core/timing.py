@@ -0,0 +1,136 @@
+"""
+Request-scoped performance timing collector.
+
+Stages (DB commands, cache round trips, upstream API calls, serialization)
+record spans into a collector bound to the current request through a
+contextvar. The collector is rendered as a ``Server-Timing`` header and fed to
+per-stage Prometheus histograms by ``ServerTimingMiddleware``.
+
+Recording is a no-op outside a request, so instrumented code can run
+unchanged in Celery tasks and scripts.
+"""
+
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Callable, Dict, Iterator, List, Optional
+
+from pymongo import monitoring
+
+
+class RequestTimings:
+    """Accumulated span durations for one request, keyed by stage"""
+
+    __slots__ = ("started_at", "_stages", "_lock")
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        # stage -> [total_ms, count]
+        self._stages: Dict[str, List[float]] = {}
+        # Sync endpoints and dependencies run in the threadpool with a copied
+        # context that still points at this collector
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, duration_ms: float) -> None:
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                self._stages[stage] = [duration_ms, 1]
+            else:
+                entry[0] += duration_ms
+                entry[1] += 1
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def stages(self) -> Dict[str, float]:
+        """Total milliseconds per stage"""
+        with self._lock:
+            return {stage: entry[0] for stage, entry in self._stages.items()}
+
+    def counts(self) -> Dict[str, int]:
+        """Number of spans per stage"""
+        with self._lock:
+            return {stage: int(entry[1]) for stage, entry in self._stages.items()}
+
+    def server_timing_header(self, include_total: bool = True) -> str:
+        """Render as a Server-Timing header value"""
+        parts = [f"{stage};dur={duration:.2f}" for stage, duration in self.stages().items()]
+        if include_total:
+            parts.append(f"total;dur={self.elapsed_ms():.2f}")
+        return ", ".join(parts)
+
+
+_timings_var: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def start_request_timing() -> Token:
+    """Bind a fresh collector to the current context"""
+    return _timings_var.set(RequestTimings())
+
+
+def reset_request_timing(token: Token) -> None:
+    _timings_var.reset(token)
+
+
+def get_request_timings() -> Optional[RequestTimings]:
+    return _timings_var.get()
+
+
+def record_span(stage: str, duration_ms: float) -> None:
+    """Record a span into the active collector, if any"""
+    timings = _timings_var.get()
+    if timings is not None:
+        timings.record(stage, duration_ms)
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """Time the enclosed block as ``stage``"""
+    timings = _timings_var.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.record(stage, (time.perf_counter() - start) * 1000)
+
+
+def timed_stage(stage: str) -> Callable:
+    """Decorator form of ``timed`` for sync and async callables"""
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with timed(stage):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class MongoTimingListener(monitoring.CommandListener):
+    """PyMongo command listener that records every command as a ``db`` span
+
+    Registered on the shared client, so all repositories report their query
+    time without per-method instrumentation.
+    """
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        record_span("db", event.duration_micros / 1000)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        record_span("db", event.duration_micros / 1000)
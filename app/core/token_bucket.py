@@ -0,0 +1,92 @@
+"""
+Shared token bucket.
+
+여러 워커 프로세스가 하나의 전역 처리율 (예: ``alerts_global_rps``) 을 나눠 쓰도록
+Redis 에 버킷 상태를 두고 Lua 스크립트로 원자적으로 리필/차감합니다.
+한 번에 여러 토큰을 요청할 수 있으며, 남은 토큰만큼 부분 지급하고 다음 토큰까지의
+대기 시간을 돌려줍니다. Redis 를 쓸 수 없으면 프로세스 로컬 버킷으로 대체합니다.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]=bucket, ARGV: rate(tokens/s), capacity, requested
+_TAKE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local granted = math.min(requested, math.floor(tokens))
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+local wait_ms = 0
+if granted < requested then
+  wait_ms = math.ceil((1 - (tokens - math.floor(tokens))) / rate * 1000)
+end
+return {granted, wait_ms}
+"""
+
+
+class _LocalBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self, requested: int) -> Tuple[int, float]:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        granted = min(requested, int(self.tokens))
+        self.tokens -= granted
+        wait = 0.0 if granted >= requested else (1 - (self.tokens - math.floor(self.tokens))) / self.rate
+        return granted, wait
+
+
+class TokenBucket:
+    """Redis-backed token bucket shared by every process using the same ``key``"""
+
+    def __init__(self, key: str, rate: float, capacity: Optional[float] = None, redis_client: Any = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.key = f"token_bucket:{key}"
+        self.rate = float(rate)
+        self.capacity = float(capacity or rate)
+        self.redis = redis_client
+        self._local = _LocalBucket(self.rate, self.capacity)
+        self._script = None
+
+    async def take(self, requested: int = 1) -> Tuple[int, float]:
+        """최대 ``requested`` 개를 가져감 -> (지급 수, 부족 시 다음 토큰까지 대기 초)"""
+        if requested <= 0:
+            return 0, 0.0
+        if self.redis is not None:
+            try:
+                if self._script is None:
+                    self._script = self.redis.register_script(_TAKE_SCRIPT)
+                granted, wait_ms = await self._script(keys=[self.key], args=[self.rate, self.capacity, requested])
+                return int(granted), int(wait_ms) / 1000
+            except Exception as e:
+                logger.warning(f"Token bucket '{self.key}' falling back to local state: {e}")
+        return self._local.take(requested)
+
+    async def acquire(self, requested: int = 1) -> None:
+        """``requested`` 개를 모두 얻을 때까지 대기"""
+        remaining = requested
+        while remaining > 0:
+            granted, wait = await self.take(remaining)
+            remaining -= granted
+            if remaining > 0:
+                await asyncio.sleep(max(wait, 0.001))
@@ -0,0 +1,372 @@
+"""
+Batched notification delivery worker.
+
+``send_notification`` 는 알림 하나마다 이벤트 루프, Mongo 클라이언트, 레이트 리미터,
+EmailService (Jinja Environment) 를 새로 만듭니다. 이 워커는 이것들을 워커 수명
+동안 유지하면서 ``queued`` 알림을 배치 단위로 가져와 발송합니다.
+
+배치 하나의 흐름:
+
+1. claim: ``queued`` (또는 lease 가 만료된 ``sending``) 알림을 ``sending`` 으로 바꾸고
+   claim token 을 기록 (여러 워커가 동시에 돌아도 같은 알림을 두 번 보내지 않음)
+2. preload: 사용자 / 콘텐츠 / 구독 / 알림 설정 / 오늘 발송 수를 ``$in`` 쿼리로 한 번에
+3. 판단: ``send_notification`` 과 같은 규칙 (설정, 방해금지, 일일 한도).
+   방해금지 시간인 알림은 ``not_before`` (방해금지 종료 시각) 를 기록하고 ``queued`` 로
+   되돌려, 그 전에는 다시 claim 되지 않음
+4. 발송: 전역 RPS 는 Redis 공유 토큰 버킷으로 제한, 허용된 만큼 ``send_many`` 로
+   묶어 렌더링/발송 (SMTP 세션은 재사용)
+5. 상태 반영: 토큰 버킷 구간마다 ``bulk_write`` (예외가 나도 이미 보낸 결과는 기록하고
+   아직 보내지 않은 알림은 ``queued`` 로 되돌림)
+
+실행:
+    python -m app.domains.alerts.delivery          # 상주 워커
+    celery task app.domains.alerts.tasks.deliver_notifications  # beat 로 주기 실행
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, UpdateOne
+
+from ...core.config import settings
+from ...core.token_bucket import TokenBucket
+from .repository import AlertsRepository, is_quiet_hours, quiet_hours_end
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_BUCKET_KEY = "alerts:global"
+
+# (notification, user, content, subscription)
+_Sendable = Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]
+
+
+@dataclass
+class DeliveryStats:
+    claimed: int = 0
+    sent: int = 0
+    failed: int = 0
+    skipped: int = 0
+    deferred: int = 0
+    batches: int = 0
+
+    def add(self, other: "DeliveryStats") -> None:
+        for name, value in asdict(other).items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class NotificationDeliveryWorker:
+    """Long-lived delivery loop: claim -> preload -> decide -> send -> bulk_write"""
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        email_service: Any = None,
+        bucket: Optional[TokenBucket] = None,
+        batch_size: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+    ):
+        self.db = db
+        self.notifications = db["notifications"]
+        self.repository = AlertsRepository(db)
+        if email_service is None:
+            from ...shared.services.email_service import EmailService
+
+            email_service = EmailService()
+        self.email_service = email_service
+        self.bucket = bucket or TokenBucket(GLOBAL_BUCKET_KEY, rate=settings.alerts_global_rps)
+        self.batch_size = batch_size or settings.alerts_delivery_batch_size
+        self.lease_seconds = lease_seconds or settings.alerts_delivery_lease_seconds
+
+    # --- claim ----------------------------------------------------------------
+
+    def _claimable(self, now: datetime) -> Dict[str, Any]:
+        return {"$or": [
+            # not_before (방해금지로 미뤄진 시각) 이 지나지 않은 알림은 제외
+            {"status": "queued", "not_before": {"$not": {"$gt": now}}},
+            {"status": "sending", "claimed_at": {"$lt": now - timedelta(seconds=self.lease_seconds)}},
+        ]}
+
+    async def claim_batch(self) -> Tuple[str, List[Dict[str, Any]]]:
+        """최대 ``batch_size`` 개의 알림을 이 워커 소유로 표시하고 반환"""
+        now = datetime.utcnow()
+        claimable = self._claimable(now)
+        cursor = self.notifications.find(claimable, projection={"_id": 1}).sort("created_at", ASCENDING).limit(self.batch_size)
+        ids = [doc["_id"] async for doc in cursor]
+        if not ids:
+            return "", []
+        token = uuid.uuid4().hex
+        # 조건을 다시 걸어 다른 워커가 먼저 가져간 알림은 제외
+        await self.notifications.update_many(
+            {"_id": {"$in": ids}, **claimable},
+            {"$set": {"status": "sending", "claim_token": token, "claimed_at": now}},
+        )
+        claimed = [doc async for doc in self.notifications.find({"claim_token": token})]
+        return token, claimed
+
+    # --- preload --------------------------------------------------------------
+
+    async def _load_by_ids(self, collection: str, ids: List[Any], projection: Optional[Dict[str, int]] = None) -> Dict[Any, Dict[str, Any]]:
+        if not ids:
+            return {}
+        cursor = self.db[collection].find({"_id": {"$in": ids}}, projection=projection)
+        return {doc["_id"]: doc async for doc in cursor}
+
+    async def _preload(self, batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+        user_ids = list(dict.fromkeys(n["user_id"] for n in batch))
+        subscription_ids = list(dict.fromkeys(n.get("subscription_id") for n in batch))
+        content_ids_by_domain: Dict[str, List[Any]] = defaultdict(list)
+        for n in batch:
+            content_ids_by_domain[n.get("domain", "announcements")].append(n.get("content_id"))
+
+        users, subscriptions, preferences, daily_counts, defaults, *contents = await asyncio.gather(
+            self._load_by_ids("users", user_ids, projection={"email": 1, "name": 1}),
+            self._load_by_ids("alert_subscriptions", subscription_ids),
+            self.repository.get_many_user_preferences(user_ids),
+            self.repository.get_daily_notification_counts(user_ids),
+            self.repository.get_default_preferences(),
+            *(self._load_by_ids(domain, list(dict.fromkeys(ids))) for domain, ids in content_ids_by_domain.items()),
+        )
+        return {
+            "users": users,
+            "subscriptions": subscriptions,
+            "preferences": preferences,
+            "daily_counts": daily_counts,
+            "defaults": defaults,
+            "contents": dict(zip(content_ids_by_domain.keys(), contents)),
+        }
+
+    # --- decide + send --------------------------------------------------------
+
+    @staticmethod
+    def _finish(notif: Dict[str, Any], token: str, status: str, **delivery_info: Any) -> UpdateOne:
+        update: Dict[str, Any] = {"$set": {"status": status, "sent_at": datetime.utcnow()}, "$unset": {"claim_token": "", "claimed_at": ""}}
+        if delivery_info:
+            update["$set"]["delivery_info"] = delivery_info
+        return UpdateOne({"_id": notif["_id"], "claim_token": token}, update)
+
+    @staticmethod
+    def _release(notif: Dict[str, Any], token: str, not_before: Optional[datetime] = None) -> UpdateOne:
+        update: Dict[str, Any] = {"$set": {"status": "queued"}, "$unset": {"claim_token": "", "claimed_at": ""}}
+        if not_before is not None:
+            update["$set"]["not_before"] = not_before
+        return UpdateOne({"_id": notif["_id"], "claim_token": token}, update)
+
+    async def _flush(self, ops: List[UpdateOne]) -> None:
+        if ops:
+            await self.notifications.bulk_write(list(ops), ordered=False)
+            ops.clear()
+
+    async def process_batch(self, token: str, batch: List[Dict[str, Any]]) -> DeliveryStats:
+        stats = DeliveryStats(claimed=len(batch), batches=1)
+        if not batch:
+            return stats
+        ops: List[UpdateOne] = []
+        sendable: List[_Sendable] = []
+        # 아직 발송을 시도하지 않은 첫 sendable 위치 (예외 시 그 뒤는 queued 로 되돌림)
+        unattempted = 0
+        try:
+            await self._decide(token, batch, stats, ops, sendable)
+            position = 0
+            while position < len(sendable):
+                # 전역 RPS: 남은 발송 수만큼 한 번에 요청하고, 부족하면 다음 토큰까지 대기
+                granted, wait = await self.bucket.take(len(sendable) - position)
+                chunk = sendable[position:position + granted]
+                unattempted = position + granted
+                await self._send_chunk(token, chunk, stats, ops)
+                position += granted
+                # 구간마다 바로 기록: 이후 예외가 나도 sent 결과를 잃어 lease 만료 후 중복 발송되지 않음
+                await self._flush(ops)
+                if position < len(sendable):
+                    await asyncio.sleep(max(wait, 0.001))
+        finally:
+            ops.extend(self._release(notif, token) for notif, *_ in sendable[unattempted:])
+            await self._flush(ops)
+        return stats
+
+    async def _decide(
+        self,
+        token: str,
+        batch: List[Dict[str, Any]],
+        stats: DeliveryStats,
+        ops: List[UpdateOne],
+        sendable: List[_Sendable],
+    ) -> None:
+        """발송하지 않을 알림의 상태를 ``ops`` 에, 보낼 알림을 ``sendable`` 에 추가"""
+        data = await self._preload(batch)
+        now = datetime.now().astimezone()
+        sent_in_batch: Counter = Counter()
+
+        for notif in batch:
+            user_id = notif["user_id"]
+            user = data["users"].get(user_id) or {}
+            if not user.get("email"):
+                ops.append(self._finish(notif, token, "failed", error="user_email_not_found"))
+                stats.failed += 1
+                continue
+
+            stored = data["preferences"].get(user_id)
+            preferences = stored or data["defaults"]
+            channel = notif.get("channel", "email")
+            if not (preferences.get(f"{channel}_enabled", True) and preferences.get("new_announcements", True)):
+                ops.append(self._finish(notif, token, "skipped"))
+                stats.skipped += 1
+                continue
+
+            if stored and is_quiet_hours(stored, now):
+                # 방해금지 시간에는 실패로 처리하지 않고 방해금지가 끝날 때까지 미룸
+                ops.append(self._release(notif, token, not_before=quiet_hours_end(stored, now)))
+                stats.deferred += 1
+                continue
+
+            max_daily = stored.get("max_daily_notifications", 10) if stored else 10
+            if data["daily_counts"].get(user_id, 0) + sent_in_batch[user_id] >= max_daily:
+                ops.append(self._finish(notif, token, "skipped"))
+                stats.skipped += 1
+                continue
+
+            content = data["contents"].get(notif.get("domain", "announcements"), {}).get(notif.get("content_id"))
+            subscription = data["subscriptions"].get(notif.get("subscription_id"))
+            if not content or not subscription:
+                ops.append(self._finish(notif, token, "failed", error="content_not_found" if not content else "subscription_not_found"))
+                stats.failed += 1
+                continue
+
+            sent_in_batch[user_id] += 1
+            sendable.append((notif, user, content, subscription))
+
+    async def _send_chunk(
+        self,
+        token: str,
+        chunk: List[_Sendable],
+        stats: DeliveryStats,
+        ops: List[UpdateOne],
+    ) -> None:
+        # 허용된 만큼 한 번에 렌더링/발송 (EmailService 스레드 풀에서 배치 단위로)
+        results = await self.email_service.send_many([
+            self.email_service.new_announcement_email(
+                user_email=user["email"],
+                user_name=user.get("name", "사용자"),
+                announcement=content,
+                matched_keywords=subscription.get("keywords", []),
+                match_score=notif.get("score", 0.0),
+                threshold=subscription.get("match_threshold", 0.5),
+                tracking_id=str(notif["_id"]),
+            )
+            for notif, user, content, subscription in chunk
+        ])
+        for (notif, *_), result in zip(chunk, results):
+            ok = bool(result.get("success"))
+            ops.append(self._finish(
+                notif, token, "sent" if ok else "failed",
+                message_id=result.get("message_id"),
+                template="new_announcement",
+                error=result.get("error"),
+            ))
+            if ok:
+                stats.sent += 1
+            else:
+                stats.failed += 1
+
+    # --- loops ----------------------------------------------------------------
+
+    async def run_once(self) -> DeliveryStats:
+        token, batch = await self.claim_batch()
+        if not batch:
+            return DeliveryStats()
+        return await self.process_batch(token, batch)
+
+    async def drain(self, max_batches: Optional[int] = None, time_budget: Optional[float] = None) -> DeliveryStats:
+        """대기 중인 알림이 없거나 ``max_batches`` / ``time_budget`` 초에 도달할 때까지 처리
+
+        시간 예산은 새 batch 를 claim 하기 전에만 확인하므로, 태스크 time limit 보다 한 batch
+        발송 시간 이상 짧아야 합니다 (진행 중인 batch 가 잘리지 않도록).
+        """
+        total = DeliveryStats()
+        started = time.monotonic()
+        while max_batches is None or total.batches < max_batches:
+            if time_budget is not None and time.monotonic() - started >= time_budget:
+                break
+            stats = await self.run_once()
+            if not stats.claimed:
+                break
+            total.add(stats)
+        return total
+
+    async def run_forever(self, stop_event: asyncio.Event, idle_seconds: Optional[float] = None) -> DeliveryStats:
+        idle = idle_seconds if idle_seconds is not None else settings.alerts_delivery_idle_seconds
+        total = DeliveryStats()
+        while not stop_event.is_set():
+            try:
+                stats = await self.run_once()
+                total.add(stats)
+            except Exception as e:
+                logger.exception("Notification delivery batch failed: %s", e)
+                stats = DeliveryStats()
+            if stats.claimed:
+                logger.info("Delivery batch: %s", stats.to_dict())
+                continue
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=idle)
+            except asyncio.TimeoutError:
+                continue
+        return total
+
+    async def close(self) -> None:
+        client = getattr(self.email_service, "client", None)
+        if client is not None and hasattr(client, "close"):
+            await asyncio.to_thread(client.close)
+
+
+def create_bucket_redis_client() -> Any:
+    """워커 전용 async Redis 클라이언트 (이벤트 루프마다 새로 생성)"""
+    try:
+        import redis.asyncio as aioredis  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return aioredis.from_url(settings.redis_url, socket_connect_timeout=2.0, socket_timeout=2.0)
+
+
+async def create_worker(db: Any = None, redis_client: Any = None) -> Tuple[NotificationDeliveryWorker, Any]:
+    """(worker, redis client) - 넘기지 않은 자원은 호출한 이벤트 루프에 묶어 새로 만듦"""
+    from ...core.database import DatabaseManager
+
+    if db is None:
+        db = await DatabaseManager().get_async_database()
+    if redis_client is None:
+        redis_client = create_bucket_redis_client()
+    bucket = TokenBucket(GLOBAL_BUCKET_KEY, rate=settings.alerts_global_rps, redis_client=redis_client)
+    return NotificationDeliveryWorker(db, bucket=bucket), redis_client
+
+
+async def _main() -> None:  # pragma: no cover - process entrypoint
+    import signal
+
+    worker, redis_client = await create_worker()
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+    logger.info("Notification delivery worker started (batch=%d, rps=%d)", worker.batch_size, settings.alerts_global_rps)
+    try:
+        await worker.run_forever(stop_event)
+    finally:
+        await worker.close()
+        if redis_client is not None:
+            await redis_client.aclose()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
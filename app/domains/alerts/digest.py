@@ -0,0 +1,269 @@
+"""
+Set-based daily digest engine.
+
+기존 ``digest_daily`` 는 사용자마다 users / 설정 / 방해금지 / 구독 조회를 하고,
+구독마다 신규·마감 공고 쿼리를 두 번씩 실행했습니다 (사용자 × 구독 × 2).
+여기서는 한 번의 실행에 필요한 데이터를 집합 단위로 읽습니다.
+
+1. 수신자: 다이제스트 설정 사용자 + daily 구독 사용자 (쿼리 2회)
+2. 구독 / 사용자 / 알림 설정: ``$in`` 쿼리 (각 1회)
+3. 공고: 최근 24시간 신규, 7일 내 마감 (각 1회)
+4. 매칭: 모든 구독을 ``SubscriptionMatcher`` 하나에 색인해 공고를 한 번씩 통과
+5. 렌더링/발송: 세마포어로 동시 실행 수 제한
+
+실행 결과는 ``DigestRunReport`` (처리량 포함) 로 반환합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Mapping, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ...core.config import settings
+from .matcher import SubscriptionMatcher
+from .repository import AlertsRepository, is_quiet_hours
+
+logger = logging.getLogger(__name__)
+
+# 구독당 다이제스트에 담는 공고 수 (기존 쿼리의 limit(5) 와 동일)
+PER_SUBSCRIPTION_LIMIT = 5
+DEADLINE_WINDOW_DAYS = 7
+
+
+@dataclass
+class DigestRunReport:
+    recipients: int = 0
+    eligible: int = 0
+    sent: int = 0
+    failed: int = 0
+    skipped: int = 0
+    new_announcements: int = 0
+    deadline_announcements: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def throughput_per_second(self) -> float:
+        """초당 처리한 다이제스트 (발송 + 실패)"""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return round((self.sent + self.failed) / self.duration_seconds, 2)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "throughput_per_second": self.throughput_per_second}
+
+
+@dataclass
+class DigestPlan:
+    """사용자 한 명분의 다이제스트 내용"""
+    user_id: Any
+    user: Dict[str, Any]
+    subscriptions: List[Dict[str, Any]]
+    new_announcements: List[Dict[str, Any]]
+    deadline_announcements: List[Dict[str, Any]]
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "new_this_week": len(self.new_announcements),
+            "matched_this_week": len(self.new_announcements),
+            "deadline_this_week": len(self.deadline_announcements),
+            "popular_keywords": [kw for sub in self.subscriptions for kw in sub.get("keywords", [])][:3],
+        }
+
+
+class DailyDigestEngine:
+    """Builds every daily digest of a run from a handful of set queries"""
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        email_service: Any = None,
+        concurrency: Optional[int] = None,
+    ):
+        self.db = db
+        self.repository = AlertsRepository(db)
+        if email_service is None:
+            from ...shared.services.email_service import EmailService
+
+            email_service = EmailService()
+        self.email_service = email_service
+        self.concurrency = concurrency or settings.alerts_digest_concurrency
+
+    # --- loading --------------------------------------------------------------
+
+    async def load_recipients(self) -> List[Any]:
+        prefs = await self.repository.get_users_with_preferences(
+            category="digest_notifications",
+            digest_frequency="daily",
+        )
+        # Also include users with daily subscriptions (backward compatibility)
+        sub_users = await self.db["alert_subscriptions"].distinct("user_id", {"frequency": "daily", "is_active": True})
+        return list(dict.fromkeys([p["user_id"] for p in prefs] + list(sub_users)))
+
+    async def _find_all(self, collection: str, query: Mapping[str, Any], **kwargs: Any) -> List[Dict[str, Any]]:
+        return [doc async for doc in self.db[collection].find(query, **kwargs)]
+
+    async def load_announcements(self, now: datetime) -> Dict[str, List[Dict[str, Any]]]:
+        new, deadline = await asyncio.gather(
+            self._find_all("announcements", {"created_at": {"$gte": now - timedelta(days=1)}}),
+            self._find_all(
+                "announcements",
+                {"application_end_date": {"$gte": now, "$lte": now + timedelta(days=DEADLINE_WINDOW_DAYS)}},
+                sort=[("application_end_date", 1)],
+            ),
+        )
+        return {"new": new, "deadline": deadline}
+
+    # --- planning -------------------------------------------------------------
+
+    def match_new(self, subscriptions: List[Dict[str, Any]], announcements: List[Dict[str, Any]]) -> Dict[Any, List[Dict[str, Any]]]:
+        """구독 _id -> 매칭된 신규 공고 (점수 순, 구독당 최대 5건)"""
+        # 다이제스트는 기존 $text 조회처럼 키워드 하나만 걸려도 포함 (임계값 미적용)
+        matcher = SubscriptionMatcher("announcements", [{**s, "match_threshold": 0.0} for s in subscriptions])
+        matched: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+        for doc in announcements:
+            for candidate in matcher.match(doc):
+                matched[candidate.subscription["_id"]].append({
+                    **doc,
+                    "url": f"{settings.frontend_url}/announcements/{doc['_id']}",
+                    "match_score": round(candidate.score, 2),
+                })
+        return {
+            sub_id: sorted(docs, key=lambda d: d["match_score"], reverse=True)[:PER_SUBSCRIPTION_LIMIT]
+            for sub_id, docs in matched.items()
+        }
+
+    def match_deadlines(self, subscriptions: List[Dict[str, Any]], announcements: List[Dict[str, Any]], now: datetime) -> Dict[Any, List[Dict[str, Any]]]:
+        """구독 _id -> 7일 내 마감 공고 (필터만 적용, 마감 임박 순, 구독당 최대 5건)"""
+        def _entry(doc: Dict[str, Any]) -> Dict[str, Any]:
+            days_left = (doc.get("application_end_date", now) - now).days
+            return {
+                **doc,
+                "url": f"{settings.frontend_url}/announcements/{doc['_id']}",
+                "days_left": max(0, days_left),
+            }
+
+        # 필터가 없는 구독은 전체 마감 공고 상위 5건 (기존 쿼리와 동일)
+        unfiltered = [_entry(doc) for doc in announcements[:PER_SUBSCRIPTION_LIMIT]]
+        filter_only = [{**s, "keywords": [], "match_threshold": 0.0} for s in subscriptions]
+        matcher = SubscriptionMatcher("announcements", filter_only)
+
+        matched: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+        for doc in announcements:  # 이미 마감일 오름차순
+            for candidate in matcher.match(doc):
+                docs = matched[candidate.subscription["_id"]]
+                if len(docs) < PER_SUBSCRIPTION_LIMIT:
+                    docs.append(_entry(doc))
+
+        return {
+            sub["_id"]: matched.get(sub["_id"], []) if self._has_filters(sub) else unfiltered
+            for sub in subscriptions
+        }
+
+    @staticmethod
+    def _has_filters(sub: Mapping[str, Any]) -> bool:
+        filters = sub.get("filters") or {}
+        if not isinstance(filters, Mapping):
+            filters = filters.model_dump()
+        return any(v for v in filters.values())
+
+    async def build_plans(self, now: Optional[datetime] = None) -> tuple[List[DigestPlan], DigestRunReport]:
+        now = now or datetime.utcnow()
+        report = DigestRunReport()
+        recipients = await self.load_recipients()
+        report.recipients = len(recipients)
+        if not recipients:
+            return [], report
+
+        subs, users, preferences, defaults, announcements = await asyncio.gather(
+            self._find_all("alert_subscriptions", {"user_id": {"$in": recipients}, "is_active": True}),
+            self._find_all("users", {"_id": {"$in": recipients}}, projection={"email": 1, "name": 1}),
+            self.repository.get_many_user_preferences(recipients),
+            self.repository.get_default_preferences(),
+            self.load_announcements(now),
+        )
+        report.new_announcements = len(announcements["new"])
+        report.deadline_announcements = len(announcements["deadline"])
+
+        users_by_id = {u["_id"]: u for u in users}
+        subs_by_user: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+        for sub in subs:
+            subs_by_user[sub["user_id"]].append(sub)
+
+        # 발송 대상만 색인 (설정/방해금지/이메일/구독 조건 통과)
+        local_now = datetime.now().astimezone()
+        eligible: List[Any] = []
+        for user_id in recipients:
+            user = users_by_id.get(user_id)
+            stored = preferences.get(user_id)
+            prefs = stored or defaults
+            if (
+                not user or not user.get("email")
+                or not (prefs.get("email_enabled", True) and prefs.get("digest_notifications", True))
+                or (stored and is_quiet_hours(stored, local_now))
+                or not subs_by_user.get(user_id)
+            ):
+                report.skipped += 1
+                continue
+            eligible.append(user_id)
+        report.eligible = len(eligible)
+
+        eligible_subs = [sub for user_id in eligible for sub in subs_by_user[user_id]]
+        new_by_sub = self.match_new(eligible_subs, announcements["new"])
+        deadline_by_sub = self.match_deadlines(eligible_subs, announcements["deadline"], now)
+
+        plans: List[DigestPlan] = []
+        for user_id in eligible:
+            user_subs = subs_by_user[user_id]
+            new_items = {d["_id"]: d for sub in user_subs for d in new_by_sub.get(sub["_id"], [])}
+            deadline_items = {d["_id"]: d for sub in user_subs for d in deadline_by_sub.get(sub["_id"], [])}
+            plans.append(DigestPlan(
+                user_id=user_id,
+                user=users_by_id[user_id],
+                subscriptions=user_subs,
+                new_announcements=list(new_items.values()),
+                deadline_announcements=list(deadline_items.values()),
+            ))
+        return plans, report
+
+    # --- sending --------------------------------------------------------------
+
+    async def _send(self, plan: DigestPlan, semaphore: asyncio.Semaphore, stamp: str) -> bool:
+        async with semaphore:
+            try:
+                result = await self.email_service.send_daily_digest(
+                    user_email=plan.user["email"],
+                    user_name=plan.user.get("name", "사용자"),
+                    new_announcements=plan.new_announcements,
+                    deadline_announcements=plan.deadline_announcements,
+                    stats=plan.stats,
+                    tracking_id=f"digest_{plan.user_id}_{stamp}",
+                )
+            except Exception as e:
+                logger.error(f"Error sending digest to user {plan.user_id}: {e}")
+                return False
+        if not result.get("success"):
+            logger.warning(f"Failed to send digest to {plan.user['email']}: {result.get('error')}")
+            return False
+        return True
+
+    async def run(self, now: Optional[datetime] = None) -> DigestRunReport:
+        started = time.perf_counter()
+        now = now or datetime.utcnow()
+        plans, report = await self.build_plans(now)
+
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+        stamp = now.strftime("%Y%m%d")
+        results = await asyncio.gather(*(self._send(plan, semaphore, stamp) for plan in plans))
+        report.sent = sum(1 for ok in results if ok)
+        report.failed = len(results) - report.sent
+        report.duration_seconds = round(time.perf_counter() - started, 3)
+        logger.info(f"Daily digest completed: {report.to_dict()}")
+        return report
@@ -1,16 +1,48 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from .repository import AlertsRepository
+from .reminders import reminder_due_times
+from .repository import AlertsRepository, is_quiet_hours
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class EligibilityCandidate:
+    """배치 평가 대상 (content 가 있으면 차단 키워드도 확인)"""
+    user_id: Any
+    content_id: Any
+    content: Optional[Mapping[str, Any]] = field(default=None, compare=False)
+
+
+@dataclass(frozen=True)
+class EligibilityDecision:
+    allowed: bool
+    reason: str
+
+
+def _blocked_keywords(preferences: Optional[Dict[str, Any]]) -> Set[str]:
+    if not preferences:
+        return set()
+    blocked_keywords = preferences.get("blocked_keywords", [])
+    return set(keyword.lower().strip() for keyword in blocked_keywords if keyword.strip())
+
+
+def _content_text(content_data: Mapping[str, Any]) -> str:
+    return (
+        content_data.get("title", "") + " " +
+        content_data.get("description", "") + " " +
+        content_data.get("summary", "") + " " +
+        " ".join(content_data.get("keywords", []))
+    ).lower()
+
+
 class NotificationFrequencyManager:
     """알림 빈도 및 스케줄링 관리"""
     
@@ -60,6 +92,75 @@ class NotificationFrequencyManager:
         # 이 로직은 호출하는 쪽에서 처리되지만, 여기서도 체크 가능
         
         return True, "Allowed"
+
+    async def evaluate_batch(
+        self,
+        candidates: Sequence[EligibilityCandidate],
+        notification_type: str,
+        hours: int = 24,
+    ) -> List[EligibilityDecision]:
+        """
+        후보 전체의 발송 가능 여부를 한 번에 판단
+
+        ``should_send_notification`` + ``is_content_blocked`` 와 같은 규칙을
+        같은 순서로 적용하지만, 관련 사용자 전체의 설정 / 오늘 발송 수 /
+        최근 알림 쌍을 쿼리 몇 번으로 미리 읽고 나머지는 메모리에서 판단합니다.
+        같은 배치 안에서 먼저 허용된 (user_id, content_id) 는 이후 후보의 중복으로 봅니다.
+
+        Returns:
+            입력 순서와 같은 순서의 판단 결과
+        """
+        if not candidates:
+            return []
+
+        user_ids = list(dict.fromkeys(c.user_id for c in candidates))
+        content_ids = list(dict.fromkeys(c.content_id for c in candidates))
+
+        preferences_by_user = await self.repository.get_many_user_preferences(user_ids)
+        daily_counts = await self.repository.get_daily_notification_counts(user_ids)
+        recent_pairs = await self.repository.get_recent_notification_pairs(user_ids, content_ids, hours=hours)
+        defaults = await self.repository.get_default_preferences()
+
+        now = datetime.now().astimezone()
+        quiet_by_user: Dict[Any, bool] = {}
+        decisions: List[EligibilityDecision] = []
+        for candidate in candidates:
+            user_id = candidate.user_id
+            stored = preferences_by_user.get(user_id)
+            preferences = stored or defaults
+
+            if not preferences.get(notification_type, True):
+                decisions.append(EligibilityDecision(False, f"Category {notification_type} disabled"))
+                continue
+
+            if user_id not in quiet_by_user:
+                # 설정 문서가 없으면 check_quiet_hours 와 같이 방해금지 없음
+                quiet_by_user[user_id] = bool(stored) and is_quiet_hours(stored, now)
+            if quiet_by_user[user_id]:
+                decisions.append(EligibilityDecision(False, "Quiet hours active"))
+                continue
+
+            max_daily = stored.get("max_daily_notifications", 10) if stored else 10
+            current_count = daily_counts.get(user_id, 0)
+            if current_count >= max_daily:
+                decisions.append(EligibilityDecision(False, f"Daily limit reached ({current_count}/{max_daily})"))
+                continue
+
+            pair = (user_id, candidate.content_id)
+            if pair in recent_pairs:
+                decisions.append(EligibilityDecision(False, "Duplicate notification"))
+                continue
+
+            if candidate.content is not None:
+                content_text = _content_text(candidate.content)
+                blocked = next((kw for kw in _blocked_keywords(stored) if kw in content_text), None)
+                if blocked:
+                    decisions.append(EligibilityDecision(False, f"Blocked by keyword: {blocked}"))
+                    continue
+
+            recent_pairs.add(pair)
+            decisions.append(EligibilityDecision(True, "Allowed"))
+        return decisions
     
     async def _count_recent_notifications(self, user_id: Any, notification_type: str, content_id: str, hours: int = 24) -> int:
         """최근 N시간 내 같은 콘텐츠에 대한 알림 수 확인"""
@@ -107,14 +208,8 @@ class NotificationFrequencyManager:
             preferences = await self.repository.get_default_preferences()
             
         reminder_days = preferences.get("deadline_reminder_days", [7, 3, 1])
-        
-        schedule = []
-        for days_before in reminder_days:
-            reminder_date = deadline_date - timedelta(days=days_before)
-            if reminder_date > datetime.utcnow():
-                schedule.append(reminder_date)
-                
-        return sorted(schedule)
+        # 실제 발송은 DeadlineReminderScheduler 가 같은 계산으로 시간 버킷에 기록한 뒤 처리
+        return [due_at for _, due_at in reminder_due_times(deadline_date, reminder_days, datetime.utcnow())]
     
     async def calculate_notification_priority(self, user_id: Any, notification_data: Dict[str, Any]) -> int:
         """
@@ -222,11 +317,7 @@ class NotificationFrequencyManager:
     async def get_blocked_keywords(self, user_id: Any) -> Set[str]:
         """사용자의 차단 키워드 목록 조회"""
         preferences = await self.repository.get_user_preferences(user_id)
-        if not preferences:
-            return set()
-            
-        blocked_keywords = preferences.get("blocked_keywords", [])
-        return set(keyword.lower().strip() for keyword in blocked_keywords if keyword.strip())
+        return _blocked_keywords(preferences)
     
     async def is_content_blocked(self, user_id: Any, content_data: Dict[str, Any]) -> tuple[bool, str]:
         """콘텐츠가 사용자의 차단 키워드에 걸리는지 확인"""
@@ -236,12 +327,7 @@ class NotificationFrequencyManager:
             return False, "No blocked keywords"
             
         # 콘텐츠 텍스트 추출
-        content_text = (
-            content_data.get("title", "") + " " +
-            content_data.get("description", "") + " " +
-            content_data.get("summary", "") + " " +
-            " ".join(content_data.get("keywords", []))
-        ).lower()
+        content_text = _content_text(content_data)
         
         # 차단 키워드 확인
         for blocked_keyword in blocked_keywords:
@@ -0,0 +1,29 @@
+"""Alerts domain index declarations (applied by app.core.indexes)"""
+
+from pymongo import ASCENDING, DESCENDING
+
+from ...core.indexes import IndexSpec, index_registry
+
+index_registry.register(
+    "alerts",
+    # Subscriptions: user, active, frequency (user_id 단일 조회도 이 인덱스의 prefix로 처리)
+    IndexSpec.build("alert_subscriptions", [("user_id", ASCENDING), ("is_active", ASCENDING), ("frequency", ASCENDING)]),
+    IndexSpec.build("alert_subscriptions", [("is_active", ASCENDING), ("frequency", ASCENDING)], name="idx_active_frequency"),
+    # Notifications unique: one per (user, subscription, content)
+    IndexSpec.build(
+        "notifications",
+        [("user_id", ASCENDING), ("subscription_id", ASCENDING), ("content_id", ASCENDING)],
+        name="uniq_user_sub_content",
+        unique=True,
+    ),
+    IndexSpec.build("notifications", [("status", ASCENDING), ("created_at", DESCENDING)], name="idx_status_created"),
+    IndexSpec.build("notifications", [("user_id", ASCENDING), ("status", ASCENDING)], name="idx_user_status"),
+    IndexSpec.build("notifications", [("domain", ASCENDING), ("created_at", DESCENDING)], name="idx_domain_created"),
+    IndexSpec.build("delivery_logs", [("notification_id", ASCENDING), ("attempt", DESCENDING)], name="idx_notification_attempt"),
+    IndexSpec.build("delivery_logs", [("next_retry_at", ASCENDING)], name="idx_next_retry"),
+    IndexSpec.build("notification_preferences", "user_id", unique=True),
+    # Deadline reminders: 시간 버킷 단위 claim, 마감 후 자동 만료
+    IndexSpec.build("deadline_reminders", [("bucket", ASCENDING), ("status", ASCENDING)], name="idx_bucket_status"),
+    IndexSpec.build("deadline_reminders", "claim_token", name="idx_claim_token", sparse=True),
+    IndexSpec.build("deadline_reminders", "expire_at", name="ttl_expire_at", expireAfterSeconds=0),
+)
@@ -0,0 +1,236 @@
+"""
+Percolator-style subscription matcher.
+
+기존 ``match_and_enqueue`` 는 구독마다 ``$text`` 쿼리를 한 번씩 실행했습니다
+(구독 수 × 쿼리). 여기서는 반대로 활성 구독을 메모리 역색인으로 만든 뒤,
+최근 변경된 문서를 한 번씩 흘려 보내 후보 (구독, 문서, 점수) 를 만듭니다.
+비용은 문서 수와 문서에 실제로 걸리는 구독 수에 비례합니다.
+
+- 키워드 토큰 -> 구독 posting list
+- 키워드 없이 필터만 있는 구독은 첫 번째 필터 값 (category/region/status) 으로 색인
+- 필터 (domain, categories, regions, statuses, 게시일 범위) 는 후보에 대해서만 평가하며
+  ``AlertsService.build_query`` 와 같은 필드에 같은 ``$in`` 의미로 적용
+- 점수는 구독 키워드 중 문서에 등장한 비율 (0.0-1.0) 이며 ``match_threshold`` 이상만 반환
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# 도메인별 텍스트 인덱스 필드 (app/domains/*/indexes.py 와 동일). 없으면 모든 문자열 필드 ($**)
+TEXT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "announcements": (
+        "announcement_data.title",
+        "announcement_data.content",
+        "announcement_data.business_name",
+    ),
+}
+
+# AlertFilters 이름 -> 문서 필드 (build_query 와 동일)
+FILTER_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("categories", "category"),
+    ("regions", "region"),
+    ("statuses", "status"),
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _get_path(doc: Mapping[str, Any], path: str) -> Any:
+    value: Any = doc
+    for part in path.split("."):
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _iter_strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, Mapping):
+        for item in value.values():
+            yield from _iter_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_strings(item)
+
+
+def document_text(domain: str, doc: Mapping[str, Any]) -> str:
+    fields = TEXT_FIELDS.get(domain)
+    if fields is None:
+        return " ".join(_iter_strings(doc))
+    return " ".join(s for path in fields for s in _iter_strings(_get_path(doc, path)))
+
+
+def _matches_in(value: Any, allowed: Set[Any]) -> bool:
+    """MongoDB ``$in`` 의미 (배열 필드는 원소 중 하나라도 포함되면 일치)"""
+    if isinstance(value, (list, tuple)):
+        return any(v in allowed for v in value)
+    return value in allowed
+
+
+@dataclass(frozen=True)
+class _Keyword:
+    phrase: str
+    tokens: Tuple[str, ...]
+
+
+@dataclass
+class _IndexedSubscription:
+    subscription: Dict[str, Any]
+    keywords: Tuple[_Keyword, ...]
+    domain: Optional[str]
+    filters: Tuple[Tuple[str, Set[Any]], ...]
+    date_from: Optional[datetime]
+    date_to: Optional[datetime]
+    threshold: float
+
+    def accepts(self, domain: str, doc: Mapping[str, Any]) -> bool:
+        # 문서에 domain 필드가 없으면 컬렉션 이름으로 비교
+        if self.domain and doc.get("domain", domain) != self.domain:
+            return False
+        for field, allowed in self.filters:
+            if not _matches_in(doc.get(field), allowed):
+                return False
+        if self.date_from or self.date_to:
+            published_at = doc.get("published_at")
+            if not isinstance(published_at, datetime):
+                return False
+            if self.date_from and published_at < self.date_from:
+                return False
+            if self.date_to and published_at > self.date_to:
+                return False
+        return True
+
+
+@dataclass(frozen=True)
+class MatchCandidate:
+    """문서 하나에 대해 통과한 구독 (user_id 는 subscription 에서 꺼냄)"""
+    subscription: Dict[str, Any]
+    document: Mapping[str, Any]
+    score: float
+
+    @property
+    def user_id(self) -> Any:
+        return self.subscription["user_id"]
+
+
+class SubscriptionMatcher:
+    """In-memory inverted index over active subscriptions for one domain"""
+
+    def __init__(self, domain: str, subscriptions: Iterable[Mapping[str, Any]]):
+        self.domain = domain
+        self._subs: List[_IndexedSubscription] = []
+        self._by_term: Dict[str, List[int]] = {}
+        self._by_filter: Dict[Tuple[str, Any], List[int]] = {}
+        for sub in subscriptions:
+            self.add(sub)
+
+    def __len__(self) -> int:
+        return len(self._subs)
+
+    def add(self, sub: Mapping[str, Any]) -> bool:
+        """구독을 색인 (키워드와 필터가 모두 없으면 build_query 와 같이 건너뜀)"""
+        filters = sub.get("filters") or {}
+        if not isinstance(filters, Mapping):
+            filters = filters.model_dump()
+        domain_filter = filters.get("domain")
+
+        keywords = []
+        for raw in sub.get("keywords") or []:
+            tokens = tuple(tokenize(raw))
+            if tokens:
+                keywords.append(_Keyword(" ".join(tokens), tokens))
+        field_filters = tuple(
+            (field, set(filters[name])) for name, field in FILTER_FIELDS if filters.get(name)
+        )
+        date_from = filters.get("start_date_from")
+        date_to = filters.get("start_date_to")
+        if not keywords and not field_filters and not (date_from or date_to) and not domain_filter:
+            return False
+
+        indexed = _IndexedSubscription(
+            subscription=dict(sub),
+            keywords=tuple(keywords),
+            domain=domain_filter,
+            filters=field_filters,
+            date_from=date_from,
+            date_to=date_to,
+            threshold=float(sub.get("match_threshold", 0.5)),
+        )
+        position = len(self._subs)
+        self._subs.append(indexed)
+
+        if keywords:
+            for term in {kw.tokens[0] for kw in keywords}:
+                self._by_term.setdefault(term, []).append(position)
+        elif field_filters:
+            field, allowed = field_filters[0]
+            for value in allowed:
+                self._by_filter.setdefault((field, value), []).append(position)
+        else:
+            # 날짜/도메인 필터만 있는 구독은 모든 문서의 후보
+            self._by_filter.setdefault(("*", None), []).append(position)
+        return True
+
+    def _candidates(self, tokens: Set[str], doc: Mapping[str, Any]) -> Set[int]:
+        candidates: Set[int] = set()
+        for term in tokens:
+            candidates.update(self._by_term.get(term, ()))
+        if self._by_filter:
+            candidates.update(self._by_filter.get(("*", None), ()))
+            for _, field in FILTER_FIELDS:
+                value = doc.get(field)
+                for v in value if isinstance(value, (list, tuple)) else (value,):
+                    try:
+                        candidates.update(self._by_filter.get((field, v), ()))
+                    except TypeError:  # unhashable value
+                        continue
+        return candidates
+
+    def match(self, doc: Mapping[str, Any]) -> List[MatchCandidate]:
+        """문서 하나를 색인에 통과시켜 임계값 이상인 후보를 점수 내림차순으로 반환"""
+        if not self._subs:
+            return []
+        text = document_text(self.domain, doc)
+        token_list = tokenize(text)
+        tokens = set(token_list)
+        normalized: Optional[str] = None
+
+        results: List[MatchCandidate] = []
+        for position in self._candidates(tokens, doc):
+            indexed = self._subs[position]
+            if indexed.keywords:
+                hits = 0
+                for kw in indexed.keywords:
+                    if not tokens.issuperset(kw.tokens):
+                        continue
+                    if len(kw.tokens) > 1:
+                        # 여러 단어 키워드는 $text 와 같이 구(phrase)로 일치해야 함
+                        if normalized is None:
+                            normalized = " " + " ".join(token_list) + " "
+                        if f" {kw.phrase} " not in normalized:
+                            continue
+                    hits += 1
+                score = hits / len(indexed.keywords)
+            else:
+                score = 1.0
+            if score <= 0 or score < indexed.threshold:
+                continue
+            if not indexed.accepts(self.domain, doc):
+                continue
+            results.append(MatchCandidate(indexed.subscription, doc, score))
+        results.sort(key=lambda c: c.score, reverse=True)
+        return results
+
+    def match_many(self, docs: Iterable[Mapping[str, Any]]) -> Iterator[MatchCandidate]:
+        for doc in docs:
+            yield from self.match(doc)
@@ -0,0 +1,105 @@
+"""
+Alert matching pipeline: match -> batched eligibility -> enqueue.
+
+주기 작업 (``match_and_enqueue``) 과 이벤트 스트림 소비자 (``stream_consumer``) 가
+같은 경로를 씁니다. 구독 역색인은 ``alerts_matcher_refresh_seconds`` 동안 재사용하므로
+상주 소비자가 이벤트마다 구독을 다시 읽지 않습니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, AsyncIterable, Iterable, List, Optional, Union
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ...core.config import settings
+from .frequency_manager import EligibilityCandidate, NotificationFrequencyManager
+from .matcher import MatchCandidate, SubscriptionMatcher
+from .models import Notification
+from .service import AlertsService
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 적격성을 평가할 후보 수 (쿼리 수는 배치당 상수)
+ELIGIBILITY_BATCH_SIZE = 1000
+
+
+class AlertMatchingPipeline:
+    """Matches documents of one domain against realtime subscriptions and enqueues notifications"""
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        domain: str,
+        service: Optional[AlertsService] = None,
+        refresh_seconds: Optional[float] = None,
+    ):
+        self.db = db
+        self.domain = domain
+        self.service = service or AlertsService(db)
+        self.freq_manager = NotificationFrequencyManager(db)
+        self.refresh_seconds = refresh_seconds if refresh_seconds is not None else settings.alerts_matcher_refresh_seconds
+        self._matcher: Optional[SubscriptionMatcher] = None
+        self._loaded_at = 0.0
+
+    async def matcher(self) -> SubscriptionMatcher:
+        """활성 realtime 구독의 역색인 (refresh_seconds 가 지나면 다시 읽음)"""
+        if self._matcher is None or time.monotonic() - self._loaded_at >= self.refresh_seconds:
+            cursor = self.db["alert_subscriptions"].find({"is_active": True, "frequency": "realtime"})
+            self._matcher = SubscriptionMatcher(self.domain, [s async for s in cursor])
+            self._loaded_at = time.monotonic()
+        return self._matcher
+
+    async def _flush(self, batch: List[MatchCandidate]) -> int:
+        # 배치 단위로 설정/발송 수/중복을 한 번에 읽어 판단
+        decisions = await self.freq_manager.evaluate_batch(
+            [EligibilityCandidate(c.user_id, str(c.document.get("_id")), c.document) for c in batch],
+            "new_announcement",
+        )
+        enqueued = 0
+        for candidate, decision in zip(batch, decisions):
+            sub, d = candidate.subscription, candidate.document
+            if not decision.allowed:
+                logger.debug(f"Notification skipped for user {sub['user_id']} on {d.get('_id')}: {decision.reason}")
+                continue
+            notif = Notification(
+                subscription_id=sub["_id"],
+                user_id=sub["user_id"],
+                domain=self.domain,
+                content_id=d.get("_id"),
+                channel=(sub.get("channels") or ["email"])[0],
+                score=candidate.score,
+            )
+            # (user, subscription, content) upsert 라 같은 문서를 다시 처리해도 알림은 하나
+            await self.service.enqueue_notification(notif)
+            enqueued += 1
+            logger.debug(f"Matched content {d.get('_id')} with score {candidate.score:.2f} (threshold: {sub.get('match_threshold', 0.5)})")
+        return enqueued
+
+    async def process(self, docs: Union[Iterable[Any], AsyncIterable[Any]]) -> int:
+        """문서를 한 번씩 역색인에 통과시켜 (구독, 문서, 점수) 후보를 만들고 배치로 enqueue"""
+        matcher = await self.matcher()
+        if not len(matcher):
+            return 0
+
+        matched = 0
+        pending: List[MatchCandidate] = []
+
+        async def _consume(d: Any) -> None:
+            nonlocal matched, pending
+            pending.extend(matcher.match(d))
+            if len(pending) >= ELIGIBILITY_BATCH_SIZE:
+                matched += await self._flush(pending)
+                pending = []
+
+        if hasattr(docs, "__aiter__"):
+            async for d in docs:
+                await _consume(d)
+        else:
+            for d in docs:
+                await _consume(d)
+        if pending:
+            matched += await self._flush(pending)
+        return matched
@@ -0,0 +1,333 @@
+"""
+Time-bucketed deadline reminders.
+
+기존에는 마감 알림 일정을 사용자마다 요청 시점에 계산
+(``NotificationFrequencyManager.get_deadline_reminder_schedule``) 하고, 다이제스트가
+마감일 기준으로 공고를 훑었습니다. 여기서는 다가오는 마감 이벤트를
+``deadline_reminders`` 컬렉션에 미리 만들어 두고 (1시간 단위 버킷, ``due_at`` 색인),
+주기 작업은 현재 버킷만 claim 해서 발송합니다. 발송 비용은 공고 × 사용자가 아니라
+해당 시간에 도래한 알림 수에 비례합니다.
+
+claim 은 ``alerts_delivery_batch_size`` 단위로 나눠 하고, 발송은
+``NotificationDeliveryWorker.process_batch`` 처럼 token bucket 이 허용한 구간마다 보내고
+바로 기록합니다. 태스크가 중간에 끊겨도 보낸 알림이 다시 발송되지 않고, 시도하지 않은
+알림은 pending 으로 돌아갑니다.
+
+문서 형태 (``_id`` = ``{user_id}:{announcement_id}:{days_before}``)::
+
+    {
+        "user_id", "subscription_id", "announcement_id", "days_before",
+        "deadline", "due_at", "bucket",        # bucket = due_at 의 정시
+        "status": "pending" | "claimed" | "sent" | "failed" | "skipped",
+        "claim_token", "claimed_at", "expire_at",
+    }
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, UpdateOne
+
+from ...core.config import settings
+from ...core.token_bucket import TokenBucket
+from .delivery import GLOBAL_BUCKET_KEY
+from .matcher import SubscriptionMatcher
+from .repository import AlertsRepository, is_quiet_hours
+
+logger = logging.getLogger(__name__)
+
+REMINDERS_COLLECTION = "deadline_reminders"
+MATERIALIZE_CHUNK_SIZE = 1000
+
+
+def hour_bucket(moment: datetime) -> datetime:
+    """``moment`` 가 속한 1시간 버킷의 시작 시각"""
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def reminder_due_times(deadline: datetime, reminder_days: Iterable[int], now: datetime) -> List[Tuple[int, datetime]]:
+    """(D-n, 발송 시각) 목록 - 이미 지난 시각은 제외, 시각 순 정렬"""
+    due = [(days, deadline - timedelta(days=days)) for days in set(reminder_days)]
+    return sorted(((days, at) for days, at in due if at > now), key=lambda item: item[1])
+
+
+@dataclass
+class ReminderStats:
+    claimed: int = 0
+    sent: int = 0
+    failed: int = 0
+    skipped: int = 0
+    deferred: int = 0
+
+    def add(self, other: "ReminderStats") -> None:
+        for name, value in asdict(other).items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class DeadlineReminderScheduler:
+    """Materializes deadline reminders into hourly buckets and dispatches the due bucket"""
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        email_service: Any = None,
+        bucket: Optional[TokenBucket] = None,
+        lease_seconds: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ):
+        self.db = db
+        self.reminders = db[REMINDERS_COLLECTION]
+        self.repository = AlertsRepository(db)
+        self._email_service = email_service
+        self.bucket = bucket or TokenBucket(GLOBAL_BUCKET_KEY, rate=settings.alerts_global_rps)
+        self.lease_seconds = lease_seconds or settings.alerts_delivery_lease_seconds
+        self.batch_size = batch_size or settings.alerts_delivery_batch_size
+
+    @property
+    def email_service(self) -> Any:
+        if self._email_service is None:
+            from ...shared.services.email_service import EmailService
+
+            self._email_service = EmailService()
+        return self._email_service
+
+    # --- materialize ----------------------------------------------------------
+
+    async def _find_all(self, collection: str, query: Dict[str, Any], **kwargs: Any) -> List[Dict[str, Any]]:
+        return [doc async for doc in self.db[collection].find(query, **kwargs)]
+
+    async def materialize(self, now: Optional[datetime] = None, since_minutes: Optional[int] = None) -> int:
+        """
+        마감이 ``alerts_reminder_horizon_days`` 안에 있는 공고의 알림을 버킷에 기록.
+
+        ``since_minutes`` 를 주면 그 사이 생성/수정된 공고만 다시 계산합니다 (증분).
+        같은 (사용자, 공고, D-n) 은 하나의 문서로 upsert 되므로 반복 실행해도 안전합니다.
+        """
+        now = now or datetime.utcnow()
+        query: Dict[str, Any] = {
+            "application_end_date": {"$gt": now, "$lte": now + timedelta(days=settings.alerts_reminder_horizon_days)},
+        }
+        if since_minutes is not None:
+            since = now - timedelta(minutes=since_minutes)
+            query["$or"] = [{"created_at": {"$gte": since}}, {"updated_at": {"$gte": since}}]
+
+        announcements, subscriptions = await asyncio.gather(
+            self._find_all("announcements", query),
+            self._find_all("alert_subscriptions", {"is_active": True}),
+        )
+        if not announcements or not subscriptions:
+            return 0
+
+        matcher = SubscriptionMatcher("announcements", subscriptions)
+        matches = [matcher.match(doc) for doc in announcements]
+        user_ids = list(dict.fromkeys(c.user_id for candidates in matches for c in candidates))
+        preferences, defaults = await asyncio.gather(
+            self.repository.get_many_user_preferences(user_ids),
+            self.repository.get_default_preferences(),
+        )
+
+        ops: Dict[str, UpdateOne] = {}
+        for doc, candidates in zip(announcements, matches):
+            deadline = doc["application_end_date"]
+            for candidate in candidates:
+                prefs = preferences.get(candidate.user_id) or defaults
+                if not prefs.get("deadline_reminders", True):
+                    continue
+                for days, due_at in reminder_due_times(deadline, prefs.get("deadline_reminder_days", [7, 3, 1]), now):
+                    reminder_id = f"{candidate.user_id}:{doc['_id']}:{days}"
+                    if reminder_id in ops:  # 같은 사용자의 다른 구독이 같은 공고에 매칭
+                        continue
+                    ops[reminder_id] = UpdateOne(
+                        {"_id": reminder_id},
+                        {
+                            # 마감일이 바뀌면 발송 시각도 따라감 (이미 발송된 문서는 상태 유지)
+                            "$set": {
+                                "deadline": deadline,
+                                "due_at": due_at,
+                                "bucket": hour_bucket(due_at),
+                                "expire_at": deadline + timedelta(days=1),
+                            },
+                            "$setOnInsert": {
+                                "user_id": candidate.user_id,
+                                "subscription_id": candidate.subscription.get("_id"),
+                                "announcement_id": doc["_id"],
+                                "days_before": days,
+                                "status": "pending",
+                                "created_at": now,
+                            },
+                        },
+                        upsert=True,
+                    )
+
+        pending = list(ops.values())
+        for start in range(0, len(pending), MATERIALIZE_CHUNK_SIZE):
+            await self.reminders.bulk_write(pending[start:start + MATERIALIZE_CHUNK_SIZE], ordered=False)
+        logger.info("Materialized %d deadline reminders from %d announcements", len(pending), len(announcements))
+        return len(pending)
+
+    # --- claim ----------------------------------------------------------------
+
+    def _claimable(self, now: datetime) -> Dict[str, Any]:
+        current = hour_bucket(now)
+        return {
+            "bucket": {"$gte": current - timedelta(hours=settings.alerts_reminder_catchup_hours), "$lte": current},
+            "$or": [
+                {"status": "pending"},
+                {"status": "claimed", "claimed_at": {"$lt": now - timedelta(seconds=self.lease_seconds)}},
+            ],
+        }
+
+    async def claim_due(self, now: Optional[datetime] = None) -> Tuple[str, List[Dict[str, Any]]]:
+        """현재 버킷 (+ 놓친 최근 버킷) 의 pending 알림을 최대 ``batch_size`` 개 claim"""
+        now = now or datetime.utcnow()
+        claimable = self._claimable(now)
+        cursor = self.reminders.find(claimable, projection={"_id": 1}).sort("due_at", ASCENDING).limit(self.batch_size)
+        ids = [doc["_id"] async for doc in cursor]
+        if not ids:
+            return "", []
+        token = uuid.uuid4().hex
+        # 조건을 다시 걸어 다른 워커가 먼저 가져간 알림은 제외
+        await self.reminders.update_many(
+            {"_id": {"$in": ids}, **claimable},
+            {"$set": {"status": "claimed", "claim_token": token, "claimed_at": now}},
+        )
+        claimed = await self._find_all(REMINDERS_COLLECTION, {"claim_token": token})
+        return token, claimed
+
+    # --- dispatch -------------------------------------------------------------
+
+    async def _load_by_ids(self, collection: str, ids: List[Any], projection: Optional[Dict[str, int]] = None) -> Dict[Any, Dict[str, Any]]:
+        if not ids:
+            return {}
+        docs = await self._find_all(collection, {"_id": {"$in": ids}}, projection=projection)
+        return {doc["_id"]: doc for doc in docs}
+
+    @staticmethod
+    def _finish(reminder: Dict[str, Any], token: str, update: Dict[str, Any]) -> UpdateOne:
+        return UpdateOne(
+            {"_id": reminder["_id"], "claim_token": token},
+            {"$set": update, "$unset": {"claim_token": "", "claimed_at": ""}},
+        )
+
+    @staticmethod
+    def _release(reminder: Dict[str, Any], token: str) -> UpdateOne:
+        return UpdateOne(
+            {"_id": reminder["_id"], "claim_token": token},
+            {"$set": {"status": "pending"}, "$unset": {"claim_token": "", "claimed_at": ""}},
+        )
+
+    async def _flush(self, ops: List[UpdateOne]) -> None:
+        if ops:
+            await self.reminders.bulk_write(list(ops), ordered=False)
+            ops.clear()
+
+    async def dispatch(self, token: str, reminders: List[Dict[str, Any]], now: Optional[datetime] = None) -> ReminderStats:
+        stats = ReminderStats(claimed=len(reminders))
+        if not reminders:
+            return stats
+        now = now or datetime.utcnow()
+        user_ids = list(dict.fromkeys(r["user_id"] for r in reminders))
+        users, announcements, preferences, defaults = await asyncio.gather(
+            self._load_by_ids("users", user_ids, projection={"email": 1, "name": 1}),
+            self._load_by_ids("announcements", list(dict.fromkeys(r["announcement_id"] for r in reminders))),
+            self.repository.get_many_user_preferences(user_ids),
+            self.repository.get_default_preferences(),
+        )
+
+        local_now = datetime.now().astimezone()
+        ops: List[UpdateOne] = []
+        sendable: List[Tuple[Dict[str, Any], Any]] = []
+        for reminder in reminders:
+            user = users.get(reminder["user_id"]) or {}
+            announcement = announcements.get(reminder["announcement_id"])
+            if not user.get("email") or not announcement:
+                error = "user_email_not_found" if not user.get("email") else "announcement_not_found"
+                ops.append(self._finish(reminder, token, {"status": "failed", "error": error, "processed_at": now}))
+                stats.failed += 1
+                continue
+
+            stored = preferences.get(reminder["user_id"])
+            prefs = stored or defaults
+            if not (prefs.get("email_enabled", True) and prefs.get("deadline_reminders", True)):
+                ops.append(self._finish(reminder, token, {"status": "skipped", "processed_at": now}))
+                stats.skipped += 1
+                continue
+
+            if stored and is_quiet_hours(stored, local_now):
+                # 방해금지 시간이면 다음 버킷으로 이동
+                ops.append(self._finish(reminder, token, {"status": "pending", "bucket": hour_bucket(now) + timedelta(hours=1)}))
+                stats.deferred += 1
+                continue
+
+            content = {**announcement, **(announcement.get("announcement_data") or {}), "id": str(announcement["_id"])}
+            message = self.email_service.deadline_reminder_email(
+                user_email=user["email"],
+                user_name=user.get("name", "사용자"),
+                announcement=content,
+                days_left=reminder["days_before"],
+                tracking_id=f"reminder_{reminder['_id']}",
+            )
+            sendable.append((reminder, message))
+
+        # 아직 발송을 시도하지 않은 첫 sendable 위치 (예외 / 취소 시 그 뒤는 pending 으로 되돌림)
+        unattempted = 0
+        try:
+            position = 0
+            while position < len(sendable):
+                # 전역 RPS: 남은 발송 수만큼 요청하고, 허용된 구간만 보낸 뒤 바로 기록
+                granted, wait = await self.bucket.take(len(sendable) - position)
+                chunk = sendable[position:position + granted]
+                unattempted = position + granted
+                results = await self.email_service.send_many([message for _, message in chunk])
+                for (reminder, _), result in zip(chunk, results):
+                    ok = bool(result.get("success"))
+                    update: Dict[str, Any] = {"status": "sent" if ok else "failed", "processed_at": now}
+                    if not ok:
+                        update["error"] = result.get("error")
+                    ops.append(self._finish(reminder, token, update))
+                    if ok:
+                        stats.sent += 1
+                    else:
+                        stats.failed += 1
+                position += granted
+                await self._flush(ops)
+                if position < len(sendable):
+                    await asyncio.sleep(max(wait, 0.001))
+        finally:
+            ops.extend(self._release(reminder, token) for reminder, _ in sendable[unattempted:])
+            await self._flush(ops)
+        return stats
+
+    async def run_due(
+        self,
+        now: Optional[datetime] = None,
+        max_batches: Optional[int] = None,
+        time_budget: Optional[float] = None,
+    ) -> ReminderStats:
+        """도래한 알림이 없거나 ``max_batches`` / ``time_budget`` 초에 도달할 때까지 batch 단위로 claim / 발송"""
+        now = now or datetime.utcnow()
+        total = ReminderStats()
+        batches = 0
+        started = time.monotonic()
+        while max_batches is None or batches < max_batches:
+            if time_budget is not None and time.monotonic() - started >= time_budget:
+                break
+            token, reminders = await self.claim_due(now)
+            if not reminders:
+                break
+            total.add(await self.dispatch(token, reminders, now))
+            batches += 1
+        if total.claimed:
+            logger.info("Deadline reminders dispatched: %s", total.to_dict())
+        return total
@@ -1,15 +1,79 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import pytz
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo import ASCENDING, DESCENDING
+from pymongo import DESCENDING
 from pymongo.errors import DuplicateKeyError
 
+from ...core.indexes import apply_indexes_async
+from ...core.preference_cache import copy_value, preference_cache
 from .models import AlertSubscription, Notification, DeliveryLog, NotificationPreference
 
 
+PREFERENCES_CACHE_NAMESPACE = "notification_preferences"
+
+_default_preferences: Optional[Dict[str, Any]] = None
+
+
+def _serialize_preferences(doc: Dict[str, Any]) -> Dict[str, Any]:
+    # Convert ObjectId to string for serialization
+    if "_id" in doc:
+        doc["_id"] = str(doc["_id"])
+    if "id" in doc:
+        doc["id"] = str(doc["id"])
+    return doc
+
+
+def is_quiet_hours(preferences: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+    """설정 문서 기준 현재 시간이 방해금지 시간인지 (DB 조회 없음)
+
+    ``now`` 는 timezone-aware 시각 (없으면 설정된 시간대의 현재 시각)
+    """
+    if not preferences.get("quiet_hours_enabled", False):
+        return False
+    timezone_str = preferences.get("quiet_hours_timezone", "Asia/Seoul")
+    try:
+        timezone = pytz.timezone(timezone_str)
+        current_time = now.astimezone(timezone) if now else datetime.now(timezone)
+        current_hour = current_time.hour
+
+        start_hour = preferences.get("quiet_hours_start", 22)
+        end_hour = preferences.get("quiet_hours_end", 7)
+
+        # 방해금지 시간 처리 (예: 22시-7시)
+        if start_hour > end_hour:
+            # 다음날로 넘어가는 경우
+            return current_hour >= start_hour or current_hour < end_hour
+        # 같은 날 안에서 처리
+        return start_hour <= current_hour < end_hour
+    except Exception:
+        # 시간대 처리 오류시 방해금지 시간이 아닌 것으로 처리
+        return False
+
+
+def quiet_hours_end(preferences: Dict[str, Any], now: datetime) -> datetime:
+    """방해금지 시간이 끝나는 다음 시각 (UTC naive, ``created_at`` 등과 같은 기준)
+
+    ``now`` 는 timezone-aware 시각. 시간대 처리 오류시 1시간 뒤.
+    """
+    try:
+        timezone = pytz.timezone(preferences.get("quiet_hours_timezone", "Asia/Seoul"))
+        local_now = now.astimezone(timezone)
+        midnight = local_now.replace(hour=0, minute=0, second=0, microsecond=0)
+        end = midnight + timedelta(hours=preferences.get("quiet_hours_end", 7))
+        if end <= local_now:
+            end += timedelta(days=1)
+        return end.astimezone(pytz.utc).replace(tzinfo=None)
+    except Exception:
+        return now.astimezone(pytz.utc).replace(tzinfo=None) + timedelta(hours=1)
+
+
 class AlertsRepository:
+    _indexes_ensured = False
+
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
         self.subs = db["alert_subscriptions"]
@@ -18,9 +82,12 @@ class AlertsRepository:
         self.preferences = db["notification_preferences"]
 
     async def ensure_indexes(self) -> None:
-        await self.subs.create_index([("user_id", ASCENDING), ("is_active", ASCENDING), ("frequency", ASCENDING)])
-        await self.notifications.create_index([("user_id", ASCENDING), ("subscription_id", ASCENDING), ("content_id", ASCENDING)], unique=True)
-        await self.preferences.create_index([("user_id", ASCENDING)], unique=True)
+        """Apply the alerts index declarations once per process (workers without lifespan)"""
+        if AlertsRepository._indexes_ensured:
+            return
+        report = await apply_indexes_async(self.db, domains=["alerts"])
+        report.log()
+        AlertsRepository._indexes_ensured = not any(c.errors for c in report.collections)
 
     async def create_subscription(self, doc: AlertSubscription) -> str:
         res = await self.subs.insert_one(doc.model_dump(by_alias=True))
@@ -57,19 +124,35 @@ class AlertsRepository:
 
     # NotificationPreference CRUD methods
     async def get_user_preferences(self, user_id: Any) -> Optional[Dict[str, Any]]:
-        """사용자의 알림 설정 조회"""
+        """사용자의 알림 설정 조회 (preference cache 경유)"""
+        found, cached = preference_cache.get(PREFERENCES_CACHE_NAMESPACE, user_id)
+        if found:
+            return cached
         doc = await self.preferences.find_one({"user_id": user_id})
         if doc:
-            # Convert ObjectId to string for serialization
-            if "_id" in doc:
-                doc["_id"] = str(doc["_id"])
-            if "id" in doc:
-                doc["id"] = str(doc["id"])
+            doc = _serialize_preferences(doc)
+        preference_cache.set(PREFERENCES_CACHE_NAMESPACE, user_id, doc)
         return doc
 
+    async def get_many_user_preferences(self, user_ids: List[Any]) -> Dict[Any, Optional[Dict[str, Any]]]:
+        """여러 사용자의 알림 설정 일괄 조회 (캐시 미스만 ``$in`` 쿼리 한 번)
+
+        Returns:
+            user_id -> 설정 문서 (설정이 없는 사용자는 ``None``)
+        """
+        result, misses = preference_cache.get_many(PREFERENCES_CACHE_NAMESPACE, user_ids)
+        if misses:
+            fetched: Dict[Any, Optional[Dict[str, Any]]] = {user_id: None for user_id in misses}
+            async for doc in self.preferences.find({"user_id": {"$in": misses}}):
+                fetched[doc["user_id"]] = _serialize_preferences(doc)
+            preference_cache.set_many(PREFERENCES_CACHE_NAMESPACE, fetched)
+            result.update(fetched)
+        return result
+
     async def create_user_preferences(self, preferences: NotificationPreference) -> str:
         """사용자의 알림 설정 생성"""
         res = await self.preferences.insert_one(preferences.model_dump(by_alias=True))
+        preference_cache.invalidate(preferences.user_id, PREFERENCES_CACHE_NAMESPACE)
         return str(res.inserted_id)
 
     async def upsert_user_preferences(self, user_id: Any, preferences_data: Dict[str, Any]) -> bool:
@@ -90,6 +173,8 @@ class AlertsRepository:
             },
             upsert=True
         )
+        # write-through (새로 생성된 문서는 다음 조회에서 적재)
+        preference_cache.merge(PREFERENCES_CACHE_NAMESPACE, user_id, preferences_data)
         return res.matched_count > 0 or res.upserted_id is not None
 
     async def update_user_preferences(self, user_id: Any, updates: Dict[str, Any]) -> bool:
@@ -112,17 +197,25 @@ class AlertsRepository:
             {"user_id": user_id},
             {"$set": filtered_updates}
         )
+        if res.matched_count > 0:
+            preference_cache.merge(PREFERENCES_CACHE_NAMESPACE, user_id, filtered_updates)
+        else:
+            preference_cache.invalidate(user_id, PREFERENCES_CACHE_NAMESPACE)
         return res.matched_count > 0
 
     async def delete_user_preferences(self, user_id: Any) -> bool:
         """사용자의 알림 설정 삭제"""
         res = await self.preferences.delete_one({"user_id": user_id})
+        preference_cache.set(PREFERENCES_CACHE_NAMESPACE, user_id, None)
         return res.deleted_count > 0
 
     async def get_default_preferences(self) -> Dict[str, Any]:
-        """기본 알림 설정 반환"""
-        default_preferences = NotificationPreference(user_id="default")
-        return default_preferences.model_dump(exclude={"id", "user_id", "created_at", "updated_at"})
+        """기본 알림 설정 반환 (한 번만 생성, 호출자는 복사본을 받음)"""
+        global _default_preferences
+        if _default_preferences is None:
+            default_preferences = NotificationPreference(user_id="default")
+            _default_preferences = default_preferences.model_dump(exclude={"id", "user_id", "created_at", "updated_at"})
+        return copy_value(_default_preferences)
 
     async def get_users_with_preferences(self, 
                                        channel: Optional[str] = None,
@@ -169,39 +262,12 @@ class AlertsRepository:
 
     async def check_quiet_hours(self, user_id: Any) -> tuple[bool, Dict[str, Any]]:
         """사용자의 현재 시간이 방해금지 시간인지 확인"""
-        from datetime import datetime
-        import pytz
-        
         preferences = await self.get_user_preferences(user_id)
         
         if not preferences:
             return False, {}
             
-        if not preferences.get("quiet_hours_enabled", False):
-            return False, preferences
-            
-        timezone_str = preferences.get("quiet_hours_timezone", "Asia/Seoul")
-        try:
-            timezone = pytz.timezone(timezone_str)
-            current_time = datetime.now(timezone)
-            current_hour = current_time.hour
-            
-            start_hour = preferences.get("quiet_hours_start", 22)
-            end_hour = preferences.get("quiet_hours_end", 7)
-            
-            # 방해금지 시간 처리 (예: 22시-7시)
-            if start_hour > end_hour:
-                # 다음날로 넘어가는 경우
-                is_quiet = current_hour >= start_hour or current_hour < end_hour
-            else:
-                # 같은 날 안에서 처리
-                is_quiet = start_hour <= current_hour < end_hour
-                
-            return is_quiet, preferences
-            
-        except Exception:
-            # 시간대 처리 오류시 방해금지 시간이 아닌 것으로 처리
-            return False, preferences
+        return is_quiet_hours(preferences), preferences
 
     async def get_daily_notification_count(self, user_id: Any) -> int:
         """사용자의 오늘 알림 발송 수 조회"""
@@ -221,6 +287,40 @@ class AlertsRepository:
         
         return count
 
+    async def get_daily_notification_counts(self, user_ids: List[Any]) -> Dict[Any, int]:
+        """여러 사용자의 오늘 알림 발송 수 (aggregate 한 번)"""
+        if not user_ids:
+            return {}
+        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        today_end = today_start + timedelta(days=1)
+        cursor = self.notifications.aggregate([
+            {"$match": {
+                "user_id": {"$in": list(user_ids)},
+                "status": "sent",
+                "sent_at": {"$gte": today_start, "$lt": today_end},
+            }},
+            {"$group": {"_id": "$user_id", "count": {"$sum": 1}}},
+        ])
+        counts = {user_id: 0 for user_id in user_ids}
+        async for row in cursor:
+            counts[row["_id"]] = row["count"]
+        return counts
+
+    async def get_recent_notification_pairs(self, user_ids: List[Any], content_ids: List[Any], hours: int = 24) -> Set[Tuple[Any, Any]]:
+        """최근 N시간 내 생성된 (user_id, content_id) 쌍 (find 한 번)"""
+        if not user_ids or not content_ids:
+            return set()
+        since = datetime.utcnow() - timedelta(hours=hours)
+        cursor = self.notifications.find(
+            {
+                "user_id": {"$in": list(user_ids)},
+                "content_id": {"$in": list(content_ids)},
+                "created_at": {"$gte": since},
+            },
+            projection={"_id": 0, "user_id": 1, "content_id": 1},
+        )
+        return {(doc["user_id"], doc["content_id"]) async for doc in cursor}
+
     async def check_daily_limit(self, user_id: Any) -> tuple[bool, int, int]:
         """사용자의 일일 알림 한도 확인 (허용 여부, 현재 수, 최대 수)"""
         preferences = await self.get_user_preferences(user_id)
@@ -28,9 +28,8 @@ router = APIRouter(
 async def get_service() -> AlertsService:
     dbm = DatabaseManager()
     db = await dbm.get_async_database()
-    service = AlertsService(db)
-    await service.init()
-    return service
+    # 인덱스는 애플리케이션 시작 시 적용됨 (app.core.indexes)
+    return AlertsService(db)
 
 
 @router.post(
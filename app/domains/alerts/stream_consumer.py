@@ -0,0 +1,107 @@
+"""
+Event-driven alert matching.
+
+수집 경로가 ``AnnouncementCreatedEvent`` / ``AnnouncementUpdatedEvent`` 를 Redis Stream
+에 기록하면, 이 소비자가 consumer group (``alerts_stream_group``) 으로 읽어 해당 공고만
+매칭합니다. ``updated_at`` 구간을 주기적으로 훑지 않으므로 다시 수집된 (바뀌지 않은)
+공고는 재검사하지 않고, 알림 지연은 XREADGROUP block 시간 수준입니다.
+
+실행:
+    python -m app.domains.alerts.stream_consumer
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+from typing import Any, List, Optional, Tuple
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ...core.config import settings
+from ...shared.events.domain_events import AnnouncementUpdatedEvent, DomainEvent
+from ...shared.events.stream import EventStreamConsumer
+from .pipeline import AlertMatchingPipeline
+
+logger = logging.getLogger(__name__)
+
+# 수정 이벤트 중 매칭 결과에 영향을 주는 변경 필드
+MATCH_RELEVANT_CHANGES = {"announcement_data", "is_active"}
+
+
+class AlertEventHandler:
+    """Loads the announcements referenced by a batch of events (one query) and matches them"""
+
+    def __init__(self, db: AsyncIOMotorDatabase, pipeline: Optional[AlertMatchingPipeline] = None):
+        self.db = db
+        self.pipeline = pipeline or AlertMatchingPipeline(db, "announcements")
+
+    @staticmethod
+    def _is_relevant(event: DomainEvent) -> bool:
+        if isinstance(event, AnnouncementUpdatedEvent):
+            return bool(MATCH_RELEVANT_CHANGES.intersection(event.changes))
+        return True
+
+    async def __call__(self, events: List[DomainEvent]) -> None:
+        ids: List[Any] = []
+        for event in events:
+            if not self._is_relevant(event):
+                continue
+            announcement_id = getattr(event, "announcement_id", None)
+            if announcement_id:
+                ids.append(ObjectId(announcement_id) if ObjectId.is_valid(announcement_id) else announcement_id)
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return
+        cursor = self.db["announcements"].find({"_id": {"$in": ids}, "is_active": {"$ne": False}})
+        enqueued = await self.pipeline.process(cursor)
+        logger.info("Stream matching: %d announcements -> %d notifications", len(ids), enqueued)
+
+
+def consumer_name() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+async def create_consumer() -> Tuple[EventStreamConsumer, Any]:
+    """(consumer, redis client) - 호출한 이벤트 루프에 묶인 자원을 만듦"""
+    import redis.asyncio as aioredis  # type: ignore
+    from ...core.database import DatabaseManager
+    from .repository import AlertsRepository
+
+    db = await DatabaseManager().get_async_database()
+    await AlertsRepository(db).ensure_indexes()
+    redis_client = aioredis.from_url(settings.redis_url, decode_responses=True, socket_connect_timeout=2.0)
+    consumer = EventStreamConsumer(
+        redis_client,
+        group=settings.alerts_stream_group,
+        consumer=consumer_name(),
+        handler=AlertEventHandler(db),
+        batch_size=settings.alerts_stream_batch_size,
+        block_ms=settings.alerts_stream_block_ms,
+        claim_idle_ms=settings.alerts_stream_claim_idle_ms,
+        max_deliveries=settings.alerts_stream_max_deliveries,
+    )
+    return consumer, redis_client
+
+
+async def _main() -> None:  # pragma: no cover - process entrypoint
+    import signal
+
+    consumer, redis_client = await create_consumer()
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+    logger.info("Alert stream consumer %s started (group=%s)", consumer.consumer, consumer.group)
+    try:
+        await consumer.run_forever(stop_event)
+    finally:
+        await redis_client.aclose()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
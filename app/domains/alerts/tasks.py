@@ -2,28 +2,31 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from celery import shared_task
 from pymongo import ASCENDING, DESCENDING
 
 from ...core.celery_config import celery_app
 from ...core.config import settings
-from ...core.database import DatabaseManager
+from ...core.async_runtime import get_worker_database, run_async, worker_runtime
 from ...core.rate_limiter import RateLimiter, RateLimitConfig, RateLimitStrategy
 from .models import Notification
 from .service import AlertsService
+from .repository import AlertsRepository
 from .frequency_manager import NotificationFrequencyManager
-from ...shared.clients.email_client import EmailClient
-from ...shared.services.email_service import EmailService
+from .pipeline import AlertMatchingPipeline
+from ...core.lazy import LazyObject
 
+# 이메일 클라이언트/Jinja 템플릿 엔진은 실제 발송 시점에 import
+EmailClient = LazyObject("app.shared.clients.email_client:EmailClient")
+EmailService = LazyObject("app.shared.services.email_service:EmailService")
 
-logger = logging.getLogger(__name__)
 
+logger = logging.getLogger(__name__)
 
 async def _get_service() -> AlertsService:
-    dbm = DatabaseManager()
-    db = await dbm.get_async_database()
+    db = await get_worker_database()
     service = AlertsService(db)
     await service.init()
     return service
@@ -39,74 +42,18 @@ def match_and_enqueue(self, domain: str, since_minutes: int = 15) -> int:
         return 0
 
     try:
-        import asyncio
-
         async def _run() -> int:
-            dbm = DatabaseManager()
-            db = await dbm.get_async_database()
+            db = await get_worker_database()
             service = AlertsService(db)
             await service.init()
 
-            # Determine target collection by domain
-            collection = db[domain]
-
+            # 이벤트 스트림 소비자가 놓친 변경을 보완하는 주기 스캔
             since = datetime.utcnow() - timedelta(minutes=since_minutes)
-            cursor = collection.find({"updated_at": {"$gte": since}}).sort("updated_at", DESCENDING)
-
-            matched = 0
-            # Fetch active subscriptions (simple: all realtime)
-            subs_cursor = db["alert_subscriptions"].find({"is_active": True, "frequency": "realtime"})
-            subs = [s async for s in subs_cursor]
-
-            for sub in subs:
-                query = service.build_query(domain, sub.get("keywords", []), sub.get("filters"))
-                if not query:
-                    continue
-                # Get match threshold (default to 0.5 if not set)
-                threshold = sub.get("match_threshold", 0.5)
-                
-                # Search recent docs matched by subscription
-                docs = collection.find({"updated_at": {"$gte": since}, **query}, projection={"score": {"$meta": "textScore"}}).sort("score", DESCENDING)
-                async for d in docs:
-                    # Normalize text score (MongoDB text scores typically range from 0 to a few points)
-                    # We'll normalize by dividing by keyword count as a simple heuristic
-                    raw_score = d.get("score", 0)
-                    keyword_count = len(sub.get("keywords", []))
-                    normalized_score = min(1.0, raw_score / max(1, keyword_count))
-                    
-                    # Only create notification if score meets threshold
-                    if normalized_score >= threshold:
-                        # Check frequency manager for additional filtering
-                        freq_manager = NotificationFrequencyManager(db)
-                        should_send, reason = await freq_manager.should_send_notification(
-                            sub["user_id"], 
-                            "new_announcement", 
-                            str(d.get("_id"))
-                        )
-                        
-                        if should_send:
-                            # Check for blocked content
-                            is_blocked, block_reason = await freq_manager.is_content_blocked(sub["user_id"], d)
-                            
-                            if not is_blocked:
-                                notif = Notification(
-                                    subscription_id=sub["_id"],
-                                    user_id=sub["user_id"],
-                                    domain=domain,
-                                    content_id=d.get("_id"),
-                                    channel=(sub.get("channels") or ["email"])[0],
-                                    score=normalized_score,
-                                )
-                                await service.enqueue_notification(notif)
-                                matched += 1
-                                logger.debug(f"Matched content {d.get('_id')} with score {normalized_score:.2f} (threshold: {threshold})")
-                            else:
-                                logger.debug(f"Content {d.get('_id')} blocked for user {sub['user_id']}: {block_reason}")
-                        else:
-                            logger.debug(f"Notification skipped for user {sub['user_id']}: {reason}")
-            return matched
-
-        return asyncio.run(_run())
+            pipeline = AlertMatchingPipeline(db, domain, service=service)
+            cursor = db[domain].find({"updated_at": {"$gte": since}}).sort("updated_at", DESCENDING)
+            return await pipeline.process(cursor)
+
+        return run_async(_run())
 
     except Exception as e:
         logger.exception("match_and_enqueue failed: %s", e)
@@ -120,11 +67,8 @@ def send_notification(self, notification_id: str) -> bool:
         return False
     # Scaffold: fetch notification+user and send via EmailClient(dev)
     try:
-        import asyncio
-
         async def _run() -> bool:
-            dbm = DatabaseManager()
-            db = await dbm.get_async_database()
+            db = await get_worker_database()
             notif = await db["notifications"].find_one({"_id": notification_id})
             if not notif:
                 logger.warning("Notification not found: %s", notification_id)
@@ -236,12 +180,88 @@ def send_notification(self, notification_id: str) -> bool:
             
             return result.get("success", False)
 
-        return asyncio.run(_run())
+        return run_async(_run())
     except Exception as e:
         logger.exception("send_notification failed: %s", e)
         raise
 
 
+@shared_task(bind=True, name="app.domains.alerts.tasks.deliver_notifications")
+def deliver_notifications(self, max_batches: Optional[int] = None) -> Dict[str, int]:
+    """Drain queued notifications in batches (one loop / Mongo client / SMTP session per run).
+    Prefer this over per-notification send_notification for throughput.
+    """
+    if not settings.alerts_enabled:
+        logger.info("Alerts disabled, skipping deliver_notifications")
+        return {}
+
+    from .delivery import create_worker
+
+    async def _run() -> Dict[str, int]:
+        # Mongo / Redis 클라이언트는 워커 런타임 소유 (태스크가 닫지 않음)
+        worker, _ = await create_worker(await get_worker_database(), worker_runtime.redis())
+        try:
+            # 시간 예산: 큐의 soft time limit 전에 새 batch claim 을 멈춤 (진행 중인 batch 가 잘리지 않도록)
+            stats = await worker.drain(
+                max_batches or settings.alerts_delivery_max_batches,
+                time_budget=settings.alerts_delivery_time_budget_seconds,
+            )
+            return stats.to_dict()
+        finally:
+            await worker.close()
+
+    try:
+        return run_async(_run())
+    except Exception as e:
+        logger.exception("deliver_notifications failed: %s", e)
+        raise
+
+
+@shared_task(bind=True, name="app.domains.alerts.tasks.materialize_deadline_reminders")
+def materialize_deadline_reminders(self, since_minutes: Optional[int] = None) -> int:
+    """Write upcoming deadline reminders into hourly buckets (incremental when since_minutes is set)"""
+    if not settings.alerts_enabled:
+        logger.info("Alerts disabled, skipping materialize_deadline_reminders")
+        return 0
+
+    from .reminders import DeadlineReminderScheduler
+
+    async def _run() -> int:
+        db = await get_worker_database()
+        await AlertsRepository(db).ensure_indexes()
+        return await DeadlineReminderScheduler(db).materialize(since_minutes=since_minutes)
+
+    try:
+        return run_async(_run())
+    except Exception as e:
+        logger.exception("materialize_deadline_reminders failed: %s", e)
+        raise
+
+
+@shared_task(bind=True, name="app.domains.alerts.tasks.dispatch_deadline_reminders")
+def dispatch_deadline_reminders(self) -> Dict[str, int]:
+    """Claim and send the reminders of the current hour bucket"""
+    if not settings.alerts_enabled:
+        logger.info("Alerts disabled, skipping dispatch_deadline_reminders")
+        return {}
+
+    from .delivery import GLOBAL_BUCKET_KEY
+    from .reminders import DeadlineReminderScheduler
+    from ...core.token_bucket import TokenBucket
+
+    async def _run() -> Dict[str, int]:
+        db = await get_worker_database()
+        bucket = TokenBucket(GLOBAL_BUCKET_KEY, rate=settings.alerts_global_rps, redis_client=worker_runtime.redis())
+        scheduler = DeadlineReminderScheduler(db, bucket=bucket)
+        return (await scheduler.run_due(time_budget=settings.alerts_delivery_time_budget_seconds)).to_dict()
+
+    try:
+        return run_async(_run())
+    except Exception as e:
+        logger.exception("dispatch_deadline_reminders failed: %s", e)
+        raise
+
+
 @shared_task(bind=True, name="app.domains.alerts.tasks.digest_daily")
 def digest_daily(self) -> int:
     if not settings.alerts_enabled:
@@ -249,150 +269,16 @@ def digest_daily(self) -> int:
         return 0
     
     try:
-        import asyncio
-        
+        from .digest import DailyDigestEngine
+
         async def _run() -> int:
-            dbm = DatabaseManager()
-            db = await dbm.get_async_database()
-            
-            # Get users who have daily digest enabled in preferences
-            daily_users_prefs = await svc.repository.get_users_with_preferences(
-                category="digest_notifications",
-                digest_frequency="daily"
-            )
-            
-            # Also include users with daily subscriptions (backward compatibility)
-            daily_users_subs = db["alert_subscriptions"].find({
-                "frequency": "daily",
-                "is_active": True
-            }).distinct("user_id")
-            
-            # Combine both sets of users
-            all_daily_users = set()
-            
-            # Add users from preferences
-            for pref in daily_users_prefs:
-                all_daily_users.add(pref["user_id"])
-            
-            # Add users from subscriptions
-            async for user_id in daily_users_subs:
-                all_daily_users.add(user_id)
-            
-            sent_count = 0
-            yesterday = datetime.utcnow() - timedelta(days=1)
-            
-            # Initialize service for preference checks
-            service = AlertsService(db)
-            await service.init()
-            
-            for user_id in all_daily_users:
-                try:
-                    # Get user info
-                    user = await db["users"].find_one({"_id": user_id})
-                    if not user or not user.get("email"):
-                        continue
-                    
-                    # Check if digest notifications are allowed for this user
-                    is_allowed, preferences = await service.repository.is_notification_allowed(
-                        user_id, 
-                        "email", 
-                        "digest_notifications"
-                    )
-                    if not is_allowed:
-                        logger.debug(f"Digest notification blocked by preferences for {user_id}")
-                        continue
-                    
-                    # Check quiet hours (digest could be sent during quiet time, but respect user preference)
-                    is_quiet, _ = await service.repository.check_quiet_hours(user_id)
-                    if is_quiet:
-                        logger.debug(f"Digest blocked by quiet hours for {user_id}")
-                        continue
-                    
-                    # Get user's subscriptions
-                    user_subs = []
-                    async for sub in db["alert_subscriptions"].find({
-                        "user_id": user_id,
-                        "is_active": True
-                    }):
-                        user_subs.append(sub)
-                    
-                    if not user_subs:
-                        continue
-                    
-                    # Aggregate new announcements for the user
-                    new_announcements = []
-                    deadline_announcements = []
-                    
-                    for sub in user_subs:
-                        # Find new announcements matching this subscription
-                        service = AlertsService(db)
-                        query = service.build_query("announcements", sub.get("keywords", []), sub.get("filters"))
-                        if query:
-                            query["created_at"] = {"$gte": yesterday}
-                            
-                            async for content in db["announcements"].find(query).limit(5):
-                                new_announcements.append({
-                                    **content,
-                                    "url": f"{settings.frontend_url}/announcements/{content['_id']}",
-                                    "match_score": 0.8  # Simplified for digest
-                                })
-                        
-                        # Find deadline announcements
-                        deadline_query = {}
-                        if sub.get("filters"):
-                            deadline_query = service.build_query("announcements", [], sub.get("filters"))
-                        
-                        # Announcements expiring in the next 7 days
-                        deadline_query["application_end_date"] = {
-                            "$gte": datetime.utcnow(),
-                            "$lte": datetime.utcnow() + timedelta(days=7)
-                        }
-                        
-                        async for content in db["announcements"].find(deadline_query).limit(5):
-                            days_left = (content.get("application_end_date", datetime.utcnow()) - datetime.utcnow()).days
-                            deadline_announcements.append({
-                                **content,
-                                "url": f"{settings.frontend_url}/announcements/{content['_id']}",
-                                "days_left": max(0, days_left)
-                            })
-                    
-                    # Remove duplicates
-                    new_announcements = {ann["_id"]: ann for ann in new_announcements}.values()
-                    deadline_announcements = {ann["_id"]: ann for ann in deadline_announcements}.values()
-                    
-                    # Generate stats
-                    stats = {
-                        "new_this_week": len(new_announcements),
-                        "matched_this_week": len(new_announcements),
-                        "deadline_this_week": len(deadline_announcements),
-                        "popular_keywords": [kw for sub in user_subs for kw in sub.get("keywords", [])][:3]
-                    }
-                    
-                    # Send digest email
-                    email_service = EmailService()
-                    result = await email_service.send_daily_digest(
-                        user_email=user["email"],
-                        user_name=user.get("name", "사용자"),
-                        new_announcements=list(new_announcements),
-                        deadline_announcements=list(deadline_announcements),
-                        stats=stats,
-                        tracking_id=f"digest_{user_id}_{datetime.utcnow().strftime('%Y%m%d')}"
-                    )
-                    
-                    if result.get("success"):
-                        sent_count += 1
-                        logger.info(f"Daily digest sent to {user['email']}")
-                    else:
-                        logger.warning(f"Failed to send digest to {user['email']}: {result.get('error')}")
-                        
-                except Exception as e:
-                    logger.error(f"Error sending digest to user {user_id}: {e}")
-                    continue
-            
-            logger.info(f"Daily digest completed: {sent_count} emails sent")
-            return sent_count
+            db = await get_worker_database()
+
+            # 신규/마감 공고와 구독을 집합 단위로 한 번씩 읽어 메모리에서 매칭
+            report = await DailyDigestEngine(db).run()
+            return report.sent
         
-        return asyncio.run(_run())
+        return run_async(_run())
         
     except Exception as e:
         logger.exception("digest_daily failed: %s", e)
@@ -11,12 +11,19 @@ from dataclasses import dataclass
 from ...shared.clients.kstartup_api_client import KStartupAPIClient
 from ...shared.models.kstartup import AnnouncementItem, KStartupAnnouncementResponse
 from ...shared.exceptions import APIResponseError, DataValidationError
+from ...shared.jobs import CollectionJobStore, default_worker_id, new_job_id
+from ...core.config import settings
+from ...core.distributed_lock import RedisLease, ensure_lease
+from .events import publish_announcements_created
 from .repository import AnnouncementRepository
 from .schemas import AnnouncementCreate
 from .models import Announcement
 
 logger = logging.getLogger(__name__)
 
+# 사업공고 전체 수집 작업이 공유하는 single-flight 락 (batch-collect, 수집 태스크)
+COLLECTION_LOCK = "announcements.collect"
+
 
 @dataclass
 class BatchResult:
@@ -28,6 +35,11 @@ class BatchResult:
     error_items: int
     processing_time: float
     errors: List[str]
+    job_id: Optional[str] = None
+    # 이전 실행에서 이미 완료되어 건너뛴 페이지 수
+    resumed_pages: int = 0
+    # 작업의 모든 페이지 구간이 완료됨 (다른 워커가 처리한 구간 포함)
+    job_completed: bool = False
 
 
 @dataclass
@@ -40,17 +52,38 @@ class BatchProgress:
     start_time: datetime
     elapsed_time: float
     estimated_remaining_time: float
+    job_id: Optional[str] = None
+    pages_done: int = 0
+    # 이번 실행에서 처리한 페이지 (처리 속도 계산용)
+    pages_this_run: int = 0
+    new_items: int = 0
+    duplicate_items: int = 0
+    error_count: int = 0
+    # running / completed / failed (마지막 보고에서만 종료 상태)
+    status: str = "running"
 
 
 class AnnouncementBatchService:
     """사업공고 대량 데이터 수집 배치 서비스"""
     
-    def __init__(self, repository: AnnouncementRepository, api_client: KStartupAPIClient):
+    def __init__(
+        self,
+        repository: AnnouncementRepository,
+        api_client: KStartupAPIClient,
+        job_store: Optional[CollectionJobStore] = None,
+    ):
         self.repository = repository
         self.api_client = api_client
         self.batch_size = 100  # 페이지당 항목 수
         self.max_concurrent_requests = 5  # 동시 요청 수 제한
         self.progress_callback = None
+        self._job_store = job_store
+
+    @property
+    def job_store(self) -> CollectionJobStore:
+        if self._job_store is None:
+            self._job_store = CollectionJobStore(self.repository.db)
+        return self._job_store
         
     def set_progress_callback(self, callback):
         """진행 상황 콜백 함수 설정"""
@@ -60,15 +93,32 @@ class AnnouncementBatchService:
         self, 
         max_pages: Optional[int] = None,
         business_type: Optional[str] = None,
-        business_name: Optional[str] = None
+        business_name: Optional[str] = None,
+        job_id: Optional[str] = None,
+        worker_id: Optional[str] = None,
+        lease: Optional[RedisLease] = None,
     ) -> BatchResult:
-        """모든 사업공고 데이터를 대량으로 수집"""
+        """모든 사업공고 데이터를 대량으로 수집
+
+        페이지 범위는 job 단위로 체크포인트됩니다. 같은 ``job_id`` 로 다시 호출하면 완료된
+        구간은 건너뛰고, 여러 워커가 같은 ``job_id`` 로 실행하면 구간을 lease 로 나눠
+        처리합니다. ``lease`` (``COLLECTION_LOCK``) 를 잃으면 벌크 삽입과 구간 완료 기록 전에
+        중단합니다.
+        """
         start_time = datetime.now()
+        job_id = job_id or new_job_id("batch_collect")
+        worker_id = worker_id or default_worker_id()
         total_processed = 0
         new_items = 0
         duplicate_items = 0
         error_items = 0
         errors = []
+        total_pages = 0
+        resumed_pages = 0
+        pages_this_run = 0
+        pages_done = 0
+        estimated_total = 0
+        job_completed = False
         
         try:
             # 1. 총 데이터 양 추정
@@ -89,8 +139,21 @@ class AnnouncementBatchService:
             
             if max_pages:
                 total_pages = min(total_pages, max_pages)
+
+            # 재개 시에는 처음 등록된 페이지 범위를 그대로 사용
+            job = self.job_store.ensure_job(
+                job_id,
+                kind="announcements.batch_collect",
+                first_page=1,
+                last_page=total_pages,
+                chunk_pages=settings.collection_job_chunk_pages,
+                params={"max_pages": max_pages, "business_type": business_type, "business_name": business_name},
+            )
+            total_pages = job.get("last_page") or total_pages
+            resumed_pages = self.job_store.progress(job_id).pages_done
                 
-            logger.info(f"예상 총 페이지: {total_pages}, 배치 크기: {self.batch_size}")
+            logger.info(f"[{job_id}] 예상 총 페이지: {total_pages}, 배치 크기: {self.batch_size}, "
+                        f"이미 완료된 페이지: {resumed_pages}")
             
             # 2. 배치 단위로 병렬 처리
             semaphore = asyncio.Semaphore(self.max_concurrent_requests)
@@ -104,7 +167,7 @@ class AnnouncementBatchService:
                 
                 tasks = []
                 for page in range(page_start, min(page_end, total_pages + 1)):
-                    tasks.append(self._process_single_page(semaphore, page, business_type, business_name))
+                    tasks.append(self._process_single_page(semaphore, page, business_type, business_name, lease))
                 
                 results = await asyncio.gather(*tasks, return_exceptions=True)
                 
@@ -121,53 +184,74 @@ class AnnouncementBatchService:
                 
                 return batch_processed, batch_new, batch_duplicates, batch_errors
             
-            # 3. 대용량 처리를 위한 청크 단위 실행
-            chunk_size = 20  # 한 번에 처리할 페이지 수
-            current_page = 1
-            
-            while current_page <= total_pages:
-                chunk_end = min(current_page + chunk_size, total_pages + 1)
+            # 3. 대용량 처리를 위한 청크 단위 실행 (남은 구간을 하나씩 lease)
+            while (chunk := self.job_store.claim(job_id, worker_id)) is not None:
+                chunk_start, chunk_end = chunk.next_page, chunk.end + 1
                 
-                logger.info(f"페이지 {current_page}-{chunk_end-1} 처리 중...")
+                logger.info(f"[{job_id}] 페이지 {chunk_start}-{chunk_end-1} 처리 중...")
                 
-                batch_processed, batch_new, batch_duplicates, batch_errors = await process_page_batch(
-                    current_page, chunk_end
-                )
+                try:
+                    batch_processed, batch_new, batch_duplicates, batch_errors = await process_page_batch(
+                        chunk_start, chunk_end
+                    )
+                    # fencing: lease 를 잃었으면 완료 기록 없이 구간 반납
+                    ensure_lease(lease)
+                except BaseException:
+                    # 취소 / 타임아웃: lease 만료를 기다리지 않고 바로 다른 워커가 가져가도록
+                    self.job_store.release(chunk, "interrupted")
+                    raise
                 
                 total_processed += batch_processed
                 new_items += batch_new
                 duplicate_items += batch_duplicates
                 errors.extend(batch_errors)
+                pages_this_run += chunk_end - chunk_start
+
+                if not self.job_store.complete(chunk, {
+                    "processed": batch_processed,
+                    "new": batch_new,
+                    "duplicates": batch_duplicates,
+                    "errors": len(batch_errors),
+                }):
+                    # lease 만료 후 다른 워커가 가져간 구간: 결과는 저장됐고 중복은 check_duplicate 가 거름
+                    logger.warning(f"[{job_id}] 페이지 {chunk_start}-{chunk_end-1} lease 만료, 완료 기록 생략")
                 
-                # 진행 상황 보고
+                # 진행 상황 보고 (다른 워커가 처리한 구간 포함)
+                pages_done = self.job_store.progress(job_id).pages_done
                 elapsed_time = (datetime.now() - start_time).total_seconds()
                 estimated_remaining = 0
-                if current_page > 1:
-                    avg_time_per_page = elapsed_time / (current_page - 1)
-                    remaining_pages = total_pages - current_page + 1
-                    estimated_remaining = avg_time_per_page * remaining_pages
+                if pages_this_run:
+                    avg_time_per_page = elapsed_time / pages_this_run
+                    estimated_remaining = avg_time_per_page * max(0, total_pages - pages_done)
                 
                 progress = BatchProgress(
-                    current_page=current_page,
+                    current_page=chunk_end - 1,
                     total_pages=total_pages,
                     processed_items=total_processed,
                     estimated_total=estimated_total,
                     start_time=start_time,
                     elapsed_time=elapsed_time,
-                    estimated_remaining_time=estimated_remaining
+                    estimated_remaining_time=estimated_remaining,
+                    job_id=job_id,
+                    pages_done=pages_done,
+                    pages_this_run=pages_this_run,
+                    new_items=new_items,
+                    duplicate_items=duplicate_items,
+                    error_count=len(errors),
                 )
                 
                 if self.progress_callback:
                     await self.progress_callback(progress)
                     
-                logger.info(f"진행상황: {current_page}/{total_pages} 페이지, "
+                logger.info(f"[{job_id}] 진행상황: {pages_done}/{total_pages} 페이지, "
                           f"처리된 항목: {total_processed}, 신규: {new_items}, "
                           f"중복: {duplicate_items}, 오류: {len(errors)}")
                 
-                current_page = chunk_end
-                
                 # 메모리 정리를 위한 짧은 대기
                 await asyncio.sleep(0.1)
+
+            job_completed = self.job_store.finish_if_done(job_id)
+            pages_done = self.job_store.progress(job_id).pages_done
                 
         except Exception as e:
             logger.error(f"배치 수집 중 오류: {e}")
@@ -175,6 +259,25 @@ class AnnouncementBatchService:
             error_items += 1
             
         processing_time = (datetime.now() - start_time).total_seconds()
+
+        # 최종 보고 (다른 워커가 남은 구간을 처리 중이면 running 유지)
+        if self.progress_callback:
+            await self.progress_callback(BatchProgress(
+                current_page=total_pages,
+                total_pages=total_pages,
+                processed_items=total_processed,
+                estimated_total=estimated_total,
+                start_time=start_time,
+                elapsed_time=processing_time,
+                estimated_remaining_time=0,
+                job_id=job_id,
+                pages_done=pages_done,
+                pages_this_run=pages_this_run,
+                new_items=new_items,
+                duplicate_items=duplicate_items,
+                error_count=len(errors),
+                status="failed" if error_items else ("completed" if job_completed else "running"),
+            ))
         
         result = BatchResult(
             total_requested=total_pages * self.batch_size,
@@ -183,7 +286,10 @@ class AnnouncementBatchService:
             duplicate_items=duplicate_items,
             error_items=error_items,
             processing_time=processing_time,
-            errors=errors
+            errors=errors,
+            job_id=job_id,
+            resumed_pages=resumed_pages,
+            job_completed=job_completed,
         )
         
         logger.info(f"배치 수집 완료: {result}")
@@ -194,7 +300,8 @@ class AnnouncementBatchService:
         semaphore: asyncio.Semaphore, 
         page_no: int,
         business_type: Optional[str] = None,
-        business_name: Optional[str] = None
+        business_name: Optional[str] = None,
+        lease: Optional[RedisLease] = None,
     ) -> Tuple[int, int, int, List[str]]:
         """단일 페이지 처리"""
         async with semaphore:
@@ -254,9 +361,12 @@ class AnnouncementBatchService:
                 
                 # 벌크 삽입 실행
                 if items_to_create:
+                    ensure_lease(lease)
                     try:
                         created_items = await self.repository.create_many(items_to_create)
                         new_items = len(created_items)
+                        # Redis 파이프라인은 동기 호출이라 이벤트 루프를 막지 않도록 스레드에서 발행
+                        await asyncio.to_thread(publish_announcements_created, created_items)
                         logger.debug(f"페이지 {page_no}: {new_items}개 신규 항목 생성")
                     except Exception as e:
                         errors.append(f"페이지 {page_no} 벌크 삽입 오류: {str(e)}")
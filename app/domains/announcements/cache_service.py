@@ -3,11 +3,14 @@ Redis 캐싱 서비스 for Announcements
 """
 import json
 import hashlib
-from typing import Optional, Any, Dict
+import threading
+from typing import Optional, Any, Dict, Tuple
 from datetime import timedelta
 import redis
 import logging
 from ...core.config import settings
+from ...core.timing import timed
+from ...core.compression import compress, compression_level
 
 logger = logging.getLogger(__name__)
 
@@ -15,26 +18,55 @@ class AnnouncementCacheService:
     """Redis 기반 공고 캐싱 서비스"""
     
     def __init__(self):
-        """Redis 클라이언트 초기화"""
-        try:
-            self.redis_client = redis.Redis(
-                host=settings.REDIS_HOST,
-                port=settings.REDIS_PORT,
-                db=settings.REDIS_DB,
-                decode_responses=True,
-                socket_keepalive=True,
-                socket_connect_timeout=5,
-                retry_on_timeout=True,
-                health_check_interval=30
-            )
-            # 연결 테스트
-            self.redis_client.ping()
-            self.enabled = True
-            logger.info("Redis cache service initialized successfully")
-        except Exception as e:
-            logger.warning(f"Redis not available, caching disabled: {e}")
-            self.redis_client = None
-            self.enabled = False
+        """Redis 클라이언트는 첫 사용 시 연결 (import 시점에 네트워크 접근 없음)"""
+        self.redis_client = None
+        self.raw_client = None
+        self._enabled: Optional[bool] = None
+        self._connect_lock = threading.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        if self._enabled is None:
+            self._connect()
+        return self._enabled
+    
+    def _connect(self) -> None:
+        """Redis 클라이언트 초기화 (최초 1회)"""
+        with self._connect_lock:
+            if self._enabled is not None:
+                return
+            try:
+                redis_client = redis.Redis(
+                    host=settings.REDIS_HOST,
+                    port=settings.REDIS_PORT,
+                    db=settings.REDIS_DB,
+                    decode_responses=True,
+                    socket_keepalive=True,
+                    socket_connect_timeout=5,
+                    retry_on_timeout=True,
+                    health_check_interval=30
+                )
+                # 직렬화된 응답 바이트를 그대로 주고받는 클라이언트 (디코딩 없음)
+                raw_client = redis.Redis(
+                    host=settings.REDIS_HOST,
+                    port=settings.REDIS_PORT,
+                    db=settings.REDIS_DB,
+                    decode_responses=False,
+                    socket_keepalive=True,
+                    socket_connect_timeout=5,
+                    retry_on_timeout=True,
+                    health_check_interval=30
+                )
+                # 연결 테스트
+                redis_client.ping()
+                self.redis_client, self.raw_client = redis_client, raw_client
+                self._enabled = True
+                logger.info("Redis cache service initialized successfully")
+            except Exception as e:
+                logger.warning(f"Redis not available, caching disabled: {e}")
+                self.redis_client = None
+                self.raw_client = None
+                self._enabled = False
     
     def _generate_cache_key(self, prefix: str, params: Dict[str, Any]) -> str:
         """캐시 키 생성"""
@@ -49,7 +81,8 @@ class AnnouncementCacheService:
             return None
             
         try:
-            cached_data = self.redis_client.get(cache_key)
+            with timed("cache_get"):
+                cached_data = self.redis_client.get(cache_key)
             if cached_data:
                 logger.debug(f"Cache hit for key: {cache_key}")
                 return json.loads(cached_data)
@@ -71,17 +104,100 @@ class AnnouncementCacheService:
             
         try:
             serialized_data = json.dumps(data, ensure_ascii=False, default=str)
-            self.redis_client.setex(
-                cache_key,
-                ttl_seconds,
-                serialized_data
-            )
+            with timed("cache_set"):
+                self.redis_client.setex(
+                    cache_key,
+                    ttl_seconds,
+                    serialized_data
+                )
             logger.debug(f"Cached response for key: {cache_key} (TTL: {ttl_seconds}s)")
             return True
         except Exception as e:
             logger.error(f"Error setting cache: {e}")
             return False
     
+    def get_cached_bytes(
+        self,
+        cache_key: str,
+        encoding: Optional[str] = None
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        직렬화된 응답 바이트 조회 (파싱하지 않음)
+        
+        encoding이 주어지면 미리 압축해 둔 변형(`{key}:{encoding}`)을 우선 반환.
+        원본만 있으면 한 번 압축해서 원본의 남은 TTL로 변형을 채워 둔다.
+        
+        Returns:
+            (body, 적용된 Content-Encoding 또는 None)
+        """
+        if not self.enabled:
+            return None, None
+            
+        try:
+            if encoding is None:
+                with timed("cache_get"):
+                    cached_data = self.raw_client.get(cache_key)
+                logger.debug(f"Cache {'hit' if cached_data else 'miss'} for key: {cache_key}")
+                return cached_data, None
+            
+            variant_key = f"{cache_key}:{encoding}"
+            with timed("cache_get"):
+                pipe = self.raw_client.pipeline(transaction=False)
+                pipe.get(variant_key)
+                pipe.get(cache_key)
+                pipe.pttl(cache_key)
+                variant, raw, pttl = pipe.execute()
+            
+            if variant:
+                logger.debug(f"Cache hit for key: {variant_key}")
+                return variant, encoding
+            if not raw:
+                logger.debug(f"Cache miss for key: {cache_key}")
+                return None, None
+            if len(raw) < settings.compression_minimum_size:
+                return raw, None
+            
+            compressed = compress(raw, encoding, compression_level(encoding, len(raw), precompress=True))
+            if pttl and pttl > 0:
+                with timed("cache_set"):
+                    self.raw_client.set(variant_key, compressed, px=pttl)
+            return compressed, encoding
+        except Exception as e:
+            logger.error(f"Error getting cache: {e}")
+            return None, None
+    
+    def set_cached_bytes(
+        self,
+        cache_key: str,
+        body: bytes,
+        ttl_seconds: int = 60,
+        encoding: Optional[str] = None
+    ) -> Tuple[bytes, Optional[str]]:
+        """
+        응답으로 보낸 바이트를 그대로 캐싱 (재직렬화 없음)
+        
+        encoding이 주어지면 압축 변형도 함께 저장하고, 응답으로 보낼
+        (body, Content-Encoding)을 반환해 같은 압축 결과를 재사용한다.
+        """
+        served: Tuple[bytes, Optional[str]] = (body, None)
+        if encoding is not None and len(body) >= settings.compression_minimum_size:
+            served = (compress(body, encoding, compression_level(encoding, len(body), precompress=True)), encoding)
+        
+        if not self.enabled:
+            return served
+            
+        try:
+            with timed("cache_set"):
+                pipe = self.raw_client.pipeline(transaction=False)
+                pipe.setex(cache_key, ttl_seconds, body)
+                if served[1] is not None:
+                    pipe.setex(f"{cache_key}:{served[1]}", ttl_seconds, served[0])
+                pipe.execute()
+            logger.debug(f"Cached response for key: {cache_key} (TTL: {ttl_seconds}s)")
+        except Exception as e:
+            logger.error(f"Error setting cache: {e}")
+        return served
+    
     def invalidate_cache(self, pattern: str = "announcements:*") -> int:
         """캐시 무효화"""
         if not self.enabled:
@@ -130,6 +246,30 @@ class AnnouncementCacheService:
         cache_key = self._generate_cache_key("announcements:list", params)
         return self.set_cached_response(cache_key, data, ttl_seconds)
     
+    def get_announcements_list_bytes(
+        self,
+        page: int,
+        size: int,
+        encoding: Optional[str] = None,
+        **filters
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """공고 목록 캐시 조회 (직렬화/사전 압축된 바이트)"""
+        cache_key = self._generate_cache_key("announcements:list", {"page": page, "size": size, **filters})
+        return self.get_cached_bytes(cache_key, encoding)
+    
+    def set_announcements_list_bytes(
+        self,
+        page: int,
+        size: int,
+        body: bytes,
+        ttl_seconds: int = 60,
+        encoding: Optional[str] = None,
+        **filters
+    ) -> Tuple[bytes, Optional[str]]:
+        """공고 목록 캐싱 (원본 + 협상된 인코딩의 압축본)"""
+        cache_key = self._generate_cache_key("announcements:list", {"page": page, "size": size, **filters})
+        return self.set_cached_bytes(cache_key, body, ttl_seconds, encoding)
+    
     def get_announcement_detail_cache(self, announcement_id: str) -> Optional[Dict]:
         """공고 상세 캐시 조회"""
         cache_key = f"announcements:detail:{announcement_id}"
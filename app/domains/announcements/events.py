@@ -0,0 +1,40 @@
+"""
+사업공고 수집 이벤트 발행 (Redis Stream).
+
+수집 경로 (``fetch_and_save_announcements``, ``AnnouncementBatchService``,
+``bulk_create_announcements``) 와 수정 경로가 저장 직후 호출합니다. 발행 실패는
+수집을 막지 않습니다 (``EventStreamPublisher.publish`` 가 로그만 남김).
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from ...shared.events.domain_events import AnnouncementCreatedEvent, AnnouncementUpdatedEvent
+from ...shared.events.stream import event_stream_publisher
+from .models import Announcement
+
+
+def announcement_created_event(announcement: Announcement) -> Optional[AnnouncementCreatedEvent]:
+    if not announcement.id:
+        return None
+    data = announcement.announcement_data
+    return AnnouncementCreatedEvent(
+        announcement_id=str(announcement.id),
+        title=data.title or data.business_name or "",
+        organization_name=data.organization or data.supervising_institution or "",
+        category_code=data.business_category,
+    )
+
+
+def publish_announcements_created(announcements: Iterable[Announcement]) -> int:
+    """새로 저장된 공고마다 AnnouncementCreatedEvent 발행 (파이프라인 한 번)"""
+    events = [e for e in (announcement_created_event(a) for a in announcements) if e is not None]
+    return event_stream_publisher.publish(events)
+
+
+def publish_announcement_updated(announcement_id: str, changes: Dict[str, Any]) -> int:
+    """실제 변경이 있을 때만 AnnouncementUpdatedEvent 발행"""
+    if not changes:
+        return 0
+    return event_stream_publisher.publish([
+        AnnouncementUpdatedEvent(announcement_id=str(announcement_id), changes=changes)
+    ])
@@ -0,0 +1,88 @@
+"""Announcement domain index declarations (applied by app.core.indexes)
+
+create_indexes.js, scripts/init-mongo.js, scripts/optimize_indexes.py 에
+흩어져 있던 정의를 통합했습니다. 키가 같은 중복 정의는 하나로 합쳤습니다.
+"""
+
+from pymongo import ASCENDING, DESCENDING, TEXT
+
+from ...core.indexes import IndexSpec, index_registry
+from ...shared.jobs.checkpoints import CHUNKS_COLLECTION, JOBS_COLLECTION
+
+COLLECTION = "announcements"
+
+index_registry.register(
+    "announcements",
+    # 목록 조회 (is_active + 최신순)
+    IndexSpec.build(COLLECTION, [("is_active", ASCENDING), ("created_at", DESCENDING)], name="idx_active_created"),
+    IndexSpec.build(COLLECTION, [("created_at", DESCENDING)], name="idx_created"),
+    IndexSpec.build(COLLECTION, [("updated_at", DESCENDING)], name="idx_updated_at"),
+    IndexSpec.build(
+        COLLECTION,
+        [("announcement_data.business_id", ASCENDING), ("is_active", ASCENDING)],
+        name="idx_business_id_active",
+    ),
+    IndexSpec.build(COLLECTION, [("announcement_data.business_name", ASCENDING)], name="idx_business_name"),
+    IndexSpec.build(
+        COLLECTION,
+        [("announcement_data.business_type", ASCENDING), ("is_active", ASCENDING), ("created_at", DESCENDING)],
+        name="idx_business_type_active",
+    ),
+    IndexSpec.build(
+        COLLECTION,
+        [("announcement_data.status", ASCENDING), ("is_active", ASCENDING)],
+        name="idx_status_active",
+    ),
+    IndexSpec.build(
+        COLLECTION,
+        [("announcement_data.status", ASCENDING), ("announcement_data.deadline", DESCENDING)],
+        name="idx_status_deadline",
+    ),
+    IndexSpec.build(
+        COLLECTION,
+        [("is_active", ASCENDING), ("announcement_data.announcement_date", DESCENDING)],
+        name="idx_active_announcement_date",
+    ),
+    IndexSpec.build(
+        COLLECTION,
+        [("is_active", ASCENDING), ("announcement_data.end_date", ASCENDING)],
+        name="idx_active_end_date",
+    ),
+    IndexSpec.build(
+        COLLECTION,
+        [("announcement_data.start_date", ASCENDING), ("announcement_data.end_date", ASCENDING), ("is_active", ASCENDING)],
+        name="idx_date_range",
+    ),
+    IndexSpec.build(
+        COLLECTION,
+        [("announcement_data.announcement_id", ASCENDING)],
+        name="idx_announcement_id",
+        unique=True,
+        sparse=True,
+    ),
+    # 컬렉션당 텍스트 인덱스는 하나만 허용됨. MongoDB 텍스트 검색은 한국어
+    # 형태소 분석을 지원하지 않으므로 default_language="none" (토큰 단위 매칭)
+    IndexSpec.build(
+        COLLECTION,
+        [
+            ("announcement_data.title", TEXT),
+            ("announcement_data.content", TEXT),
+            ("announcement_data.business_name", TEXT),
+        ],
+        name="idx_text_search",
+        default_language="none",
+    ),
+)
+
+# 대량 수집 작업 체크포인트 (app.shared.jobs)
+index_registry.register(
+    "announcements",
+    # claim: job 의 pending / 만료된 구간을 start 순으로
+    IndexSpec.build(
+        CHUNKS_COLLECTION,
+        [("job_id", ASCENDING), ("status", ASCENDING), ("start", ASCENDING)],
+        name="idx_job_status_start",
+    ),
+    IndexSpec.build(CHUNKS_COLLECTION, "expire_at", name="ttl_expire_at", expireAfterSeconds=0),
+    IndexSpec.build(JOBS_COLLECTION, "expire_at", name="ttl_expire_at", expireAfterSeconds=0),
+)
@@ -9,6 +9,7 @@ from datetime import datetime
 from pymongo.database import Database
 from ...core.interfaces.base_repository import BaseRepository, QueryFilter, SortOption, PaginationResult
 from .models import Announcement, AnnouncementCreate, AnnouncementUpdate
+from .events import publish_announcements_created
 from ...core.database import get_database
 import logging
 
@@ -302,10 +303,12 @@ class AnnouncementRepository(BaseRepository[Announcement, AnnouncementCreate, An
     def bulk_create_announcements(self, announcements: List[AnnouncementCreate]) -> List[Announcement]:
         """Bulk create announcements"""
         try:
-            return self.create_many(announcements)
+            created = self.create_many(announcements)
         except Exception as e:
             logger.error(f"Failed to bulk create announcements: {e}")
             return []
+        publish_announcements_created(created)
+        return created
     
     def update_status_by_business_id(self, business_id: str, status: str) -> bool:
         """Update announcement status by business ID"""
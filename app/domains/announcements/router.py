@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status, BackgroundTasks
-from fastapi.responses import ORJSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, status, BackgroundTasks
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List, Optional, Dict, Any
+import asyncio
+import logging
+import math
 from .service import AnnouncementService
-from .batch_service import AnnouncementBatchService
+from .batch_service import COLLECTION_LOCK, AnnouncementBatchService
 from .models import AnnouncementResponse, AnnouncementCreate, AnnouncementUpdate
 from .cache_service import announcement_cache_service
 from .schemas import (
@@ -19,7 +22,9 @@ from ...shared.responses import (
     CreatedResponse,
     success_response,
     created_response,
-    error_response
+    error_response,
+    paginated_envelope,
+    raw_json_response
 )
 from ...shared.schemas import (
     BaseResponse as BaseResponseSchema,
@@ -36,6 +41,13 @@ from ...shared.exceptions.custom_exceptions import (
     BusinessLogicException
 )
 from ...core.dependencies import get_announcement_service, get_announcement_batch_service
+from ...core.timing import timed
+from ...core.compression import negotiate_encoding
+from ...core.distributed_lock import LeaseNotAcquired, RedisLease, single_flight_async
+from ...core.request_context import get_request_id
+from ...shared.jobs import SSE_HEARTBEAT, format_sse, job_progress_publisher, read_progress
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/announcements",
@@ -143,13 +155,16 @@ async def fetch_announcements(
     중복된 데이터는 자동으로 스킵되며, 새로운 데이터만 데이터베이스에 저장됩니다.
     """
     try:
-        announcements = service.fetch_and_save_announcements(
-            page_no=page_no,
-            num_of_rows=num_of_rows,
-            business_name=business_name,
-            business_type=business_type,
-            order_by_latest=order_by_latest
-        )
+        # 같은 조건의 수집이 진행 중이면 중복 실행하지 않고 409 + 진행 중인 작업 ID
+        lock_name = f"announcements.fetch:{page_no}:{num_of_rows}:{business_name or '*'}:{business_type or '*'}:{order_by_latest}"
+        async with single_flight_async(lock_name, owner=get_request_id()):
+            announcements = service.fetch_and_save_announcements(
+                page_no=page_no,
+                num_of_rows=num_of_rows,
+                business_name=business_name,
+                business_type=business_type,
+                order_by_latest=order_by_latest
+            )
         
         response_data = []
         for a in announcements:
@@ -177,6 +192,11 @@ async def fetch_announcements(
             data=response_data,
             message=f"총 {len(response_data)}개의 사업공고가 성공적으로 수집되었습니다"
         )
+    except LeaseNotAcquired as e:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "같은 조건의 수집이 이미 진행 중입니다", "job_id": e.holder.owner if e.holder else None}
+        )
     except ValidationException as e:
         raise HTTPException(status_code=422, detail=str(e))
     except BusinessLogicException as e:
@@ -188,6 +208,99 @@ async def fetch_announcements(
         )
  
 
+# 목록 기본 필터 (쿼리 파라미터 기본값과 동일) - warm-up 이 같은 캐시 키를 채우도록 공유
+DEFAULT_LIST_FILTERS: Dict[str, Any] = {
+    "is_active": True,
+    "order_by_latest": True,
+    "sort_by": "announcement_date",
+    "business_type": None,
+    "status": None,
+    "keyword": None
+}
+
+
+def build_announcement_list_body(
+    service: AnnouncementService,
+    page: int,
+    size: int,
+    filters: Dict[str, Any]
+) -> bytes:
+    """목록 페이지를 조회해 응답 envelope 을 orjson 바이트로 직렬화"""
+    result = service.get_announcements(
+        page=page,
+        page_size=size,
+        is_active=filters["is_active"],
+        order_by_latest=filters["order_by_latest"],
+        sort_by=filters["sort_by"],
+        business_type=filters["business_type"],
+        status=filters["status"],
+        search=filters["keyword"]
+    )
+    
+    # 응답 직렬화는 한 번만: orjson 바이트를 응답과 캐시에 함께 사용
+    with timed("serialize"):
+        items = []
+        for a in result.items:
+            if isinstance(a.announcement_data, dict):
+                announcement_data_dict = a.announcement_data
+            elif hasattr(a.announcement_data, '__dict__'):
+                announcement_data_dict = a.announcement_data.__dict__
+            else:
+                announcement_data_dict = {}
+            
+            items.append({
+                "id": str(a.id),
+                "announcement_data": announcement_data_dict,
+                "source_url": a.source_url,
+                "is_active": a.is_active,
+                "created_at": a.created_at.isoformat() if a.created_at else None,
+                "updated_at": a.updated_at.isoformat() if a.updated_at else None
+            })
+        
+        total_pages = math.ceil(result.total_count / size) if result.total_count > 0 else 1
+        
+        body = paginated_envelope(
+            items,
+            {
+                "page": result.page,
+                "size": size,
+                "total": result.total_count,
+                "total_pages": total_pages,
+                "has_next": result.has_next,
+                "has_previous": result.has_previous
+            },
+            message="사업공고 목록 조회 성공"
+        )
+    return body
+
+
+def warm_announcement_list_cache(
+    service: AnnouncementService,
+    pages: int,
+    size: int,
+    encoding: Optional[str] = None
+) -> int:
+    """
+    기본 필터의 첫 ``pages`` 개 목록 페이지를 캐시에 미리 적재 (lifespan warm-up)
+    
+    Returns:
+        적재한 페이지 수
+    """
+    warmed = 0
+    for page in range(1, pages + 1):
+        body = build_announcement_list_body(service, page, size, DEFAULT_LIST_FILTERS)
+        announcement_cache_service.set_announcements_list_bytes(
+            page=page,
+            size=size,
+            body=body,
+            ttl_seconds=60,
+            encoding=encoding,
+            **DEFAULT_LIST_FILTERS
+        )
+        warmed += 1
+    return warmed
+
+
 @router.get(
     "/",
     response_model=PaginatedResponse[AnnouncementResponseSchema],
@@ -210,6 +323,7 @@ async def fetch_announcements(
     responses=READ_ONLY_HTTP_RESPONSES
 )
 async def get_announcements(
+    request: Request,
     pagination: PaginationParams = Depends(),
     keyword: Optional[str] = Query(None, description="검색 키워드"),
     business_type: Optional[str] = Query(None, description="사업 유형 필터"),
@@ -225,123 +339,47 @@ async def get_announcements(
     표준 페이지네이션과 필터링을 지원합니다.
     """
     try:
-        import time
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        # Performance profiling
-        start_time = time.time()
-        
-        logger.info(f"Router received parameters: business_type='{business_type}', status='{status}', keyword='{keyword}', is_active={is_active}, sort_by='{sort_by}'")
+        # 단계별 소요시간은 요청 타이밍 수집기(Server-Timing/히스토그램)로 기록
+        # (cache_get/cache_set: 캐시 서비스, db: MongoDB 커맨드 리스너)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Router received parameters: business_type='{business_type}', status='{status}', keyword='{keyword}', is_active={is_active}, sort_by='{sort_by}'")
+        
+        cache_filters = {
+            "is_active": is_active if is_active is not None else True,
+            "order_by_latest": order_by_latest,
+            "sort_by": sort_by,
+            "business_type": business_type,
+            "status": status,
+            "keyword": keyword
+        }
         
-        # 캐시 확인
-        cache_check_start = time.time()
-        cached_response = announcement_cache_service.get_announcements_list_cache(
+        # 캐시 확인 - 캐시된(사전 압축된) 바이트를 파싱/재압축 없이 그대로 응답
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        # 압축본이 없으면 높은 레벨(br 9 / zstd 12)로 압축하므로 이벤트 루프 밖에서 실행
+        cached_body, cached_encoding = await asyncio.to_thread(
+            announcement_cache_service.get_announcements_list_bytes,
             page=pagination.page,
             size=pagination.size,
-            is_active=is_active if is_active is not None else True,
-            order_by_latest=order_by_latest,
-            sort_by=sort_by,
-            business_type=business_type,
-            status=status,
-            keyword=keyword
+            encoding=encoding,
+            **cache_filters
         )
-        cache_check_time = time.time() - cache_check_start
-        logger.info(f"Cache check took: {cache_check_time:.3f}s")
+        if cached_body:
+            return raw_json_response(cached_body, content_encoding=cached_encoding)
         
-        if cached_response:
-            logger.info(f"Returning cached announcement list - Total time: {time.time() - start_time:.3f}s")
-            return cached_response
+        body = build_announcement_list_body(service, pagination.page, pagination.size, cache_filters)
         
-        # Use the enhanced get_announcements method with filtering support
-        db_query_start = time.time()
-        result = service.get_announcements(
-            page=pagination.page,
-            page_size=pagination.size,
-            is_active=is_active if is_active is not None else True,
-            order_by_latest=order_by_latest,
-            sort_by=sort_by,
-            business_type=business_type,
-            status=status,
-            search=keyword
-        )
-        db_query_time = time.time() - db_query_start
-        logger.info(f"Database query took: {db_query_time:.3f}s")
-        
-        # Optimize serialization - use dict() instead of model_dump() for better performance
-        serialization_start = time.time()
-        items = []
-        for a in result.items:
-            # Fast serialization without model_dump
-            if isinstance(a.announcement_data, dict):
-                announcement_data_dict = a.announcement_data
-            elif hasattr(a.announcement_data, '__dict__'):
-                announcement_data_dict = a.announcement_data.__dict__
-            else:
-                announcement_data_dict = {}
-            
-            # Create plain dictionary with minimal processing
-            response_item = {
-                "id": str(a.id),
-                "announcement_data": announcement_data_dict,
-                "source_url": a.source_url,
-                "is_active": a.is_active,
-                "created_at": a.created_at.isoformat() if a.created_at else None,
-                "updated_at": a.updated_at.isoformat() if a.updated_at else None
-            }
-            items.append(response_item)
-        
-        serialization_time = time.time() - serialization_start
-        logger.info(f"Serialization took: {serialization_time:.3f}s for {len(items)} items")
-        
-        import math
-        total_pages = math.ceil(result.total_count / pagination.size) if result.total_count > 0 else 1
-        
-        response_creation_start = time.time()
-        response = PaginatedResponse(
-            success=True,
-            items=items,
-            message="사업공고 목록 조회 성공",
-            pagination={
-                "page": result.page,
-                "size": pagination.size,
-                "total": result.total_count,
-                "total_pages": total_pages,
-                "has_next": result.has_next,
-                "has_previous": result.has_previous
-            }
-        )
-        response_creation_time = time.time() - response_creation_start
-        logger.info(f"Response creation took: {response_creation_time:.3f}s")
-        
-        # 응답 캐싱 (60초 TTL)
-        cache_set_start = time.time()
-        announcement_cache_service.set_announcements_list_cache(
+        # 응답 캐싱 (60초 TTL) - 원본과 협상된 인코딩의 압축본을 함께 저장
+        body, body_encoding = await asyncio.to_thread(
+            announcement_cache_service.set_announcements_list_bytes,
             page=pagination.page,
             size=pagination.size,
-            data=response.model_dump(),
+            body=body,
             ttl_seconds=60,
-            is_active=is_active if is_active is not None else True,
-            order_by_latest=order_by_latest,
-            sort_by=sort_by,
-            business_type=business_type,
-            status=status,
-            keyword=keyword
+            encoding=encoding,
+            **cache_filters
         )
-        cache_set_time = time.time() - cache_set_start
-        logger.info(f"Cache set took: {cache_set_time:.3f}s")
         
-        total_time = time.time() - start_time
-        logger.info(f"=== Performance Summary ===")
-        logger.info(f"Cache check: {cache_check_time:.3f}s")
-        logger.info(f"DB query: {db_query_time:.3f}s")
-        logger.info(f"Serialization: {serialization_time:.3f}s")
-        logger.info(f"Response creation: {response_creation_time:.3f}s")
-        logger.info(f"Cache set: {cache_set_time:.3f}s")
-        logger.info(f"TOTAL TIME: {total_time:.3f}s")
-        logger.info(f"========================")
-        
-        return response
+        return raw_json_response(body, content_encoding=body_encoding)
     except ValidationException as e:
         raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
@@ -695,6 +733,7 @@ async def get_announcement_statistics(
     }
 )
 async def batch_collect_announcements(
+    request: Request,
     background_tasks: BackgroundTasks,
     max_pages: Optional[int] = Query(
         None,
@@ -713,19 +752,36 @@ async def batch_collect_announcements(
         description="사업명으로 필터링 (부분 검색)",
         example="창업도약패키지"
     ),
+    job_id: Optional[str] = Query(
+        None,
+        description="중단된 수집 작업을 이어서 실행할 작업 ID (완료된 페이지 구간은 건너뜀)"
+    ),
     batch_service: AnnouncementBatchService = Depends(get_announcement_batch_service)
 ):
     """
     사업공고 대량 수집 배치 작업 시작
     
-    백그라운드에서 비동기로 대량 데이터 수집을 실행합니다.
+    백그라운드에서 비동기로 대량 데이터 수집을 실행합니다. 진행 상황은 작업 ID 별로
+    체크포인트되며, 같은 ``job_id`` 로 다시 호출하면 마지막 체크포인트부터 재개합니다.
     """
     try:
-        from datetime import datetime
-        import uuid
+        from ...shared.jobs import new_job_id
         
-        # 작업 ID 생성
-        task_id = f"batch_collect_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}"
+        # 작업 ID 생성 (재개 요청이면 기존 ID 사용)
+        task_id = job_id or new_job_id("batch_collect")
+
+        # 사업공고 전체 수집 (batch-collect, 수집 태스크) 은 한 번에 하나만: 진행 중이면 그 작업 ID 반환
+        lease = RedisLease(COLLECTION_LOCK, owner=task_id)
+        if not await asyncio.to_thread(lease.acquire):
+            running_id = lease.holder.owner if lease.holder else None
+            return success_response(
+                data={
+                    "task_id": running_id,
+                    "status": "already_running",
+                    "events_url": str(request.url_for("stream_batch_job_progress", job_id=running_id)),
+                },
+                message="사업공고 수집 작업이 이미 진행 중입니다"
+            )
         
         # 예상 총량 계산
         estimated_total = 25921
@@ -735,6 +791,9 @@ async def batch_collect_announcements(
         # 백그라운드 작업 시작
         async def batch_collection_task():
             """배치 수집 백그라운드 작업"""
+            lease.start_renewal()
+            # 구간마다 진행 이벤트 발행 (GET /batch-jobs/{job_id}/events 로 구독)
+            batch_service.set_progress_callback(job_progress_publisher)
             try:
                 import logging
                 logger = logging.getLogger(__name__)
@@ -743,7 +802,9 @@ async def batch_collect_announcements(
                 result = await batch_service.collect_all_announcements(
                     max_pages=max_pages,
                     business_type=business_type,
-                    business_name=business_name
+                    business_name=business_name,
+                    job_id=task_id,
+                    lease=lease,
                 )
                 
                 logger.info(f"배치 수집 작업 완료: {task_id} - {result}")
@@ -752,6 +813,8 @@ async def batch_collect_announcements(
                 import logging
                 logger = logging.getLogger(__name__)
                 logger.error(f"배치 수집 작업 오류: {task_id} - {e}")
+            finally:
+                await asyncio.to_thread(lease.release)
         
         # 백그라운드 태스크 추가
         background_tasks.add_task(batch_collection_task)
@@ -762,7 +825,8 @@ async def batch_collect_announcements(
                 "estimated_total": estimated_total,
                 "max_pages": max_pages or "unlimited",
                 "batch_size": 100,
-                "status": "started",
+                "status": "resumed" if job_id else "started",
+                "events_url": str(request.url_for("stream_batch_job_progress", job_id=task_id)),
                 "filters": {
                     "business_type": business_type,
                     "business_name": business_name
@@ -799,4 +863,56 @@ async def get_batch_collection_statistics(
         raise HTTPException(
             status_code=500,
             detail=f"통계 조회 중 오류가 발생했습니다: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@router.get(
+    "/batch-jobs/{job_id}",
+    response_model=BaseResponse[dict],
+    summary="수집 작업 진행 상황 조회",
+    description="체크포인트된 대량 수집 작업의 페이지 구간별 진행 상황과 누적 카운터를 조회합니다.",
+    responses=READ_ONLY_HTTP_RESPONSES
+)
+async def get_batch_job_progress(
+    job_id: str,
+    batch_service: AnnouncementBatchService = Depends(get_announcement_batch_service)
+):
+    """대량 수집 작업 진행 상황 조회"""
+    progress = batch_service.job_store.progress(job_id)
+    if not progress.total_chunks:
+        raise HTTPException(status_code=404, detail=f"수집 작업을 찾을 수 없습니다: {job_id}")
+    return success_response(
+        data=progress.to_dict(),
+        message="수집 작업 진행 상황 조회 성공"
+    )
+
+
+@router.get(
+    "/batch-jobs/{job_id}/events",
+    summary="수집 작업 진행 상황 스트림 (SSE)",
+    description=(
+        "대량 수집 작업의 진행 이벤트 (pages/s, items/s, 오류율, ETA) 를 Server-Sent Events 로 전달합니다. "
+        "접속 시 마지막 이벤트를 먼저 보내고, 작업이 끝나면 스트림을 닫습니다. "
+        "`Last-Event-ID` 헤더로 끊긴 지점부터 이어 받을 수 있습니다."
+    ),
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_batch_job_progress(job_id: str, request: Request):
+    """대량 수집 작업 진행 상황 SSE 스트림"""
+    client = job_progress_publisher.client
+    if client is None:
+        raise HTTPException(status_code=503, detail="진행 상황 스트림을 사용할 수 없습니다 (Redis 클라이언트 없음)")
+    last_event_id = request.headers.get("last-event-id")
+
+    async def events():
+        async for event_id, event in read_progress(client, job_id, last_event_id=last_event_id):
+            if await request.is_disconnected():
+                break
+            yield SSE_HEARTBEAT if event is None else format_sse(event, event_id)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
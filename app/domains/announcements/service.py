@@ -2,6 +2,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 from .models import Announcement, AnnouncementCreate, AnnouncementUpdate
 from .repository import AnnouncementRepository
+from .events import publish_announcement_updated, publish_announcements_created
 from ...shared.clients.kstartup_api_client import KStartupAPIClient
 from ...shared.models.kstartup import KStartupAnnouncementResponse, AnnouncementItem
 from ...shared.interfaces.base_service import BaseService
@@ -135,6 +136,9 @@ class AnnouncementService(BaseService[Announcement, AnnouncementCreate, Announce
         except Exception as e:
             logger.error(f"K-Startup API 호출 실패: {e}")
             # API 호출 실패시 빈 리스트 반환
+        
+        # 새로 저장된 공고만 이벤트 발행 (중복 스킵된 공고는 알림 매칭 대상 아님)
+        publish_announcements_created(announcements)
             
         # 새로 저장된 데이터와 기존 데이터 모두 반환
         return all_processed_items if all_processed_items else announcements
@@ -398,7 +402,7 @@ class AnnouncementService(BaseService[Announcement, AnnouncementCreate, Announce
         """저장된 사업공고 목록 조회 (페이지네이션, 기본 최신순, 필터링 지원)"""
         try:
             # Enhanced logging to debug filtering issue
-            logger.info(f"Service get_announcements called with: page={page}, page_size={page_size}, is_active={is_active}, business_type='{business_type}', status='{status}', search='{search}'")
+            logger.debug(f"Service get_announcements called with: page={page}, page_size={page_size}, is_active={is_active}, business_type='{business_type}', status='{status}', search='{search}'")
             
             # 기본 필터 설정
             filters = QueryFilter()
@@ -409,7 +413,7 @@ class AnnouncementService(BaseService[Announcement, AnnouncementCreate, Announce
             
             # business_type 필터 추가
             if business_type:
-                logger.info(f"Applying business_type filter: '{business_type}' to field 'announcement_data.business_type'")
+                logger.debug(f"Applying business_type filter: '{business_type}' to field 'announcement_data.business_type'")
                 # Try both business_type and business_category fields for compatibility
                 filters.eq("announcement_data.business_type", business_type)
                 # Also add alternative field name search
@@ -425,7 +429,8 @@ class AnnouncementService(BaseService[Announcement, AnnouncementCreate, Announce
                 filters.regex("announcement_data.business_name", search, "i")  # case-insensitive
             
             # Log the final filters being applied
-            logger.info(f"Final filters to be applied: {filters.to_dict()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Final filters to be applied: {filters.to_dict()}")
             
             # 마감임박순 선택 시 마감일이 오늘 이후인 공고만 필터링
             if sort_by == "end_date":
@@ -436,7 +441,7 @@ class AnnouncementService(BaseService[Announcement, AnnouncementCreate, Announce
                 korea_tz = ZoneInfo("Asia/Seoul")
                 today = datetime.now(korea_tz).strftime("%Y-%m-%d")
                 filters.gte("announcement_data.end_date", today)
-                logger.info(f"마감임박순 정렬: 오늘({today}, KST) 이후 마감인 공고만 필터링")
+                logger.debug(f"마감임박순 정렬: 오늘({today}, KST) 이후 마감인 공고만 필터링")
             
             # 정렬 설정 (sort_by 파라미터에 따라 announcement_date 또는 end_date 기준)
             from ...core.interfaces.base_repository import SortOption
@@ -457,12 +462,12 @@ class AnnouncementService(BaseService[Announcement, AnnouncementCreate, Announce
                 sort=sort
             )
             
-            logger.info(f"Service returning {len(result.items)} items out of {result.total_count} total")
+            logger.debug(f"Service returning {len(result.items)} items out of {result.total_count} total")
             
             # Log sample of returned items to verify filtering
-            if result.items and business_type:
+            if result.items and business_type and logger.isEnabledFor(logging.DEBUG):
                 sample_types = [item.announcement_data.business_type for item in result.items[:5]]
-                logger.info(f"Sample business_types in result: {sample_types}")
+                logger.debug(f"Sample business_types in result: {sample_types}")
             
             return result
         except Exception as e:
@@ -546,10 +551,12 @@ class AnnouncementService(BaseService[Announcement, AnnouncementCreate, Announce
     def create_announcement(self, announcement_data: AnnouncementCreate) -> Announcement:
         """새 사업공고 생성"""
         try:
-            return self.repository.create(announcement_data)
+            announcement = self.repository.create(announcement_data)
         except Exception as e:
             logger.error(f"공고 생성 오류: {e}")
             raise
+        publish_announcements_created([announcement])
+        return announcement
     
     def update_announcement(
         self, 
@@ -558,10 +565,14 @@ class AnnouncementService(BaseService[Announcement, AnnouncementCreate, Announce
     ) -> Optional[Announcement]:
         """사업공고 수정"""
         try:
-            return self.repository.update_by_id(announcement_id, update_data)
+            updated = self.repository.update_by_id(announcement_id, update_data)
         except Exception as e:
             logger.error(f"공고 수정 오류: {e}")
             return None
+        # update_by_id 는 실제로 바뀐 문서가 없으면 None
+        if updated is not None:
+            publish_announcement_updated(announcement_id, update_data.model_dump(exclude_unset=True))
+        return updated
     
     def delete_announcement(self, announcement_id: str) -> bool:
         """사업공고 삭제 (비활성화)"""
@@ -6,6 +6,7 @@ following the enhanced Celery architecture.
 """
 
 from typing import Dict, Any, List, Optional
+from dataclasses import asdict
 from datetime import datetime, timedelta
 import asyncio
 import logging
@@ -14,8 +15,13 @@ from celery.exceptions import Retry
 
 from ...core.celery_config import celery_app
 from ...core.database import get_database
+from ...core.async_runtime import run_async
+from ...core.config import settings
+from ...core.distributed_lock import LeaseLost, RedisLease, active_lease, ensure_lease, singleton_task
 from ...shared.schemas import DataCollectionResult
 from ...shared.classification.services import ClassificationService
+from ...shared.jobs import CollectionJobStore, new_job_id
+from .batch_service import COLLECTION_LOCK, AnnouncementBatchService
 from .service import AnnouncementService
 from .models import AnnouncementCreate
 
@@ -49,10 +55,12 @@ class AnnouncementTask(Task):
     time_limit=1800,  # 30 minutes
     soft_time_limit=1500  # 25 minutes
 )
+@singleton_task(lock=COLLECTION_LOCK)
 def fetch_announcements_comprehensive(self, 
                                     start_page: int = 1, 
                                     max_pages: Optional[int] = None,
-                                    validate_codes: bool = True) -> Dict[str, Any]:
+                                    validate_codes: bool = True,
+                                    job_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Comprehensive announcement data fetching with validation and classification.
     
@@ -60,39 +68,65 @@ def fetch_announcements_comprehensive(self,
         start_page: Starting page number for data collection
         max_pages: Maximum number of pages to process (None for all)
         validate_codes: Whether to validate classification codes
+        job_id: Checkpoint job to resume (default: one job per task id, so
+            retries and redeliveries continue after the last completed page)
         
     Returns:
         Dictionary with collection results and statistics
     """
+    job_id = job_id or (
+        f"fetch_announcements_comprehensive:{self.request.id}" if self.request.id
+        else new_job_id("fetch_announcements_comprehensive")
+    )
     try:
-        logger.info(f"Starting comprehensive announcement fetch from page {start_page}")
+        logger.info(f"Starting comprehensive announcement fetch from page {start_page} (job {job_id})")
         
-        result = asyncio.run(_fetch_announcements_async(
+        result = run_async(_fetch_announcements_async(
             start_page=start_page,
             max_pages=max_pages,
-            validate_codes=validate_codes
+            validate_codes=validate_codes,
+            job_id=job_id,
+            lease=active_lease(),
         ))
         
         logger.info(f"Comprehensive announcement fetch completed: {result['summary']}")
         return result
         
+    except LeaseLost:
+        raise
     except Exception as e:
         logger.error(f"Error in comprehensive announcement fetch: {e}")
         self.retry(countdown=300, exc=e)
 
 
+# 체크포인트에 누적되는 수집 통계 키
+_CHECKPOINT_COUNTERS = (
+    "pages_processed", "total_fetched", "total_created", "total_updated", "validation_errors", "api_errors",
+)
+
+
 async def _fetch_announcements_async(start_page: int, 
                                    max_pages: Optional[int],
-                                   validate_codes: bool) -> Dict[str, Any]:
-    """Async implementation of comprehensive announcement fetching."""
+                                   validate_codes: bool,
+                                   job_id: Optional[str] = None,
+                                   lease: Optional[RedisLease] = None) -> Dict[str, Any]:
+    """Async implementation of comprehensive announcement fetching.
+
+    페이지마다 cursor 와 통계를 job 체크포인트에 기록하고, 같은 job 으로 다시 실행하면
+    마지막 완료 페이지 다음부터 (이전 통계를 이어받아) 계속합니다. ``lease`` 가 있으면
+    페이지 저장과 체크포인트 전에 확인하고, 잃었으면 ``LeaseLost`` 로 중단합니다.
+    """
     
     # Initialize services
     db = get_database()
     announcement_service = AnnouncementService(db)
     classification_service = ClassificationService() if validate_codes else None
+    job_store = CollectionJobStore(db)
+    job_id = job_id or new_job_id("fetch_announcements_comprehensive")
     
     # Collection statistics
     stats = {
+        "job_id": job_id,
         "start_time": datetime.utcnow(),
         "pages_processed": 0,
         "total_fetched": 0,
@@ -102,21 +136,49 @@ async def _fetch_announcements_async(start_page: int,
         "api_errors": 0,
         "classification_stats": {}
     }
+
+    # 순차 수집은 끝 페이지가 정해지지 않은 구간 하나
+    job_store.ensure_job(
+        job_id,
+        kind="announcements.fetch_comprehensive",
+        first_page=start_page,
+        last_page=start_page + max_pages - 1 if max_pages else None,
+        params={"max_pages": max_pages, "validate_codes": validate_codes},
+    )
+    chunk = job_store.claim(job_id)
+    if chunk is None:
+        logger.info(f"Job {job_id} is already completed or running on another worker")
+        stats.update(job_store.progress(job_id).counters)
+        stats["skipped"] = True
+    else:
+        stats.update({k: v for k, v in chunk.counters.items() if k in _CHECKPOINT_COUNTERS})
+        stats["resumed_from_page"] = chunk.next_page
     
-    current_page = start_page
+    current_page = chunk.next_page if chunk else start_page
     consecutive_empty_pages = 0
+    run_api_errors = 0
+    exhausted = False
+
+    def _checkpoint(page: int, before: Dict[str, int]) -> bool:
+        ensure_lease(lease)
+        return job_store.checkpoint(chunk, page, {k: stats[k] - before[k] for k in _CHECKPOINT_COUNTERS})
     
     try:
-        while True:
+        while chunk is not None:
+            before = {k: stats[k] for k in _CHECKPOINT_COUNTERS}
+
             # Check page limits
             if max_pages and (current_page - start_page + 1) > max_pages:
                 logger.info(f"Reached maximum page limit: {max_pages}")
+                exhausted = True
                 break
             
             if consecutive_empty_pages >= 3:
                 logger.info("Found 3 consecutive empty pages, stopping")
+                exhausted = True
                 break
             
+            ensure_lease(lease)
             try:
                 logger.info(f"Processing page {current_page}")
                 
@@ -129,6 +191,8 @@ async def _fetch_announcements_async(start_page: int,
                 if not page_result or len(page_result) == 0:
                     consecutive_empty_pages += 1
                     logger.info(f"Empty page {current_page}, consecutive empty: {consecutive_empty_pages}")
+                    if not _checkpoint(current_page, before):
+                        break
                     current_page += 1
                     continue
                 
@@ -162,22 +226,39 @@ async def _fetch_announcements_async(start_page: int,
                         logger.warning(f"Error processing announcement {announcement_data.get('announcement_id', 'unknown')}: {e}")
                 
                 logger.info(f"Page {current_page} completed: {len(page_result)} announcements")
+                if not _checkpoint(current_page, before):
+                    break
                 current_page += 1
                 
                 # Small delay to prevent overwhelming the API
                 await asyncio.sleep(1)
                 
+            except LeaseLost:
+                raise
             except Exception as e:
                 stats["api_errors"] += 1
+                run_api_errors += 1
                 logger.error(f"Error fetching page {current_page}: {e}")
+                if not _checkpoint(current_page, before):
+                    break
                 current_page += 1
                 
-                if stats["api_errors"] >= 5:
+                if run_api_errors >= 5:
                     logger.error("Too many API errors, stopping")
                     break
+
+        if chunk is not None:
+            # 끝까지 수집했으면 완료, API 오류로 멈췄으면 다음 실행이 이어가도록 반납
+            if exhausted and job_store.complete(chunk):
+                job_store.finish_if_done(job_id)
+            elif not exhausted:
+                job_store.release(chunk, "stopped after repeated API errors")
     
-    except Exception as e:
+    except BaseException as e:
         logger.error(f"Fatal error in announcement fetching: {e}")
+        # 다음 재시도가 lease 만료를 기다리지 않고 마지막 체크포인트부터 이어가도록
+        if chunk is not None:
+            job_store.release(chunk, str(e))
         raise
     
     finally:
@@ -232,7 +313,7 @@ def validate_announcement_integrity(self) -> Dict[str, Any]:
     try:
         logger.info("Starting announcement data integrity validation")
         
-        result = asyncio.run(_validate_announcement_integrity_async())
+        result = run_async(_validate_announcement_integrity_async())
         
         logger.info(f"Announcement integrity validation completed: {result['summary']}")
         return result
@@ -355,7 +436,7 @@ def cleanup_announcement_duplicates(self) -> Dict[str, Any]:
     try:
         logger.info("Starting announcement duplicate cleanup")
         
-        result = asyncio.run(_cleanup_announcement_duplicates_async())
+        result = run_async(_cleanup_announcement_duplicates_async())
         
         logger.info(f"Announcement duplicate cleanup completed: {result['summary']}")
         return result
@@ -437,6 +518,7 @@ async def _cleanup_announcement_duplicates_async() -> Dict[str, Any]:
     base=AnnouncementTask, 
     max_retries=1
 )
+@singleton_task()
 def generate_announcement_statistics(self) -> Dict[str, Any]:
     """
     Generate comprehensive statistics for announcement data.
@@ -446,7 +528,7 @@ def generate_announcement_statistics(self) -> Dict[str, Any]:
     try:
         logger.info("Generating announcement statistics")
         
-        result = asyncio.run(_generate_announcement_statistics_async())
+        result = run_async(_generate_announcement_statistics_async())
         
         logger.info("Announcement statistics generation completed")
         return result
@@ -537,6 +619,112 @@ async def _generate_announcement_statistics_async() -> Dict[str, Any]:
     return stats
 
 
+@celery_app.task(
+    bind=True,
+    base=AnnouncementTask,
+    max_retries=3,
+    default_retry_delay=60,
+    acks_late=True,
+)
+def fetch_announcements_job(self,
+                            job_id: str,
+                            max_pages: Optional[int] = None,
+                            business_type: Optional[str] = None,
+                            business_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Work on a shared bulk collection job until no page range is left to claim.
+
+    Several of these tasks with the same ``job_id`` split the page space between
+    them; a redelivered or retried task resumes from the job checkpoints.
+
+    The workers share ``COLLECTION_LOCK`` with ``job_id`` as the owner, so a
+    backfill never overlaps the other full collection tasks or batch-collect.
+    """
+    lease = RedisLease(COLLECTION_LOCK, owner=job_id) if settings.task_singleton_enabled else None
+    if lease is not None and not lease.join():
+        running_id = lease.holder.owner if lease.holder else None
+        logger.info(f"Announcement collection job {job_id}: '{COLLECTION_LOCK}' held by {running_id}, coalescing")
+        return {
+            "status": "coalesced",
+            "job_id": running_id,
+            "lock": COLLECTION_LOCK,
+            "message": f"Already running as {running_id}",
+        }
+    if lease is not None:
+        lease.start_renewal()
+    try:
+        result = run_async(_fetch_announcements_job_async(job_id, max_pages, business_type, business_name, lease))
+    except Exception as e:
+        logger.error(f"Error in announcement collection job {job_id}: {e}")
+        self.retry(exc=e)
+    finally:
+        if lease is not None:
+            lease.stop_renewal()
+    # 모든 구간이 끝났으면 바로 해제, 아니면 다른 워커가 갱신을 이어가거나 ttl 후 만료
+    if lease is not None and result.get("job_completed"):
+        lease.release()
+    return result
+
+
+async def _fetch_announcements_job_async(job_id: str,
+                                         max_pages: Optional[int],
+                                         business_type: Optional[str],
+                                         business_name: Optional[str],
+                                         lease: Optional[RedisLease] = None) -> Dict[str, Any]:
+    from ...shared.clients.kstartup_api_client import KStartupAPIClient
+    from .repository import AnnouncementRepository
+
+    batch_service = AnnouncementBatchService(AnnouncementRepository(get_database()), KStartupAPIClient())
+    result = await batch_service.collect_all_announcements(
+        max_pages=max_pages,
+        business_type=business_type,
+        business_name=business_name,
+        job_id=job_id,
+        lease=lease,
+    )
+    return asdict(result)
+
+
+@celery_app.task(bind=True, base=AnnouncementTask)
+def fetch_announcements_backfill(self,
+                                 workers: int = 4,
+                                 max_pages: Optional[int] = None,
+                                 business_type: Optional[str] = None,
+                                 business_name: Optional[str] = None,
+                                 job_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Start (or resume, given an existing ``job_id``) a bulk collection job split
+    across ``workers`` ``fetch_announcements_job`` tasks.
+
+    ``COLLECTION_LOCK`` is taken with ``job_id`` as the owner before dispatching;
+    the workers join that lease while they run.
+    """
+    job_id = job_id or new_job_id("backfill")
+    lease = None
+    if settings.task_singleton_enabled:
+        lease = RedisLease(COLLECTION_LOCK, owner=job_id, ttl=settings.task_lock_dispatch_ttl_seconds)
+        if not lease.join():
+            running_id = lease.holder.owner if lease.holder else None
+            logger.info(f"Announcement backfill {job_id}: '{COLLECTION_LOCK}' held by {running_id}, coalescing")
+            return {
+                "status": "coalesced",
+                "job_id": running_id,
+                "lock": COLLECTION_LOCK,
+                "message": f"Already running as {running_id}",
+            }
+    try:
+        task_ids = [
+            fetch_announcements_job.delay(job_id, max_pages, business_type, business_name).id
+            for _ in range(max(1, workers))
+        ]
+    except Exception:
+        if lease is not None:
+            lease.release()
+        raise
+    logger.info(f"Announcement backfill {job_id} dispatched to {len(task_ids)} workers")
+    return {"job_id": job_id, "workers": len(task_ids), "task_ids": task_ids}
+
+
 # Legacy tasks for backward compatibility
 @celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
 def fetch_announcements_task(self) -> Dict[str, Any]:
@@ -650,27 +838,34 @@ def get_announcement_tasks() -> List[Dict[str, Any]]:
             "description": "Comprehensive announcement data fetching with validation",
             "category": "data_collection",
             "estimated_duration": "15-30 minutes",
-            "queue": "announcements"
+            "queue": "ingestion"
+        },
+        {
+            "name": "fetch_announcements_backfill",
+            "description": "Checkpointed bulk collection split across several workers",
+            "category": "data_collection",
+            "estimated_duration": "10-30 minutes",
+            "queue": "ingestion"
         },
         {
             "name": "validate_announcement_integrity",
             "description": "Validate data integrity for announcement collection",
             "category": "validation",
             "estimated_duration": "5-10 minutes",
-            "queue": "announcements"
+            "queue": "maintenance"
         },
         {
             "name": "cleanup_announcement_duplicates",
             "description": "Clean up duplicate announcements",
             "category": "maintenance",
             "estimated_duration": "5-15 minutes",
-            "queue": "announcements"
+            "queue": "maintenance"
         },
         {
             "name": "generate_announcement_statistics",
             "description": "Generate comprehensive announcement statistics",
             "category": "analytics",
             "estimated_duration": "2-5 minutes",
-            "queue": "announcements"
+            "queue": "analytics"
         }
     ]
\ No newline at end of file
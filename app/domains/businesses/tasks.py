@@ -11,6 +11,7 @@ import logging
 from celery import shared_task
 from ...core.celery_config import celery_app
 from ...core.database import get_database
+from ...core.distributed_lock import singleton_task
 from .service import BusinessService
 from .repository import BusinessRepository
 from ...shared.clients.kstartup_api_client import KStartupAPIClient
@@ -18,7 +19,18 @@ from ...shared.clients.kstartup_api_client import KStartupAPIClient
 logger = logging.getLogger(__name__)
 
 
+def _page_lock_key(
+    page_no: int = 1,
+    num_of_rows: int = 50,
+    business_field: Optional[str] = None,
+    organization: Optional[str] = None,
+) -> str:
+    """같은 페이지/필터 수집만 하나로 합침"""
+    return f"{page_no}:{num_of_rows}:{business_field or '*'}:{organization or '*'}"
+
+
 @shared_task(bind=True, name="app.domains.businesses.tasks.fetch_businesses_comprehensive")
+@singleton_task(key=_page_lock_key)
 def fetch_businesses_comprehensive(
     self,
     page_no: int = 1,
@@ -89,6 +101,7 @@ def fetch_businesses_comprehensive(
 
 
 @shared_task(bind=True, name="app.domains.businesses.tasks.fetch_businesses_incremental")
+@singleton_task(lock="businesses.collect")
 def fetch_businesses_incremental(self, max_pages: int = 5) -> Dict[str, Any]:
     """
     Incremental business data fetching task.
@@ -203,6 +216,7 @@ def cleanup_inactive_businesses(self, days_old: int = 90) -> Dict[str, Any]:
 
 
 @shared_task(bind=True, name="app.domains.businesses.tasks.generate_business_statistics")
+@singleton_task()
 def generate_business_statistics(self) -> Dict[str, Any]:
     """
     Generate comprehensive business statistics.
@@ -19,7 +19,9 @@ from ...shared.responses import (
     BaseResponse,
     PaginatedResponse, 
     CreatedResponse,
-    success_response
+    success_response,
+    paginated_envelope,
+    raw_json_response
 )
 from ...shared.pagination import PaginationParams
 from ...shared.exceptions.custom_exceptions import (
@@ -28,6 +30,8 @@ from ...shared.exceptions.custom_exceptions import (
     BusinessLogicException
 )
 from ...core.dependencies import get_content_service
+from ...core.distributed_lock import LeaseNotAcquired, single_flight_async
+from ...core.request_context import get_request_id
 
 router = APIRouter(
     prefix="/contents",
@@ -99,13 +103,16 @@ async def fetch_contents(
     중복된 데이터는 자동으로 스킵되며, 새로운 데이터만 데이터베이스에 저장됩니다.
     """
     try:
-        contents = service.fetch_and_save_contents(
-            page_no=page_no,
-            num_of_rows=num_of_rows,
-            content_type=content_type,
-            category=category,
-            order_by_latest=order_by_latest
-        )
+        # 같은 조건의 수집이 진행 중이면 중복 실행하지 않고 409 + 진행 중인 작업 ID
+        lock_name = f"contents.fetch:{page_no}:{num_of_rows}:{content_type or '*'}:{category or '*'}:{order_by_latest}"
+        async with single_flight_async(lock_name, owner=get_request_id()):
+            contents = service.fetch_and_save_contents(
+                page_no=page_no,
+                num_of_rows=num_of_rows,
+                content_type=content_type,
+                category=category,
+                order_by_latest=order_by_latest
+            )
         
         response_data = []
         for c in contents:
@@ -133,6 +140,11 @@ async def fetch_contents(
             data=response_data,
             message=f"총 {len(response_data)}개의 콘텐츠가 성공적으로 수집되었습니다"
         )
+    except LeaseNotAcquired as e:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "같은 조건의 수집이 이미 진행 중입니다", "job_id": e.holder.owner if e.holder else None}
+        )
     except ValidationException as e:
         raise HTTPException(status_code=422, detail=str(e))
     except BusinessLogicException as e:
@@ -223,19 +235,18 @@ async def get_contents(
         import math
         total_pages = math.ceil(result.total_count / pagination.size) if result.total_count > 0 else 1
         
-        return PaginatedResponse(
-            success=True,
-            items=items,
-            message="콘텐츠 목록 조회 성공",
-            pagination={
+        return raw_json_response(paginated_envelope(
+            items,
+            {
                 "page": result.page,
                 "size": pagination.size,
                 "total": result.total_count,
                 "total_pages": total_pages,
                 "has_next": result.has_next,
                 "has_previous": result.has_previous
-            }
-        )
+            },
+            message="콘텐츠 목록 조회 성공"
+        ))
     except ValidationException as e:
         raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
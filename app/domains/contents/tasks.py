@@ -11,6 +11,7 @@ import logging
 from celery import shared_task
 from ...core.celery_config import celery_app
 from ...core.database import get_database
+from ...core.distributed_lock import singleton_task
 from .service import ContentService
 from .repository import ContentRepository
 from ...shared.clients.kstartup_api_client import KStartupAPIClient
@@ -18,7 +19,18 @@ from ...shared.clients.kstartup_api_client import KStartupAPIClient
 logger = logging.getLogger(__name__)
 
 
+def _page_lock_key(
+    page_no: int = 1,
+    num_of_rows: int = 50,
+    content_type: Optional[str] = None,
+    category: Optional[str] = None,
+) -> str:
+    """같은 페이지/필터 수집만 하나로 합침"""
+    return f"{page_no}:{num_of_rows}:{content_type or '*'}:{category or '*'}"
+
+
 @shared_task(bind=True, name="app.domains.contents.tasks.fetch_contents_comprehensive")
+@singleton_task(key=_page_lock_key)
 def fetch_contents_comprehensive(
     self,
     page_no: int = 1,
@@ -89,6 +101,7 @@ def fetch_contents_comprehensive(
 
 
 @shared_task(bind=True, name="app.domains.contents.tasks.fetch_contents_incremental")
+@singleton_task(lock="contents.collect")
 def fetch_contents_incremental(self, max_pages: int = 5) -> Dict[str, Any]:
     """
     Incremental content data fetching task.
@@ -249,6 +262,7 @@ def cleanup_inactive_contents(self, days_old: int = 180) -> Dict[str, Any]:
 
 
 @shared_task(bind=True, name="app.domains.contents.tasks.generate_content_statistics")
+@singleton_task()
 def generate_content_statistics(self) -> Dict[str, Any]:
     """
     Generate comprehensive content statistics.
@@ -0,0 +1,18 @@
+"""Statistics domain index declarations (applied by app.core.indexes)"""
+
+from pymongo import DESCENDING, TEXT
+
+from ...core.indexes import IndexSpec, index_registry
+
+index_registry.register(
+    "statistics",
+    IndexSpec.build("statistics", [("updated_at", DESCENDING)], name="idx_updated_at"),
+    # 알림 키워드 매칭($text)용 와일드카드 텍스트 인덱스
+    IndexSpec.build(
+        "statistics",
+        [("$**", TEXT)],
+        name="idx_text_search",
+        default_language="none",
+        language_override="language",
+    ),
+)
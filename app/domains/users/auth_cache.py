@@ -0,0 +1,90 @@
+"""
+Authenticated user cache.
+
+Resolves the ``User`` for a verified access token without a MongoDB query on
+every authenticated request. Entries are keyed on ``(sub, iat)`` so a newly
+issued token never sees a user cached for an older one, and are invalidated
+per user on profile/settings updates, account deletion and logout.
+
+The cache is per process; other workers converge within the TTL.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from ...core.config import settings
+from .models import User
+
+CacheKey = Tuple[str, Any]
+
+
+class AuthUserCache:
+    """Bounded TTL/LRU cache of authenticated users keyed on (sub, iat)"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 5000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, User]]" = OrderedDict()
+        # user_id -> keys, so one update drops every token's entry for the user
+        self._keys_by_user: Dict[str, Set[CacheKey]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, user_id: str, issued_at: Any) -> Optional[User]:
+        if not self.enabled or not user_id:
+            return None
+        key = (user_id, issued_at)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if time.monotonic() > expires_at:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return user
+
+    def set(self, user_id: str, issued_at: Any, user: User) -> None:
+        if not self.enabled or not user_id:
+            return
+        key = (user_id, issued_at)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, user)
+            self._entries.move_to_end(key)
+            self._keys_by_user.setdefault(user_id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def invalidate(self, user_id: Optional[str]) -> None:
+        """Drop every cached entry for ``user_id``"""
+        if not user_id:
+            return
+        with self._lock:
+            for key in self._keys_by_user.pop(user_id, ()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: CacheKey) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys_by_user.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[key[0]]
+
+
+auth_user_cache = AuthUserCache(settings.auth_user_cache_ttl_seconds)
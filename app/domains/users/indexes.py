@@ -0,0 +1,15 @@
+"""User domain index declarations (applied by app.core.indexes)"""
+
+from pymongo import ASCENDING
+
+from ...core.indexes import IndexSpec, index_registry
+
+index_registry.register(
+    "users",
+    IndexSpec.build("users", "email", unique=True),
+    # OAuth 계정 조회
+    IndexSpec.build("users", [("provider", ASCENDING), ("external_id", ASCENDING)], sparse=True),
+    IndexSpec.build("users", "is_active"),
+    IndexSpec.build("users", "is_verified"),
+    IndexSpec.build("user_settings", "user_id", unique=True),
+)
@@ -16,6 +16,7 @@ from bson import ObjectId
 from bson.errors import InvalidId
 
 from ...core.database import get_database
+from ...core.preference_cache import preference_cache
 from .models import (
     User, UserCreate, SocialUserCreate, UserUpdate, AuthProvider,
     UserSettings, UserSettingsUpdate
@@ -23,6 +24,12 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+SETTINGS_CACHE_NAMESPACE = "user_settings"
+
+
+def _settings_from_doc(doc: Dict[str, Any]) -> UserSettings:
+    return UserSettings(**{k: v for k, v in doc.items() if k != "_id" and k != "user_id"})
+
 
 class UserRepository:
     """Repository for user data access operations"""
@@ -33,42 +40,7 @@ class UserRepository:
         self.db = db_client
         self.collection: Collection = self.db.users
         self.settings_collection: Collection = self.db.user_settings
-
-        # Enable index creation for better performance
-        # Call during application startup for production environments
-        self._create_indexes()
-
-    def _create_indexes(self):
-        """Create database indexes for user collection"""
-        try:
-            # Use ensure_index with background=True to avoid blocking
-            # Only create if they don't exist
-            existing_indexes = [idx['name'] for idx in self.collection.list_indexes()]
-
-            # Unique index on email
-            if "email_1" not in existing_indexes:
-                self.collection.create_index("email", unique=True, background=True)
-
-            # Compound index for provider + external_id (for OAuth users)
-            if "provider_1_external_id_1" not in existing_indexes:
-                self.collection.create_index([("provider", 1), ("external_id", 1)], sparse=True, background=True)
-
-            # Index for active users
-            if "is_active_1" not in existing_indexes:
-                self.collection.create_index("is_active", background=True)
-
-            # Index for email verification status
-            if "is_verified_1" not in existing_indexes:
-                self.collection.create_index("is_verified", background=True)
-
-            # Settings indexes
-            settings_indexes = [idx['name'] for idx in self.settings_collection.list_indexes()]
-            if "user_id_1" not in settings_indexes:
-                self.settings_collection.create_index("user_id", unique=True, background=True)
-
-        except Exception as e:
-            # Log the error but don't fail the repository initialization
-            logger.warning(f"Could not create indexes: {e}")
+        # 인덱스는 app/domains/users/indexes.py 에 선언되어 시작 시 한 번 적용됨
 
     def _convert_objectid_to_string(self, doc: Dict[str, Any]) -> Dict[str, Any]:
         """Convert MongoDB ObjectId to string for Pydantic models"""
@@ -206,6 +178,9 @@ class UserRepository:
     # ===== User Settings CRUD =====
     def get_user_settings(self, user_id: str) -> UserSettings:
         try:
+            found, doc = preference_cache.get(SETTINGS_CACHE_NAMESPACE, user_id)
+            if found:
+                return _settings_from_doc(doc)
             doc = self.settings_collection.find_one({"user_id": user_id})
             if not doc:
                 # create default settings on first read
@@ -217,11 +192,36 @@ class UserRepository:
                 }
                 self.settings_collection.insert_one(default)
                 doc = default
-            return UserSettings(**{k: v for k, v in doc.items() if k != "_id" and k != "user_id"})
+            doc.pop("_id", None)
+            preference_cache.set(SETTINGS_CACHE_NAMESPACE, user_id, doc)
+            return _settings_from_doc(doc)
         except Exception as e:
             logger.error(f"Error getting user settings: {e}")
             return UserSettings()
 
+    def get_many_user_settings(self, user_ids: List[str]) -> Dict[str, UserSettings]:
+        """Batch settings lookup for background jobs (one ``$in`` query for cache misses).
+
+        Users without a stored document get default settings; the document itself
+        is still materialized on their first single read.
+        """
+        try:
+            docs, misses = preference_cache.get_many(SETTINGS_CACHE_NAMESPACE, user_ids)
+            if misses:
+                fetched: Dict[str, Dict[str, Any]] = {}
+                for doc in self.settings_collection.find({"user_id": {"$in": misses}}):
+                    doc.pop("_id", None)
+                    fetched[doc["user_id"]] = doc
+                preference_cache.set_many(SETTINGS_CACHE_NAMESPACE, fetched)
+                docs.update(fetched)
+            return {
+                user_id: _settings_from_doc(docs[user_id]) if user_id in docs else UserSettings()
+                for user_id in dict.fromkeys(user_ids)
+            }
+        except Exception as e:
+            logger.error(f"Error getting user settings batch: {e}")
+            return {user_id: UserSettings() for user_id in user_ids}
+
     def update_user_settings(self, user_id: str, update: UserSettingsUpdate) -> UserSettings:
         try:
             logger.info(f"🔄 Updating settings for user {user_id}")
@@ -246,12 +246,15 @@ class UserRepository:
                     upsert=True,
                 )
                 logger.info(f"✅ MongoDB update result: matched={result.matched_count}, modified={result.modified_count}, upserted={result.upserted_id}")
+                # write-through (캐시에 없으면 아래 조회에서 다시 적재)
+                preference_cache.merge(SETTINGS_CACHE_NAMESPACE, user_id, payload)
 
             final_settings = self.get_user_settings(user_id)
             logger.info(f"🎉 Final settings returned: {final_settings}")
             return final_settings
         except Exception as e:
             logger.error(f"Error updating user settings: {e}")
+            preference_cache.invalidate(user_id, SETTINGS_CACHE_NAMESPACE)
             return self.get_user_settings(user_id)
 
     def update_last_login(self, user_id: str) -> bool:
@@ -266,6 +269,18 @@ class UserRepository:
             logger.error(f"Error updating last login: {e}")
             return False
 
+    def update_password_hash(self, user_id: str, password_hash: str) -> bool:
+        """Replace stored password hash (rehash on login after cost change)"""
+        try:
+            result = self.collection.update_one(
+                {"_id": ObjectId(user_id)},
+                {"$set": {"password_hash": password_hash, "updated_at": datetime.utcnow()}}
+            )
+            return result.modified_count > 0
+        except Exception as e:
+            logger.error(f"Error updating password hash: {e}")
+            return False
+
     def link_google_account(self, user_id: str, external_id: str, profile_image_url: Optional[str] = None) -> bool:
         """Link Google account to existing local account"""
         try:
@@ -302,6 +317,7 @@ class UserRepository:
         """Delete user (GDPR compliance)"""
         try:
             result = self.collection.delete_one({"_id": ObjectId(user_id)})
+            preference_cache.invalidate(user_id)
             return result.deleted_count > 0
         except Exception as e:
             logger.error(f"Error deleting user: {e}")
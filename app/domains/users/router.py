@@ -17,7 +17,8 @@ from .models import (
     TokenResponse, TokenRefresh, AccountLinkRequest
 )
 from .service import UserService
-from ...shared.clients.google_oauth_client import google_oauth_client
+from .auth_cache import auth_user_cache
+from ...core.lazy import LazyObject
 from ...core.dependencies import get_service_dependency
 from ...core.config import settings
 from ...core.constants import HTTPStatusMessages, TokenConstants, OAuthConstants
@@ -41,6 +42,9 @@ router = APIRouter(
 security_scheme = HTTPBearer(auto_error=False)
 logger = logging.getLogger(__name__)
 
+# OAuth 클라이언트는 첫 사용 시 import
+google_oauth_client = LazyObject("app.shared.clients.google_oauth_client:google_oauth_client")
+
 # Dependency injection
 get_user_service = get_service_dependency(UserService)
 
@@ -541,10 +545,14 @@ async def link_google_account(
     Requires valid access token and correct password
     """
     # Verify current password
-    from ...core.security import verify_password
-    if not current_user.password_hash or not verify_password(
-        link_request.password, current_user.password_hash
-    ):
+    from ...core.security import verify_password, password_hash_pool, PasswordHasherBusy
+    try:
+        password_ok = bool(current_user.password_hash) and await password_hash_pool.run(
+            verify_password, link_request.password, current_user.password_hash
+        )
+    except PasswordHasherBusy as e:
+        raise UserService._hasher_busy(e)
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="현재 비밀번호가 올바르지 않습니다"
@@ -564,7 +572,8 @@ async def link_google_account(
 
 @router.delete("/unlink-google")
 async def unlink_google_account(
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user),
+    user_service: UserService = Depends(get_user_service)
 ):
     """
     Unlink Google account from current account
@@ -579,8 +588,8 @@ async def unlink_google_account(
         )
     
     # Unlink Google account
-    user_service = UserService()
     success = user_service.user_repository.unlink_google_account(current_user.id)
+    auth_user_cache.invalidate(current_user.id)
     if success:
         return {"message": "Google 계정 연결이 해제되었습니다"}
     else:
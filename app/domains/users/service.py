@@ -8,6 +8,7 @@ providing unified user management capabilities.
 from typing import Optional, Dict, Any
 from datetime import datetime
 from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
 
 from .models import (
     User, UserCreate, SocialUserCreate, UserUpdate, UserLogin,
@@ -15,11 +16,16 @@ from .models import (
     UserSettings, UserSettingsUpdate
 )
 from .repository import UserRepository
+from .auth_cache import auth_user_cache
 from ...core.security import (
-    verify_password, get_password_hash, create_token_pair,
-    verify_token, blacklist_token
+    create_token_pair, verify_token, verify_token_async, decode_token, blacklist_token,
+    get_password_hash_async, verify_and_update_password_async, PasswordHasherBusy
 )
-from ...shared.clients.google_oauth_client import google_oauth_client
+from ...shared.exceptions.custom_exceptions import ServiceUnavailableException
+from ...core.lazy import LazyObject
+
+# OAuth 클라이언트는 첫 사용 시 import
+google_oauth_client = LazyObject("app.shared.clients.google_oauth_client:google_oauth_client")
 
 
 class UserService:
@@ -49,8 +55,11 @@ class UserService:
                 detail="이미 등록된 이메일 주소입니다"
             )
 
-        # Hash password
-        password_hash = get_password_hash(user_create.password)
+        # Hash password (bounded worker pool, event loop is not blocked)
+        try:
+            password_hash = await get_password_hash_async(user_create.password)
+        except PasswordHasherBusy as e:
+            raise self._hasher_busy(e)
 
         # Create user
         user = self.user_repository.create_local_user(user_create, password_hash)
@@ -93,12 +102,27 @@ class UserService:
                 detail="이메일 또는 비밀번호가 올바르지 않습니다"
             )
 
-        # Verify password
-        if not user.password_hash or not verify_password(user_login.password, user.password_hash):
+        # Verify password (bounded worker pool)
+        if not user.password_hash:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="이메일 또는 비밀번호가 올바르지 않습니다"
             )
+        try:
+            verified, new_hash = await verify_and_update_password_async(
+                user_login.password, user.password_hash
+            )
+        except PasswordHasherBusy as e:
+            raise self._hasher_busy(e)
+        if not verified:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="이메일 또는 비밀번호가 올바르지 않습니다"
+            )
+        if new_hash:
+            # 비용 파라미터가 바뀐 해시는 로그인 시 재해싱해서 저장
+            self.user_repository.update_password_hash(user.id, new_hash)
+            auth_user_cache.invalidate(user.id)
 
         # Check if user is active
         if not user.is_active:
@@ -167,6 +191,7 @@ class UserService:
                             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail="계정 연결에 실패했습니다"
                         )
+                    auth_user_cache.invalidate(email_user.id)
                     user = self.user_repository.get_by_id(email_user.id)
                 else:
                     # Create new Google user
@@ -232,6 +257,7 @@ class UserService:
                 {"_id": ObjectId(user.id)},
                 {"$set": update_data}
             )
+            auth_user_cache.invalidate(user.id)
             # Refresh user data
             return self.user_repository.get_by_id(user.id)
 
@@ -291,6 +317,10 @@ class UserService:
             True if logout successful
         """
         try:
+            payload = decode_token(access_token) if access_token else None
+            if payload:
+                auth_user_cache.invalidate(payload.get("sub"))
+            
             # Blacklist access token
             blacklist_token(access_token)
 
@@ -315,17 +345,22 @@ class UserService:
         Raises:
             HTTPException: If token is invalid or user not found
         """
-        # Verify token
-        payload = verify_token(token)
+        # Single decode + async blacklist lookup (local negative cache)
+        payload = await verify_token_async(token)
         if not payload or payload.get("type") != "access":
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="유효하지 않은 액세스 토큰입니다"
             )
 
-        # Get user
+        # Get user - (sub, iat) 캐시 우선, 미스 시에만 MongoDB 조회 (스레드풀)
         user_id = payload.get("sub")
-        user = self.user_repository.get_by_id(user_id)
+        issued_at = payload.get("iat")
+        user = auth_user_cache.get(user_id, issued_at)
+        if user is None:
+            user = await run_in_threadpool(self.user_repository.get_by_id, user_id)
+            if user and user.is_active:
+                auth_user_cache.set(user_id, issued_at, user)
         if not user or not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -349,6 +384,7 @@ class UserService:
             HTTPException: If update fails
         """
         user = self.user_repository.update_user(user_id, user_update)
+        auth_user_cache.invalidate(user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -365,7 +401,9 @@ class UserService:
         # Optionally update name together if provided
         if update.name is not None:
             self.user_repository.update_user(user_id, UserUpdate(name=update.name))
-        return self.user_repository.update_user_settings(user_id, update)
+        result = self.user_repository.update_user_settings(user_id, update)
+        auth_user_cache.invalidate(user_id)
+        return result
 
     async def delete_user_account(self, user_id: str) -> bool:
         """
@@ -377,7 +415,18 @@ class UserService:
         Returns:
             True if deletion successful
         """
-        return self.user_repository.delete_user(user_id)
+        deleted = self.user_repository.delete_user(user_id)
+        auth_user_cache.invalidate(user_id)
+        return deleted
+
+    @staticmethod
+    def _hasher_busy(error: PasswordHasherBusy) -> ServiceUnavailableException:
+        """Shed load when the password hash pool is saturated (503 + Retry-After)"""
+        return ServiceUnavailableException(
+            message="요청이 많아 잠시 후 다시 시도해주세요",
+            service_name="password_hasher",
+            retry_after=error.retry_after
+        )
 
     def _to_user_response(self, user: User) -> UserResponse:
         """Convert User model to UserResponse (exclude sensitive data)"""
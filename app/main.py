@@ -4,50 +4,25 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 import uvicorn
 
 from .core.config import settings
-from .core.database import connect_to_mongo, close_mongo_connection
-from .core.di_config import configure_dependencies, validate_container_setup
-from .core.container import setup_container
+from .core.startup import readiness, start_dependencies, stop_dependencies, warm_up
 from .core.middleware import (
     RequestValidationMiddleware,
     ResponseValidationMiddleware,
-    RateLimitMiddleware,
     HealthCheckMiddleware,
     RequestIdMiddleware,
-    CSRFMiddleware
+    CSRFMiddleware,
+    ServerTimingMiddleware,
+    DIScopeMiddleware,
+    RateLimitBackendMiddleware
 )
-from .core.rate_limit import RedisRateLimitMiddleware
 from .core.logging_config import setup_logging
 from .core.metrics import init_metrics, poll_celery_metrics
-import os
-
-def _is_redis_available(url: str) -> bool:
-    try:
-        import redis  # type: ignore
-        client = redis.from_url(url)
-        client.ping()
-        return True
-    except Exception:
-        return False
-from .domains.announcements.router import router as announcements_router
-from .domains.businesses.router import router as businesses_router
-from .domains.contents.router import router as contents_router
-from .domains.users.router import router as users_router
-from .domains.keys.router import router as keys_router
-from .core.config import settings as _settings_for_alerts
-# Alerts versioned router is included conditionally to avoid runtime impact when disabled
-try:
-    from .domains.alerts.versioned_router import get_v1_router as get_alerts_v1_router
-except Exception:
-    get_alerts_v1_router = None  # type: ignore
-from .domains.usage.router import router as usage_router
-from .domains.data_requests.router import router as data_requests_router
-from .domains.data_sources.router import router as data_sources_router
-from .shared.classification.router import router as classification_router
-from .scheduler.task_management_api import get_task_management_router
+from .core.router_registry import include_enabled_routers
 from .shared.exceptions.handlers import (
     base_api_exception_handler,
     http_exception_handler,
@@ -63,7 +38,7 @@ from .shared.exceptions.api_exceptions import KoreanPublicAPIError
 from .shared.exceptions.data_exceptions import DataValidationError
 from .shared.swagger_config import tags_metadata, swagger_ui_parameters
 from .shared.security.schemas import SECURITY_SCHEMES
-from starlette.middleware.gzip import GZipMiddleware
+from .core.compression import CompressionMiddleware
 
 # 로깅 설정 (설정값은 내부에서 처리)
 setup_logging()
@@ -78,44 +53,22 @@ async def lifespan(app: FastAPI):
     logger.info("애플리케이션 시작 중...")
     
     try:
-        # MongoDB 연결 (개발 테스트를 위해 임시로 우회)
-        try:
-            connect_to_mongo()
-            logger.info("MongoDB 연결 성공")
-        except Exception as db_error:
-            logger.warning(f"MongoDB 연결 실패, Mock 데이터 모드로 실행: {db_error}")
-            # MongoDB 연결 실패 시에도 계속 진행
-        
-        # DI 컨테이너 설정
-        logger.info("의존성 주입 컨테이너 설정 중...")
-        container = configure_dependencies()
-        setup_container(container)
-        logger.info("의존성 주입 컨테이너 설정 완료")
-        
-        # 의존성 검증 (선택적)
-        if settings.debug:
-            logger.info("의존성 검증 중...")
-            validation_results = validate_container_setup(container)
-            failed_validations = [name for name, result in validation_results.items() if result["status"] == "error"]
-            
-            if failed_validations:
-                logger.warning(f"의존성 검증 실패: {failed_validations}")
-                for name in failed_validations:
-                    logger.error(f"{name}: {validation_results[name]['error']}")
-            else:
-                logger.info("모든 의존성 검증 성공")
-        
+        # MongoDB(sync/Motor), Redis, HTTP 풀, DI 컨테이너를 동시에 준비 (단계별 타임아웃)
+        # MongoDB 연결 실패 시에도 경고 후 계속 진행 (DI 컨테이너 실패만 치명적)
+        started = await start_dependencies()
     except Exception as e:
         logger.error(f"애플리케이션 초기화 실패: {e}")
         raise
     
-    logger.info("애플리케이션 시작 완료")
+    # 캐시 warm-up 은 백그라운드로 실행하고, 완료 시 /health/ready 가 ready 로 전환
+    warmup_task = asyncio.create_task(warm_up(connected=[step.name for step in started if step.ok]))
+    logger.info("애플리케이션 시작 완료 (warm-up 진행 중)")
+    
     # Start background Celery metrics poller
     stop_metrics = None
     try:
-        import asyncio as _asyncio
-        stop_metrics = _asyncio.Event()
-        _asyncio.create_task(poll_celery_metrics(stop_metrics, interval_seconds=15))
+        stop_metrics = asyncio.Event()
+        asyncio.create_task(poll_celery_metrics(stop_metrics, interval_seconds=15))
         logger.info("Celery metrics poller started")
     except Exception as e:
         logger.warning(f"Celery metrics poller disabled: {e}")
@@ -124,15 +77,14 @@ async def lifespan(app: FastAPI):
     
     # 종료시 실행
     logger.info("애플리케이션 종료 중...")
-    try:
-        close_mongo_connection()
-    except Exception as e:
-        logger.error(f"MongoDB 연결 종료 중 오류: {e}")
+    if not warmup_task.done():
+        warmup_task.cancel()
     try:
         if stop_metrics is not None:
             stop_metrics.set()  # type: ignore
     except Exception:
         pass
+    await stop_dependencies()
     logger.info("애플리케이션 종료 완료")
 
 
@@ -288,34 +240,26 @@ app.add_middleware(
 )
 
 # 미들웨어 등록 (순서 중요: 먼저 등록된 미들웨어가 나중에 실행됨)
+# DI 요청 스코프 (가장 안쪽: 엔드포인트/의존성 해석을 감쌈)
+app.add_middleware(DIScopeMiddleware)
 app.add_middleware(ResponseValidationMiddleware)
 app.add_middleware(RequestValidationMiddleware)
-# 레이트리밋: Redis 사용 가능 시 분산 미들웨어만 활성화
-redis_enabled = _is_redis_available(settings.redis_url)
-if not redis_enabled:
-    app.add_middleware(RateLimitMiddleware, calls_per_minute=settings.rl_per_minute, calls_per_hour=settings.rl_per_hour)
+app.add_middleware(ServerTimingMiddleware)
 app.add_middleware(HealthCheckMiddleware)
 app.add_middleware(RequestIdMiddleware)
 app.add_middleware(CSRFMiddleware)
-
-if redis_enabled:
-    try:
-        app.add_middleware(
-            RedisRateLimitMiddleware,
-            redis_url=settings.redis_url,
-            calls_per_minute=settings.rl_per_minute,
-            calls_per_hour=settings.rl_per_hour,
-        )
-        logger.info("RedisRateLimitMiddleware enabled")
-    except Exception as e:
-        logger.warning(f"RedisRateLimitMiddleware disabled: {e}")
+# 레이트리밋: 백엔드(Redis/메모리)는 import 시점이 아닌 시작 시 결정
+app.add_middleware(
+    RateLimitBackendMiddleware,
+    backend=settings.rate_limit_backend,
+    redis_url=settings.redis_url,
+    calls_per_minute=settings.rl_per_minute,
+    calls_per_hour=settings.rl_per_hour,
+)
 
 # Metrics
 init_metrics(app, enabled=True, endpoint="/metrics")
 
-# GZip compression for large JSON responses (improves LCP)
-app.add_middleware(GZipMiddleware, minimum_size=500)
-
 # API 버전 미들웨어 (요청 초기에 처리)
 app.add_middleware(
     create_deprecation_middleware(
@@ -330,6 +274,10 @@ app.add_middleware(
     )
 )
 
+# 응답 압축: br/zstd/gzip 협상 + 본문 크기별 레벨 (사전 압축된 캐시 응답은 통과)
+# 가장 바깥에 등록 - 버전 변환이 끝난 본문을 압축해야 구버전 클라이언트도 변환된 응답을 받음
+app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_minimum_size)
+
 # 예외 핸들러 등록 (순서 중요: 구체적인 예외부터 일반적인 예외 순서로)
 app.add_exception_handler(BaseAPIException, base_api_exception_handler)
 app.add_exception_handler(KoreanPublicAPIError, korean_api_exception_handler)
@@ -341,37 +289,8 @@ app.add_exception_handler(Exception, general_exception_handler)
 # MongoDB 연결은 lifespan에서 처리
 
 
-# 라우터 등록
-app.include_router(announcements_router, prefix="/api/v1")
-app.include_router(businesses_router, prefix="/api/v1")
-app.include_router(contents_router, prefix="/api/v1")
-app.include_router(users_router, prefix="/api/v1")
-app.include_router(data_requests_router, prefix="/api/v1")
-app.include_router(classification_router, prefix="/api/v1")
-app.include_router(keys_router, prefix="/api/v1")
-app.include_router(usage_router, prefix="/api/v1")
-app.include_router(get_task_management_router())
-app.include_router(data_sources_router, prefix="/api/v1")
-
-# Conditionally mount alerts router when enabled (keeps default runtime unchanged)
-if _settings_for_alerts.alerts_enabled and get_alerts_v1_router is not None:
-    try:
-        app.include_router(get_alerts_v1_router(), prefix="/api")
-        logger.info("Alerts router mounted under /api/v1/alerts")
-    except Exception as e:
-        logger.warning(f"Failed to mount alerts router: {e}")
-
-# Versioned router examples (demonstrating API versioning system)
-# These show how to implement different API versions with backward compatibility
-try:
-    from .domains.announcements.versioned_router import create_versioned_announcement_router
-    from .domains.businesses.versioned_router import create_versioned_business_router
-    
-    app.include_router(create_versioned_announcement_router(), prefix="/api")
-    app.include_router(create_versioned_business_router(), prefix="/api")
-    logger.info("Versioned routers enabled for announcements and businesses")
-except Exception as e:
-    logger.warning(f"Failed to enable versioned routers: {e}")
+# 라우터 등록 (settings.enabled_routers 에 포함된 라우터 모듈만 import)
+include_enabled_routers(app, settings)
 
 # 버전 정보 엔드포인트 추가
 add_version_info_endpoint(app)
@@ -431,6 +350,17 @@ def health_check():
     }
 
 
+@app.get(
+    "/health/ready",
+    tags=["기본"],
+    summary="서비스 준비 상태 확인",
+    description="시작 시 연결 및 캐시 warm-up 이 끝났는지 확인합니다. 완료 전에는 503 을 반환합니다."
+)
+def readiness_check():
+    """레디니스 엔드포인트 - 로드밸런서/오케스트레이터의 트래픽 투입 기준"""
+    return ORJSONResponse(readiness.to_dict(), status_code=200 if readiness.ready else 503)
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "app.main:app",
@@ -1,5 +1,7 @@
 from celery import Celery
 from ..core.config import settings
+from ..core.async_runtime import install_worker_hooks
+from ..core.task_queues import INGESTION_QUEUE
 
 celery_app = Celery(
     "korea_public_api",
@@ -21,25 +23,28 @@ celery_app.conf.update(
         'fetch-announcements-daily': {
             'task': 'app.scheduler.tasks.fetch_all_announcements',
             'schedule': 60.0 * 60.0 * 24,  # 매일 실행
-            'options': {'queue': 'data_collection'}
+            'options': {'queue': INGESTION_QUEUE}
         },
         'fetch-contents-daily': {
             'task': 'app.scheduler.tasks.fetch_all_contents',
             'schedule': 60.0 * 60.0 * 24,  # 매일 실행
-            'options': {'queue': 'data_collection'}
+            'options': {'queue': INGESTION_QUEUE}
         },
         'fetch-statistics-weekly': {
             'task': 'app.scheduler.tasks.fetch_all_statistics',
             'schedule': 60.0 * 60.0 * 24 * 7,  # 매주 실행
-            'options': {'queue': 'data_collection'}
+            'options': {'queue': INGESTION_QUEUE}
         },
         'fetch-businesses-weekly': {
             'task': 'app.scheduler.tasks.fetch_all_businesses',
             'schedule': 60.0 * 60.0 * 24 * 7,  # 매주 실행
-            'options': {'queue': 'data_collection'}
+            'options': {'queue': INGESTION_QUEUE}
         }
     },
     task_routes={
-        'app.scheduler.tasks.*': {'queue': 'data_collection'}
+        'app.scheduler.tasks.*': {'queue': INGESTION_QUEUE}
     }
-)
\ No newline at end of file
+)
+
+# 워커 프로세스 수명 동안 이벤트 루프 하나를 유지
+install_worker_hooks()
@@ -7,7 +7,6 @@ performance tracking, alerting, and automated issue resolution.
 
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timedelta
-import asyncio
 import logging
 import json
 import traceback
@@ -16,6 +15,7 @@ from celery.exceptions import Retry
 
 from ..core.celery_config import celery_app
 from ..core.database import get_database
+from ..core.async_runtime import run_async
 from ..shared.classification.services import ClassificationService
 from ..domains.announcements.service import AnnouncementService
 
@@ -79,7 +79,7 @@ def comprehensive_system_monitor(self) -> Dict[str, Any]:
     try:
         logger.info("Starting comprehensive system monitoring")
         
-        result = asyncio.run(_comprehensive_system_monitor_async())
+        result = run_async(_comprehensive_system_monitor_async())
         
         # Analyze results and trigger alerts if needed
         _analyze_monitoring_results(result)
@@ -789,13 +789,13 @@ def get_monitoring_tasks() -> List[Dict[str, Any]]:
             "description": "Comprehensive system health and performance monitoring",
             "category": "monitoring",
             "estimated_duration": "2-5 minutes",
-            "queue": "monitoring"
+            "queue": "maintenance"
         },
         {
             "name": "generate_monitoring_report",
             "description": "Generate comprehensive monitoring report",
             "category": "reporting",
             "estimated_duration": "3-7 minutes",
-            "queue": "monitoring"
+            "queue": "analytics"
         }
     ]
\ No newline at end of file
@@ -7,12 +7,16 @@ monitoring, scheduling, and system administration.
 
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timedelta
+import asyncio
 import logging
 from fastapi import APIRouter, HTTPException, Query, Body, Depends
 from pydantic import BaseModel, Field
 from enum import Enum
 
 from ..core.celery_config import celery_app, get_task_info, get_queue_info, get_schedule_info
+from ..core.distributed_lock import dispatch_singleton
+from ..core.metrics import collect_queue_stats_async
+from ..core.task_queues import PRIORITY_LEVELS
 from ..core.tasks import get_available_tasks
 from ..domains.announcements.tasks import get_announcement_tasks
 from .monitoring_tasks import get_monitoring_tasks
@@ -94,6 +98,14 @@ class QueueInfo(BaseModel):
     consumers: int
     messages_ready: int = 0
     messages_unacknowledged: int = 0
+    workload: Optional[str] = None
+    priority: Optional[int] = Field(None, description="기본 브로커 우선순위 (Redis: 낮을수록 먼저)")
+    lag_seconds: float = Field(0.0, description="가장 오래 대기 중인 메시지의 대기 시간")
+    throughput_per_minute: float = Field(0.0, description="최근 구간의 분당 완료 작업 수")
+    concurrency: Optional[int] = None
+    prefetch_multiplier: Optional[int] = None
+    soft_time_limit: Optional[int] = None
+    time_limit: Optional[int] = None
 
 
 class WorkerInfo(BaseModel):
@@ -230,29 +242,25 @@ async def execute_task(request: TaskExecutionRequest) -> Dict[str, Any]:
         if request.eta:
             task_options["eta"] = request.eta
         
-        # Set priority (convert enum to number)
-        priority_map = {
-            TaskPriority.LOW: 1,
-            TaskPriority.MEDIUM: 5,
-            TaskPriority.HIGH: 8,
-            TaskPriority.CRITICAL: 10
-        }
-        task_options["priority"] = priority_map.get(request.priority, 5)
+        # Set priority (convert enum to broker priority; Redis 는 숫자가 낮을수록 먼저)
+        priority = request.priority or TaskPriority.MEDIUM
+        task_options["priority"] = PRIORITY_LEVELS[priority.value]
         
-        # Execute the task
-        async_result = task.apply_async(
-            args=request.args,
-            kwargs=request.kwargs,
-            **task_options
+        # Execute the task (singleton 태스크가 이미 실행/대기 중이면 그 작업 ID 로 합침)
+        task_id, started = await asyncio.to_thread(
+            dispatch_singleton, task, request.args, request.kwargs, **task_options
         )
         
-        logger.info(f"Task {request.task_name} submitted with ID: {async_result.id}")
+        if started:
+            logger.info(f"Task {request.task_name} submitted with ID: {task_id}")
+        else:
+            logger.info(f"Task {request.task_name} already running as {task_id}, not submitted again")
         
         return {
-            "task_id": async_result.id,
+            "task_id": task_id,
             "task_name": request.task_name,
-            "status": "submitted",
-            "message": "Task submitted for execution",
+            "status": "submitted" if started else "coalesced",
+            "message": "Task submitted for execution" if started else "Task is already running; returning its ID",
             "queue": request.queue or "default",
             "priority": request.priority,
             "submitted_at": datetime.utcnow().isoformat()
@@ -370,10 +378,37 @@ async def list_queues() -> List[QueueInfo]:
         # Get queue information from Celery configuration
         queue_config = get_queue_info()
         
-        # Get active queue statistics
+        # 대기 수 / 지연 / 처리량은 브로커에서 직접 읽음 (브로커가 없으면 0)
+        stats = {queue.name: queue for queue in await collect_queue_stats_async()}
+        
         # Avoid blocking inspect calls when no broker/workers are available
-        queue_names = queue_config.get("queues", [])
-        queue_infos = [QueueInfo(name=qn, length=0, consumers=0) for qn in queue_names]
+        try:
+            active_queues = celery_app.control.inspect(timeout=1).active_queues() or {}
+        except Exception:
+            active_queues = {}
+        consumers: Dict[str, int] = {}
+        for worker_queues in active_queues.values():
+            for queue in worker_queues:
+                consumers[queue.get("name")] = consumers.get(queue.get("name"), 0) + 1
+        
+        queue_infos = []
+        for profile in queue_config.get("profiles", []):
+            queue_stats = stats.get(profile["name"])
+            length = queue_stats.length if queue_stats else 0
+            queue_infos.append(QueueInfo(
+                name=profile["name"],
+                length=length,
+                consumers=consumers.get(profile["name"], 0),
+                messages_ready=length,
+                workload=profile["workload"],
+                priority=profile["priority"],
+                lag_seconds=queue_stats.lag_seconds if queue_stats else 0.0,
+                throughput_per_minute=queue_stats.throughput_per_minute if queue_stats else 0.0,
+                concurrency=profile["concurrency"],
+                prefetch_multiplier=profile["prefetch_multiplier"],
+                soft_time_limit=profile["soft_time_limit"],
+                time_limit=profile["time_limit"],
+            ))
         
         return queue_infos
         
@@ -1,27 +1,29 @@
 from celery import Celery
-from ..core.database import connect_to_mongo, close_mongo_connection
+from ..core.async_runtime import run_async
+from ..core.distributed_lock import active_lease, ensure_lease, singleton_task
+from ..domains.announcements.batch_service import COLLECTION_LOCK
 from ..domains.announcements.service import AnnouncementService
 from ..shared.clients.public_data_client import PublicDataAPIClient
 import logging
-import asyncio
 from .celery_app import celery_app
 
 logger = logging.getLogger(__name__)
 
 
 async def async_task_wrapper(async_func):
-    """비동기 함수를 Celery 태스크에서 실행하기 위한 래퍼"""
-    await connect_to_mongo()
-    try:
-        result = await async_func()
-        return result
-    finally:
-        await close_mongo_connection()
+    """비동기 함수를 Celery 태스크에서 실행하기 위한 래퍼
+    
+    MongoDB 연결 풀은 워커 프로세스 수명 동안 유지되므로 태스크마다 연결/종료하지 않음
+    """
+    return await async_func()
 
 
 @celery_app.task(bind=True, max_retries=3)
+@singleton_task(lock=COLLECTION_LOCK)
 def fetch_all_announcements(self):
     """모든 사업공고 데이터 수집"""
+    lease = active_lease()
+
     async def _fetch():
         logger.info("사업공고 데이터 수집 시작")
         service = AnnouncementService()
@@ -30,6 +32,8 @@ def fetch_all_announcements(self):
         page = 1
         
         while True:
+            # fencing: 락을 잃었으면 저장 전에 중단 (LeaseLost 는 재시도하지 않음)
+            ensure_lease(lease)
             try:
                 announcements = await service.fetch_and_save_announcements(
                     page_no=page,
@@ -54,10 +58,11 @@ def fetch_all_announcements(self):
         logger.info(f"사업공고 데이터 수집 완료: 총 {total_fetched}개")
         return {"total_fetched": total_fetched}
     
-    return asyncio.run(async_task_wrapper(_fetch))
+    return run_async(async_task_wrapper(_fetch))
 
 
 @celery_app.task(bind=True, max_retries=3)
+@singleton_task(lock="contents.collect")
 def fetch_all_contents(self):
     """모든 콘텐츠 데이터 수집"""
     async def _fetch():
@@ -66,10 +71,11 @@ def fetch_all_contents(self):
         logger.info("콘텐츠 서비스 미구현 - 스킵")
         return {"total_fetched": 0}
     
-    return asyncio.run(async_task_wrapper(_fetch))
+    return run_async(async_task_wrapper(_fetch))
 
 
 @celery_app.task(bind=True, max_retries=3)
+@singleton_task()
 def fetch_all_statistics(self):
     """모든 통계 데이터 수집"""
     async def _fetch():
@@ -78,10 +84,11 @@ def fetch_all_statistics(self):
         logger.info("통계 서비스 미구현 - 스킵")
         return {"total_fetched": 0}
     
-    return asyncio.run(async_task_wrapper(_fetch))
+    return run_async(async_task_wrapper(_fetch))
 
 
 @celery_app.task(bind=True, max_retries=3)
+@singleton_task(lock="businesses.collect")
 def fetch_all_businesses(self):
     """모든 사업정보 데이터 수집"""
     async def _fetch():
@@ -90,7 +97,7 @@ def fetch_all_businesses(self):
         logger.info("사업정보 서비스 미구현 - 스킵")
         return {"total_fetched": 0}
     
-    return asyncio.run(async_task_wrapper(_fetch))
+    return run_async(async_task_wrapper(_fetch))
 
 
 @celery_app.task
@@ -9,7 +9,7 @@ from fastapi import APIRouter, HTTPException, Query, Path, Depends, Body
 from fastapi.responses import JSONResponse
 import logging
 
-from .services import ClassificationService
+from .services import ClassificationService, classification_service
 from .models import (
     BusinessCategoryCode, ContentCategoryCode,
     ClassificationCodeSearchRequest, ClassificationCodeSearchResponse,
@@ -37,8 +37,8 @@ COMMON_ERROR_RESPONSES = {
 
 # Dependency injection
 def get_classification_service() -> ClassificationService:
-    """Get ClassificationService instance."""
-    return ClassificationService()
+    """Get the shared ClassificationService instance (warmed at startup)."""
+    return classification_service
 
 
 @router.get(
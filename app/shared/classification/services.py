@@ -632,6 +632,20 @@ class ClassificationService:
         self._cache[cache_key] = data
         self._last_cache_update[cache_key] = datetime.utcnow()
     
+    async def warm_cache(self) -> int:
+        """
+        Pre-load the category tables served by the list endpoints.
+        
+        Returns:
+            Number of cache entries populated
+        """
+        for filter_active in (True, False):
+            for include_details in (True, False):
+                await self.get_business_categories(filter_active, include_details)
+                await self.get_content_categories(filter_active, include_details)
+        self.unified_validator.get_all_valid_codes()
+        return len(self._cache)
+    
     def clear_cache(self) -> None:
         """Clear all cached data."""
         self._cache.clear()
@@ -675,4 +689,8 @@ class ClassificationService:
                 "status": "unhealthy",
                 "timestamp": datetime.utcnow().isoformat(),
                 "error": str(e)
-            }
\ No newline at end of file
+            }
+
+
+# Shared instance so the per-process cache survives across requests
+classification_service = ClassificationService()
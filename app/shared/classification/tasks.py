@@ -7,12 +7,12 @@ of classification code usage across the system.
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-import asyncio
 import logging
 from celery import Task
 
 from ...core.celery_config import celery_app
 from ...core.database import get_database
+from ...core.async_runtime import run_async
 from .services import ClassificationService
 
 logger = logging.getLogger(__name__)
@@ -50,7 +50,7 @@ def validate_classification_usage(self) -> Dict[str, Any]:
     try:
         logger.info("Starting classification usage validation")
         
-        result = asyncio.run(_validate_classification_usage_async())
+        result = run_async(_validate_classification_usage_async())
         
         logger.info(f"Classification validation completed: {result['summary']}")
         return result
@@ -263,7 +263,7 @@ def generate_classification_statistics(self) -> Dict[str, Any]:
     try:
         logger.info("Generating classification statistics")
         
-        result = asyncio.run(_generate_classification_statistics_async())
+        result = run_async(_generate_classification_statistics_async())
         
         logger.info("Classification statistics generation completed")
         return result
@@ -470,13 +470,13 @@ def get_classification_tasks() -> List[Dict[str, Any]]:
             "description": "Validate classification code usage across all domains",
             "category": "validation",
             "estimated_duration": "5-10 minutes",
-            "queue": "classification"
+            "queue": "analytics"
         },
         {
             "name": "generate_classification_statistics",
             "description": "Generate comprehensive classification usage statistics",
             "category": "analytics",
             "estimated_duration": "3-5 minutes",
-            "queue": "classification"
+            "queue": "analytics"
         }
     ]
\ No newline at end of file
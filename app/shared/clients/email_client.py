@@ -1,26 +1,116 @@
 from __future__ import annotations
 
 import logging
+import smtplib
+import threading
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.utils import formataddr, make_msgid
 from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# meta["priority"] -> (X-Priority, X-MSMail-Priority)
+_PRIORITY_HEADERS = {"high": ("1", "High"), "low": ("5", "Low")}
+
 
 class EmailClient:
     """Simple email client abstraction.
 
     - Dev: logs instead of sending
-    - Prod: replace `send` with provider integration (SES/SendGrid/etc.)
+    - SMTP: one SMTP session per client, opened lazily and reused across sends
+      (reconnects once if the server dropped it); call ``close`` when done
+    - Other providers (SES/SendGrid/etc.): not implemented
     """
 
-    def __init__(self, provider: str = "dev") -> None:
+    def __init__(self, provider: str = "dev", *, smtp_settings: Any = None) -> None:
         self.provider = provider
+        self._smtp_settings = smtp_settings
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+
+    @property
+    def smtp_settings(self) -> Any:
+        if self._smtp_settings is None:
+            from ...core.config import settings
+
+            self._smtp_settings = settings
+        return self._smtp_settings
 
     def send(self, to: str, subject: str, html: str, text: Optional[str] = None, *, meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         if self.provider == "dev":
             logger.info("[DEV EMAIL] to=%s subject=%s meta=%s", to, subject, meta)
             return {"ok": True, "provider": "dev"}
+        if self.provider == "smtp":
+            return self._send_smtp(to, subject, html, text, meta or {})
         # Placeholder for real providers
         logger.warning("Email provider '%s' not implemented", self.provider)
         return {"ok": False, "error": "provider_not_implemented", "provider": self.provider}
 
+    # --- SMTP -----------------------------------------------------------------
+
+    def _connect(self) -> smtplib.SMTP:
+        cfg = self.smtp_settings
+        smtp = smtplib.SMTP(cfg.smtp_host, cfg.smtp_port, timeout=cfg.smtp_timeout_seconds)
+        if cfg.smtp_use_tls:
+            smtp.starttls()
+        if cfg.smtp_username:
+            smtp.login(cfg.smtp_username, cfg.smtp_password or "")
+        logger.info("SMTP session opened to %s:%s", cfg.smtp_host, cfg.smtp_port)
+        return smtp
+
+    def _build_message(self, to: str, subject: str, html: str, text: Optional[str], meta: Dict[str, Any]) -> MIMEMultipart:
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        cfg = self.smtp_settings
+        msg["From"] = meta.get("from_email") or formataddr((cfg.smtp_from_name, cfg.smtp_from_email))
+        msg["To"] = to
+        msg["Message-ID"] = make_msgid()
+        if meta.get("reply_to"):
+            msg["Reply-To"] = meta["reply_to"]
+        if meta.get("priority") in _PRIORITY_HEADERS:
+            msg["X-Priority"], msg["X-MSMail-Priority"] = _PRIORITY_HEADERS[meta["priority"]]
+        if meta.get("tracking_id"):
+            msg["X-Tracking-ID"] = str(meta["tracking_id"])
+        if text:
+            msg.attach(MIMEText(text, "plain", "utf-8"))
+        msg.attach(MIMEText(html, "html", "utf-8"))
+        return msg
+
+    def _send_smtp(self, to: str, subject: str, html: str, text: Optional[str], meta: Dict[str, Any]) -> Dict[str, Any]:
+        msg = self._build_message(to, subject, html, text, meta)
+        with self._smtp_lock:
+            for attempt in (1, 2):
+                try:
+                    if self._smtp is None:
+                        self._smtp = self._connect()
+                    self._smtp.send_message(msg)
+                    return {"ok": True, "provider": "smtp", "message_id": msg["Message-ID"]}
+                except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, OSError) as e:
+                    # 끊긴 세션은 버리고 한 번만 다시 연결
+                    self._discard_smtp()
+                    if attempt == 2:
+                        logger.error("SMTP send to %s failed: %s", to, e)
+                        return {"ok": False, "error": str(e), "provider": "smtp"}
+                except smtplib.SMTPException as e:
+                    logger.error("SMTP send to %s rejected: %s", to, e)
+                    return {"ok": False, "error": str(e), "provider": "smtp"}
+        return {"ok": False, "error": "unreachable", "provider": "smtp"}
+
+    def _discard_smtp(self) -> None:
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None:
+            try:
+                smtp.close()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """Close the reused SMTP session (no-op for dev)"""
+        with self._smtp_lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except Exception:
+                    pass
+                self._discard_smtp()
@@ -2,35 +2,77 @@
 Google OAuth 2.0 Client for handling Google authentication flow.
 
 Implements authorization code flow, token exchange, and user profile retrieval.
+
+모든 HTTP 호출은 프로세스 공유 커넥션 풀(``app.core.http``)을 사용합니다.
+OpenID discovery 문서와 JWKS 는 TTL(Cache-Control max-age 우선) 동안 캐시하며,
+토큰 응답의 ID 토큰을 로컬에서 검증해 userinfo 왕복을 생략합니다. ID 토큰이
+없거나 필요한 클레임이 빠진 경우에만 userinfo 를 호출합니다.
 """
 
-import httpx
+import asyncio
+import logging
+import re
+import time
 from typing import Optional, Dict, Any
 from urllib.parse import urlencode
-import secrets
-from datetime import datetime, timedelta
+from datetime import datetime
+
+import httpx
+from jose import JWTError, jwk, jwt
 
 from ...core.config import settings
+from ...core.http import get_http_client
 from ...core.security import security
 
+logger = logging.getLogger(__name__)
+
+# discovery 실패 시 사용하는 기본 엔드포인트
+DEFAULT_ENDPOINTS: Dict[str, str] = {
+    "authorization_endpoint": "https://accounts.google.com/o/oauth2/v2/auth",
+    "token_endpoint": "https://oauth2.googleapis.com/token",
+    "userinfo_endpoint": "https://www.googleapis.com/oauth2/v2/userinfo",
+    "jwks_uri": "https://www.googleapis.com/oauth2/v3/certs",
+    "revocation_endpoint": "https://oauth2.googleapis.com/revoke",
+}
+GOOGLE_ISSUERS = ("https://accounts.google.com", "accounts.google.com")
+# Google ID 토큰 서명 알고리즘 (토큰 헤더의 alg 는 신뢰하지 않음)
+GOOGLE_ID_TOKEN_ALGORITHM = "RS256"
+
+# 모르는 kid 로 인한 JWKS 재조회 최소 간격 (키 로테이션 대응, 요청 폭주 방지)
+JWKS_MIN_REFRESH_SECONDS = 60
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def _max_age(response: httpx.Response, default: int) -> int:
+    """Cache-Control max-age (없으면 default)"""
+    match = _MAX_AGE_RE.search(response.headers.get("cache-control", ""))
+    return int(match.group(1)) if match else default
+
 
 class GoogleOAuthClient:
     """Google OAuth 2.0 client for authentication"""
-    
+
     def __init__(self):
         self.client_id = settings.google_client_id
         self.client_secret = settings.google_client_secret
         self.redirect_uri = settings.google_redirect_uri
         self.scope = settings.google_scope
-        
-        # Google OAuth 2.0 endpoints
-        self.auth_url = "https://accounts.google.com/o/oauth2/v2/auth"
-        self.token_url = "https://oauth2.googleapis.com/token"
-        self.userinfo_url = "https://www.googleapis.com/oauth2/v2/userinfo"
+
+        # Google OAuth 2.0 endpoints (discovery 로 갱신)
+        self.auth_url = DEFAULT_ENDPOINTS["authorization_endpoint"]
+        self.token_url = DEFAULT_ENDPOINTS["token_endpoint"]
+        self.userinfo_url = DEFAULT_ENDPOINTS["userinfo_endpoint"]
         self.tokeninfo_url = "https://oauth2.googleapis.com/tokeninfo"
-        
-        # HTTP client will be created per request to avoid closed-client reuse issues
-    
+
+        # discovery / JWKS 캐시
+        self._discovery: Optional[Dict[str, Any]] = None
+        self._discovery_expires_at = 0.0
+        self._signing_keys: Dict[str, Any] = {}
+        self._jwks_expires_at = 0.0
+        self._jwks_fetched_at = 0.0
+        self._refresh_lock = asyncio.Lock()
+
     def get_authorization_url(
         self,
         state: Optional[str] = None,
@@ -39,22 +81,22 @@ class GoogleOAuthClient:
     ) -> Dict[str, str]:
         """
         Generate Google OAuth authorization URL with CSRF protection
-        
+
         Args:
             state: Optional state parameter for additional CSRF protection
             redirect_to: Optional path (or URL) to redirect client after successful authentication
             remember: Optional flag that indicates persistent login preference
-            
+
         Returns:
             Dict containing authorization URL and state token
         """
         if not self.client_id:
             raise ValueError("Google Client ID not configured")
-        
+
         # Generate secure state token
         if state is None:
             state = security.generate_state_token()
-        
+
         # Store state data in Redis for verification (used by callback)
         state_data = {
             "timestamp": datetime.utcnow().isoformat(),
@@ -66,7 +108,7 @@ class GoogleOAuthClient:
             "redirect_url": self.redirect_uri,
         }
         security.store_oauth_state(state, state_data, expire_seconds=600)  # 10 minutes
-        
+
         # Build authorization URL parameters
         params = {
             "client_id": self.client_id,
@@ -78,30 +120,144 @@ class GoogleOAuthClient:
             "access_type": "offline",  # Get refresh token
             "prompt": "consent"  # Force consent screen to get refresh token
         }
-        
+
         authorization_url = f"{self.auth_url}?{urlencode(params)}"
-        
+
         return {
             "authorization_url": authorization_url,
             "state": state
         }
-    
+
+    async def get_discovery(self) -> Dict[str, Any]:
+        """OpenID discovery 문서 (TTL 캐시, 실패 시 기본 엔드포인트)"""
+        if self._discovery is not None and time.monotonic() < self._discovery_expires_at:
+            return self._discovery
+
+        async with self._refresh_lock:
+            if self._discovery is not None and time.monotonic() < self._discovery_expires_at:
+                return self._discovery
+            try:
+                response = await get_http_client().get(settings.google_discovery_url)
+                response.raise_for_status()
+                document = {**DEFAULT_ENDPOINTS, **response.json()}
+                ttl = _max_age(response, settings.google_oidc_cache_ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Google discovery fetch failed, using default endpoints: {e}")
+                # 이전 문서가 있으면 계속 사용하고 짧게 재시도
+                document = self._discovery or dict(DEFAULT_ENDPOINTS)
+                ttl = JWKS_MIN_REFRESH_SECONDS
+
+            self._discovery = document
+            self._discovery_expires_at = time.monotonic() + ttl
+            self.auth_url = document["authorization_endpoint"]
+            self.token_url = document["token_endpoint"]
+            self.userinfo_url = document["userinfo_endpoint"]
+            return document
+
+    async def _get_signing_key(self, kid: str) -> Any:
+        """kid 에 해당하는 서명 키 (JWKS TTL 캐시, 모르는 kid 는 제한적으로 재조회)"""
+        now = time.monotonic()
+        key = self._signing_keys.get(kid)
+        if key is not None and now < self._jwks_expires_at:
+            return key
+
+        async with self._refresh_lock:
+            key = self._signing_keys.get(kid)
+            now = time.monotonic()
+            stale = now >= self._jwks_expires_at
+            if key is None or stale:
+                if stale or now - self._jwks_fetched_at >= JWKS_MIN_REFRESH_SECONDS:
+                    try:
+                        await self._refresh_jwks()
+                    except httpx.HTTPError:
+                        if key is None:
+                            raise
+                        # 갱신 실패 시 만료된 캐시 키로 계속 검증 (Google 키는 수일 단위로 교체)
+                        logger.warning("Google JWKS refresh failed, using cached keys")
+                key = self._signing_keys.get(kid, key)
+
+        if key is None:
+            raise JWTError(f"Unknown signing key: {kid}")
+        return key
+
+    async def _refresh_jwks(self) -> None:
+        discovery = self._discovery or DEFAULT_ENDPOINTS
+        response = await get_http_client().get(discovery["jwks_uri"])
+        response.raise_for_status()
+
+        keys: Dict[str, Any] = {}
+        for entry in response.json().get("keys", []):
+            if entry.get("kid") and entry.get("alg", GOOGLE_ID_TOKEN_ALGORITHM) == GOOGLE_ID_TOKEN_ALGORITHM:
+                # 키 객체를 미리 만들어 두어 검증마다 JWK 파싱을 반복하지 않음
+                keys[entry["kid"]] = jwk.construct(entry, GOOGLE_ID_TOKEN_ALGORITHM)
+
+        self._signing_keys = keys
+        self._jwks_fetched_at = time.monotonic()
+        self._jwks_expires_at = self._jwks_fetched_at + _max_age(response, settings.google_oidc_cache_ttl_seconds)
+        logger.debug(f"Google JWKS refreshed ({len(keys)} keys)")
+
+    async def warm_cache(self) -> int:
+        """discovery 문서와 JWKS 를 미리 적재 (lifespan warm-up), 키 개수 반환"""
+        await self.get_discovery()
+        async with self._refresh_lock:
+            await self._refresh_jwks()
+        return len(self._signing_keys)
+
+    async def verify_id_token(self, id_token: str, access_token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Verify a Google ID token locally against the cached JWKS
+
+        Args:
+            id_token: ID token from the token endpoint
+            access_token: Access token issued with it (checks at_hash when present)
+
+        Returns:
+            Verified claims
+
+        Raises:
+            JWTError: If the signature, audience, issuer or expiry is invalid
+        """
+        header = jwt.get_unverified_header(id_token)
+        key = await self._get_signing_key(header.get("kid", ""))
+        return jwt.decode(
+            id_token,
+            key,
+            algorithms=[GOOGLE_ID_TOKEN_ALGORITHM],
+            audience=self.client_id,
+            issuer=GOOGLE_ISSUERS,
+            access_token=access_token,
+            options={"leeway": settings.google_id_token_leeway_seconds},
+        )
+
+    @staticmethod
+    def _user_info_from_claims(claims: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """ID 토큰 클레임 → user_info (필수 클레임이 없으면 None)"""
+        if not all(claims.get(field) for field in ("sub", "email", "name")):
+            return None
+        return {
+            "external_id": claims["sub"],
+            "email": claims["email"],
+            "name": claims["name"],
+            "picture": claims.get("picture"),
+            "verified_email": bool(claims.get("email_verified", False))
+        }
+
     async def exchange_code_for_tokens(self, code: str, state: str) -> Optional[Dict[str, Any]]:
         """
         Exchange authorization code for access token and user info
-        
+
         Args:
             code: Authorization code from Google
             state: State parameter for CSRF verification
-            
+
         Returns:
             Dict containing access token, refresh token, and user info
         """
         # Verify state parameter
-        state_data = security.get_oauth_state(state)
+        state_data = await security.get_oauth_state_async(state)
         if not state_data:
             raise ValueError("Invalid or expired state parameter")
-        
+
         # Determine redirect_uri used during authorization
         # Must match exactly what was used to obtain the authorization code
         redirect_uri_for_exchange = None
@@ -116,23 +272,38 @@ class GoogleOAuthClient:
             "grant_type": "authorization_code",
             "redirect_uri": redirect_uri_for_exchange or self.redirect_uri
         }
-        
+
         try:
+            await self.get_discovery()
+
             # Get access token
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                token_response = await client.post(
-                    self.token_url,
-                    data=token_data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"}
-                )
-                token_response.raise_for_status()
-                tokens = token_response.json()
-            
-            # Get user info using access token
-            user_info = await self._get_user_info(tokens["access_token"])
+            token_response = await get_http_client().post(
+                self.token_url,
+                data=token_data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"}
+            )
+            token_response.raise_for_status()
+            tokens = token_response.json()
+
+            user_info = None
+            if tokens.get("id_token"):
+                try:
+                    claims = await self.verify_id_token(tokens["id_token"], tokens["access_token"])
+                except JWTError as e:
+                    logger.warning(f"Google ID token rejected: {e}")
+                    return None
+                except httpx.HTTPError as e:
+                    # JWKS 를 가져올 수 없으면 userinfo 로 대체 (토큰은 TLS 로 Google 에서 직접 받음)
+                    logger.warning(f"Google JWKS unavailable, falling back to userinfo: {e}")
+                else:
+                    user_info = self._user_info_from_claims(claims)
+
+            # Get user info using access token (ID 토큰이 없거나 클레임이 부족할 때만)
+            if user_info is None:
+                user_info = await self._get_user_info(tokens["access_token"])
             if not user_info:
                 return None
-            
+
             return {
                 "access_token": tokens["access_token"],
                 "refresh_token": tokens.get("refresh_token"),
@@ -140,96 +311,94 @@ class GoogleOAuthClient:
                 "user_info": user_info,
                 "state_data": state_data
             }
-        
+
         except httpx.HTTPStatusError as e:
-            print(f"HTTP error during token exchange: {e}")
+            logger.error(f"HTTP error during token exchange: {e}")
             return None
         except Exception as e:
-            print(f"Error during token exchange: {e}")
+            logger.error(f"Error during token exchange: {e}")
             return None
-    
+
     async def _get_user_info(self, access_token: str) -> Optional[Dict[str, Any]]:
         """
         Get user profile information from Google API
-        
+
         Args:
             access_token: Google access token
-            
+
         Returns:
             User profile information
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                headers = {"Authorization": f"Bearer {access_token}"}
-                response = await client.get(self.userinfo_url, headers=headers)
-                response.raise_for_status()
-                user_info = response.json()
-            
-            # Validate required fields
-            required_fields = ["id", "email", "name"]
-            if not all(field in user_info for field in required_fields):
-                print(f"Missing required fields in user info: {user_info}")
+            headers = {"Authorization": f"Bearer {access_token}"}
+            response = await get_http_client().get(self.userinfo_url, headers=headers)
+            response.raise_for_status()
+            user_info = response.json()
+
+            # v2 userinfo 는 id/verified_email, OIDC userinfo 는 sub/email_verified
+            external_id = user_info.get("id") or user_info.get("sub")
+            if not (external_id and user_info.get("email") and user_info.get("name")):
+                logger.warning(f"Missing required fields in user info: {sorted(user_info)}")
                 return None
-            
+
             return {
-                "external_id": user_info["id"],
+                "external_id": external_id,
                 "email": user_info["email"],
                 "name": user_info["name"],
                 "picture": user_info.get("picture"),
-                "verified_email": user_info.get("verified_email", False)
+                "verified_email": user_info.get("verified_email", user_info.get("email_verified", False))
             }
-        
+
         except httpx.HTTPStatusError as e:
-            print(f"HTTP error getting user info: {e}")
+            logger.error(f"HTTP error getting user info: {e}")
             return None
         except Exception as e:
-            print(f"Error getting user info: {e}")
+            logger.error(f"Error getting user info: {e}")
             return None
-    
+
     async def verify_token(self, access_token: str) -> Optional[Dict[str, Any]]:
         """
         Verify Google access token and get basic info
-        
+
         Args:
             access_token: Google access token to verify
-            
+
         Returns:
             Token info if valid, None if invalid
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                params = {"access_token": access_token}
-                response = await client.get(self.tokeninfo_url, params=params)
-                response.raise_for_status()
-                token_info = response.json()
-            
+            params = {"access_token": access_token}
+            response = await get_http_client().get(self.tokeninfo_url, params=params)
+            response.raise_for_status()
+            token_info = response.json()
+
             # Verify token belongs to our app
             if token_info.get("aud") != self.client_id:
-                print("Token does not belong to this application")
+                logger.warning("Token does not belong to this application")
                 return None
-            
+
             # Check if token is expired
-            expires_in = token_info.get("expires_in", 0)
+            expires_in = int(token_info.get("expires_in", 0))
             if expires_in <= 0:
-                print("Token has expired")
+                logger.info("Token has expired")
                 return None
-            
+
             return token_info
-        
+
         except httpx.HTTPStatusError as e:
-            print(f"HTTP error verifying token: {e}")
+            logger.error(f"HTTP error verifying token: {e}")
             return None
         except Exception as e:
-            print(f"Error verifying token: {e}")
+            logger.error(f"Error verifying token: {e}")
             return None
-    
+
     async def refresh_access_token(self, refresh_token: str) -> Optional[Dict[str, Any]]:
         """
         Refresh Google access token using refresh token
-        
+
         Args:
             refresh_token: Google refresh token
-            
+
         Returns:
             New token information
         """
@@ -239,59 +408,58 @@ class GoogleOAuthClient:
             "refresh_token": refresh_token,
             "grant_type": "refresh_token"
         }
-        
+
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.token_url,
-                    data=token_data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"}
-                )
-                response.raise_for_status()
-                tokens = response.json()
-            
+            await self.get_discovery()
+            response = await get_http_client().post(
+                self.token_url,
+                data=token_data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"}
+            )
+            response.raise_for_status()
+            tokens = response.json()
+
             return {
                 "access_token": tokens["access_token"],
                 "expires_in": tokens.get("expires_in", 3600),
                 "refresh_token": tokens.get("refresh_token", refresh_token)  # May be same or new
             }
-        
+
         except httpx.HTTPStatusError as e:
-            print(f"HTTP error refreshing token: {e}")
+            logger.error(f"HTTP error refreshing token: {e}")
             return None
         except Exception as e:
-            print(f"Error refreshing token: {e}")
+            logger.error(f"Error refreshing token: {e}")
             return None
-    
+
     async def revoke_token(self, token: str) -> bool:
         """
         Revoke Google access or refresh token
-        
+
         Args:
             token: Access or refresh token to revoke
-            
+
         Returns:
             True if revocation successful
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                params = {"token": token}
-                response = await client.post(
-                    "https://oauth2.googleapis.com/revoke",
-                    params=params,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"}
-                )
-                # Google returns 200 for successful revocation
-                return response.status_code == 200
-        
+            discovery = await self.get_discovery()
+            response = await get_http_client().post(
+                discovery["revocation_endpoint"],
+                params={"token": token},
+                headers={"Content-Type": "application/x-www-form-urlencoded"}
+            )
+            # Google returns 200 for successful revocation
+            return response.status_code == 200
+
         except Exception as e:
-            print(f"Error revoking token: {e}")
+            logger.error(f"Error revoking token: {e}")
             return False
-    
+
     async def close(self):
-        """No-op; kept for backward compatibility"""
+        """No-op; the shared HTTP pool is closed by the application lifespan"""
         return
 
 
 # Global Google OAuth client instance
-google_oauth_client = GoogleOAuthClient()
\ No newline at end of file
+google_oauth_client = GoogleOAuthClient()
@@ -0,0 +1,197 @@
+"""
+Durable domain event stream on Redis Streams.
+
+In-process ``EventBus`` 는 프로세스가 끝나면 이벤트가 사라지고 워커 간에 공유되지
+않습니다. 수집 (ingestion) 이벤트는 Redis Stream 에 ``XADD`` 로 기록하고, 소비자는
+consumer group 으로 읽어 처리 후 ``XACK`` 합니다.
+
+- 같은 그룹 안에서는 이벤트 하나가 한 소비자에게만 전달됩니다.
+- 처리 도중 죽은 소비자의 이벤트는 ``claim_idle_ms`` 후 ``XAUTOCLAIM`` 으로 회수합니다.
+- ``max_deliveries`` 번 전달되고도 처리되지 않은 이벤트는 ``{stream}:dead`` 로 옮깁니다.
+
+전달은 at-least-once 이므로 핸들러는 멱등이어야 합니다
+(알림은 (user, subscription, content) 로 upsert 되어 한 번만 만들어짐).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from ...core.config import settings
+from .domain_events import AnnouncementCreatedEvent, AnnouncementUpdatedEvent, DomainEvent
+
+try:
+    import redis  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    redis = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# 스트림으로 주고받는 이벤트 (이름 -> 클래스)
+STREAM_EVENT_TYPES: Dict[str, Type[DomainEvent]] = {
+    cls.__name__: cls for cls in (AnnouncementCreatedEvent, AnnouncementUpdatedEvent)
+}
+
+StreamEntry = Tuple[str, Dict[str, str]]
+EventBatchHandler = Callable[[List[DomainEvent]], Awaitable[None]]
+
+
+def encode_event(event: DomainEvent) -> Dict[str, str]:
+    return {
+        "type": type(event).__name__,
+        "event_id": event.event_id,
+        "payload": event.model_dump_json(),
+    }
+
+
+def decode_event(fields: Dict[str, str]) -> Optional[DomainEvent]:
+    event_cls = STREAM_EVENT_TYPES.get(fields.get("type", ""))
+    if event_cls is None:
+        return None
+    return event_cls.model_validate_json(fields["payload"])
+
+
+class EventStreamPublisher:
+    """Appends domain events to the Redis Stream (sync; safe to call from ingestion code)"""
+
+    def __init__(self, client: Any = None, stream: Optional[str] = None, maxlen: Optional[int] = None):
+        self._client = client
+        self.stream = stream or settings.event_stream_name
+        self.maxlen = maxlen or settings.event_stream_maxlen
+
+    @property
+    def client(self) -> Any:
+        if self._client is None and redis is not None:
+            self._client = redis.from_url(
+                settings.redis_url,
+                decode_responses=True,
+                socket_connect_timeout=2.0,
+                socket_timeout=2.0,
+            )
+        return self._client
+
+    def publish(self, events: Sequence[DomainEvent]) -> int:
+        """이벤트를 한 번의 파이프라인으로 기록 -> 기록된 수 (실패 시 0, 수집은 계속)"""
+        if not events or not settings.event_stream_enabled:
+            return 0
+        client = self.client
+        if client is None:
+            logger.warning("redis-py not installed; %d domain events not published", len(events))
+            return 0
+        try:
+            pipe = client.pipeline(transaction=False)
+            for event in events:
+                pipe.xadd(self.stream, encode_event(event), maxlen=self.maxlen, approximate=True)
+            pipe.execute()
+        except Exception as e:
+            # 스트림에 못 올린 변경은 주기 match_and_enqueue 가 보완
+            logger.warning("Failed to publish %d domain events to %s: %s", len(events), self.stream, e)
+            return 0
+        return len(events)
+
+
+event_stream_publisher = EventStreamPublisher()
+
+
+class EventStreamConsumer:
+    """Consumer-group reader: read/reclaim -> handle batch -> XACK"""
+
+    def __init__(
+        self,
+        client: Any,
+        group: str,
+        consumer: str,
+        handler: EventBatchHandler,
+        stream: Optional[str] = None,
+        batch_size: int = 100,
+        block_ms: int = 5000,
+        claim_idle_ms: int = 60000,
+        max_deliveries: int = 5,
+    ):
+        self.client = client
+        self.group = group
+        self.consumer = consumer
+        self.handler = handler
+        self.stream = stream or settings.event_stream_name
+        self.dead_letter_stream = f"{self.stream}:dead"
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.max_deliveries = max_deliveries
+        self._reclaim_cursor = "0-0"
+
+    async def ensure_group(self) -> None:
+        try:
+            # "0": 그룹 생성 전에 쌓인 이벤트부터 처리
+            await self.client.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+            logger.info("Created consumer group %s on %s", self.group, self.stream)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def read(self) -> List[StreamEntry]:
+        response = await self.client.xreadgroup(
+            self.group, self.consumer, {self.stream: ">"}, count=self.batch_size, block=self.block_ms or None
+        )
+        return [entry for _, entries in response or [] for entry in entries]
+
+    async def _dead_letter_exhausted(self) -> None:
+        pending = await self.client.xpending_range(
+            self.stream, self.group, min="-", max="+", count=self.batch_size, idle=self.claim_idle_ms
+        )
+        exhausted = [p["message_id"] for p in pending if p["times_delivered"] >= self.max_deliveries]
+        for entry_id in exhausted:
+            for _, fields in await self.client.xrange(self.stream, min=entry_id, max=entry_id):
+                await self.client.xadd(self.dead_letter_stream, {**fields, "source_id": entry_id})
+            await self.client.xack(self.stream, self.group, entry_id)
+            logger.error("Event %s exceeded %d deliveries; moved to %s", entry_id, self.max_deliveries, self.dead_letter_stream)
+
+    async def reclaim(self) -> List[StreamEntry]:
+        """다른 (죽은) 소비자에 오래 머문 pending 이벤트를 이 소비자로 가져옴"""
+        await self._dead_letter_exhausted()
+        response = await self.client.xautoclaim(
+            self.stream, self.group, self.consumer, self.claim_idle_ms,
+            start_id=self._reclaim_cursor, count=self.batch_size,
+        )
+        self._reclaim_cursor, entries = response[0], response[1]
+        # 삭제(trim)된 항목은 fields 가 None
+        return [(entry_id, fields) for entry_id, fields in entries if fields]
+
+    async def process(self, entries: List[StreamEntry]) -> int:
+        """배치 처리 후 ACK (핸들러가 실패하면 ACK 하지 않아 재전달됨)"""
+        if not entries:
+            return 0
+        events: List[DomainEvent] = []
+        for entry_id, fields in entries:
+            try:
+                event = decode_event(fields)
+            except Exception as e:
+                logger.warning("Undecodable event %s: %s", entry_id, e)
+                event = None
+            if event is not None:
+                events.append(event)
+        if events:
+            await self.handler(events)
+        await self.client.xack(self.stream, self.group, *[entry_id for entry_id, _ in entries])
+        return len(events)
+
+    async def run_once(self) -> int:
+        entries = await self.reclaim()
+        entries += await self.read()
+        return await self.process(entries)
+
+    async def run_forever(self, stop_event: asyncio.Event) -> None:
+        await self.ensure_group()
+        while not stop_event.is_set():
+            try:
+                handled = await self.run_once()
+                if handled:
+                    logger.info("Handled %d stream events", handled)
+            except Exception as e:
+                logger.exception("Event stream batch failed: %s", e)
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
@@ -0,0 +1,39 @@
+"""
+Long-running job state shared by Celery tasks and API endpoints.
+"""
+
+from .checkpoints import (
+    CHUNKS_COLLECTION,
+    JOBS_COLLECTION,
+    CollectionJobStore,
+    JobProgress,
+    PageChunk,
+    default_worker_id,
+    new_job_id,
+)
+from .progress import (
+    SSE_HEARTBEAT,
+    JobProgressPublisher,
+    ProgressEvent,
+    format_sse,
+    job_progress_publisher,
+    progress_stream,
+    read_progress,
+)
+
+__all__ = [
+    'CHUNKS_COLLECTION',
+    'JOBS_COLLECTION',
+    'CollectionJobStore',
+    'JobProgress',
+    'PageChunk',
+    'default_worker_id',
+    'new_job_id',
+    'SSE_HEARTBEAT',
+    'JobProgressPublisher',
+    'ProgressEvent',
+    'format_sse',
+    'job_progress_publisher',
+    'progress_stream',
+    'read_progress',
+]
@@ -0,0 +1,294 @@
+"""
+Checkpointed, resumable page-range jobs (MongoDB).
+
+대량 수집 작업 (``collect_all_announcements``, ``fetch_announcements_comprehensive``) 이
+배포 / OOM / 타임아웃으로 중단되면 1 페이지부터 다시 시작했고 진행 상황은 로그에만
+남았습니다. 작업 상태를 job ID 별로 MongoDB 에 기록합니다.
+
+- ``collection_jobs``: 작업 메타데이터 (파라미터, 페이지 범위, 상태)
+- ``collection_job_chunks``: 페이지 구간마다 상태 / lease / cursor (마지막 완료 페이지) / 카운터
+
+워커는 ``claim`` 으로 pending 이거나 lease 가 만료된 구간을 원자적으로 가져가고
+(``find_one_and_update``), 처리 중에는 ``checkpoint`` 로 cursor 와 카운터를 기록하며
+lease 를 연장합니다. 모든 쓰기는 claim 때 받은 ``lease_token`` 으로 fencing 되어, lease 를
+잃은 (멈췄다 깨어난) 워커의 늦은 쓰기는 반영되지 않습니다.
+
+같은 job ID 로 워커 N 개를 띄우면 구간을 나눠 처리하고, 재시작한 워커는 마지막
+checkpoint 다음 페이지부터 이어갑니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Mapping, Optional
+
+from pymongo import ASCENDING, ReturnDocument, UpdateOne
+
+from ...core.config import settings
+
+logger = logging.getLogger(__name__)
+
+JOBS_COLLECTION = "collection_jobs"
+CHUNKS_COLLECTION = "collection_job_chunks"
+
+# 완료된 작업 기록 보존 기간
+JOB_RETENTION_DAYS = 30
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def new_job_id(prefix: str) -> str:
+    return f"{prefix}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+
+def chunk_id(job_id: str, start: int) -> str:
+    return f"{job_id}:{start}"
+
+
+@dataclass
+class PageChunk:
+    """A leased page range [start, end] (end=None: open-ended sequential scan)"""
+
+    job_id: str
+    start: int
+    end: Optional[int]
+    lease_token: str
+    cursor: Optional[int] = None
+    attempts: int = 0
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def id(self) -> str:
+        return chunk_id(self.job_id, self.start)
+
+    @property
+    def next_page(self) -> int:
+        """재개할 페이지 (마지막 checkpoint 다음)"""
+        return self.start if self.cursor is None else self.cursor + 1
+
+    @classmethod
+    def from_doc(cls, doc: Mapping[str, Any]) -> "PageChunk":
+        return cls(
+            job_id=doc["job_id"],
+            start=doc["start"],
+            end=doc.get("end"),
+            lease_token=doc.get("lease_token", ""),
+            cursor=doc.get("cursor"),
+            attempts=doc.get("attempts", 0),
+            counters=dict(doc.get("counters") or {}),
+        )
+
+
+@dataclass
+class JobProgress:
+    job_id: str
+    status: str
+    total_chunks: int = 0
+    done_chunks: int = 0
+    leased_chunks: int = 0
+    pages_done: int = 0
+    total_pages: Optional[int] = None
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def fraction_done(self) -> float:
+        if self.total_pages:
+            return min(1.0, self.pages_done / self.total_pages)
+        return self.done_chunks / self.total_chunks if self.total_chunks else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "total_chunks": self.total_chunks,
+            "done_chunks": self.done_chunks,
+            "leased_chunks": self.leased_chunks,
+            "pages_done": self.pages_done,
+            "total_pages": self.total_pages,
+            "fraction_done": round(self.fraction_done, 4),
+            "counters": self.counters,
+        }
+
+
+class CollectionJobStore:
+    """Job / page-range state with lease-based claims (sync pymongo)"""
+
+    def __init__(self, db: Any, lease_seconds: Optional[int] = None):
+        self.jobs = db[JOBS_COLLECTION]
+        self.chunks = db[CHUNKS_COLLECTION]
+        self.lease_seconds = lease_seconds or settings.collection_job_lease_seconds
+
+    def _lease_until(self, now: datetime) -> datetime:
+        return now + timedelta(seconds=self.lease_seconds)
+
+    @staticmethod
+    def _fenced(chunk: PageChunk) -> Dict[str, Any]:
+        return {"_id": chunk.id, "lease_token": chunk.lease_token, "status": "leased"}
+
+    def ensure_job(
+        self,
+        job_id: str,
+        kind: str,
+        first_page: int,
+        last_page: Optional[int],
+        chunk_pages: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """작업과 페이지 구간을 (없을 때만) 만들고 작업 문서를 반환 (재개 시 원래 범위 유지)"""
+        now = datetime.utcnow()
+        self.jobs.update_one(
+            {"_id": job_id},
+            {
+                "$setOnInsert": {
+                    "kind": kind,
+                    "params": params or {},
+                    "first_page": first_page,
+                    "last_page": last_page,
+                    "status": "running",
+                    "created_at": now,
+                },
+                "$set": {"updated_at": now},
+            },
+            upsert=True,
+        )
+        job = self.jobs.find_one({"_id": job_id}) or {}
+        first, last = job.get("first_page", first_page), job.get("last_page", last_page)
+
+        # 끝이 정해지지 않은 순차 수집은 구간 하나
+        if last is None or not chunk_pages:
+            bounds = [(first, last)]
+        else:
+            bounds = [(s, min(s + chunk_pages - 1, last)) for s in range(first, last + 1, chunk_pages)]
+        self.chunks.bulk_write([
+            UpdateOne(
+                {"_id": chunk_id(job_id, start)},
+                {"$setOnInsert": {
+                    "job_id": job_id,
+                    "start": start,
+                    "end": end,
+                    "status": "pending",
+                    "cursor": None,
+                    "attempts": 0,
+                    "counters": {},
+                    "created_at": now,
+                }},
+                upsert=True,
+            )
+            for start, end in bounds
+        ], ordered=False)
+        return job
+
+    def claim(self, job_id: str, worker_id: Optional[str] = None) -> Optional[PageChunk]:
+        """pending 이거나 lease 가 만료된 가장 앞 구간을 가져옴 (없으면 None)"""
+        now = datetime.utcnow()
+        doc = self.chunks.find_one_and_update(
+            {
+                "job_id": job_id,
+                "$or": [
+                    {"status": "pending"},
+                    {"status": "leased", "lease_expires_at": {"$lt": now}},
+                ],
+            },
+            {
+                "$set": {
+                    "status": "leased",
+                    "lease_owner": worker_id or default_worker_id(),
+                    "lease_token": uuid.uuid4().hex,
+                    "lease_expires_at": self._lease_until(now),
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("start", ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+        if doc is None:
+            return None
+        chunk = PageChunk.from_doc(doc)
+        if chunk.attempts > 1:
+            logger.info("Job %s: resuming pages from %d (attempt %d)", job_id, chunk.next_page, chunk.attempts)
+        return chunk
+
+    def checkpoint(self, chunk: PageChunk, page: int, counters: Optional[Mapping[str, int]] = None) -> bool:
+        """page 까지 완료 기록 + 카운터 누적 + lease 연장 (lease 를 잃었으면 False)"""
+        now = datetime.utcnow()
+        update: Dict[str, Any] = {"$set": {"cursor": page, "lease_expires_at": self._lease_until(now), "updated_at": now}}
+        inc = {f"counters.{k}": v for k, v in (counters or {}).items() if v}
+        if inc:
+            update["$inc"] = inc
+        if self.chunks.update_one(self._fenced(chunk), update).modified_count != 1:
+            logger.warning("Job %s: lease on pages %d- lost; checkpoint at %d discarded", chunk.job_id, chunk.start, page)
+            return False
+        chunk.cursor = page
+        for k, v in (counters or {}).items():
+            chunk.counters[k] = chunk.counters.get(k, 0) + v
+        return True
+
+    def complete(self, chunk: PageChunk, counters: Optional[Mapping[str, int]] = None) -> bool:
+        now = datetime.utcnow()
+        update: Dict[str, Any] = {
+            "$set": {"status": "done", "completed_at": now, "updated_at": now},
+            "$unset": {"lease_expires_at": "", "lease_token": ""},
+        }
+        if chunk.end is not None:
+            update["$set"]["cursor"] = chunk.end
+        inc = {f"counters.{k}": v for k, v in (counters or {}).items() if v}
+        if inc:
+            update["$inc"] = inc
+        return self.chunks.update_one(self._fenced(chunk), update).modified_count == 1
+
+    def release(self, chunk: PageChunk, error: Optional[str] = None) -> bool:
+        """구간을 다시 pending 으로 (cursor 는 유지되어 다음 워커가 이어서 처리)"""
+        return self.chunks.update_one(
+            self._fenced(chunk),
+            {
+                "$set": {"status": "pending", "last_error": error, "updated_at": datetime.utcnow()},
+                "$unset": {"lease_expires_at": "", "lease_token": "", "lease_owner": ""},
+            },
+        ).modified_count == 1
+
+    def progress(self, job_id: str) -> JobProgress:
+        job = self.jobs.find_one({"_id": job_id}, {"status": 1, "first_page": 1, "last_page": 1}) or {}
+        last, first = job.get("last_page"), job.get("first_page", 1)
+        progress = JobProgress(
+            job_id=job_id,
+            status=job.get("status", "unknown"),
+            total_pages=(last - first + 1) if last is not None else None,
+        )
+        cursor = self.chunks.find(
+            {"job_id": job_id},
+            {"status": 1, "start": 1, "end": 1, "cursor": 1, "counters": 1},
+        )
+        for doc in cursor:
+            progress.total_chunks += 1
+            if doc.get("status") == "done":
+                progress.done_chunks += 1
+            elif doc.get("status") == "leased":
+                progress.leased_chunks += 1
+            if doc.get("cursor") is not None:
+                progress.pages_done += doc["cursor"] - doc["start"] + 1
+            for k, v in (doc.get("counters") or {}).items():
+                progress.counters[k] = progress.counters.get(k, 0) + v
+        return progress
+
+    def finish_if_done(self, job_id: str) -> bool:
+        """모든 구간이 끝났으면 작업을 completed 로 (보존 기간 후 TTL 로 삭제)"""
+        if self.chunks.count_documents({"job_id": job_id, "status": {"$ne": "done"}}, limit=1):
+            return False
+        now = datetime.utcnow()
+        expire_at = now + timedelta(days=JOB_RETENTION_DAYS)
+        result = self.jobs.update_one(
+            {"_id": job_id, "status": {"$ne": "completed"}},
+            {"$set": {"status": "completed", "completed_at": now, "updated_at": now, "expire_at": expire_at}},
+        )
+        if result.modified_count:
+            self.chunks.update_many({"job_id": job_id}, {"$set": {"expire_at": expire_at}})
+            logger.info("Job %s completed", job_id)
+        return True
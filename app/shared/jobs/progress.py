@@ -0,0 +1,187 @@
+"""
+Live progress channel for bulk collection jobs (Redis Streams).
+
+``batch-collect`` 진행 상황은 로그와 매 호출마다 ``count_all`` / ``count_recent`` 를 실행하는
+``get_batch_collection_statistics`` 로만 볼 수 있었습니다.
+``AnnouncementBatchService.progress_callback`` 이 구간을 끝낼 때마다 진행 이벤트를
+``jobs:progress:<job_id>`` 스트림에 ``XADD`` 하고, SSE 엔드포인트는 ``XREAD BLOCK`` 으로
+이어 읽어 전달합니다.
+
+pub/sub 대신 Streams 를 쓰는 이유: 늦게 접속한 클라이언트도 마지막 이벤트를 바로 받고,
+``Last-Event-ID`` 로 끊긴 지점부터 이어 받을 수 있습니다. 스트림은 ``maxlen`` 으로 잘리고
+``ttl`` 후 삭제됩니다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Optional, Tuple
+
+from ...core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_STREAM_PREFIX = "jobs:progress"
+TERMINAL_STATUSES = frozenset({"completed", "failed"})
+
+
+def progress_stream(job_id: str) -> str:
+    return f"{PROGRESS_STREAM_PREFIX}:{job_id}"
+
+
+def _text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+@dataclass
+class ProgressEvent:
+    """One progress snapshot (rates are averages over this run)"""
+
+    job_id: str
+    status: str
+    pages_done: int = 0
+    total_pages: int = 0
+    items_processed: int = 0
+    new_items: int = 0
+    duplicate_items: int = 0
+    errors: int = 0
+    pages_per_second: float = 0.0
+    items_per_second: float = 0.0
+    # 처리한 항목당 오류 수
+    error_rate: float = 0.0
+    eta_seconds: Optional[float] = None
+    elapsed_seconds: float = 0.0
+    timestamp: str = ""
+
+    @classmethod
+    def from_batch(cls, progress: Any) -> "ProgressEvent":
+        """``BatchProgress`` -> event"""
+        elapsed = max(progress.elapsed_time, 1e-9)
+        processed = progress.processed_items
+        return cls(
+            job_id=progress.job_id or "",
+            status=progress.status,
+            pages_done=progress.pages_done,
+            total_pages=progress.total_pages,
+            items_processed=processed,
+            new_items=progress.new_items,
+            duplicate_items=progress.duplicate_items,
+            errors=progress.error_count,
+            pages_per_second=round(progress.pages_this_run / elapsed, 3),
+            items_per_second=round(processed / elapsed, 3),
+            error_rate=round(progress.error_count / processed, 4) if processed else 0.0,
+            eta_seconds=round(progress.estimated_remaining_time, 1),
+            elapsed_seconds=round(progress.elapsed_time, 1),
+            timestamp=datetime.utcnow().isoformat(),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, raw: Any) -> "ProgressEvent":
+        return cls(**json.loads(_text(raw)))
+
+    @property
+    def finished(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+
+def format_sse(event: ProgressEvent, event_id: Optional[str] = None) -> str:
+    lines = [f"id: {event_id}"] if event_id else []
+    lines += ["event: progress", f"data: {event.to_json()}"]
+    return "\n".join(lines) + "\n\n"
+
+
+SSE_HEARTBEAT = ": keep-alive\n\n"
+
+
+class JobProgressPublisher:
+    """Appends progress events to the job stream (async; usable as ``progress_callback``)"""
+
+    def __init__(self, client: Any = None, maxlen: Optional[int] = None, ttl_seconds: Optional[int] = None):
+        self._client = client
+        self.maxlen = maxlen or settings.job_progress_stream_maxlen
+        self.ttl_seconds = ttl_seconds or settings.job_progress_ttl_seconds
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            try:
+                import redis.asyncio as aioredis  # type: ignore
+            except Exception:  # pragma: no cover - optional dependency
+                return None
+            # SSE 리더가 XREAD BLOCK 을 쓰므로 socket_timeout 은 두지 않음
+            self._client = aioredis.from_url(settings.redis_url, decode_responses=True, socket_connect_timeout=2.0)
+        return self._client
+
+    async def publish(self, event: ProgressEvent) -> bool:
+        """이벤트 기록 (실패해도 수집은 계속)"""
+        client = self.client
+        if client is None or not event.job_id:
+            return False
+        stream = progress_stream(event.job_id)
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.xadd(stream, {"data": event.to_json()}, maxlen=self.maxlen, approximate=True)
+            pipe.expire(stream, self.ttl_seconds)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to publish progress for job %s: %s", event.job_id, e)
+            return False
+        return True
+
+    async def __call__(self, progress: Any) -> None:
+        await self.publish(ProgressEvent.from_batch(progress))
+
+
+async def read_progress(
+    client: Any,
+    job_id: str,
+    last_event_id: Optional[str] = None,
+    block_ms: Optional[int] = None,
+    idle_timeout: Optional[float] = None,
+) -> AsyncIterator[Tuple[Optional[str], Optional[ProgressEvent]]]:
+    """(event id, event) 를 순서대로 반환, 대기 중에는 (None, None) (heartbeat)
+
+    ``last_event_id`` 가 없으면 마지막 이벤트부터 시작합니다. 종료 상태 이벤트를 보내거나
+    ``idle_timeout`` 동안 새 이벤트가 없으면 끝납니다.
+    """
+    stream = progress_stream(job_id)
+    block_ms = block_ms or settings.job_progress_heartbeat_ms
+    idle_timeout = idle_timeout or settings.job_progress_idle_timeout_seconds
+    cursor = last_event_id or "0-0"
+
+    if last_event_id is None:
+        latest = await client.xrevrange(stream, count=1)
+        if latest:
+            entry_id, fields = latest[0]
+            cursor = _text(entry_id)
+            event = ProgressEvent.from_json(fields.get("data") or fields.get(b"data"))
+            yield cursor, event
+            if event.finished:
+                return
+
+    last_seen = time.monotonic()
+    while True:
+        response = await client.xread({stream: cursor}, count=100, block=block_ms)
+        if not response:
+            if time.monotonic() - last_seen >= idle_timeout:
+                return
+            yield None, None
+            continue
+        last_seen = time.monotonic()
+        for _, entries in response:
+            for entry_id, fields in entries:
+                cursor = _text(entry_id)
+                event = ProgressEvent.from_json(fields.get("data") or fields.get(b"data"))
+                yield cursor, event
+                if event.finished:
+                    return
+
+
+job_progress_publisher = JobProgressPublisher()
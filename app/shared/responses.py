@@ -5,12 +5,13 @@ Provides consistent response structures and status code handling
 for all API endpoints following RESTful best practices.
 """
 
-from typing import Any, Dict, List, Optional, Union, Generic, TypeVar
+from typing import Any, Dict, List, Mapping, Optional, Union, Generic, TypeVar
 from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, Field, ConfigDict
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+import orjson
 
 # Type variable for generic responses
 T = TypeVar('T')
@@ -455,4 +456,145 @@ def paginated_response(
     return JSONResponse(
         content=response.model_dump(exclude_none=True),
         status_code=HTTPStatusCodes.OK
-    )
\ No newline at end of file
+    )
+
+
+# Fast envelope path
+#
+# 목록 엔드포인트는 이미 plain dict로 만든 items를 다시 Pydantic 모델로 감싸고
+# FastAPI가 response_model로 재검증/재직렬화하는 비용이 컸음.
+# 아래 헬퍼는 PaginatedResponse/BaseResponse와 동일한 구조를 orjson 바이트로
+# 한 번만 직렬화하고, 같은 바이트를 캐시에도 그대로 저장할 수 있게 한다.
+
+_PAGINATION_FIELDS = ("total", "page", "size", "total_pages", "has_next", "has_previous")
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(value: Any) -> Any:
+    """Fallback for types orjson does not handle natively (ObjectId, models, ...)."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _utc_timestamp() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+def dumps_json(content: Any) -> bytes:
+    """Serialize to JSON bytes with the envelope encoder settings."""
+    return orjson.dumps(content, default=_orjson_default, option=_ORJSON_OPTIONS)
+
+
+def build_pagination_meta(total: int, page: int, size: int) -> Dict[str, Any]:
+    """PaginationMeta-shaped dict without model validation."""
+    total_pages = (total + size - 1) // size if size > 0 else 0
+    return {
+        "total": total,
+        "page": page,
+        "size": size,
+        "total_pages": total_pages,
+        "has_next": page < total_pages,
+        "has_previous": page > 1
+    }
+
+
+def paginated_envelope(
+    items: List[Any],
+    pagination: Mapping[str, Any],
+    message: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """
+    Serialize a PaginatedResponse-compatible envelope straight to bytes.
+    
+    Args:
+        items: Already plain items (dicts)
+        pagination: Pagination metadata; only PaginationMeta fields are kept
+        message: Response message
+        filters: Applied filters for reference
+        
+    Returns:
+        JSON bytes matching ``PaginatedResponse.model_dump()``
+    """
+    return dumps_json({
+        "success": True,
+        "items": items,
+        "pagination": {field: pagination[field] for field in _PAGINATION_FIELDS},
+        "message": message,
+        "timestamp": _utc_timestamp(),
+        "status": ResponseStatus.SUCCESS.value,
+        "filters": filters
+    })
+
+
+def data_envelope(
+    data: Any = None,
+    message: Optional[str] = None,
+    success: bool = True,
+    metadata: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """
+    Serialize a BaseResponse-compatible envelope straight to bytes.
+    
+    Returns:
+        JSON bytes matching ``BaseResponse.model_dump()``
+    """
+    return dumps_json({
+        "success": success,
+        "data": data,
+        "message": message,
+        "timestamp": _utc_timestamp(),
+        "status": (ResponseStatus.SUCCESS if success else ResponseStatus.ERROR).value,
+        "metadata": metadata
+    })
+
+
+class RawJSONResponse(Response):
+    """JSON response whose body is already serialized bytes."""
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return bytes(content)
+        if isinstance(content, str):
+            return content.encode("utf-8")
+        return dumps_json(content)
+
+
+def raw_json_response(
+    body: bytes,
+    status_code: int = HTTPStatusCodes.OK,
+    headers: Optional[Dict[str, str]] = None,
+    content_encoding: Optional[str] = None
+) -> RawJSONResponse:
+    """
+    Return pre-serialized envelope bytes as-is.
+    
+    FastAPI skips response_model validation/serialization for Response
+    instances, so the body is serialized exactly once. Pass
+    ``content_encoding`` when ``body`` is already compressed (precompressed
+    cache entries); the compression middleware then leaves it alone.
+    """
+    if content_encoding:
+        headers = dict(headers or {})
+        headers["Content-Encoding"] = content_encoding
+        headers["Vary"] = "Accept-Encoding"
+    return RawJSONResponse(content=body, status_code=status_code, headers=headers)
+
+
+def fast_paginated_response(
+    items: List[Any],
+    total: int,
+    page: int,
+    size: int,
+    message: str = "Items retrieved successfully",
+    filters: Optional[Dict[str, Any]] = None
+) -> RawJSONResponse:
+    """Fast-path counterpart of ``paginated_response``."""
+    return raw_json_response(
+        paginated_envelope(items, build_pagination_meta(total, page, size), message, filters)
+    )
+
@@ -1,46 +1,137 @@
 from __future__ import annotations
 
+import asyncio
+import html as html_lib
 import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from typing import Dict, Any, Optional, List, Sequence, Union
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    TemplateNotFound,
+    select_autoescape,
+)
 
-from ..interfaces.base_service import BaseService
 from ..clients.email_client import EmailClient
 from ...core.config import settings
 
 logger = logging.getLogger(__name__)
 
+_JINJA_TOKEN = re.compile(r"{{.*?}}|{%.*?%}|{#.*?#}", re.S)
+_PLACEHOLDER = re.compile(r"\x00(\d+)\x00")
+_INVISIBLE_BLOCK = re.compile(r"<(head|style|script)\b.*?</\1\s*>", re.S | re.I)
+_LINE_BREAK_TAG = re.compile(r"<br\s*/?>|</(?:p|div|h[1-6]|tr|li|table|ul|ol)\s*>", re.I)
+_CELL_END_TAG = re.compile(r"</t[dh]\s*>", re.I)
+_LINK = re.compile(r"<a\b[^>]*?href=\"([^\"]*)\"[^>]*>(.*?)</a\s*>", re.S | re.I)
+_ANY_TAG = re.compile(r"<[^>]+>")
+_BLANK_LINES = re.compile(r"\n\s*\n(\s*\n)+")
+
+
+def html_template_to_text(source: str) -> str:
+    """
+    HTML 템플릿 소스를 텍스트 템플릿 소스로 변환 (템플릿당 한 번).
+
+    Jinja 구문은 보존하고 HTML 태그/엔티티만 제거하므로, 결과 템플릿을 같은
+    context 로 렌더링하면 메일마다 렌더링된 HTML 을 정규식으로 훑지 않고도
+    텍스트 본문을 얻을 수 있습니다. 제거되는 영역 안의 ``{% %}`` 문은 블록 짝이
+    깨지지 않도록 남깁니다.
+    """
+    tokens: List[str] = []
+
+    def _mask(match: re.Match) -> str:
+        tokens.append(match.group(0))
+        return f"\x00{len(tokens) - 1}\x00"
+
+    def _drop(match: re.Match) -> str:
+        return "".join(
+            m.group(0) for m in _PLACEHOLDER.finditer(match.group(0))
+            if tokens[int(m.group(1))].startswith("{%")
+        )
+
+    text = _JINJA_TOKEN.sub(_mask, source)
+    text = _INVISIBLE_BLOCK.sub(_drop, text)
+    text = _LINK.sub(lambda m: f"{m.group(2).strip()} ({m.group(1)})", text)
+    text = _LINE_BREAK_TAG.sub("\n", text)
+    text = _CELL_END_TAG.sub(" ", text)
+    text = _ANY_TAG.sub(_drop, text)
+    text = html_lib.unescape(text)
+    text = "\n".join(" ".join(line.split()) for line in text.splitlines())
+    text = _BLANK_LINES.sub("\n\n", text)
+    return _PLACEHOLDER.sub(lambda m: tokens[int(m.group(1))], text)
+
+
+class TextAlternativeLoader(BaseLoader):
+    """``foo.txt`` 가 있으면 그대로, 없으면 ``foo.html`` 에서 변환한 텍스트 템플릿을 제공"""
+
+    def __init__(self, loader: BaseLoader):
+        self.loader = loader
+
+    def get_source(self, environment: Environment, template: str):
+        if template.endswith(".html"):
+            try:
+                return self.loader.get_source(environment, template[:-5] + ".txt")
+            except TemplateNotFound:
+                pass
+        source, filename, uptodate = self.loader.get_source(environment, template)
+        return html_template_to_text(source), filename, uptodate
+
+
+@dataclass
+class RenderedEmail:
+    html: str
+    text: str
+
 
 class EmailTemplateEngine:
     """Jinja2 기반 이메일 템플릿 엔진"""
     
-    def __init__(self, templates_dir: str = "templates"):
+    def __init__(self, templates_dir: str = "templates", cache_dir: Optional[str] = None):
         """
         Initialize the template engine.
         
         Args:
             templates_dir: Path to templates directory relative to project root
+            cache_dir: Jinja bytecode cache directory (defaults to ``settings.email_template_cache_dir``)
         """
         # Get project root and create templates path
         project_root = Path(__file__).parent.parent.parent.parent
         self.templates_path = project_root / templates_dir
+        cache_dir = cache_dir or settings.email_template_cache_dir
+        loader = FileSystemLoader(str(self.templates_path))
         
         # Initialize Jinja2 environment
+        # 컴파일 결과는 환경별 LRU + 바이트코드 캐시 (프로세스 재시작 후에도 재컴파일 생략)
         self.env = Environment(
-            loader=FileSystemLoader(str(self.templates_path)),
+            loader=loader,
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
             lstrip_blocks=True,
+            auto_reload=settings.debug,
+            bytecode_cache=FileSystemBytecodeCache(cache_dir),
+        )
+        # 텍스트 대체 본문용 환경 (같은 템플릿 이름, 변환된 소스, 이스케이프 없음)
+        self.text_env = Environment(
+            loader=TextAlternativeLoader(loader),
+            autoescape=False,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=settings.debug,
+            bytecode_cache=FileSystemBytecodeCache(cache_dir, "__jinja2_text_%s.cache"),
         )
         
         # Add custom filters
-        self.env.filters['datetime'] = self._datetime_filter
-        self.env.filters['date'] = self._date_filter
-        self.env.filters['currency'] = self._currency_filter
+        for env in (self.env, self.text_env):
+            env.filters['datetime'] = self._datetime_filter
+            env.filters['date'] = self._date_filter
+            env.filters['currency'] = self._currency_filter
         
         logger.info(f"Email template engine initialized with path: {self.templates_path}")
 
@@ -85,6 +176,14 @@ class EmailTemplateEngine:
             logger.error(f"Error rendering template {template_name}: {e}")
             raise
 
+    def render_text(self, template_name: str, context: Dict[str, Any]) -> Optional[str]:
+        """텍스트 대체 본문 렌더링 (템플릿이 없으면 None)"""
+        try:
+            template = self.text_env.get_template(template_name)
+        except TemplateNotFound:
+            return None
+        return _BLANK_LINES.sub("\n\n", template.render(**context)).strip()
+
     def template_exists(self, template_name: str) -> bool:
         """Check if template exists"""
         try:
@@ -94,13 +193,51 @@ class EmailTemplateEngine:
             return False
 
 
-class EmailService(BaseService):
-    """Enhanced email service with template support and comprehensive features"""
+@lru_cache(maxsize=None)
+def get_template_engine(templates_dir: str = "templates") -> EmailTemplateEngine:
+    """프로세스 공용 템플릿 엔진 (컴파일된 템플릿을 EmailService 인스턴스 간에 공유)"""
+    return EmailTemplateEngine(templates_dir)
+
+
+_render_executor: Optional[ThreadPoolExecutor] = None
+_render_executor_lock = threading.Lock()
+
+
+def get_render_executor() -> ThreadPoolExecutor:
+    """템플릿 렌더링/발송용 공용 스레드 풀 (이벤트 루프를 막지 않도록)"""
+    global _render_executor
+    with _render_executor_lock:
+        if _render_executor is None:
+            _render_executor = ThreadPoolExecutor(
+                max_workers=settings.email_render_workers,
+                thread_name_prefix="email-render",
+            )
+        return _render_executor
+
+
+@dataclass
+class TemplatedEmail:
+    """``EmailService.send_many`` 로 보낼 메일 한 통"""
+    to: str
+    template_name: str
+    context: Dict[str, Any]
+    subject: Optional[str] = None
+    priority: str = "normal"
+    tracking_id: Optional[str] = None
+    from_email: Optional[str] = None
+    reply_to: Optional[str] = None
+
+
+class EmailService:
+    """Enhanced email service with template support and comprehensive features
+
+    저장소 항목을 관리하지 않으므로 CRUD 템플릿인 ``BaseService`` 를 상속하지 않음
+    """
     
-    def __init__(self):
-        super().__init__()
-        self.template_engine = EmailTemplateEngine()
-        self.client = EmailClient(provider="dev")  # Can be configured
+    def __init__(self, client: Optional[EmailClient] = None):
+        self.template_engine = get_template_engine()
+        # 배달 워커는 SMTP 세션을 재사용하도록 수명이 긴 클라이언트를 주입
+        self.client = client or EmailClient(provider=settings.email_provider)
         
     async def send_templated_email(
         self,
@@ -131,95 +268,116 @@ class EmailService(BaseService):
         Returns:
             Dictionary with send result
         """
+        # attachments 는 EmailClient 가 지원하지 않아 현재 사용되지 않음
+        message = TemplatedEmail(
+            to=to,
+            template_name=template_name,
+            context=context,
+            subject=subject,
+            priority=priority,
+            tracking_id=tracking_id,
+            from_email=from_email,
+            reply_to=reply_to,
+        )
+        return (await self.send_many([message]))[0]
+
+    def _full_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        # Add default context variables
+        default_context = {
+            'current_date': datetime.now(),
+            'year': datetime.now().year,
+            'platform_name': '한국 공공데이터 플랫폼',
+            'support_email': 'support@example.com',
+            'unsubscribe_url': f"{settings.frontend_url}/unsubscribe",
+            'settings_url': f"{settings.frontend_url}/settings/notifications",
+            'support_url': f"{settings.frontend_url}/support"
+        }
+        # Merge with provided context
+        return {**default_context, **context}
+
+    def render_email(self, template_name: str, context: Dict[str, Any]) -> RenderedEmail:
+        """HTML 과 텍스트 대체 본문을 같은 context 로 렌더링"""
+        html_content = self.template_engine.render_template(template_name, context)
+        text_content = None
         try:
-            # Add default context variables
-            default_context = {
-                'current_date': datetime.now(),
-                'year': datetime.now().year,
-                'platform_name': '한국 공공데이터 플랫폼',
-                'support_email': 'support@example.com',
-                'unsubscribe_url': f"{settings.frontend_url}/unsubscribe",
-                'settings_url': f"{settings.frontend_url}/settings/notifications",
-                'support_url': f"{settings.frontend_url}/support"
-            }
-            
-            # Merge with provided context
-            full_context = {**default_context, **context}
-            
-            # Render email content
-            html_content = self.template_engine.render_template(template_name, full_context)
-            
-            # Generate text version from HTML (simple fallback)
+            text_content = self.template_engine.render_text(template_name, context)
+        except Exception as e:
+            logger.warning(f"Text alternative for {template_name} failed, deriving from HTML: {e}")
+        if not text_content:
             text_content = self._html_to_text(html_content)
+        return RenderedEmail(html=html_content, text=text_content)
+
+    def _send_one(self, message: TemplatedEmail) -> Dict[str, Any]:
+        try:
+            full_context = self._full_context(message.context)
+            rendered = self.render_email(message.template_name, full_context)
             
             # Determine subject
-            email_subject = subject or full_context.get('subject', '한국 공공데이터 알림')
-            
-            # Create multipart message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = email_subject
-            msg['From'] = from_email or f"한국 공공데이터 플랫폼 <{settings.smtp_from_email if hasattr(settings, 'smtp_from_email') else 'noreply@example.com'}>"
-            msg['To'] = to
-            
-            if reply_to:
-                msg['Reply-To'] = reply_to
-                
-            # Set priority
-            if priority == "high":
-                msg['X-Priority'] = '1'
-                msg['X-MSMail-Priority'] = 'High'
-            elif priority == "low":
-                msg['X-Priority'] = '5'
-                msg['X-MSMail-Priority'] = 'Low'
-            
-            # Add tracking headers if provided
-            if tracking_id:
-                msg['X-Tracking-ID'] = tracking_id
-                
-            # Attach text and HTML parts
-            text_part = MIMEText(text_content, 'plain', 'utf-8')
-            html_part = MIMEText(html_content, 'html', 'utf-8')
-            
-            msg.attach(text_part)
-            msg.attach(html_part)
+            email_subject = message.subject or full_context.get('subject', '한국 공공데이터 알림')
             
             # Use existing EmailClient to send
             result = self.client.send(
-                to=to,
+                to=message.to,
                 subject=email_subject,
-                html=html_content,
-                text=text_content,
+                html=rendered.html,
+                text=rendered.text,
                 meta={
-                    'template': template_name,
-                    'tracking_id': tracking_id,
-                    'priority': priority,
+                    'template': message.template_name,
+                    'tracking_id': message.tracking_id,
+                    'priority': message.priority,
+                    'from_email': message.from_email,
+                    'reply_to': message.reply_to,
                     'timestamp': datetime.now().isoformat()
                 }
             )
             
-            logger.info(f"Templated email sent to {to} using template {template_name}")
+            logger.info(f"Templated email sent to {message.to} using template {message.template_name}")
             
             return {
                 'success': result.get('ok', False),
                 'message_id': result.get('message_id'),
-                'template': template_name,
-                'tracking_id': tracking_id,
+                'error': result.get('error'),
+                'template': message.template_name,
+                'tracking_id': message.tracking_id,
                 'sent_at': datetime.now().isoformat()
             }
             
         except Exception as e:
-            logger.error(f"Error sending templated email to {to}: {e}")
+            logger.error(f"Error sending templated email to {message.to}: {e}")
             return {
                 'success': False,
                 'error': str(e),
-                'template': template_name,
-                'tracking_id': tracking_id
+                'template': message.template_name,
+                'tracking_id': message.tracking_id
             }
 
+    def _send_chunk(self, messages: Sequence[TemplatedEmail]) -> List[Dict[str, Any]]:
+        return [self._send_one(message) for message in messages]
+
+    async def send_many(
+        self,
+        messages: Sequence[TemplatedEmail],
+        batch_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 통을 렌더링/발송 (입력 순서대로 결과 반환).
+
+        ``batch_size`` 통씩 묶어 공용 스레드 풀에서 렌더링과 발송을 수행하므로
+        템플릿 렌더링 CPU 와 SMTP I/O 가 이벤트 루프를 막지 않습니다.
+        """
+        if not messages:
+            return []
+        size = batch_size or settings.email_render_batch_size
+        loop = asyncio.get_running_loop()
+        executor = get_render_executor()
+        chunks = [messages[i:i + size] for i in range(0, len(messages), size)]
+        results = await asyncio.gather(*(
+            loop.run_in_executor(executor, self._send_chunk, chunk) for chunk in chunks
+        ))
+        return [result for chunk_results in results for result in chunk_results]
+
     def _html_to_text(self, html_content: str) -> str:
-        """Convert HTML to plain text (simple implementation)"""
-        import re
-        
+        """Convert HTML to plain text (fallback when no text template is available)"""
         # Remove HTML tags
         text = re.sub(r'<[^>]+>', '', html_content)
         
@@ -234,7 +392,7 @@ class EmailService(BaseService):
         
         return text.strip()
 
-    async def send_new_announcement_notification(
+    def new_announcement_email(
         self,
         user_email: str,
         user_name: str,
@@ -243,8 +401,8 @@ class EmailService(BaseService):
         match_score: float,
         threshold: float,
         tracking_id: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """Send new announcement notification"""
+    ) -> TemplatedEmail:
+        """Build a new announcement notification for ``send_many``"""
         
         context = {
             'user_name': user_name,
@@ -257,7 +415,7 @@ class EmailService(BaseService):
             'subject': f"🚀 새로운 공고 알림: {announcement.get('title', '')[:50]}..."
         }
         
-        return await self.send_templated_email(
+        return TemplatedEmail(
             to=user_email,
             template_name="email/new_announcement.html",
             context=context,
@@ -265,15 +423,31 @@ class EmailService(BaseService):
             tracking_id=tracking_id
         )
 
-    async def send_deadline_reminder(
+    async def send_new_announcement_notification(
         self,
         user_email: str,
         user_name: str,
         announcement: Dict[str, Any],
-        days_left: int,
+        matched_keywords: List[str],
+        match_score: float,
+        threshold: float,
         tracking_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Send deadline reminder notification"""
+        """Send new announcement notification"""
+        message = self.new_announcement_email(
+            user_email, user_name, announcement, matched_keywords, match_score, threshold, tracking_id
+        )
+        return (await self.send_many([message]))[0]
+
+    def deadline_reminder_email(
+        self,
+        user_email: str,
+        user_name: str,
+        announcement: Dict[str, Any],
+        days_left: int,
+        tracking_id: Optional[str] = None
+    ) -> TemplatedEmail:
+        """Build a deadline reminder for ``send_many``"""
         
         # Determine urgency text
         if days_left <= 1:
@@ -296,7 +470,7 @@ class EmailService(BaseService):
             'subject': f"⏰ 마감 {urgency_text} 알림 (D-{days_left}): {announcement.get('title', '')[:40]}..."
         }
         
-        return await self.send_templated_email(
+        return TemplatedEmail(
             to=user_email,
             template_name="email/deadline_reminder.html",
             context=context,
@@ -304,6 +478,18 @@ class EmailService(BaseService):
             tracking_id=tracking_id
         )
 
+    async def send_deadline_reminder(
+        self,
+        user_email: str,
+        user_name: str,
+        announcement: Dict[str, Any],
+        days_left: int,
+        tracking_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Send deadline reminder notification"""
+        message = self.deadline_reminder_email(user_email, user_name, announcement, days_left, tracking_id)
+        return (await self.send_many([message]))[0]
+
     async def send_daily_digest(
         self,
         user_email: str,
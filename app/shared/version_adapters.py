@@ -5,7 +5,7 @@ Handles backward compatibility and response format transformation
 between different API versions.
 """
 
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic, Union, Callable
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Generic, Union, Callable
 from abc import ABC, abstractmethod
 from pydantic import BaseModel
 from datetime import datetime
@@ -39,17 +39,65 @@ class VersionAdapter(ABC, Generic[TSource, TTarget]):
         pass
 
 
+class TransformationPlan:
+    """
+    Flat, precompiled transformation for one (route, source, target) triple.
+    
+    Adapter selection and field mapping lookups happen once at compile time;
+    applying the plan is a straight loop over the resolved steps. A plan with
+    no steps is a passthrough and callers can skip adaptation entirely.
+    """
+    
+    __slots__ = ("route", "source_key", "target_key", "steps")
+    
+    def __init__(
+        self,
+        route: Optional[str],
+        source_key: Optional[str],
+        target_key: str,
+        steps: Tuple[Callable[[Any], Any], ...] = ()
+    ):
+        self.route = route
+        self.source_key = source_key
+        self.target_key = target_key
+        self.steps = steps
+    
+    @property
+    def is_passthrough(self) -> bool:
+        return not self.steps
+    
+    def apply(self, data: Any) -> Any:
+        """Apply the plan to a dict/model payload (before serialization)."""
+        if not self.steps:
+            return data
+        if isinstance(data, BaseModel):
+            data = data.model_dump(mode="json")
+        for step in self.steps:
+            data = step(data)
+        return data
+
+
 class ResponseVersionAdapter:
     """Adapts responses between different API versions."""
     
     def __init__(self):
         self._adapters: List[VersionAdapter] = []
+        self._adapter_routes: List[Optional[str]] = []
         self._field_mappings: Dict[str, Dict[str, str]] = {}
         self._field_transformers: Dict[str, Dict[str, Callable]] = {}
+        self._plan_cache: Dict[Tuple[Optional[str], Optional[str], str], TransformationPlan] = {}
     
-    def register_adapter(self, adapter: VersionAdapter) -> None:
-        """Register a version adapter."""
+    def register_adapter(self, adapter: VersionAdapter, route_prefix: Optional[str] = None) -> None:
+        """
+        Register a version adapter.
+        
+        Args:
+            adapter: Adapter instance
+            route_prefix: Restrict the adapter to routes starting with this prefix
+        """
         self._adapters.append(adapter)
+        self._adapter_routes.append(route_prefix)
+        self._plan_cache.clear()
         logger.debug(f"Registered adapter: {adapter.source_version.short_version} -> {adapter.target_version.short_version}")
     
     def register_field_mapping(
@@ -65,6 +113,7 @@ class ResponseVersionAdapter:
             field_mappings: Dict mapping old field names to new field names
         """
         self._field_mappings[version] = field_mappings
+        self._plan_cache.clear()
     
     def register_field_transformer(
         self,
@@ -83,65 +132,117 @@ class ResponseVersionAdapter:
         if version not in self._field_transformers:
             self._field_transformers[version] = {}
         self._field_transformers[version][field] = transformer
+        self._plan_cache.clear()
     
-    def adapt_response(
+    def compile_plan(
         self,
-        data: Any,
         target_version: APIVersion,
-        source_version: Optional[APIVersion] = None
-    ) -> Any:
+        source_version: Optional[APIVersion] = None,
+        route: Optional[str] = None
+    ) -> TransformationPlan:
         """
-        Adapt response data to target version format.
+        Compile (or fetch the cached) transformation plan.
         
         Args:
-            data: Source data to transform
-            target_version: Target API version
-            source_version: Source API version (latest if not specified)
+            target_version: Version requested by the client
+            source_version: Native version the handler produces; ``None`` means
+                the handler already speaks the requested version
+            route: Route path used to scope route-specific adapters
             
         Returns:
-            Transformed data compatible with target version
+            TransformationPlan, a passthrough when nothing applies
         """
-        if source_version and source_version == target_version:
-            return data
+        source_key = source_version.short_version if source_version else None
+        target_key = target_version.short_version
+        cache_key = (route, source_key, target_key)
         
-        # Try registered adapters first
-        for adapter in self._adapters:
-            if adapter.can_transform(source_version, target_version):
+        plan = self._plan_cache.get(cache_key)
+        if plan is None:
+            plan = TransformationPlan(
+                route, source_key, target_key,
+                self._compile_steps(target_version, source_version, route)
+            )
+            self._plan_cache[cache_key] = plan
+        return plan
+    
+    def _compile_steps(
+        self,
+        target_version: APIVersion,
+        source_version: Optional[APIVersion],
+        route: Optional[str]
+    ) -> Tuple[Callable[[Any], Any], ...]:
+        if source_version is None or source_version.short_version == target_version.short_version:
+            return ()
+        
+        candidates = [
+            adapter for adapter, prefix in zip(self._adapters, self._adapter_routes)
+            if (prefix is None or (route is not None and route.startswith(prefix)))
+            and adapter.can_transform(source_version, target_version)
+        ]
+        field_step = self._compile_field_step(target_version.short_version)
+        
+        if not candidates:
+            return (field_step,) if field_step else ()
+        
+        def adapter_chain(data: Any) -> Any:
+            # Same fallback order as before: first adapter that succeeds wins,
+            # then generic field mapping
+            for adapter in candidates:
                 try:
                     return adapter.transform(data)
                 except Exception as e:
                     logger.error(f"Adapter transformation failed: {e}")
-                    continue
+            return field_step(data) if field_step else data
         
-        # Fall back to generic field mapping and transformation
-        return self._apply_field_transformations(data, target_version)
+        return (adapter_chain,)
     
-    def _apply_field_transformations(self, data: Any, target_version: APIVersion) -> Any:
-        """Apply field mappings and transformations for a version."""
-        if not isinstance(data, dict):
-            return data
-        
-        version_key = target_version.short_version
-        result = data.copy()
+    def _compile_field_step(self, version_key: str) -> Optional[Callable[[Any], Any]]:
+        """Resolve mappings/transformers for a version into a single step."""
+        mappings = tuple(self._field_mappings.get(version_key, {}).items())
+        transformers = tuple(self._field_transformers.get(version_key, {}).items())
+        if not mappings and not transformers:
+            return None
         
-        # Apply field mappings
-        if version_key in self._field_mappings:
-            mappings = self._field_mappings[version_key]
-            for old_field, new_field in mappings.items():
+        def field_step(data: Any) -> Any:
+            if not isinstance(data, dict):
+                return data
+            result = data.copy()
+            for old_field, new_field in mappings:
                 if old_field in result:
                     result[new_field] = result.pop(old_field)
-        
-        # Apply field transformers
-        if version_key in self._field_transformers:
-            transformers = self._field_transformers[version_key]
-            for field, transformer in transformers.items():
+            for field, transformer in transformers:
                 if field in result:
                     try:
                         result[field] = transformer(result[field])
                     except Exception as e:
                         logger.warning(f"Field transformation failed for {field}: {e}")
+            return result
         
-        return result
+        return field_step
+    
+    def adapt_response(
+        self,
+        data: Any,
+        target_version: APIVersion,
+        source_version: Optional[APIVersion] = None
+    ) -> Any:
+        """
+        Adapt response data to target version format.
+        
+        Args:
+            data: Source data to transform
+            target_version: Target API version
+            source_version: Native version of ``data`` (requested version if not specified)
+            
+        Returns:
+            Transformed data compatible with target version
+        """
+        return self.compile_plan(target_version, source_version).apply(data)
+    
+    def _apply_field_transformations(self, data: Any, target_version: APIVersion) -> Any:
+        """Apply field mappings and transformations for a version."""
+        field_step = self._compile_field_step(target_version.short_version)
+        return field_step(data) if field_step else data
 
 
 class V1ResponseAdapter(VersionAdapter[Dict[str, Any], Dict[str, Any]]):
@@ -347,11 +448,22 @@ class VersionedResponseBuilder:
         self.adapter.register_field_transformer('v1', 'created_date', datetime_to_v1_format)
         self.adapter.register_field_transformer('v1', 'modified_date', datetime_to_v1_format)
     
+    def get_plan(
+        self,
+        target_version: APIVersion,
+        source_version: Optional[APIVersion] = None,
+        route: Optional[str] = None
+    ) -> TransformationPlan:
+        """Get the compiled plan for (route, source, target)."""
+        return self.adapter.compile_plan(target_version, source_version, route)
+    
     def build_response(
         self,
         data: Any,
         target_version: APIVersion,
-        response_type: Optional[str] = None
+        response_type: Optional[str] = None,
+        source_version: Optional[APIVersion] = None,
+        route: Optional[str] = None
     ) -> Any:
         """
         Build version-appropriate response.
@@ -360,12 +472,14 @@ class VersionedResponseBuilder:
             data: Response data
             target_version: Target API version
             response_type: Optional response type hint
+            source_version: Native version of ``data`` (requested version if not specified)
+            route: Route path for route-scoped adapters
             
         Returns:
             Version-adapted response
         """
         try:
-            return self.adapter.adapt_response(data, target_version)
+            return self.get_plan(target_version, source_version, route).apply(data)
         except Exception as e:
             logger.error(f"Response adaptation failed: {e}")
             # Return original data if adaptation fails
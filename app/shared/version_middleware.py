@@ -21,7 +21,8 @@ from .versioning import (
     get_version_registry,
     get_version_extractor
 )
-from .version_adapters import get_versioned_response_builder
+from .version_adapters import TransformationPlan, get_versioned_response_builder
+from ..core.compression import decompress
 from .responses import error_response
 
 logger = logging.getLogger(__name__)
@@ -33,6 +34,11 @@ class APIVersionMiddleware(BaseHTTPMiddleware):
     
     Extracts version information from requests, validates versions,
     and adapts responses to the requested version format.
+    
+    The transformation plan is looked up per matched route template (compiled
+    once and cached). Passthrough plans never touch the response body; handlers
+    can adapt their dict/model payload before serialization with
+    ``adapt_for_request``, in which case the body is not adapted again here.
     """
     
     def __init__(
@@ -91,31 +97,59 @@ class APIVersionMiddleware(BaseHTTPMiddleware):
         if self.add_version_headers:
             self._add_version_headers(response, api_version)
         
-        # Adapt response content if needed
-        if response.status_code < 400 and hasattr(response, 'body'):
-            try:
-                adapted_response = self._adapt_response_content(response, api_version)
-                if adapted_response:
-                    return adapted_response
-            except Exception as e:
-                logger.warning(f"Response adaptation failed: {e}")
-                # Continue with original response
+        # Adapt response content if needed (skipped when the handler already adapted it)
+        if response.status_code < 400 and not getattr(request.state, "version_adapted", False):
+            plan = _resolve_plan(
+                request, api_version,
+                self.version_extractor, self.version_registry, self.response_builder
+            )
+            if plan is not None and not plan.is_passthrough:
+                response = await self._adapt_response_content(response, plan)
         
         return response
     
+    async def _adapt_response_content(self, response: Response, plan: TransformationPlan) -> Response:
+        """Apply ``plan`` to a buffered JSON body (streamed bodies are left alone).
+
+        사전 압축된 본문(캐시 응답)은 풀어서 변환하고, 압축은 바깥의
+        ``CompressionMiddleware`` 가 변환된 본문에 다시 적용합니다.
+        """
+        headers = response.headers
+        if (
+            not headers.get("content-type", "").startswith("application/json")
+            or "content-length" not in headers
+        ):
+            return response
+        
+        body = b""
+        async for chunk in response.body_iterator:
+            body += chunk
+        try:
+            encoding = headers.get("content-encoding")
+            content = plan.apply(json.loads(decompress(body, encoding) if encoding else body))
+        except Exception as e:
+            logger.warning(f"Response adaptation failed: {e}")
+            return Response(content=body, status_code=response.status_code, headers=dict(headers))
+        
+        adapted_headers = {
+            k: v for k, v in headers.items() if k.lower() not in ("content-length", "content-encoding")
+        }
+        return JSONResponse(status_code=response.status_code, content=content, headers=adapted_headers)
+    
     def _log_version_usage(self, request: Request, version: APIVersion) -> None:
         """Log API version usage for analytics."""
-        logger.info(
-            f"API request with version {version.short_version}",
-            extra={
-                "api_version": version.short_version,
-                "path": request.url.path,
-                "method": request.method,
-                "user_agent": request.headers.get("user-agent"),
-                "is_deprecated": version.is_deprecated,
-                "client_ip": request.client.host if request.client else None
-            }
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"API request with version {version.short_version}",
+                extra={
+                    "api_version": version.short_version,
+                    "path": request.url.path,
+                    "method": request.method,
+                    "user_agent": request.headers.get("user-agent"),
+                    "is_deprecated": version.is_deprecated,
+                    "client_ip": request.client.host if request.client else None
+                }
+            )
         
         # Additional warning for deprecated versions
         if version.is_deprecated:
@@ -206,41 +240,6 @@ class APIVersionMiddleware(BaseHTTPMiddleware):
         latest_version = self.version_registry.get_latest_version()
         if latest_version:
             response.headers["X-API-Latest-Version"] = latest_version.short_version
-    
-    def _adapt_response_content(self, response: Response, version: APIVersion) -> Optional[JSONResponse]:
-        """Adapt response content to requested version format."""
-        
-        # Only process JSON responses
-        content_type = response.headers.get("content-type", "")
-        if not content_type.startswith("application/json"):
-            return None
-        
-        try:
-            # Get response body
-            if hasattr(response, 'body'):
-                body = response.body
-                if isinstance(body, bytes):
-                    content = json.loads(body.decode())
-                else:
-                    content = body
-            else:
-                return None
-            
-            # Adapt content to requested version
-            adapted_content = self.response_builder.build_response(content, version)
-            
-            # Create new response with adapted content
-            if adapted_content != content:
-                return JSONResponse(
-                    status_code=response.status_code,
-                    content=adapted_content,
-                    headers=dict(response.headers)
-                )
-            
-        except Exception as e:
-            logger.warning(f"Failed to adapt response content: {e}")
-        
-        return None
 
 
 class VersionDeprecationMiddleware(BaseHTTPMiddleware):
@@ -355,6 +354,64 @@ class VersionDeprecationMiddleware(BaseHTTPMiddleware):
             logger.warning(f"Failed to add deprecation notice to response: {e}")
 
 
+def _resolve_plan(
+    request: Request,
+    api_version: APIVersion,
+    version_extractor: VersionExtractor,
+    version_registry: VersionRegistry,
+    response_builder: Any
+) -> Optional[TransformationPlan]:
+    """
+    Compiled plan for the matched route and requested version.
+    
+    Plans are keyed on the route template (``scope["route"].path``), not the
+    concrete URL, so the plan cache stays bounded by the number of routes.
+    Routes are mounted under ``/api/vN``, so the template's version prefix is
+    the handler's native format; without one the handler is assumed to speak
+    the requested version (passthrough). Returns None before routing (or for
+    unmatched paths).
+    """
+    plan = getattr(request.state, "version_plan", None)
+    if plan is not None:
+        return plan
+    route_path = getattr(request.scope.get("route"), "path", None)
+    if route_path is None:
+        return None
+    
+    native = None
+    path_version = version_extractor.extract_from_url(route_path)
+    if path_version and path_version != api_version.short_version:
+        native = version_registry.get_version(path_version)
+    plan = response_builder.get_plan(api_version, native, route_path)
+    request.state.version_plan = plan
+    return plan
+
+
+def adapt_for_request(request: Request, data: Any) -> Any:
+    """
+    Apply the version plan for the request's route to a response payload.
+    
+    Call on the dict/model before it is serialized; the middleware then leaves
+    the body alone. Returns ``data`` unchanged when there is no plan or the plan
+    is a passthrough.
+    """
+    api_version = getattr(request.state, "api_version", None)
+    if api_version is None:
+        return data
+    plan = _resolve_plan(
+        request, api_version,
+        get_version_extractor(), get_version_registry(), get_versioned_response_builder()
+    )
+    request.state.version_adapted = True
+    if plan is None or plan.is_passthrough:
+        return data
+    try:
+        return plan.apply(data)
+    except Exception as e:
+        logger.warning(f"Response adaptation failed: {e}")
+        return data
+
+
 # Middleware factory functions
 def create_version_middleware(
     version_registry: Optional[VersionRegistry] = None,
@@ -86,6 +86,7 @@ class VersionedAPIRouter(APIRouter):
             **kwargs: Additional route parameters
         """
         methods = methods or ["GET"]
+        route_path = self.prefix + path
         
         # Create version-aware endpoint wrapper
         async def versioned_endpoint(request: Request, *args, **kwargs):
@@ -139,12 +140,21 @@ class VersionedAPIRouter(APIRouter):
             # Call original endpoint
             response = await endpoint(request, *args, **kwargs)
             
-            # Adapt response to requested version
+            # Adapt response to requested version (dict/model level, before serialization)
             if isinstance(response, (dict, BaseResponse)):
-                adapted_response = self.response_builder.build_response(
-                    response, current_version
+                # APIVersionMiddleware 가 본문을 다시 변환하지 않도록 표시
+                request.state.version_adapted = True
+                plan = self.response_builder.get_plan(
+                    current_version, self._native_version(), route_path
+                )
+                if plan.is_passthrough:
+                    return response
+                return self.response_builder.build_response(
+                    response,
+                    current_version,
+                    source_version=self._native_version(),
+                    route=route_path
                 )
-                return adapted_response
             
             return response
         
@@ -156,6 +166,15 @@ class VersionedAPIRouter(APIRouter):
             **kwargs
         )
     
+    def _native_version(self) -> Optional[APIVersion]:
+        """Version the router's handlers produce natively (None = requested version)."""
+        if not self.default_version:
+            return None
+        try:
+            return self._parse_version(self.default_version)
+        except ValueError:
+            return None
+    
     def _parse_version(self, version_string: str) -> APIVersion:
         """Parse version string to APIVersion object."""
         if not version_string.startswith('v'):
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Import-time 분석 스크립트
+
+``python -X importtime -c "import app.main"`` 를 서브프로세스로 실행하고
+stderr 의 원시 출력을 요약합니다 (누적 상위 / 자체 상위 / 최상위 패키지별).
+
+Usage:
+  python scripts/importtime_report.py
+  python scripts/importtime_report.py --module app.core.celery_config --top 30
+  ENABLED_ROUTERS='["announcements"]' python scripts/importtime_report.py
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (module, self_us, cumulative_us)
+ImportRow = Tuple[str, int, int]
+
+
+def collect(module: str) -> List[ImportRow]:
+    """대상 모듈을 새 인터프리터에서 import 하고 importtime 행을 파싱"""
+    env = dict(os.environ)
+    env.setdefault("PUBLIC_DATA_API_KEY", "importtime-report-key")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.splitlines()[-20:])
+        raise SystemExit(f"import {module} failed:\n{tail}")
+
+    rows: List[ImportRow] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def summarize(rows: List[ImportRow], top: int) -> str:
+    total_us = sum(r[1] for r in rows)
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+
+    def fmt(us: int) -> str:
+        return f"{us / 1000:9.1f}ms"
+
+    lines = [f"Total import time: {total_us / 1000:.1f}ms ({len(rows)} modules)", ""]
+    lines.append(f"Top {top} by cumulative time:")
+    for name, _, cumulative_us in sorted(rows, key=lambda r: r[2], reverse=True)[:top]:
+        lines.append(f"  {fmt(cumulative_us)}  {name}")
+    lines.append("")
+    lines.append(f"Top {top} by self time:")
+    for name, self_us, _ in sorted(rows, key=lambda r: r[1], reverse=True)[:top]:
+        lines.append(f"  {fmt(self_us)}  {name}")
+    lines.append("")
+    lines.append(f"Top {top} packages (sum of self time):")
+    for package, us in sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        lines.append(f"  {fmt(us)}  {package}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Summarize python -X importtime output")
+    parser.add_argument("--module", default="app.main", help="import 할 모듈 (기본: app.main)")
+    parser.add_argument("--top", type=int, default=20, help="섹션별 출력 개수")
+    args = parser.parse_args()
+
+    print(summarize(collect(args.module), args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -27,14 +27,9 @@ try {
     // announcements 컬렉션 생성
     db.createCollection('announcements');
     
-    // 인덱스 생성 (백그라운드)
-    db.announcements.createIndex({ 'announcement_data.business_id': 1 }, { background: true });
-    db.announcements.createIndex({ 'announcement_data.business_name': 1 }, { background: true });
-    db.announcements.createIndex({ 'is_active': 1, 'announcement_data.announcement_date': -1 }, { background: true });
-    db.announcements.createIndex({ 'is_active': 1, 'announcement_data.end_date': 1 }, { background: true });
-    db.announcements.createIndex({ 'created_at': -1 }, { background: true });
+    // 인덱스는 애플리케이션 시작 시 app/core/indexes.py 레지스트리로 적용됨
     
-    print('Announcements collection and indexes created successfully');
+    print('Announcements collection created successfully');
 } catch (error) {
     print('Collections and indexes creation failed: ' + error);
 }
@@ -43,6 +43,44 @@ def event_loop():
         loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_preference_cache():
+    """Process-wide preference cache must not leak documents between tests"""
+    from app.core.preference_cache import preference_cache
+
+    preference_cache.clear()
+    yield
+    preference_cache.clear()
+
+
+class AsyncCursor:
+    """Motor cursor stand-in over a list of documents (``from tests.conftest import AsyncCursor``)
+
+    ``sort`` / ``limit`` are chainable no-ops; iterate with ``async for`` or ``to_list``.
+    """
+
+    def __init__(self, docs):
+        self._docs = list(docs)
+
+    def sort(self, *args, **kwargs):
+        return self
+
+    def limit(self, *args, **kwargs):
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._docs:
+            raise StopAsyncIteration
+        return self._docs.pop(0)
+
+    async def to_list(self, length=None):
+        docs, self._docs = self._docs, []
+        return docs
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
     """Setup test environment configuration"""
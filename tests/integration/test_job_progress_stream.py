@@ -0,0 +1,97 @@
+"""
+Integration test for the batch job progress SSE endpoint.
+
+Runs through the full ``app.main`` middleware stack and checks that events
+reach the client while the job is still running (not buffered until the end).
+TestClient collects the whole body before returning, so the ASGI app is
+driven directly.
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+from app.domains.announcements import router as announcements_router
+from app.main import app
+from app.shared.jobs import ProgressEvent
+
+EVENTS_PATH = "/api/v1/announcements/batch-jobs/job-1/events"
+
+
+async def _open_stream(path):
+    """Start a GET request and return (task, queue of sent ASGI messages)"""
+    messages: asyncio.Queue = asyncio.Queue()
+    disconnect = asyncio.Event()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver"), (b"accept", b"text/event-stream")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    sent_request = False
+
+    async def receive():
+        nonlocal sent_request
+        if not sent_request:
+            sent_request = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    task = asyncio.create_task(app(scope, receive, messages.put))
+    task.disconnect = disconnect
+    return task, messages
+
+
+async def _next_body(messages, timeout=2.0):
+    while True:
+        message = await asyncio.wait_for(messages.get(), timeout)
+        if message["type"] == "http.response.body" and message.get("body"):
+            return message
+
+
+class TestBatchJobProgressStream:
+    """Test SSE delivery through the application middleware."""
+
+    async def test_events_are_delivered_before_the_job_ends(self):
+        job_done = asyncio.Event()
+
+        async def read_progress(client, job_id, last_event_id=None):
+            yield "1-0", ProgressEvent(job_id=job_id, status="running", pages_done=20)
+            yield None, None
+            # 작업이 끝날 때까지 스트림은 열려 있음
+            await job_done.wait()
+            yield "2-0", ProgressEvent(job_id=job_id, status="completed", pages_done=40)
+
+        with patch.object(announcements_router, "read_progress", read_progress), \
+                patch.object(announcements_router.job_progress_publisher, "_client", Mock()):
+            task, messages = await _open_stream(EVENTS_PATH)
+            try:
+                start = await asyncio.wait_for(messages.get(), 2.0)
+                first = await _next_body(messages)
+                heartbeat = await _next_body(messages)
+
+                assert start["status"] == 200
+                headers = dict(start["headers"])
+                assert headers[b"content-type"].startswith(b"text/event-stream")
+                assert b"content-encoding" not in headers
+                assert b"id: 1-0" in first["body"] and b'"pages_done": 20' in first["body"]
+                assert heartbeat["body"].startswith(b":")
+                assert not task.done()
+
+                job_done.set()
+                last = await _next_body(messages)
+                assert b'"status": "completed"' in last["body"]
+                await asyncio.wait_for(task, 2.0)
+            finally:
+                job_done.set()
+                task.disconnect.set()
+                if not task.done():
+                    task.cancel()
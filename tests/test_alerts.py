@@ -152,7 +152,7 @@ class TestAlertsTasks:
     """Test Celery tasks for alerts"""
 
     @patch('app.domains.alerts.tasks.settings')
-    @patch('app.domains.alerts.tasks.DatabaseManager')
+    @patch('app.domains.alerts.tasks.get_worker_database')
     @patch('app.domains.alerts.tasks.AlertsService')
     def test_match_and_enqueue_disabled(self, mock_service, mock_dbm, mock_settings):
         """Test match_and_enqueue when alerts are disabled"""
@@ -163,7 +163,7 @@ class TestAlertsTasks:
         mock_service.assert_not_called()
 
     @patch('app.domains.alerts.tasks.settings')
-    @patch('app.domains.alerts.tasks.asyncio.run')
+    @patch('app.domains.alerts.tasks.run_async')
     def test_match_and_enqueue_with_threshold(self, mock_run, mock_settings):
         """Test match_and_enqueue with threshold filtering"""
         mock_settings.alerts_enabled = True
@@ -174,7 +174,7 @@ class TestAlertsTasks:
         mock_run.assert_called_once()
 
     @patch('app.domains.alerts.tasks.settings')
-    @patch('app.domains.alerts.tasks.DatabaseManager')
+    @patch('app.domains.alerts.tasks.get_worker_database')
     @patch('app.domains.alerts.tasks.EmailClient')
     @patch('app.domains.alerts.tasks.RateLimiter')
     def test_send_notification_disabled(self, mock_limiter, mock_email, mock_dbm, mock_settings):
@@ -186,7 +186,7 @@ class TestAlertsTasks:
         mock_email.assert_not_called()
 
     @patch('app.domains.alerts.tasks.settings')
-    @patch('app.domains.alerts.tasks.asyncio.run')
+    @patch('app.domains.alerts.tasks.run_async')
     def test_send_notification_success(self, mock_run, mock_settings):
         """Test successful notification sending"""
         mock_settings.alerts_enabled = True
@@ -239,7 +239,7 @@ class TestIntegration:
     """Integration tests for alerts system"""
 
     @pytest.mark.asyncio
-    @patch('app.domains.alerts.tasks.DatabaseManager')
+    @patch('app.domains.alerts.tasks.get_worker_database')
     @patch('app.domains.alerts.tasks.settings')
     async def test_end_to_end_alert_flow(self, mock_settings, mock_dbm):
         """Test complete alert flow from subscription to notification"""
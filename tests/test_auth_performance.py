@@ -0,0 +1,96 @@
+"""
+Performance benchmark for the authentication check.
+
+Compares the per-request overhead of the previous pipeline (two JWT decodes,
+blocking blacklist lookup, user query on every request) with the fast path
+(single decode, async blacklist with negative cache, (sub, iat) user cache).
+Redis and MongoDB are replaced with fixed-latency fakes so the numbers
+reflect the auth pipeline itself.
+"""
+
+import statistics
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.core.security import SecurityManager, blacklist_negative_cache, create_access_token
+from app.domains.users.auth_cache import AuthUserCache
+from app.domains.users.service import UserService
+
+# 네트워크 왕복을 흉내내는 고정 지연 (ms)
+REDIS_LATENCY_MS = 0.3
+MONGO_LATENCY_MS = 1.0
+ITERATIONS = 200
+
+
+def _sleep_ms(ms: float) -> None:
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+class _FakeAsyncRedis:
+    async def exists(self, key):
+        _sleep_ms(REDIS_LATENCY_MS)
+        return 0
+
+
+class _FakeSyncRedis:
+    def exists(self, key):
+        _sleep_ms(REDIS_LATENCY_MS)
+        return 0
+
+
+def _fake_get_by_id(user_id):
+    _sleep_ms(MONGO_LATENCY_MS)
+    return Mock(id=user_id, is_active=True)
+
+
+def _summary(samples):
+    return {
+        "avg": statistics.mean(samples),
+        "p95": statistics.quantiles(samples, n=20)[18],
+    }
+
+
+@pytest.mark.performance
+class TestAuthCheckOverhead:
+    """Per-request authentication overhead"""
+
+    async def test_fast_path_vs_legacy(self):
+        token = create_access_token({"sub": "bench-user"})
+        manager = SecurityManager()
+        repository = Mock()
+        repository.get_by_id.side_effect = _fake_get_by_id
+
+        # Legacy: is_token_blacklisted() decode + verify_token() decode,
+        # blocking exists, user query every request
+        legacy = []
+        with patch("app.core.security.redis_client", _FakeSyncRedis()):
+            for _ in range(ITERATIONS):
+                start = time.perf_counter()
+                manager.is_token_blacklisted(token)
+                payload = manager.decode_token(token)
+                repository.get_by_id(payload["sub"])
+                legacy.append((time.perf_counter() - start) * 1000)
+
+        blacklist_negative_cache.clear()
+        fast = []
+        with patch("app.core.security.get_async_redis_client", return_value=_FakeAsyncRedis()), \
+                patch("app.domains.users.service.auth_user_cache", AuthUserCache(ttl_seconds=30)):
+            service = UserService(user_repository=repository)
+            for _ in range(ITERATIONS):
+                start = time.perf_counter()
+                await service.get_current_user(token)
+                fast.append((time.perf_counter() - start) * 1000)
+        blacklist_negative_cache.clear()
+
+        legacy_stats = _summary(legacy)
+        fast_stats = _summary(fast)
+        print("\nAuth check overhead per request:")
+        print(f"  legacy: avg {legacy_stats['avg']:.3f}ms, p95 {legacy_stats['p95']:.3f}ms")
+        print(f"  fast:   avg {fast_stats['avg']:.3f}ms, p95 {fast_stats['p95']:.3f}ms")
+
+        assert fast_stats["avg"] < legacy_stats["avg"]
+        assert fast_stats["p95"] < REDIS_LATENCY_MS + MONGO_LATENCY_MS
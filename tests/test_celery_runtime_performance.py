@@ -0,0 +1,79 @@
+"""
+Per-task overhead benchmark for coroutine Celery tasks.
+
+Compares the previous pattern (``asyncio.run`` per task, with a new Motor
+client and HTTP pool created and closed inside each run) against submitting
+the same short coroutine to the worker-level ``AsyncRuntime``, where the loop
+and the clients are created once per worker process.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.core.async_runtime import AsyncRuntime
+
+TASKS = 50
+MONGO_URL = "mongodb://127.0.0.1:1"
+
+
+async def _short_task(db, http_client):
+    # 짧은 태스크: 실제 I/O 없이 클라이언트 핸들만 사용
+    db["announcements"]
+    http_client.headers
+    await asyncio.sleep(0)
+    return 1
+
+
+def _per_task_us(run_one):
+    start = time.perf_counter()
+    for _ in range(TASKS):
+        run_one()
+    return (time.perf_counter() - start) / TASKS * 1_000_000
+
+
+@pytest.mark.performance
+class TestCeleryAsyncRuntimeOverhead:
+    """Per-task overhead before/after the worker async runtime"""
+
+    def test_runtime_vs_asyncio_run_per_task(self):
+        def legacy():
+            async def _run():
+                client = AsyncIOMotorClient(MONGO_URL, connect=False)
+                http_client = httpx.AsyncClient()
+                try:
+                    return await _short_task(client["bench"], http_client)
+                finally:
+                    await http_client.aclose()
+                    client.close()
+
+            return asyncio.run(_run())
+
+        runtime = AsyncRuntime(name="bench-async-runtime")
+        clients = {}
+
+        async def _init():
+            clients["db"] = AsyncIOMotorClient(MONGO_URL, connect=False)["bench"]
+            clients["http"] = httpx.AsyncClient()
+
+        def shared():
+            return runtime.run(_short_task(clients["db"], clients["http"]))
+
+        try:
+            runtime.run(_init())  # 워커 시작 시 한 번 (측정에서 제외)
+            legacy_us = _per_task_us(legacy)
+            runtime_us = _per_task_us(shared)
+        finally:
+            runtime.run(clients["http"].aclose())
+            clients["db"].client.close()
+            runtime.stop()
+
+        print("\nCoroutine task overhead:")
+        print(f"  asyncio.run + new clients per task: {legacy_us:.1f}us")
+        print(f"  worker async runtime:               {runtime_us:.1f}us")
+
+        assert runtime.tasks_run == TASKS + 2
+        assert runtime_us < legacy_us
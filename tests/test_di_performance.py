@@ -0,0 +1,74 @@
+"""
+Per-request allocation benchmark for dependency resolution.
+
+Compares the previous per-request construction (new repository, service and
+KStartupAPIClient with its retry/auth strategies) with resolution through the
+configured container, where repositories and clients are singletons and only
+batch services are request-scoped.
+"""
+
+import time
+import tracemalloc
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pymongo.database import Database
+
+from app.core.di_config import configure_dependencies
+from app.domains.announcements.batch_service import AnnouncementBatchService
+from app.domains.announcements.repository import AnnouncementRepository
+from app.domains.announcements.service import AnnouncementService
+from app.shared.clients.kstartup_api_client import KStartupAPIClient
+
+REQUESTS = 200
+
+
+def _measure(resolve):
+    """Average peak bytes and microseconds per request"""
+    peaks = []
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        resolve()
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+    return sum(peaks) / len(peaks), elapsed / REQUESTS * 1_000_000
+
+
+@pytest.mark.performance
+class TestDependencyAllocation:
+    """Allocation per request before/after container lifetimes"""
+
+    def test_container_vs_per_request_construction(self):
+        db = MagicMock(spec=Database)
+        with patch("app.core.di_config.get_database", return_value=db):
+            container = configure_dependencies()
+
+        def legacy():
+            repository = AnnouncementRepository(db)
+            AnnouncementService(repository, KStartupAPIClient())
+            AnnouncementBatchService(repository, KStartupAPIClient())
+
+        def scoped():
+            with container.scope():
+                container.resolve(AnnouncementService)
+                container.resolve(AnnouncementBatchService)
+
+        scoped()  # 싱글톤 최초 생성은 측정에서 제외
+        baseline_counts = dict(container.created_counts)
+
+        legacy_bytes, legacy_us = _measure(legacy)
+        scoped_bytes, scoped_us = _measure(scoped)
+
+        print("\nDependency resolution per request:")
+        print(f"  per-request construction: {legacy_bytes / 1024:.1f} KiB peak, {legacy_us:.1f}us")
+        print(f"  container lifetimes:      {scoped_bytes / 1024:.1f} KiB peak, {scoped_us:.1f}us")
+
+        # 요청마다 새로 만드는 것은 scoped 배치 서비스 하나뿐
+        assert container.created_counts["singleton"] == baseline_counts["singleton"]
+        assert container.created_counts["scoped"] - baseline_counts["scoped"] == REQUESTS
+        assert scoped_bytes < legacy_bytes
+        assert scoped_us < legacy_us
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import ANY, Mock, patch, AsyncMock
 from pathlib import Path
 
 from app.shared.services.email_service import EmailService, EmailTemplateEngine
@@ -177,10 +177,13 @@ class TestEmailService:
             
             assert result["success"] is True
             assert result["tracking_id"] == "track123"
-            mock_render.assert_called_once_with(
-                "email/new_announcement.html",
-                pytest.any(object)  # Context will be complex, just check it's called
-            )
+            mock_render.assert_called_once_with("email/new_announcement.html", ANY)
+            context = mock_render.call_args.args[1]
+            assert context["user_name"] == sample_user["name"]
+            assert context["announcement"] == sample_announcement
+            assert context["matched_keywords"] == ["AI", "스타트업"]
+            assert context["platform_name"] == "한국 공공데이터 플랫폼"
+            assert mock_client.send.call_args.kwargs["meta"]["tracking_id"] == "track123"
 
     @pytest.mark.asyncio
     async def test_send_deadline_reminder_urgent(
@@ -243,10 +246,13 @@ class TestEmailService:
             )
             
             assert result["success"] is True
-            mock_render.assert_called_once_with(
-                "email/digest_daily.html",
-                pytest.any(object)
-            )
+            mock_render.assert_called_once_with("email/digest_daily.html", ANY)
+            context = mock_render.call_args.args[1]
+            assert context["user_name"] == sample_user["name"]
+            assert context["new_announcements"] == new_announcements
+            assert context["deadline_announcements"] == deadline_announcements
+            assert context["stats"] == stats
+            assert mock_client.send.call_args.kwargs["subject"] == context["subject"]
 
     @pytest.mark.asyncio
     async def test_preview_template(self, email_service):
@@ -316,11 +322,11 @@ class TestEmailServiceIntegration:
             )
             
             # Check that default context variables were added
-            call_args = mock_render.call_args[1]  # Get context argument
-            assert "current_date" in call_args
-            assert "platform_name" in call_args
-            assert "custom_var" in call_args
-            assert call_args["custom_var"] == "value"
+            mock_render.assert_called_once_with("email/test.html", ANY)
+            context = mock_render.call_args.args[1]
+            assert "current_date" in context
+            assert "platform_name" in context
+            assert context["custom_var"] == "value"
 
     @pytest.mark.asyncio
     async def test_multipart_email_creation(self, email_service):
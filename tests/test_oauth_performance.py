@@ -0,0 +1,108 @@
+"""
+Google OAuth login latency benchmark.
+
+Compares the previous callback flow (a new HTTP client per call, so every
+token and userinfo request pays a fresh connection, plus a userinfo round
+trip) with the pooled client that verifies the ID token locally against the
+cached JWKS. Google is simulated with fixed round-trip and connection-setup
+latencies so the numbers reflect the number of network hops.
+"""
+
+import asyncio
+import statistics
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from app.domains.users.models import AuthProvider
+from app.domains.users.service import UserService
+from app.shared.clients.google_oauth_client import DEFAULT_ENDPOINTS, GoogleOAuthClient
+from tests.unit.test_google_oauth_client import CLIENT_ID, FakeGoogle, make_id_token
+
+# 네트워크 지연 흉내 (ms): 요청 왕복 / 새 연결(TCP+TLS) 수립
+RTT_MS = 5.0
+CONNECT_MS = 10.0
+ITERATIONS = 40
+
+
+class _LatencyTransport(httpx.AsyncBaseTransport):
+    """First request on a transport pays connection setup, every request pays RTT."""
+
+    def __init__(self, fake: FakeGoogle):
+        self.fake = fake
+        self.connected = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay = RTT_MS if self.connected else RTT_MS + CONNECT_MS
+        self.connected = True
+        await asyncio.sleep(delay / 1000)
+        return self.fake.handler(request)
+
+
+def _summary(samples):
+    return {
+        "avg": statistics.mean(samples),
+        "p95": statistics.quantiles(samples, n=20)[18],
+    }
+
+
+def _existing_user():
+    return Mock(id="user-1", email="user@example.com", provider=AuthProvider.GOOGLE, is_active=True)
+
+
+@pytest.mark.performance
+class TestGoogleLoginLatency:
+    """Callback latency before/after pooling and local ID token verification"""
+
+    async def test_login_p95(self):
+        fake = FakeGoogle(id_token=make_id_token())
+
+        # Legacy: 호출마다 새 AsyncClient (token + userinfo, 각각 새 연결)
+        async def legacy_exchange():
+            async with httpx.AsyncClient(transport=_LatencyTransport(fake)) as client:
+                tokens = (await client.post(DEFAULT_ENDPOINTS["token_endpoint"], data={"code": "c"})).json()
+            async with httpx.AsyncClient(transport=_LatencyTransport(fake)) as client:
+                headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+                (await client.get(DEFAULT_ENDPOINTS["userinfo_endpoint"], headers=headers)).json()
+
+        legacy = []
+        for _ in range(ITERATIONS):
+            start = time.perf_counter()
+            await legacy_exchange()
+            legacy.append((time.perf_counter() - start) * 1000)
+
+        oauth_client = GoogleOAuthClient()
+        oauth_client.client_id = CLIENT_ID
+        shared = httpx.AsyncClient(transport=_LatencyTransport(fake))
+        repository = Mock()
+        repository.get_by_provider_and_external_id.return_value = _existing_user()
+
+        fast = []
+        with patch("app.shared.clients.google_oauth_client.get_http_client", return_value=shared), \
+                patch("app.shared.clients.google_oauth_client.security.get_oauth_state_async",
+                      AsyncMock(return_value={"redirect_url": "http://localhost/cb"})), \
+                patch("app.domains.users.service.google_oauth_client", oauth_client), \
+                patch.object(UserService, "_update_google_user_info", AsyncMock(side_effect=lambda user, info: user)), \
+                patch.object(UserService, "_to_user_response", Mock(return_value=None)), \
+                patch("app.domains.users.service.TokenResponse", Mock()):
+            await oauth_client.warm_cache()  # lifespan warm-up 과 동일
+            userinfo_before = fake.count("/userinfo")
+            service = UserService(user_repository=repository)
+            for _ in range(ITERATIONS):
+                start = time.perf_counter()
+                await service.google_oauth_login("code", "state")
+                fast.append((time.perf_counter() - start) * 1000)
+        await shared.aclose()
+
+        legacy_stats = _summary(legacy)
+        fast_stats = _summary(fast)
+        print("\nGoogle OAuth callback latency:")
+        print(f"  legacy (client per call + userinfo): avg {legacy_stats['avg']:.2f}ms, p95 {legacy_stats['p95']:.2f}ms")
+        print(f"  pooled + local ID token:             avg {fast_stats['avg']:.2f}ms, p95 {fast_stats['p95']:.2f}ms")
+
+        assert fake.count("/userinfo") == userinfo_before
+        assert fast_stats["p95"] < legacy_stats["p95"]
+        # token 교환 1회 왕복만 네트워크를 탄다
+        assert fast_stats["p95"] < 2 * RTT_MS + CONNECT_MS
@@ -0,0 +1,96 @@
+"""
+Startup budget tests.
+
+각 테스트는 새 인터프리터에서 ``import app.main`` 을 실행하여 캐시된
+sys.modules 의 영향 없이 콜드 스타트 비용과 import 그래프를 검증합니다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# CI 머신 편차를 고려해 환경 변수로 조정 가능
+STARTUP_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", "8.0"))
+
+
+# 결과는 stdout 대신 임시 파일로 전달 (QueueListener 스레드의 콘솔 로그와 섞이지 않도록)
+_PRELUDE = (
+    "import json as _json, os as _os\n"
+    "def emit(result):\n"
+    "    with open(_os.environ['STARTUP_RESULT_PATH'], 'w') as f:\n"
+    "        _json.dump(result, f)\n"
+)
+
+
+def _run(code: str, **env_overrides: str) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        result_path = os.path.join(tmp, "result.json")
+        env = dict(os.environ)
+        env.setdefault("PUBLIC_DATA_API_KEY", "startup-test-key")
+        env.update(env_overrides)
+        env["STARTUP_RESULT_PATH"] = result_path
+        proc = subprocess.run(
+            [sys.executable, "-c", _PRELUDE + code], cwd=ROOT, env=env,
+            capture_output=True, text=True, timeout=120,
+        )
+        assert proc.returncode == 0, proc.stderr[-2000:]
+        with open(result_path) as f:
+            return json.load(f)
+
+
+@pytest.mark.performance
+class TestStartupBudget:
+    """Cold import budget and lazy loading"""
+
+    def test_import_within_budget(self):
+        result = _run(
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            "import app.main\n"
+            "emit({'seconds': time.perf_counter() - start,"
+            " 'routes': len(app.main.app.routes)})\n"
+        )
+
+        print(f"\nimport app.main: {result['seconds']:.2f}s, {result['routes']} routes")
+        assert result["seconds"] < STARTUP_BUDGET_SECONDS
+
+    def test_heavy_modules_not_imported(self):
+        result = _run(
+            "import sys\n"
+            "import app.main\n"
+            "emit({m: m in sys.modules for m in ("
+            "'jinja2', 'app.shared.services.email_service',"
+            " 'app.shared.clients.google_oauth_client')})\n"
+        )
+
+        assert not any(result.values()), result
+
+    def test_disabled_routers_not_imported(self):
+        result = _run(
+            "import sys\n"
+            "import app.main\n"
+            "emit({m: m in sys.modules for m in ("
+            "'app.domains.announcements.router', 'app.domains.alerts.versioned_router',"
+            " 'app.scheduler.task_management_api', 'app.shared.classification.router')})\n",
+            ENABLED_ROUTERS='["announcements"]',
+        )
+
+        assert result.pop("app.domains.announcements.router")
+        assert not any(result.values()), result
+
+    def test_no_redis_round_trip_at_import(self):
+        result = _run(
+            "import redis\n"
+            "calls = []\n"
+            "redis.Redis.ping = lambda self, **kw: calls.append(1) or True\n"
+            "import app.main\n"
+            "emit({'pings': len(calls)})\n"
+        )
+
+        assert result["pings"] == 0
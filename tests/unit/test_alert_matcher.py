@@ -0,0 +1,121 @@
+"""
+Unit tests for the percolator-style alert subscription matcher.
+"""
+
+from datetime import datetime
+
+from app.domains.alerts.matcher import SubscriptionMatcher, document_text, tokenize
+
+
+def _announcement(title, content="", **fields):
+    return {
+        "_id": fields.pop("_id", "a1"),
+        "announcement_data": {"title": title, "content": content, "business_name": ""},
+        **fields,
+    }
+
+
+def _sub(sub_id, keywords, threshold=0.5, **filters):
+    return {
+        "_id": sub_id,
+        "user_id": f"user-{sub_id}",
+        "keywords": keywords,
+        "filters": filters,
+        "match_threshold": threshold,
+    }
+
+
+class TestTokenize:
+    """Test text extraction and tokenization."""
+
+    def test_tokenizes_korean_and_english(self):
+        assert tokenize("AI 창업 지원, Startup!") == ["ai", "창업", "지원", "startup"]
+
+    def test_uses_text_indexed_fields_for_announcements(self):
+        doc = _announcement("창업 지원", "내용", status="모집중")
+
+        assert document_text("announcements", doc) == "창업 지원 내용 "
+
+    def test_uses_all_strings_for_wildcard_domains(self):
+        doc = {"title": "통계", "nested": {"tags": ["ai", 3]}}
+
+        assert document_text("statistics", doc) == "통계 ai"
+
+
+class TestSubscriptionMatcher:
+    """Test candidate generation and scoring."""
+
+    def test_matches_only_subscriptions_sharing_a_term(self):
+        matcher = SubscriptionMatcher("announcements", [
+            _sub("s1", ["ai"]),
+            _sub("s2", ["bio"]),
+        ])
+
+        candidates = matcher.match(_announcement("AI 바우처 지원사업"))
+
+        assert [c.subscription["_id"] for c in candidates] == ["s1"]
+        assert candidates[0].user_id == "user-s1"
+        assert candidates[0].score == 1.0
+
+    def test_score_is_fraction_of_keywords_and_respects_threshold(self):
+        matcher = SubscriptionMatcher("announcements", [
+            _sub("loose", ["ai", "bio"], threshold=0.5),
+            _sub("strict", ["ai", "bio"], threshold=0.9),
+        ])
+
+        candidates = matcher.match(_announcement("AI 지원"))
+
+        assert [(c.subscription["_id"], c.score) for c in candidates] == [("loose", 0.5)]
+
+    def test_multiword_keywords_match_as_phrases(self):
+        matcher = SubscriptionMatcher("announcements", [_sub("s1", ["청년 창업"])])
+
+        assert matcher.match(_announcement("청년 창업 지원"))
+        assert not matcher.match(_announcement("창업 청년 지원"))
+
+    def test_filters_use_in_semantics(self):
+        matcher = SubscriptionMatcher("announcements", [
+            _sub("s1", ["ai"], categories=["기술"], regions=["서울"]),
+        ])
+
+        assert matcher.match(_announcement("AI", category="기술", region=["서울", "경기"]))
+        assert not matcher.match(_announcement("AI", category="교육", region="서울"))
+
+    def test_filter_only_subscriptions_are_indexed_by_filter_value(self):
+        matcher = SubscriptionMatcher("announcements", [_sub("s1", [], statuses=["모집중"])])
+
+        assert matcher.match(_announcement("아무 제목", status="모집중"))[0].score == 1.0
+        assert not matcher.match(_announcement("아무 제목", status="마감"))
+
+    def test_date_range_filter(self):
+        matcher = SubscriptionMatcher("announcements", [
+            _sub("s1", ["ai"], start_date_from=datetime(2024, 1, 1)),
+        ])
+
+        assert matcher.match(_announcement("AI", published_at=datetime(2024, 2, 1)))
+        assert not matcher.match(_announcement("AI", published_at=datetime(2023, 12, 1)))
+        assert not matcher.match(_announcement("AI"))
+
+    def test_domain_filter_compares_collection_name(self):
+        matcher = SubscriptionMatcher("announcements", [
+            _sub("s1", ["ai"], domain="contents"),
+            _sub("s2", ["ai"], domain="announcements"),
+        ])
+
+        assert [c.subscription["_id"] for c in matcher.match(_announcement("AI"))] == ["s2"]
+
+    def test_subscriptions_without_keywords_or_filters_are_skipped(self):
+        matcher = SubscriptionMatcher("announcements", [_sub("s1", [])])
+
+        assert len(matcher) == 0
+        assert matcher.match(_announcement("AI")) == []
+
+    def test_match_many_streams_documents_once(self):
+        matcher = SubscriptionMatcher("announcements", [_sub(f"s{i}", [f"kw{i}"]) for i in range(1000)])
+        docs = [_announcement(f"kw{i} 공고", _id=f"a{i}") for i in range(0, 1000, 100)]
+
+        candidates = list(matcher.match_many(docs))
+
+        assert [(c.document["_id"], c.subscription["_id"]) for c in candidates] == [
+            (f"a{i}", f"s{i}") for i in range(0, 1000, 100)
+        ]
@@ -0,0 +1,89 @@
+"""
+Unit tests for the worker-level asyncio runtime used by Celery tasks.
+"""
+
+import asyncio
+import concurrent.futures
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.async_runtime import AsyncRuntime
+
+
+@pytest.fixture
+def runtime():
+    rt = AsyncRuntime(name="test-async-runtime", shutdown_timeout=2.0)
+    yield rt
+    rt.stop()
+
+
+class TestAsyncRuntime:
+    """Test loop reuse, cancellation and shutdown."""
+
+    def test_runs_every_task_on_the_same_loop(self, runtime):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = runtime.run(current_loop())
+        second = runtime.run(current_loop())
+
+        assert first is second is runtime.loop
+        assert runtime.tasks_run == 2
+
+    def test_propagates_task_exceptions(self, runtime):
+        async def boom():
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            runtime.run(boom())
+        assert runtime.running
+
+    def test_timeout_cancels_the_coroutine(self, runtime):
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(concurrent.futures.TimeoutError):
+            runtime.run(slow(), timeout=0.05)
+
+        assert runtime.run(asyncio.wait_for(cancelled.wait(), 1.0)) is True
+
+    def test_restarts_after_fork(self, runtime):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        parent_loop = runtime.run(current_loop())
+        with patch("app.core.async_runtime.os.getpid", return_value=-1):
+            assert not runtime.running
+            child_loop = runtime.run(current_loop())
+
+        assert child_loop is not parent_loop
+
+    def test_rejects_nested_run_from_runtime_loop(self, runtime):
+        async def nested():
+            coro = asyncio.sleep(0)
+            try:
+                runtime.run(coro)
+            finally:
+                coro.close()
+
+        with pytest.raises(RuntimeError):
+            runtime.run(nested())
+
+    def test_stop_closes_loop_bound_clients(self, runtime):
+        runtime.run(asyncio.sleep(0))
+        db_manager = runtime._db_manager
+        db_manager.close_async_connection = AsyncMock()
+
+        with patch("app.core.async_runtime.close_http_client", AsyncMock()) as close_http:
+            runtime.stop()
+
+        db_manager.close_async_connection.assert_awaited_once()
+        close_http.assert_awaited_once()
+        assert runtime.loop is None
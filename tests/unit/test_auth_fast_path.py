@@ -0,0 +1,164 @@
+"""
+Unit tests for the authentication fast path.
+
+Covers single-decode verification, the async blacklist lookup with its local
+negative cache, and the (sub, iat) authenticated user cache.
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.security import (
+    SecurityManager,
+    blacklist_negative_cache,
+    create_access_token,
+    create_refresh_token,
+)
+from app.domains.users.auth_cache import AuthUserCache
+from app.domains.users.service import UserService
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    blacklist_negative_cache.clear()
+    yield
+    blacklist_negative_cache.clear()
+
+
+@pytest.fixture
+def async_redis():
+    client = Mock()
+    client.exists = AsyncMock(return_value=0)
+    with patch("app.core.security.get_async_redis_client", return_value=client):
+        yield client
+
+
+class TestVerifyTokenAsync:
+    """Test the request-path token verification."""
+
+    async def test_decodes_once(self, async_redis):
+        manager = SecurityManager()
+        token = create_access_token({"sub": "u1"})
+
+        with patch("app.core.security.jwt.decode", wraps=__import__("jose").jwt.decode) as decode:
+            payload = await manager.verify_token_async(token)
+
+        assert payload["sub"] == "u1"
+        assert decode.call_count == 1
+
+    async def test_negative_cache_skips_redis(self, async_redis):
+        manager = SecurityManager()
+        token = create_access_token({"sub": "u1"})
+
+        await manager.verify_token_async(token)
+        await manager.verify_token_async(token)
+
+        assert async_redis.exists.await_count == 1
+
+    async def test_blacklisted_token_rejected(self, async_redis):
+        async_redis.exists.return_value = 1
+        token = create_access_token({"sub": "u1"})
+
+        assert await SecurityManager().verify_token_async(token) is None
+
+    async def test_local_blacklist_evicts_negative_entry(self, async_redis):
+        manager = SecurityManager()
+        token = create_access_token({"sub": "u1"})
+        await manager.verify_token_async(token)
+
+        with patch("app.core.security.redis_client"):
+            assert manager.blacklist_token(token)
+        async_redis.exists.return_value = 1
+
+        assert await manager.verify_token_async(token) is None
+
+    async def test_redis_failure_fails_open(self, async_redis):
+        async_redis.exists.side_effect = ConnectionError("down")
+        token = create_access_token({"sub": "u1"})
+
+        assert await SecurityManager().verify_token_async(token) is not None
+
+    async def test_invalid_token_skips_redis(self, async_redis):
+        assert await SecurityManager().verify_token_async("invalid.jwt.token") is None
+        async_redis.exists.assert_not_awaited()
+
+
+class TestAuthUserCache:
+    """Test the (sub, iat) user cache."""
+
+    def test_keyed_on_sub_and_iat(self):
+        cache = AuthUserCache(ttl_seconds=30)
+        user = Mock()
+        cache.set("u1", 100, user)
+
+        assert cache.get("u1", 100) is user
+        assert cache.get("u1", 101) is None
+
+    def test_invalidate_drops_all_tokens_for_user(self):
+        cache = AuthUserCache(ttl_seconds=30)
+        cache.set("u1", 100, Mock())
+        cache.set("u1", 200, Mock())
+        cache.set("u2", 100, Mock())
+
+        cache.invalidate("u1")
+
+        assert cache.get("u1", 100) is None
+        assert cache.get("u1", 200) is None
+        assert cache.get("u2", 100) is not None
+
+    def test_expiry(self):
+        cache = AuthUserCache(ttl_seconds=30)
+        cache.set("u1", 100, Mock())
+
+        with patch("app.domains.users.auth_cache.time.monotonic", return_value=10 ** 9):
+            assert cache.get("u1", 100) is None
+        assert len(cache) == 0
+
+    def test_bounded_size(self):
+        cache = AuthUserCache(ttl_seconds=30, max_entries=2)
+        for i in range(3):
+            cache.set(f"u{i}", 1, Mock())
+
+        assert len(cache) == 2
+        assert cache.get("u0", 1) is None
+
+
+class TestGetCurrentUser:
+    """Test UserService.get_current_user with the caches."""
+
+    @pytest.fixture
+    def service(self):
+        repository = Mock()
+        repository.get_by_id.return_value = Mock(id="u1", is_active=True)
+        with patch("app.domains.users.service.auth_user_cache", AuthUserCache(ttl_seconds=30)):
+            yield UserService(user_repository=repository)
+
+    async def test_user_lookup_is_cached(self, service, async_redis):
+        token = create_access_token({"sub": "u1"})
+
+        first = await service.get_current_user(token)
+        second = await service.get_current_user(token)
+
+        assert first is second
+        assert service.user_repository.get_by_id.call_count == 1
+
+    async def test_profile_update_invalidates(self, service, async_redis):
+        token = create_access_token({"sub": "u1"})
+        await service.get_current_user(token)
+
+        service.user_repository.update_user.return_value = None
+        with pytest.raises(HTTPException):
+            await service.update_user_profile("u1", Mock())
+        await service.get_current_user(token)
+
+        assert service.user_repository.get_by_id.call_count == 2
+
+    async def test_rejects_refresh_token(self, service, async_redis):
+        token = create_refresh_token({"sub": "u1"})
+
+        with pytest.raises(HTTPException) as exc:
+            await service.get_current_user(token)
+
+        assert exc.value.status_code == 401
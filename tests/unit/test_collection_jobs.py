@@ -0,0 +1,320 @@
+"""
+Unit tests for checkpointed, lease-based bulk collection jobs.
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from app.core.distributed_lock import LeaseLost
+from app.domains.announcements.batch_service import AnnouncementBatchService
+from app.shared.jobs import CHUNKS_COLLECTION, JOBS_COLLECTION, CollectionJobStore, JobProgress, PageChunk
+
+
+def _store(jobs=None, chunks=None):
+    collections = {JOBS_COLLECTION: jobs or MagicMock(), CHUNKS_COLLECTION: chunks or MagicMock()}
+    db = MagicMock()
+    db.__getitem__.side_effect = collections.__getitem__
+    return CollectionJobStore(db, lease_seconds=60), collections
+
+
+class _MemoryJobStore:
+    """In-memory stand-in with the same claim / complete semantics"""
+
+    def __init__(self):
+        self.chunks = {}
+        self.last_page = None
+        self.completed = False
+
+    def ensure_job(self, job_id, kind, first_page, last_page, chunk_pages=None, params=None):
+        if self.last_page is None:
+            self.last_page = last_page
+            for start in range(first_page, last_page + 1, chunk_pages):
+                self.chunks[start] = {"end": min(start + chunk_pages - 1, last_page), "status": "pending", "token": None}
+        return {"_id": job_id, "first_page": first_page, "last_page": self.last_page}
+
+    def claim(self, job_id, worker_id=None):
+        for start, chunk in sorted(self.chunks.items()):
+            if chunk["status"] == "pending":
+                chunk.update(status="leased", token=f"{worker_id}:{start}")
+                return PageChunk(job_id=job_id, start=start, end=chunk["end"], lease_token=chunk["token"])
+        return None
+
+    def complete(self, chunk, counters=None):
+        self.chunks[chunk.start]["status"] = "done"
+        return True
+
+    def release(self, chunk, error=None):
+        self.chunks[chunk.start]["status"] = "pending"
+        return True
+
+    def progress(self, job_id):
+        done = [s for s, c in self.chunks.items() if c["status"] == "done"]
+        return JobProgress(
+            job_id=job_id, status="running", total_chunks=len(self.chunks), done_chunks=len(done),
+            pages_done=sum(self.chunks[s]["end"] - s + 1 for s in done), total_pages=self.last_page,
+        )
+
+    def finish_if_done(self, job_id):
+        self.completed = all(c["status"] == "done" for c in self.chunks.values())
+        return self.completed
+
+
+def _batch_service(store, pages_seen):
+    api_client = Mock()
+    api_client.async_get_announcement_information = AsyncMock(return_value=Mock(success=True))
+    service = AnnouncementBatchService(Mock(), api_client, job_store=store)
+
+    async def process_page(semaphore, page, *args):
+        pages_seen.append(page)
+        return 100, 10, 90, []
+
+    service._process_single_page = process_page
+    return service
+
+
+class TestCollectionJobStore:
+    """Test job creation, lease claims, fencing and progress."""
+
+    def test_ensure_job_splits_page_range_into_chunks(self):
+        jobs = MagicMock()
+        jobs.find_one.return_value = {"_id": "job-1", "first_page": 1, "last_page": 45}
+        store, collections = _store(jobs=jobs)
+
+        store.ensure_job("job-1", "test", first_page=1, last_page=45, chunk_pages=20)
+
+        ops = collections[CHUNKS_COLLECTION].bulk_write.call_args[0][0]
+        bounds = [(op._doc["$setOnInsert"]["start"], op._doc["$setOnInsert"]["end"]) for op in ops]
+        assert bounds == [(1, 20), (21, 40), (41, 45)]
+        assert all(op._upsert for op in ops)
+
+    def test_resumed_job_keeps_its_original_page_range(self):
+        jobs = MagicMock()
+        jobs.find_one.return_value = {"_id": "job-1", "first_page": 1, "last_page": 10}
+        store, collections = _store(jobs=jobs)
+
+        job = store.ensure_job("job-1", "test", first_page=1, last_page=300, chunk_pages=20)
+
+        assert job["last_page"] == 10
+        assert len(collections[CHUNKS_COLLECTION].bulk_write.call_args[0][0]) == 1
+
+    def test_open_ended_job_is_a_single_chunk(self):
+        jobs = MagicMock()
+        jobs.find_one.return_value = {"_id": "job-1", "first_page": 5, "last_page": None}
+        store, collections = _store(jobs=jobs)
+
+        store.ensure_job("job-1", "test", first_page=5, last_page=None)
+
+        [op] = collections[CHUNKS_COLLECTION].bulk_write.call_args[0][0]
+        assert (op._doc["$setOnInsert"]["start"], op._doc["$setOnInsert"]["end"]) == (5, None)
+
+    def test_claim_takes_pending_or_expired_leases_in_page_order(self):
+        chunks = MagicMock()
+        chunks.find_one_and_update.return_value = {
+            "job_id": "job-1", "start": 21, "end": 40, "lease_token": "t1", "cursor": 30, "attempts": 2,
+        }
+        store, _ = _store(chunks=chunks)
+
+        chunk = store.claim("job-1", "worker-a")
+
+        query, update = chunks.find_one_and_update.call_args[0]
+        kwargs = chunks.find_one_and_update.call_args[1]
+        assert {"status": "pending"} in query["$or"]
+        assert query["$or"][1]["lease_expires_at"]["$lt"] <= datetime.utcnow()
+        assert update["$set"]["lease_owner"] == "worker-a"
+        assert kwargs["sort"] == [("start", 1)]
+        assert chunk.next_page == 31
+
+    def test_claim_returns_none_when_nothing_is_left(self):
+        chunks = MagicMock()
+        chunks.find_one_and_update.return_value = None
+        store, _ = _store(chunks=chunks)
+
+        assert store.claim("job-1") is None
+
+    def test_checkpoint_is_fenced_by_lease_token(self):
+        chunks = MagicMock()
+        chunks.update_one.return_value = Mock(modified_count=1)
+        store, _ = _store(chunks=chunks)
+        chunk = PageChunk(job_id="job-1", start=1, end=None, lease_token="t1")
+
+        assert store.checkpoint(chunk, 3, {"total_fetched": 100, "api_errors": 0})
+
+        query, update = chunks.update_one.call_args[0]
+        assert query == {"_id": "job-1:1", "lease_token": "t1", "status": "leased"}
+        assert update["$set"]["cursor"] == 3
+        assert update["$inc"] == {"counters.total_fetched": 100}
+        assert (chunk.cursor, chunk.next_page, chunk.counters["total_fetched"]) == (3, 4, 100)
+
+    def test_checkpoint_after_lost_lease_is_rejected(self):
+        chunks = MagicMock()
+        chunks.update_one.return_value = Mock(modified_count=0)
+        store, _ = _store(chunks=chunks)
+        chunk = PageChunk(job_id="job-1", start=1, end=None, lease_token="stale")
+
+        assert not store.checkpoint(chunk, 3)
+        assert chunk.cursor is None
+
+    def test_progress_sums_chunks_and_counters(self):
+        jobs, chunks = MagicMock(), MagicMock()
+        jobs.find_one.return_value = {"status": "running", "first_page": 1, "last_page": 60}
+        chunks.find.return_value = [
+            {"status": "done", "start": 1, "end": 20, "cursor": 20, "counters": {"new": 5}},
+            {"status": "leased", "start": 21, "end": 40, "cursor": 25, "counters": {"new": 2}},
+            {"status": "pending", "start": 41, "end": 60, "cursor": None, "counters": {}},
+        ]
+        store, _ = _store(jobs=jobs, chunks=chunks)
+
+        progress = store.progress("job-1")
+
+        assert (progress.done_chunks, progress.leased_chunks, progress.pages_done) == (1, 1, 25)
+        assert progress.counters == {"new": 7}
+        assert progress.to_dict()["fraction_done"] == round(25 / 60, 4)
+
+
+class TestResumableBatchCollection:
+    """Test that bulk collection resumes and splits work through the job store."""
+
+    async def test_rerun_with_same_job_skips_completed_ranges(self):
+        store = _MemoryJobStore()
+        store.ensure_job("job-1", "test", 1, 60, chunk_pages=20)
+        store.chunks[1]["status"] = "done"
+        pages = []
+        service = _batch_service(store, pages)
+
+        result = await service.collect_all_announcements(max_pages=60, job_id="job-1")
+
+        assert pages == list(range(21, 61))
+        assert result.resumed_pages == 20
+        assert result.job_id == "job-1"
+        assert store.completed
+
+    async def test_workers_sharing_a_job_never_process_the_same_page(self):
+        store = _MemoryJobStore()
+        pages_a, pages_b = [], []
+        worker_a = _batch_service(store, pages_a)
+        worker_b = _batch_service(store, pages_b)
+
+        # 첫 구간을 처리하는 동안 두 번째 워커가 나머지 구간을 가져감
+        original = worker_a._process_single_page
+
+        async def interleave(semaphore, page, *args):
+            if page == 1:
+                await worker_b.collect_all_announcements(max_pages=60, job_id="job-1", worker_id="b")
+            return await original(semaphore, page, *args)
+
+        worker_a._process_single_page = interleave
+        await worker_a.collect_all_announcements(max_pages=60, job_id="job-1", worker_id="a")
+
+        assert sorted(pages_a + pages_b) == list(range(1, 61))
+        assert not set(pages_a) & set(pages_b)
+        assert store.completed
+
+    async def test_cancelled_range_is_released(self):
+        store = _MemoryJobStore()
+        service = _batch_service(store, [])
+        started = asyncio.Event()
+
+        async def slow_page(*args):
+            started.set()
+            await asyncio.sleep(10)
+
+        service._process_single_page = slow_page
+        task = asyncio.create_task(service.collect_all_announcements(max_pages=20, job_id="job-1"))
+        await started.wait()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert store.chunks[1]["status"] == "pending"
+
+    async def test_lost_lease_releases_the_range_without_completing_it(self):
+        store = _MemoryJobStore()
+        service = _batch_service(store, [])
+        lease = Mock(ensure_current=Mock(side_effect=LeaseLost("announcements.collect", 3)))
+
+        result = await service.collect_all_announcements(max_pages=40, job_id="job-1", lease=lease)
+
+        assert result.error_items == 1 and not result.job_completed
+        assert all(chunk["status"] == "pending" for chunk in store.chunks.values())
+
+
+class TestComprehensiveFetchCheckpoints:
+    """Test the sequential fetch task resuming after its last checkpoint."""
+
+    async def test_resumes_after_last_checkpointed_page(self):
+        from app.domains.announcements import tasks
+
+        chunk = PageChunk(job_id="job-1", start=1, end=None, lease_token="t1", cursor=4,
+                          counters={"pages_processed": 4, "total_fetched": 400})
+        store = Mock(claim=Mock(return_value=chunk), checkpoint=Mock(return_value=True), complete=Mock(return_value=True))
+        service = Mock(
+            fetch_and_save_announcements=AsyncMock(side_effect=[[{"announcement_id": "a"}], [], [], []]),
+            get_by_announcement_id=AsyncMock(return_value=None),
+        )
+
+        with patch.object(tasks, "get_database"), \
+                patch.object(tasks, "CollectionJobStore", return_value=store), \
+                patch.object(tasks, "AnnouncementService", return_value=service), \
+                patch.object(tasks.asyncio, "sleep", AsyncMock()):
+            stats = await tasks._fetch_announcements_async(1, None, False, job_id="job-1")
+
+        pages = [c.kwargs["page_no"] for c in service.fetch_and_save_announcements.call_args_list]
+        assert pages == [5, 6, 7, 8]
+        assert [c.args[1] for c in store.checkpoint.call_args_list] == [5, 6, 7, 8]
+        assert store.checkpoint.call_args_list[0].args[2]["total_fetched"] == 1
+        assert (stats["pages_processed"], stats["total_fetched"]) == (5, 401)
+        store.complete.assert_called_once_with(chunk)
+
+    async def test_stops_before_writing_once_the_lease_is_lost(self):
+        from app.domains.announcements import tasks
+
+        chunk = PageChunk(job_id="job-1", start=1, end=None, lease_token="t1", cursor=0)
+        store = Mock(claim=Mock(return_value=chunk), checkpoint=Mock(return_value=True))
+        service = Mock(
+            fetch_and_save_announcements=AsyncMock(return_value=[{"announcement_id": "a"}]),
+            get_by_announcement_id=AsyncMock(return_value=None),
+        )
+        lease = Mock(ensure_current=Mock(side_effect=[None, LeaseLost("announcements.collect", 3)]))
+
+        with patch.object(tasks, "get_database"), \
+                patch.object(tasks, "CollectionJobStore", return_value=store), \
+                patch.object(tasks, "AnnouncementService", return_value=service), \
+                patch.object(tasks.asyncio, "sleep", AsyncMock()):
+            with pytest.raises(LeaseLost):
+                await tasks._fetch_announcements_async(1, None, False, job_id="job-1", lease=lease)
+
+        store.checkpoint.assert_not_called()
+        store.release.assert_called_once()
+
+
+class TestPageEvents:
+    """Test that created-announcement events are published off the event loop."""
+
+    async def test_events_are_published_from_a_worker_thread(self):
+        import threading
+
+        from app.domains.announcements import batch_service
+        from app.shared.models.kstartup import AnnouncementItem
+
+        item = AnnouncementItem(pbanc_sn="174001", biz_pbanc_nm="창업 지원사업")
+        api_client = Mock()
+        api_client.async_get_announcement_information = AsyncMock(
+            return_value=Mock(success=True, data=Mock(data=[item]))
+        )
+        repository = Mock(check_duplicate=Mock(return_value=False), create_many=AsyncMock(return_value=["created"]))
+        service = AnnouncementBatchService(repository, api_client, job_store=_MemoryJobStore())
+        publish_threads = []
+
+        def publish(items):
+            publish_threads.append(threading.get_ident())
+            return len(items)
+
+        with patch.object(batch_service, "publish_announcements_created", side_effect=publish) as publish_mock:
+            processed, new_items, duplicates, errors = await service._process_single_page(asyncio.Semaphore(1), 1)
+
+        assert (processed, new_items, duplicates, errors) == (1, 1, 0, [])
+        publish_mock.assert_called_once_with(["created"])
+        assert publish_threads and publish_threads[0] != threading.get_ident()
@@ -0,0 +1,150 @@
+"""
+Unit tests for response compression.
+
+Covers Accept-Encoding negotiation, size-tuned levels, the compression
+middleware and passthrough of precompressed bodies.
+"""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import (
+    AVAILABLE_ENCODINGS,
+    CompressionMiddleware,
+    compress,
+    compression_level,
+    negotiate_encoding,
+)
+from app.core.middleware import ResponseValidationMiddleware
+from app.shared.responses import raw_json_response
+
+
+class TestNegotiation:
+    """Test Accept-Encoding parsing."""
+
+    def test_no_header_means_identity(self):
+        assert negotiate_encoding(None) is None
+        assert negotiate_encoding("") is None
+
+    def test_server_preference_on_ties(self):
+        assert negotiate_encoding("gzip, br, zstd", ("br", "zstd", "gzip")) == "br"
+        assert negotiate_encoding("gzip, zstd", ("br", "zstd", "gzip")) == "zstd"
+
+    def test_q_values(self):
+        assert negotiate_encoding("br;q=0.5, gzip", ("br", "gzip")) == "gzip"
+        assert negotiate_encoding("gzip;q=0", ("gzip",)) is None
+
+    def test_wildcard(self):
+        assert negotiate_encoding("*", ("gzip",)) == "gzip"
+        assert negotiate_encoding("*, gzip;q=0", ("br", "gzip")) == "br"
+
+    def test_unavailable_encoding_ignored(self):
+        assert negotiate_encoding("br", ("gzip",)) is None
+
+
+class TestLevels:
+    """Test size-tuned compression levels."""
+
+    def test_large_bodies_use_faster_level(self):
+        assert compression_level("gzip", 1024) > compression_level("gzip", 1024 * 1024)
+
+    def test_precompress_uses_high_level(self):
+        assert compression_level("gzip", 1024 * 1024, precompress=True) == 9
+
+    def test_gzip_roundtrip(self):
+        body = b'{"items": []}' * 100
+        assert gzip.decompress(compress(body, "gzip")) == body
+
+
+class TestCompressionMiddleware:
+    """Test middleware behaviour end to end."""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, minimum_size=500, encodings=["gzip"])
+
+        @app.get("/big")
+        def big():
+            return PlainTextResponse("x" * 2000)
+
+        @app.get("/small")
+        def small():
+            return PlainTextResponse("x" * 10)
+
+        @app.get("/precompressed")
+        def precompressed():
+            return raw_json_response(compress(b'{"ok": "' + b"y" * 1000 + b'"}', "gzip"), content_encoding="gzip")
+
+        @app.get("/stream")
+        def stream():
+            return StreamingResponse(iter([b"a" * 600, b"b" * 600]), media_type="text/plain")
+
+        @app.get("/sse")
+        def sse():
+            return StreamingResponse(iter([b"data: 1\n\n"]), media_type="text/event-stream")
+
+        return TestClient(app)
+
+    def test_compresses_large_bodies(self, client):
+        response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.text == "x" * 2000
+
+    def test_skips_small_bodies(self, client):
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_skips_without_accept_encoding(self, client):
+        response = client.get("/big", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_precompressed_body_passes_through(self, client):
+        response = client.get("/precompressed", headers={"Accept-Encoding": "gzip"})
+
+        # Decodes with a single gunzip - not compressed twice
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json() == {"ok": "y" * 1000}
+
+    def test_streaming_response(self, client):
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == "a" * 600 + "b" * 600
+
+    def test_event_stream_not_compressed(self, client):
+        response = client.get("/sse", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+
+
+class TestResponseValidationPassthrough:
+    """Test precompressed bodies through the app's middleware stack order."""
+
+    def test_precompressed_api_body_is_not_decoded(self):
+        app = FastAPI()
+        app.add_middleware(ResponseValidationMiddleware)
+        app.add_middleware(CompressionMiddleware, minimum_size=500, encodings=["gzip"])
+
+        @app.get("/api/v1/items")
+        def items():
+            body = b'{"success": true, "message": "ok", "data": "' + b"y" * 1000 + b'"}'
+            return raw_json_response(compress(body, "gzip"), content_encoding="gzip")
+
+        response = TestClient(app).get("/api/v1/items", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["data"] == "y" * 1000
+
+
+def test_gzip_always_available():
+    assert "gzip" in AVAILABLE_ENCODINGS
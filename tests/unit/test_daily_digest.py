@@ -0,0 +1,173 @@
+"""
+Unit tests for the set-based daily digest engine.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from app.domains.alerts.digest import DailyDigestEngine, DigestRunReport
+from tests.conftest import AsyncCursor
+
+NOW = datetime(2026, 3, 2, 9, 0)
+
+
+def _announcement(aid, title, *, category=None, created=None, end=None):
+    return {
+        "_id": aid,
+        "announcement_data": {"title": title, "content": "", "business_name": ""},
+        "category": category,
+        "created_at": created or NOW - timedelta(hours=2),
+        "application_end_date": end,
+    }
+
+
+def _subscription(sid, user_id, keywords=(), **filters):
+    return {
+        "_id": sid,
+        "user_id": user_id,
+        "domain": "announcements",
+        "keywords": list(keywords),
+        "filters": filters,
+        "frequency": "daily",
+        "is_active": True,
+    }
+
+
+def _engine(*, subscriptions, users, new, deadline, preferences=None, email_service=None, concurrency=4):
+    collections = {
+        "alert_subscriptions": Mock(),
+        "users": Mock(),
+        "announcements": Mock(),
+    }
+    collections["alert_subscriptions"].distinct = AsyncMock(return_value=[s["user_id"] for s in subscriptions])
+    collections["alert_subscriptions"].find = Mock(side_effect=lambda *a, **k: AsyncCursor(subscriptions))
+    collections["users"].find = Mock(side_effect=lambda *a, **k: AsyncCursor(users))
+    collections["announcements"].find = Mock(side_effect=[AsyncCursor(new), AsyncCursor(deadline)])
+
+    db = MagicMock()
+    db.__getitem__.side_effect = lambda name: collections.setdefault(name, Mock())
+    service = email_service or Mock(send_daily_digest=AsyncMock(return_value={"success": True}))
+    engine = DailyDigestEngine(db, email_service=service, concurrency=concurrency)
+    engine.repository = Mock()
+    engine.repository.get_users_with_preferences = AsyncMock(return_value=[])
+    engine.repository.get_many_user_preferences = AsyncMock(return_value=preferences or {})
+    engine.repository.get_default_preferences = AsyncMock(
+        return_value={"email_enabled": True, "digest_notifications": True}
+    )
+    return engine, collections
+
+
+class TestBuildPlans:
+    """Test set-based loading and in-memory matching."""
+
+    async def test_queries_once_per_collection(self):
+        engine, collections = _engine(
+            subscriptions=[_subscription("s1", "u1", ["ai"]), _subscription("s2", "u2", ["bio"])],
+            users=[{"_id": "u1", "email": "u1@example.com"}, {"_id": "u2", "email": "u2@example.com"}],
+            new=[_announcement("a1", "AI 지원사업"), _announcement("a2", "Bio 바우처")],
+            deadline=[],
+        )
+
+        plans, report = await engine.build_plans(NOW)
+
+        assert collections["alert_subscriptions"].find.call_count == 1
+        assert collections["users"].find.call_count == 1
+        assert collections["announcements"].find.call_count == 2
+        engine.repository.get_many_user_preferences.assert_awaited_once_with(["u1", "u2"])
+        by_user = {p.user_id: [a["_id"] for a in p.new_announcements] for p in plans}
+        assert by_user == {"u1": ["a1"], "u2": ["a2"]}
+        assert (report.recipients, report.eligible, report.new_announcements) == (2, 2, 2)
+
+    async def test_limits_matches_per_subscription(self):
+        engine, _ = _engine(
+            subscriptions=[_subscription("s1", "u1", ["ai"])],
+            users=[{"_id": "u1", "email": "u1@example.com"}],
+            new=[_announcement(f"a{i}", "AI 공고") for i in range(8)],
+            deadline=[],
+        )
+
+        plans, _ = await engine.build_plans(NOW)
+
+        assert len(plans[0].new_announcements) == 5
+        assert plans[0].new_announcements[0]["url"].endswith("/announcements/a0")
+
+    async def test_deadlines_respect_filters(self):
+        deadline = [
+            _announcement("d1", "마감 1", category="tech", end=NOW + timedelta(days=1)),
+            _announcement("d2", "마감 2", category="bio", end=NOW + timedelta(days=3)),
+        ]
+        engine, _ = _engine(
+            subscriptions=[
+                _subscription("s1", "u1", ["ai"], categories=["bio"]),
+                _subscription("s2", "u2", ["ai"]),
+            ],
+            users=[{"_id": "u1", "email": "u1@example.com"}, {"_id": "u2", "email": "u2@example.com"}],
+            new=[],
+            deadline=deadline,
+        )
+
+        plans, _ = await engine.build_plans(NOW)
+
+        by_user = {p.user_id: p.deadline_announcements for p in plans}
+        assert [d["_id"] for d in by_user["u1"]] == ["d2"]
+        assert by_user["u1"][0]["days_left"] == 3
+        assert [d["_id"] for d in by_user["u2"]] == ["d1", "d2"]
+
+    async def test_skips_ineligible_users(self):
+        engine, _ = _engine(
+            subscriptions=[
+                _subscription("s1", "u1", ["ai"]),
+                _subscription("s2", "u2", ["ai"]),
+                _subscription("s3", "u3", ["ai"]),
+            ],
+            users=[{"_id": "u1", "email": "u1@example.com"}, {"_id": "u2", "email": "u2@example.com"}],
+            new=[],
+            deadline=[],
+            preferences={"u2": {"email_enabled": True, "digest_notifications": False}},
+        )
+
+        plans, report = await engine.build_plans(NOW)
+
+        assert [p.user_id for p in plans] == ["u1"]
+        assert report.skipped == 2
+
+
+class TestRun:
+    """Test bounded concurrent sending and the run report."""
+
+    async def test_sends_with_bounded_concurrency(self):
+        active = 0
+        peak = 0
+
+        async def _send(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"success": kwargs["user_email"] != "u3@example.com"}
+
+        service = Mock(send_daily_digest=AsyncMock(side_effect=_send))
+        ids = [f"u{i}" for i in range(6)]
+        engine, _ = _engine(
+            subscriptions=[_subscription(f"s{u}", u, ["ai"]) for u in ids],
+            users=[{"_id": u, "email": f"{u}@example.com"} for u in ids],
+            new=[],
+            deadline=[],
+            email_service=service,
+            concurrency=2,
+        )
+
+        report = await engine.run(NOW)
+
+        assert peak == 2
+        assert (report.sent, report.failed) == (5, 1)
+        assert service.send_daily_digest.await_args.kwargs["tracking_id"].endswith("_20260302")
+
+    def test_report_throughput(self):
+        report = DigestRunReport(sent=8, failed=2, duration_seconds=2.0)
+
+        assert report.throughput_per_second == 5.0
+        assert report.to_dict()["throughput_per_second"] == 5.0
+        assert DigestRunReport().throughput_per_second == 0.0
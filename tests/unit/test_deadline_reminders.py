@@ -0,0 +1,216 @@
+"""
+Unit tests for the time-bucketed deadline reminder scheduler.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from app.domains.alerts.reminders import (
+    DeadlineReminderScheduler,
+    ReminderStats,
+    hour_bucket,
+    reminder_due_times,
+)
+from tests.conftest import AsyncCursor
+
+NOW = datetime(2026, 3, 2, 9, 30)
+
+
+class _UnlimitedBucket:
+    async def take(self, requested=1):
+        return requested, 0.0
+
+
+def _scheduler(collections, preferences=None):
+    db = MagicMock()
+    db.__getitem__.side_effect = lambda name: collections.setdefault(name, Mock())
+    email_service = Mock()
+    email_service.deadline_reminder_email = Mock(side_effect=lambda **kwargs: kwargs)
+    email_service.send_many = AsyncMock(side_effect=lambda messages: [{"success": True} for _ in messages])
+    scheduler = DeadlineReminderScheduler(db, email_service=email_service, bucket=_UnlimitedBucket())
+    scheduler.repository = Mock()
+    scheduler.repository.get_many_user_preferences = AsyncMock(return_value=preferences or {})
+    scheduler.repository.get_default_preferences = AsyncMock(
+        return_value={"email_enabled": True, "deadline_reminders": True, "deadline_reminder_days": [7, 3, 1]}
+    )
+    return scheduler
+
+
+def _ops(collection):
+    return [op for call in collection.bulk_write.await_args_list for op in call[0][0]]
+
+
+class TestReminderDueTimes:
+    """Test bucket and schedule helpers."""
+
+    def test_hour_bucket_floors_to_hour(self):
+        assert hour_bucket(NOW) == datetime(2026, 3, 2, 9, 0)
+
+    def test_skips_past_times_and_sorts(self):
+        deadline = NOW + timedelta(days=5)
+
+        due = reminder_due_times(deadline, [1, 7, 3], NOW)
+
+        assert due == [(3, deadline - timedelta(days=3)), (1, deadline - timedelta(days=1))]
+
+
+class TestMaterialize:
+    """Test reminder materialization from matched subscriptions."""
+
+    async def test_upserts_one_reminder_per_user_announcement_and_day(self):
+        deadline = NOW + timedelta(days=4, hours=2)
+        collections = {
+            "announcements": Mock(find=Mock(return_value=AsyncCursor([{
+                "_id": "a1",
+                "announcement_data": {"title": "AI 바우처", "content": "", "business_name": ""},
+                "application_end_date": deadline,
+            }]))),
+            "alert_subscriptions": Mock(find=Mock(return_value=AsyncCursor([
+                {"_id": "s1", "user_id": "u1", "keywords": ["ai"], "domain": "announcements"},
+                {"_id": "s2", "user_id": "u1", "keywords": ["바우처"], "domain": "announcements"},
+                {"_id": "s3", "user_id": "u2", "keywords": ["bio"], "domain": "announcements"},
+            ]))),
+            "deadline_reminders": Mock(bulk_write=AsyncMock()),
+        }
+        scheduler = _scheduler(collections)
+
+        count = await scheduler.materialize(NOW)
+
+        ops = _ops(collections["deadline_reminders"])
+        assert count == 2
+        assert [op._filter["_id"] for op in ops] == ["u1:a1:3", "u1:a1:1"]
+        first = ops[0]._doc
+        assert first["$set"]["due_at"] == deadline - timedelta(days=3)
+        assert first["$set"]["bucket"] == hour_bucket(deadline - timedelta(days=3))
+        assert first["$setOnInsert"]["status"] == "pending"
+        assert ops[0]._upsert is True
+
+    async def test_respects_disabled_reminders_and_incremental_window(self):
+        collections = {
+            "announcements": Mock(find=Mock(return_value=AsyncCursor([{
+                "_id": "a1",
+                "announcement_data": {"title": "AI"},
+                "application_end_date": NOW + timedelta(days=2),
+            }]))),
+            "alert_subscriptions": Mock(find=Mock(return_value=AsyncCursor([
+                {"_id": "s1", "user_id": "u1", "keywords": ["ai"], "domain": "announcements"},
+            ]))),
+            "deadline_reminders": Mock(bulk_write=AsyncMock()),
+        }
+        scheduler = _scheduler(collections, preferences={"u1": {"deadline_reminders": False}})
+
+        assert await scheduler.materialize(NOW, since_minutes=60) == 0
+        query = collections["announcements"].find.call_args[0][0]
+        assert query["$or"][0] == {"created_at": {"$gte": NOW - timedelta(minutes=60)}}
+        collections["deadline_reminders"].bulk_write.assert_not_awaited()
+
+
+class TestDispatch:
+    """Test claiming the current bucket and dispatching it."""
+
+    async def test_claims_only_recent_buckets(self):
+        reminders = Mock(update_many=AsyncMock(), find=Mock(side_effect=[
+            AsyncCursor([{"_id": "r1"}, {"_id": "r2"}]),
+            AsyncCursor([{"_id": "r1"}]),
+        ]))
+        scheduler = _scheduler({"deadline_reminders": reminders})
+
+        token, claimed = await scheduler.claim_due(NOW)
+
+        query, update = reminders.update_many.await_args[0]
+        assert query["_id"] == {"$in": ["r1", "r2"]}
+        assert query["bucket"]["$lte"] == datetime(2026, 3, 2, 9, 0)
+        assert query["bucket"]["$gte"] < query["bucket"]["$lte"]
+        assert update["$set"]["claim_token"] == token
+        assert reminders.find.call_args[0][0] == {"claim_token": token}
+        assert claimed == [{"_id": "r1"}]
+
+    async def test_claim_is_bounded_by_batch_size(self):
+        cursor = AsyncCursor([])
+        cursor.limit = Mock(return_value=cursor)
+        reminders = Mock(update_many=AsyncMock(), find=Mock(return_value=cursor))
+        scheduler = _scheduler({"deadline_reminders": reminders})
+        scheduler.batch_size = 25
+
+        assert await scheduler.claim_due(NOW) == ("", [])
+        cursor.limit.assert_called_once_with(25)
+        reminders.update_many.assert_not_awaited()
+
+    async def test_run_due_dispatches_batch_by_batch(self):
+        scheduler = _scheduler({})
+        scheduler.claim_due = AsyncMock(side_effect=[("t1", [{"_id": "r1"}]), ("t2", [{"_id": "r2"}]), ("", [])])
+        scheduler.dispatch = AsyncMock(side_effect=lambda token, batch, now: ReminderStats(claimed=1, sent=1))
+
+        stats = await scheduler.run_due(NOW)
+
+        assert (stats.claimed, stats.sent) == (2, 2)
+        assert [c.args[0] for c in scheduler.dispatch.await_args_list] == ["t1", "t2"]
+
+    @pytest.fixture
+    def collections(self):
+        return {
+            "users": Mock(find=Mock(return_value=AsyncCursor([
+                {"_id": "u1", "email": "u1@example.com", "name": "U1"},
+                {"_id": "u2", "email": "u2@example.com"},
+            ]))),
+            "announcements": Mock(find=Mock(return_value=AsyncCursor([
+                {"_id": "a1", "announcement_data": {"title": "AI 바우처"}},
+            ]))),
+            "deadline_reminders": Mock(bulk_write=AsyncMock()),
+        }
+
+    async def test_sends_due_reminders_in_one_batch(self, collections):
+        scheduler = _scheduler(collections, preferences={"u2": {"deadline_reminders": False}})
+        batch = [
+            {"_id": "u1:a1:3", "user_id": "u1", "announcement_id": "a1", "days_before": 3},
+            {"_id": "u2:a1:3", "user_id": "u2", "announcement_id": "a1", "days_before": 3},
+            {"_id": "u3:a1:3", "user_id": "u3", "announcement_id": "a1", "days_before": 3},
+        ]
+
+        stats = await scheduler.dispatch("tok", batch, NOW)
+
+        assert (stats.sent, stats.skipped, stats.failed) == (1, 1, 1)
+        scheduler.email_service.send_many.assert_awaited_once()
+        message = scheduler.email_service.deadline_reminder_email.call_args.kwargs
+        assert message["announcement"]["title"] == "AI 바우처"
+        assert message["days_left"] == 3
+        ops = _ops(collections["deadline_reminders"])
+        assert {op._filter["_id"]: op._doc["$set"]["status"] for op in ops} == {
+            "u1:a1:3": "sent",
+            "u2:a1:3": "skipped",
+            "u3:a1:3": "failed",
+        }
+        assert all(op._filter["claim_token"] == "tok" for op in ops)
+
+    async def test_quiet_hours_move_reminder_to_next_bucket(self, collections):
+        scheduler = _scheduler(collections, preferences={
+            "u1": {"quiet_hours_enabled": True, "quiet_hours_start": 0, "quiet_hours_end": 24},
+        })
+
+        stats = await scheduler.dispatch("tok", [
+            {"_id": "u1:a1:1", "user_id": "u1", "announcement_id": "a1", "days_before": 1},
+        ], NOW)
+
+        assert stats.deferred == 1
+        update = _ops(collections["deadline_reminders"])[0]._doc["$set"]
+        assert update == {"status": "pending", "bucket": datetime(2026, 3, 2, 10, 0)}
+        scheduler.email_service.send_many.assert_not_awaited()
+
+    async def test_sent_slices_are_recorded_before_a_later_failure(self, collections):
+        scheduler = _scheduler(collections)
+        scheduler.bucket.take = AsyncMock(return_value=(1, 0.0))
+        scheduler.email_service.send_many.side_effect = [[{"success": True}], ConnectionError("smtp down")]
+        batch = [
+            {"_id": f"u1:a1:{days}", "user_id": "u1", "announcement_id": "a1", "days_before": days}
+            for days in (7, 3, 1)
+        ]
+
+        with pytest.raises(ConnectionError):
+            await scheduler.dispatch("tok", batch, NOW)
+
+        calls = collections["deadline_reminders"].bulk_write.await_args_list
+        assert [op._doc["$set"]["status"] for op in calls[0][0][0]] == ["sent"]
+        # 발송 중 실패한 구간은 lease 만료까지 그대로, 시도하지 않은 알림은 pending 으로
+        assert [(op._filter["_id"], op._doc["$set"]["status"]) for op in calls[-1][0][0]] == [("u1:a1:1", "pending")]
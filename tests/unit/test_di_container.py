@@ -0,0 +1,156 @@
+"""
+Unit tests for DI container lifetimes.
+
+Covers thread-safe singletons, contextvar-backed request scopes and the
+DIScopeMiddleware that opens/closes a scope per request.
+"""
+
+import asyncio
+import threading
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+
+from app.core.container import CircularDependencyError, DIContainer
+from app.core.middleware import DIScopeMiddleware
+
+
+class Client:
+    instances = 0
+
+    def __init__(self):
+        Client.instances += 1
+
+
+class Repository:
+    def __init__(self, client: Client):
+        self.client = client
+
+
+class Service:
+    def __init__(self, repository: Repository, client: Optional[Client] = None):
+        self.repository = repository
+        self.client = client or Client()
+
+
+class RequestState:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class CycleA:
+    def __init__(self, b: "CycleB"):
+        self.b = b
+
+
+class CycleB:
+    def __init__(self, a: CycleA):
+        self.a = a
+
+
+CycleA.__init__.__annotations__["b"] = CycleB
+
+
+@pytest.fixture
+def container():
+    c = DIContainer()
+    c.register_singleton(Client)
+    c.register_singleton(Repository)
+    c.register_singleton(Service)
+    c.register_scoped(RequestState)
+    return c
+
+
+class TestSingleton:
+    """Test singleton lifetime."""
+
+    def test_optional_dependency_uses_registered_singleton(self, container):
+        service = container.resolve(Service)
+
+        assert service.client is container.resolve(Client)
+        assert service.repository.client is service.client
+
+    def test_created_once_under_concurrency(self, container):
+        Client.instances = 0
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(container.resolve(Client))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert Client.instances == 1
+        assert all(r is results[0] for r in results)
+
+    def test_circular_dependency_detected(self):
+        c = DIContainer()
+        c.register_transient(CycleA)
+        c.register_transient(CycleB)
+
+        with pytest.raises(CircularDependencyError):
+            c.resolve(CycleA)
+
+
+class TestScoped:
+    """Test request-scoped lifetime."""
+
+    def test_shared_within_scope_and_disposed(self, container):
+        with container.scope():
+            first = container.resolve(RequestState)
+            assert container.resolve(RequestState) is first
+
+        assert first.closed
+        with container.scope():
+            assert container.resolve(RequestState) is not first
+
+    def test_outside_scope_is_not_shared(self, container):
+        assert container.resolve(RequestState) is not container.resolve(RequestState)
+
+    async def test_concurrent_requests_are_isolated(self, container):
+        async def request():
+            with container.scope():
+                state = container.resolve(RequestState)
+                await asyncio.sleep(0.01)
+                return state, container.resolve(RequestState)
+
+        (a1, a2), (b1, b2) = await asyncio.gather(request(), request())
+
+        assert a1 is a2 and b1 is b2
+        assert a1 is not b1
+
+    async def test_scope_visible_in_threadpool(self, container):
+        from starlette.concurrency import run_in_threadpool
+
+        with container.scope():
+            state = container.resolve(RequestState)
+            assert await run_in_threadpool(container.resolve, RequestState) is state
+
+
+class TestDIScopeMiddleware:
+    """Test per-request scope handling."""
+
+    async def test_scope_per_request(self, container):
+        seen = []
+
+        async def app(scope, receive, send):
+            seen.append((container.resolve(RequestState), container.resolve(RequestState)))
+
+        middleware = DIScopeMiddleware(app)
+        with patch("app.core.middleware.get_container", return_value=container):
+            await middleware({"type": "http"}, None, None)
+            await middleware({"type": "http"}, None, None)
+
+        (a1, a2), (b1, b2) = seen
+        assert a1 is a2 and b1 is b2
+        assert a1 is not b1
+        assert a1.closed and b1.closed
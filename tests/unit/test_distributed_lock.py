@@ -0,0 +1,277 @@
+"""
+Unit tests for Redis lease locks and single-flight Celery tasks.
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.core import distributed_lock as dl
+from app.core.distributed_lock import (
+    LeaseLost,
+    LeaseNotAcquired,
+    RedisLease,
+    active_lease,
+    dispatch_singleton,
+    ensure_lease,
+    running_job,
+    single_flight,
+    singleton_task,
+)
+from app.domains.announcements import tasks as announcement_tasks
+from app.domains.announcements.batch_service import COLLECTION_LOCK
+
+
+class _FakeRedis:
+    """Runs the lock Lua scripts against an in-memory dict"""
+
+    def __init__(self):
+        self.data, self.ttl = {}, {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def register_script(self, script):
+        def run(keys, args):
+            if script == dl._ACQUIRE_SCRIPT:
+                current = self.data.get(keys[0])
+                if current is not None and current.partition("|")[2] != args[0]:
+                    return [0, current]
+                if current is not None and args[2:] == ["1"]:
+                    self.ttl[keys[0]] = args[1]
+                    return [1, current]
+                self.data[keys[1]] = self.data.get(keys[1], 0) + 1
+                self.data[keys[0]] = f"{self.data[keys[1]]}|{args[0]}"
+                self.ttl[keys[0]] = args[1]
+                return [1, self.data[keys[0]]]
+            if self.data.get(keys[0]) != args[0]:
+                return 0
+            if script == dl._RENEW_SCRIPT:
+                self.ttl[keys[0]] = args[1]
+            else:
+                del self.data[keys[0]]
+            return 1
+        return run
+
+
+@pytest.fixture
+def fake_redis():
+    client = _FakeRedis()
+    with patch.object(dl, "get_lock_client", return_value=client):
+        yield client
+
+
+def _task(task_id):
+    return Mock(request=Mock(id=task_id))
+
+
+class TestRedisLease:
+    """Test acquisition, fencing, renewal and release."""
+
+    def test_second_owner_is_rejected_and_sees_the_holder(self, fake_redis):
+        first = RedisLease("collect", owner="job-1")
+        second = RedisLease("collect", owner="job-2")
+
+        assert first.acquire()
+        assert not second.acquire()
+        assert second.holder.owner == "job-1"
+        assert second.holder.token == first.token
+
+    def test_fencing_token_increases_and_stale_holder_is_not_current(self, fake_redis):
+        first = RedisLease("collect", owner="job-1")
+        first.acquire()
+        # lease 만료 후 다른 owner 가 획득
+        del fake_redis.data["lock:collect"]
+        second = RedisLease("collect", owner="job-2")
+        second.acquire()
+
+        assert second.token > first.token
+        assert second.is_current()
+        assert not first.is_current()
+
+    def test_release_does_not_delete_another_owners_lock(self, fake_redis):
+        first = RedisLease("collect", owner="job-1")
+        first.acquire()
+        del fake_redis.data["lock:collect"]
+        RedisLease("collect", owner="job-2").acquire()
+
+        first.release()
+
+        assert fake_redis.get("lock:collect").endswith("|job-2")
+
+    def test_same_owner_reacquires_with_new_token(self, fake_redis):
+        dispatched = RedisLease("collect", owner="task-1", ttl=900)
+        dispatched.acquire()
+        running = RedisLease("collect", owner="task-1", ttl=60)
+
+        assert running.acquire()
+        assert running.token > dispatched.token
+        assert fake_redis.ttl["lock:collect"] == 60_000
+
+    def test_join_shares_the_token_of_the_same_owner(self, fake_redis):
+        first = RedisLease("collect", owner="job-1")
+        first.acquire()
+        second = RedisLease("collect", owner="job-1")
+
+        assert second.join()
+        assert second.token == first.token
+        assert first.is_current() and second.is_current()
+        assert not RedisLease("collect", owner="job-2").join()
+
+    def test_ensure_lease_raises_once_the_lock_moves(self, fake_redis):
+        lease = RedisLease("collect", owner="job-1")
+        lease.acquire()
+        ensure_lease(lease)
+        ensure_lease(None)
+        fake_redis.data["lock:collect"] = "99|job-2"
+
+        with pytest.raises(LeaseLost) as exc:
+            ensure_lease(lease)
+        assert exc.value.token == lease.token
+
+    def test_background_renewal_marks_lost_lease(self, fake_redis):
+        lease = RedisLease("collect", owner="job-1", ttl=0.15)
+        lease.acquire()
+        lease.start_renewal()
+        fake_redis.data["lock:collect"] = "99|job-2"
+
+        deadline = time.monotonic() + 2
+        while not lease.lost and time.monotonic() < deadline:
+            time.sleep(0.01)
+        lease.release()
+
+        assert lease.lost
+        assert not lease.is_current()
+
+    def test_context_manager_raises_when_held(self, fake_redis):
+        with single_flight("collect", owner="job-1"):
+            with pytest.raises(LeaseNotAcquired) as exc:
+                with single_flight("collect", owner="job-2"):
+                    pass
+        assert exc.value.holder.owner == "job-1"
+        assert fake_redis.get("lock:collect") is None
+
+    def test_redis_failure_runs_without_lock(self):
+        client = Mock(register_script=Mock(side_effect=ConnectionError("down")))
+
+        lease = RedisLease("collect", owner="job-1", client=client)
+
+        assert lease.acquire()
+        assert lease.degraded
+
+
+class TestSingletonTask:
+    """Test coalescing of duplicate Celery task runs."""
+
+    def test_duplicate_run_returns_running_job_id(self, fake_redis):
+        calls = []
+
+        @singleton_task(lock="test.collect")
+        def collect(self, page=1):
+            calls.append(page)
+            # 실행 중 같은 락을 쓰는 두 번째 트리거
+            return {"inner": collect(_task("task-2"), page=2)}
+
+        result = collect(_task("task-1"))
+
+        assert calls == [1]
+        assert result["inner"]["status"] == "coalesced"
+        assert result["inner"]["job_id"] == "task-1"
+        assert fake_redis.get("lock:test.collect") is None
+
+    def test_lost_lease_stops_the_task_without_retry(self, fake_redis):
+        writes = []
+
+        @singleton_task(lock="test.collect")
+        def collect(self):
+            lease = active_lease()
+            writes.append(1)
+            # 오래 멈춘 사이 lease 가 만료되고 다른 작업이 획득
+            fake_redis.data["lock:test.collect"] = "99|task-2"
+            ensure_lease(lease)
+            writes.append(2)
+
+        result = collect(_task("task-1"))
+
+        assert writes == [1]
+        assert result["status"] == "lease_lost"
+        assert active_lease() is None
+        assert fake_redis.get("lock:test.collect") == "99|task-2"
+
+    def test_key_separates_locks_per_arguments(self, fake_redis):
+        @singleton_task(key=lambda page=1: str(page))
+        def fetch_page(self, page=1):
+            return running_job(f"{__name__}.fetch_page", kwargs={"page": page})
+
+        assert fetch_page(_task("task-1"), page=3) == "task-1"
+        assert running_job(f"{__name__}.fetch_page", kwargs={"page": 3}) is None
+
+    def test_dispatch_coalesces_into_queued_task(self, fake_redis):
+        @singleton_task(lock="test.stats")
+        def build_stats(self):
+            return "done"
+
+        task = Mock(apply_async=Mock())
+        task.name = f"{__name__}.build_stats"
+
+        first_id, started = dispatch_singleton(task, [], {})
+        second_id, second_started = dispatch_singleton(task, [], {})
+
+        assert started and not second_started
+        assert second_id == first_id
+        task.apply_async.assert_called_once_with(args=[], kwargs={}, task_id=first_id)
+        # 워커는 같은 task id 로 락을 이어받아 실행
+        assert build_stats(_task(first_id)) == "done"
+        assert fake_redis.get("lock:test.stats") is None
+
+    def test_unregistered_tasks_are_sent_directly(self, fake_redis):
+        task = Mock(apply_async=Mock(return_value=Mock(id="abc")))
+        task.name = "app.unknown.tasks.something"
+
+        assert dispatch_singleton(task, [], {}) == ("abc", True)
+
+
+class TestAnnouncementCollectionLock:
+    """Test that backfill workers share COLLECTION_LOCK with the job id as owner."""
+
+    def test_backfill_coalesces_while_another_collection_runs(self, fake_redis):
+        RedisLease(COLLECTION_LOCK, owner="batch-1").acquire()
+
+        with patch.object(announcement_tasks.fetch_announcements_job, "delay") as delay:
+            result = announcement_tasks.fetch_announcements_backfill.run(workers=2, job_id="backfill-1")
+
+        assert result["status"] == "coalesced"
+        assert result["job_id"] == "batch-1"
+        delay.assert_not_called()
+
+    def test_workers_join_the_backfill_lease_and_release_when_done(self, fake_redis):
+        with patch.object(announcement_tasks.fetch_announcements_job, "delay") as delay:
+            announcement_tasks.fetch_announcements_backfill.run(workers=2, job_id="backfill-1")
+        assert delay.call_count == 2
+        dispatched = fake_redis.get(f"lock:{COLLECTION_LOCK}")
+
+        def run_job(done):
+            # run_async 는 전달된 값 (job 결과) 을 그대로 돌려줌
+            job = Mock(return_value={"job_id": "backfill-1", "job_completed": done})
+            with patch.object(announcement_tasks, "_fetch_announcements_job_async", job), \
+                    patch.object(announcement_tasks, "run_async", side_effect=lambda result: result):
+                announcement_tasks.fetch_announcements_job.run("backfill-1")
+            lease = job.call_args.args[-1]
+            assert lease.token == int(dispatched.split("|")[0])
+
+        run_job(done=False)
+        # 다른 워커가 아직 실행 중일 수 있으므로 유지 (같은 token)
+        assert fake_redis.get(f"lock:{COLLECTION_LOCK}") == dispatched
+
+        run_job(done=True)
+        assert fake_redis.get(f"lock:{COLLECTION_LOCK}") is None
+
+    def test_worker_coalesces_into_another_collection(self, fake_redis):
+        RedisLease(COLLECTION_LOCK, owner="batch-1").acquire()
+
+        with patch.object(announcement_tasks, "run_async") as run_async:
+            result = announcement_tasks.fetch_announcements_job.run("backfill-1")
+
+        assert result["status"] == "coalesced"
+        run_async.assert_not_called()
@@ -0,0 +1,127 @@
+"""
+Unit tests for batch notification eligibility evaluation.
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+import pytz
+
+from app.domains.alerts.frequency_manager import EligibilityCandidate, NotificationFrequencyManager
+from app.domains.alerts.repository import AlertsRepository, is_quiet_hours
+from tests.conftest import AsyncCursor
+
+
+@pytest.fixture
+def manager():
+    manager = NotificationFrequencyManager(MagicMock())
+    manager.repository = Mock()
+    manager.repository.get_many_user_preferences = AsyncMock(return_value={})
+    manager.repository.get_daily_notification_counts = AsyncMock(return_value={})
+    manager.repository.get_recent_notification_pairs = AsyncMock(return_value=set())
+    manager.repository.get_default_preferences = AsyncMock(return_value={"new_announcements": True})
+    return manager
+
+
+class TestEvaluateBatch:
+    """Test in-memory eligibility decisions."""
+
+    async def test_preloads_once_for_all_candidates(self, manager):
+        candidates = [EligibilityCandidate(f"u{i % 3}", f"c{i}") for i in range(30)]
+
+        decisions = await manager.evaluate_batch(candidates, "new_announcements")
+
+        assert all(d.allowed for d in decisions)
+        manager.repository.get_many_user_preferences.assert_awaited_once_with(["u0", "u1", "u2"])
+        manager.repository.get_daily_notification_counts.assert_awaited_once()
+        manager.repository.get_recent_notification_pairs.assert_awaited_once()
+
+    async def test_applies_rules_in_order(self, manager):
+        manager.repository.get_many_user_preferences.return_value = {
+            "disabled": {"new_announcements": False},
+            "capped": {"max_daily_notifications": 2},
+            "blocker": {"blocked_keywords": ["광고"]},
+        }
+        manager.repository.get_daily_notification_counts.return_value = {"capped": 2}
+        manager.repository.get_recent_notification_pairs.return_value = {("dup", "c1")}
+
+        decisions = await manager.evaluate_batch([
+            EligibilityCandidate("disabled", "c1"),
+            EligibilityCandidate("capped", "c1"),
+            EligibilityCandidate("dup", "c1"),
+            EligibilityCandidate("blocker", "c1", {"title": "새 광고 상품"}),
+            EligibilityCandidate("blocker", "c2", {"title": "AI 지원사업"}),
+        ], "new_announcements")
+
+        assert [(d.allowed, d.reason) for d in decisions] == [
+            (False, "Category new_announcements disabled"),
+            (False, "Daily limit reached (2/2)"),
+            (False, "Duplicate notification"),
+            (False, "Blocked by keyword: 광고"),
+            (True, "Allowed"),
+        ]
+
+    async def test_same_pair_in_one_batch_is_a_duplicate(self, manager):
+        decisions = await manager.evaluate_batch(
+            [EligibilityCandidate("u1", "c1"), EligibilityCandidate("u1", "c1")],
+            "new_announcements",
+        )
+
+        assert [d.reason for d in decisions] == ["Allowed", "Duplicate notification"]
+
+    async def test_quiet_hours_only_with_stored_preferences(self, manager):
+        quiet_all_day = {"quiet_hours_enabled": True, "quiet_hours_start": 0, "quiet_hours_end": 24}
+        manager.repository.get_many_user_preferences.return_value = {"quiet": quiet_all_day}
+        manager.repository.get_default_preferences.return_value = quiet_all_day
+
+        decisions = await manager.evaluate_batch(
+            [EligibilityCandidate("quiet", "c1"), EligibilityCandidate("other", "c1")],
+            "new_announcements",
+        )
+
+        assert [d.reason for d in decisions] == ["Quiet hours active", "Allowed"]
+
+    async def test_empty_batch(self, manager):
+        assert await manager.evaluate_batch([], "new_announcements") == []
+        manager.repository.get_many_user_preferences.assert_not_awaited()
+
+
+class TestQuietHours:
+    """Test the pure quiet-hours helper."""
+
+    def test_overnight_window(self):
+        prefs = {"quiet_hours_enabled": True, "quiet_hours_start": 22, "quiet_hours_end": 7}
+        seoul = pytz.timezone("Asia/Seoul")
+
+        assert is_quiet_hours(prefs, seoul.localize(datetime(2024, 1, 1, 23)))
+        assert is_quiet_hours(prefs, seoul.localize(datetime(2024, 1, 1, 6)))
+        assert not is_quiet_hours(prefs, seoul.localize(datetime(2024, 1, 1, 12)))
+
+    def test_disabled(self):
+        assert not is_quiet_hours({"quiet_hours_enabled": False}, datetime.now().astimezone())
+
+
+class TestBatchQueries:
+    """Test the repository preload queries."""
+
+    async def test_daily_counts_use_one_aggregate(self):
+        repository = AlertsRepository(MagicMock())
+        repository.notifications = Mock()
+        repository.notifications.aggregate = Mock(return_value=AsyncCursor([{"_id": "u1", "count": 3}]))
+
+        counts = await repository.get_daily_notification_counts(["u1", "u2"])
+
+        assert counts == {"u1": 3, "u2": 0}
+        pipeline = repository.notifications.aggregate.call_args[0][0]
+        assert pipeline[0]["$match"]["user_id"] == {"$in": ["u1", "u2"]}
+
+    async def test_recent_pairs_use_one_find(self):
+        repository = AlertsRepository(MagicMock())
+        repository.notifications = Mock()
+        repository.notifications.find = Mock(return_value=AsyncCursor([{"user_id": "u1", "content_id": "c1"}]))
+
+        pairs = await repository.get_recent_notification_pairs(["u1"], ["c1", "c2"])
+
+        assert pairs == {("u1", "c1")}
+        repository.notifications.find.assert_called_once()
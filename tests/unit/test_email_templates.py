@@ -0,0 +1,174 @@
+"""
+Unit tests for the shared email template engine, derived text alternatives
+and batched rendering in EmailService.
+"""
+
+import threading
+from datetime import datetime
+from email.header import decode_header, make_header
+from unittest.mock import Mock
+
+from app.shared.clients.email_client import EmailClient
+from app.shared.services.email_service import (
+    EmailService,
+    EmailTemplateEngine,
+    TemplatedEmail,
+    get_template_engine,
+    html_template_to_text,
+)
+
+
+def _announcement_context():
+    return {
+        "user_name": "홍길동",
+        "matched_keywords": ["AI"],
+        "match_score": 0.8,
+        "threshold": 0.5,
+        "announcement": {
+            "title": "AI & 바우처",
+            "organization": "중기부",
+            "description": "설명",
+            "application_start_date": datetime(2026, 1, 1),
+            "application_end_date": datetime(2026, 2, 1),
+        },
+        "announcement_url": "https://example.com/announcements/1",
+        "notification_settings_url": "https://example.com/settings",
+    }
+
+
+class TestHtmlTemplateToText:
+    """Test conversion of HTML template source into a text template."""
+
+    def test_strips_markup_and_keeps_jinja(self):
+        source = (
+            "<style>p { color: red; }</style>"
+            "<h1>{{ title }}</h1><p>{% if x > 1 %}<strong>big</strong>{% endif %}&amp; more</p>"
+        )
+
+        text = html_template_to_text(source)
+
+        assert "color" not in text
+        assert "<" not in text.replace("x > 1", "")
+        assert "{{ title }}" in text
+        assert "{% if x > 1 %}big{% endif %}& more" in text
+
+    def test_keeps_link_targets(self):
+        text = html_template_to_text('<a href="{{ url }}" class="btn">열기</a>')
+
+        assert text == "열기 ({{ url }})"
+
+    def test_keeps_statements_inside_removed_markup(self):
+        text = html_template_to_text('<div {% if a %}class="on"{% endif %}>{{ body }}</div>')
+
+        assert text.startswith("{% if a %}{% endif %}{{ body }}")
+
+
+class TestEmailTemplateEngine:
+    """Test template caching and text rendering."""
+
+    def test_engine_is_shared_across_services(self):
+        assert EmailService().template_engine is get_template_engine()
+        assert EmailService().template_engine is EmailService().template_engine
+
+    def test_compiled_template_is_cached(self, tmp_path):
+        engine = EmailTemplateEngine(cache_dir=str(tmp_path))
+
+        first = engine.env.get_template("email/new_announcement.html")
+
+        assert engine.env.get_template("email/new_announcement.html") is first
+        assert list(tmp_path.glob("__jinja2_*.cache"))
+
+    def test_text_alternative_renders_from_same_context(self, tmp_path):
+        engine = EmailTemplateEngine(cache_dir=str(tmp_path))
+
+        text = engine.render_text("email/new_announcement.html", _announcement_context())
+
+        assert "홍길동" in text
+        assert "AI & 바우처" in text
+        assert "(https://example.com/announcements/1)" in text
+        assert "<" not in text
+        assert "\n\n\n" not in text
+
+    def test_missing_text_template_returns_none(self, tmp_path):
+        engine = EmailTemplateEngine(cache_dir=str(tmp_path))
+
+        assert engine.render_text("email/missing.html", {}) is None
+
+
+class TestSendMany:
+    """Test batched rendering in the shared thread pool."""
+
+    async def test_renders_off_loop_in_batches(self):
+        service = EmailService(client=Mock())
+        service.client.send.return_value = {"ok": True, "message_id": "m"}
+        threads = set()
+        render = service.render_email
+
+        def _render(template_name, context):
+            threads.add(threading.get_ident())
+            return render(template_name, context)
+
+        service.render_email = _render
+        messages = [
+            TemplatedEmail(to=f"u{i}@example.com", template_name="email/new_announcement.html",
+                           context=_announcement_context(), tracking_id=str(i))
+            for i in range(5)
+        ]
+
+        results = await service.send_many(messages, batch_size=2)
+
+        assert [r["tracking_id"] for r in results] == ["0", "1", "2", "3", "4"]
+        assert all(r["success"] for r in results)
+        assert threading.get_ident() not in threads
+        text = service.client.send.call_args.kwargs["text"]
+        assert "홍길동" in text and "<" not in text
+
+    async def test_failures_are_reported_per_message(self):
+        service = EmailService(client=Mock())
+        service.client.send.return_value = {"ok": True}
+
+        results = await service.send_many([
+            TemplatedEmail(to="a@example.com", template_name="email/missing.html", context={}),
+            TemplatedEmail(to="b@example.com", template_name="email/new_announcement.html",
+                           context=_announcement_context()),
+        ])
+
+        assert results[0]["success"] is False
+        assert "error" in results[0]
+        assert results[1]["success"] is True
+
+
+class TestSenderHeaders:
+    """Test that sender, reply-to and priority reach the SMTP message."""
+
+    async def test_templated_email_carries_headers(self):
+        smtp_settings = Mock(smtp_from_email="noreply@example.com", smtp_from_name="한국 공공데이터 플랫폼")
+        client = EmailClient("smtp", smtp_settings=smtp_settings)
+        client._send_smtp = Mock(return_value={"ok": True})
+        service = EmailService(client=client)
+
+        await service.send_templated_email(
+            to="user@example.com",
+            template_name="email/new_announcement.html",
+            context=_announcement_context(),
+            from_email="alerts@example.com",
+            reply_to="help@example.com",
+            priority="high",
+        )
+
+        to, subject, html, text, meta = client._send_smtp.call_args.args
+        built = client._build_message(to, subject, html, text, meta)
+        assert built["From"] == "alerts@example.com"
+        assert built["Reply-To"] == "help@example.com"
+        assert (built["X-Priority"], built["X-MSMail-Priority"]) == ("1", "High")
+
+    def test_defaults_without_overrides(self):
+        client = EmailClient(
+            "smtp", smtp_settings=Mock(smtp_from_email="noreply@example.com", smtp_from_name="한국 공공데이터 플랫폼")
+        )
+
+        built = client._build_message("u@example.com", "s", "<p>hi</p>", None, {"priority": "normal"})
+
+        assert str(make_header(decode_header(built["From"]))) == "한국 공공데이터 플랫폼 <noreply@example.com>"
+        assert built["Reply-To"] is None
+        assert built["X-Priority"] is None
@@ -0,0 +1,167 @@
+"""
+Unit tests for the Redis Stream domain event publisher/consumer and stream-driven alert matching.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from bson import ObjectId
+
+from app.domains.alerts.stream_consumer import AlertEventHandler
+from app.shared.events.domain_events import AnnouncementCreatedEvent, AnnouncementUpdatedEvent
+from app.shared.events.stream import (
+    EventStreamConsumer,
+    EventStreamPublisher,
+    decode_event,
+    encode_event,
+)
+
+ANN_ID = "65f000000000000000000001"
+
+
+def _created(announcement_id=ANN_ID):
+    return AnnouncementCreatedEvent(announcement_id=announcement_id, title="AI 바우처", organization_name="중기부")
+
+
+def _consumer(client, handler=None, **kwargs):
+    return EventStreamConsumer(
+        client,
+        group="alerts-matcher",
+        consumer="worker-1",
+        handler=handler or AsyncMock(),
+        stream="domain-events",
+        **kwargs,
+    )
+
+
+class TestEventCodec:
+    """Test stream field encoding."""
+
+    def test_round_trip(self):
+        event = _created()
+
+        decoded = decode_event(encode_event(event))
+
+        assert isinstance(decoded, AnnouncementCreatedEvent)
+        assert decoded.event_id == event.event_id
+        assert decoded.announcement_id == ANN_ID
+
+    def test_unknown_type_is_ignored(self):
+        assert decode_event({"type": "SomethingElse", "payload": "{}"}) is None
+
+
+class TestEventStreamPublisher:
+    """Test pipelined XADD publishing."""
+
+    def test_publishes_batch_in_one_pipeline(self):
+        pipe = Mock()
+        client = Mock(pipeline=Mock(return_value=pipe))
+        publisher = EventStreamPublisher(client=client, stream="domain-events", maxlen=1000)
+
+        published = publisher.publish([_created(), _created("other")])
+
+        assert published == 2
+        assert pipe.xadd.call_count == 2
+        assert pipe.xadd.call_args.kwargs == {"maxlen": 1000, "approximate": True}
+        pipe.execute.assert_called_once()
+
+    def test_redis_failure_does_not_raise(self):
+        pipe = Mock(execute=Mock(side_effect=ConnectionError("down")))
+        publisher = EventStreamPublisher(client=Mock(pipeline=Mock(return_value=pipe)), stream="domain-events")
+
+        assert publisher.publish([_created()]) == 0
+
+    def test_empty_batch_skips_redis(self):
+        client = Mock()
+
+        assert EventStreamPublisher(client=client).publish([]) == 0
+        client.pipeline.assert_not_called()
+
+
+class TestEventStreamConsumer:
+    """Test consumer group processing, reclaim and dead-lettering."""
+
+    async def test_process_handles_batch_then_acks_all(self):
+        client = Mock(xack=AsyncMock())
+        handler = AsyncMock()
+        consumer = _consumer(client, handler)
+        entries = [
+            ("1-0", encode_event(_created())),
+            ("2-0", {"type": "Unknown", "payload": "{}"}),
+        ]
+
+        handled = await consumer.process(entries)
+
+        assert handled == 1
+        assert len(handler.await_args[0][0]) == 1
+        client.xack.assert_awaited_once_with("domain-events", "alerts-matcher", "1-0", "2-0")
+
+    async def test_handler_failure_leaves_entries_pending(self):
+        client = Mock(xack=AsyncMock())
+        consumer = _consumer(client, AsyncMock(side_effect=RuntimeError("boom")))
+
+        with pytest.raises(RuntimeError):
+            await consumer.process([("1-0", encode_event(_created()))])
+
+        client.xack.assert_not_awaited()
+
+    async def test_reclaim_dead_letters_exhausted_and_claims_idle(self):
+        fields = encode_event(_created())
+        client = Mock(
+            xpending_range=AsyncMock(return_value=[
+                {"message_id": "1-0", "times_delivered": 5},
+                {"message_id": "2-0", "times_delivered": 1},
+            ]),
+            xrange=AsyncMock(return_value=[("1-0", fields)]),
+            xadd=AsyncMock(),
+            xack=AsyncMock(),
+            xautoclaim=AsyncMock(return_value=["3-0", [("2-0", fields), ("4-0", None)], []]),
+        )
+        consumer = _consumer(client, max_deliveries=5)
+
+        entries = await consumer.reclaim()
+
+        client.xadd.assert_awaited_once_with("domain-events:dead", {**fields, "source_id": "1-0"})
+        client.xack.assert_awaited_once_with("domain-events", "alerts-matcher", "1-0")
+        assert entries == [("2-0", fields)]
+        assert consumer._reclaim_cursor == "3-0"
+
+    async def test_ensure_group_ignores_existing_group(self):
+        client = Mock(xgroup_create=AsyncMock(side_effect=Exception("BUSYGROUP Consumer Group name already exists")))
+
+        await _consumer(client).ensure_group()
+
+        client.xgroup_create.assert_awaited_once_with("domain-events", "alerts-matcher", id="0", mkstream=True)
+
+
+class TestAlertEventHandler:
+    """Test stream-driven matching of referenced announcements."""
+
+    def _handler(self):
+        announcements = Mock(find=Mock(return_value="cursor"))
+        db = MagicMock()
+        db.__getitem__.side_effect = lambda name: announcements
+        pipeline = Mock(process=AsyncMock(return_value=1))
+        return AlertEventHandler(db, pipeline=pipeline), announcements, pipeline
+
+    async def test_loads_referenced_announcements_in_one_query(self):
+        handler, announcements, pipeline = self._handler()
+
+        await handler([
+            _created(),
+            _created(),
+            AnnouncementUpdatedEvent(announcement_id="legacy-id", changes={"announcement_data": {}}),
+        ])
+
+        query = announcements.find.call_args[0][0]
+        assert query["_id"]["$in"] == [ObjectId(ANN_ID), "legacy-id"]
+        assert query["is_active"] == {"$ne": False}
+        pipeline.process.assert_awaited_once_with("cursor")
+
+    async def test_irrelevant_updates_are_skipped(self):
+        handler, announcements, pipeline = self._handler()
+
+        await handler([AnnouncementUpdatedEvent(announcement_id=ANN_ID, changes={"updated_at": "now"})])
+
+        announcements.find.assert_not_called()
+        pipeline.process.assert_not_awaited()
@@ -0,0 +1,197 @@
+"""
+Unit tests for the Google OAuth client fast path.
+
+Google endpoints are served by an in-process httpx.MockTransport; ID tokens
+are signed with a locally generated RSA key published through a fake JWKS.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt
+
+from app.core.security import _BoundedTTLStore
+from app.shared.clients.google_oauth_client import DEFAULT_ENDPOINTS, GoogleOAuthClient
+
+CLIENT_ID = "test-client.apps.googleusercontent.com"
+
+
+def _b64(value: int) -> str:
+    raw = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+_private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+PRIVATE_PEM = _private_key.private_bytes(
+    serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+).decode()
+_numbers = _private_key.public_key().public_numbers()
+JWKS = {"keys": [{"kty": "RSA", "alg": "RS256", "use": "sig", "kid": "k1", "n": _b64(_numbers.n), "e": _b64(_numbers.e)}]}
+
+
+def make_id_token(kid="k1", **overrides):
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "google-123",
+        "email": "user@example.com",
+        "email_verified": True,
+        "name": "Test User",
+        "picture": "https://example.com/p.png",
+        "iat": now,
+        "exp": now + 3600,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, PRIVATE_PEM, algorithm="RS256", headers={"kid": kid})
+
+
+class FakeGoogle:
+    """Counts calls per endpoint and answers like Google would."""
+
+    def __init__(self, id_token=None):
+        self.id_token = id_token
+        self.calls = {}
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.calls[path] = self.calls.get(path, 0) + 1
+        if path.endswith("openid-configuration"):
+            return httpx.Response(200, json=DEFAULT_ENDPOINTS, headers={"cache-control": "public, max-age=3600"})
+        if path.endswith("/certs"):
+            return httpx.Response(200, json=JWKS, headers={"cache-control": "public, max-age=20000"})
+        if path.endswith("/token"):
+            body = {"access_token": "ya29.token", "expires_in": 3599}
+            if self.id_token:
+                body["id_token"] = self.id_token
+            return httpx.Response(200, json=body)
+        if path.endswith("/userinfo"):
+            return httpx.Response(200, json={"id": "google-123", "email": "user@example.com", "name": "Test User"})
+        return httpx.Response(404)
+
+    def count(self, suffix):
+        return sum(n for path, n in self.calls.items() if path.endswith(suffix))
+
+
+@pytest.fixture
+def oauth_client():
+    client = GoogleOAuthClient()
+    client.client_id = CLIENT_ID
+    client.client_secret = "secret"
+    return client
+
+
+def _patched(fake):
+    http = httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))
+    return patch("app.shared.clients.google_oauth_client.get_http_client", return_value=http)
+
+
+def _state(data=None):
+    return patch(
+        "app.shared.clients.google_oauth_client.security.get_oauth_state_async",
+        AsyncMock(return_value=data if data is not None else {"redirect_url": "http://localhost/cb"}),
+    )
+
+
+class TestTokenExchange:
+    """Test code exchange with local ID token verification."""
+
+    async def test_id_token_skips_userinfo_and_caches_jwks(self, oauth_client):
+        fake = FakeGoogle(id_token=make_id_token())
+
+        with _patched(fake), _state():
+            first = await oauth_client.exchange_code_for_tokens("code", "state")
+            second = await oauth_client.exchange_code_for_tokens("code", "state")
+
+        assert first["user_info"]["external_id"] == "google-123"
+        assert first["user_info"]["verified_email"] is True
+        assert second["user_info"] == first["user_info"]
+        assert fake.count("/userinfo") == 0
+        assert fake.count("/certs") == 1
+        assert fake.count("openid-configuration") == 1
+        assert fake.count("/token") == 2
+
+    async def test_invalid_audience_rejected(self, oauth_client):
+        fake = FakeGoogle(id_token=make_id_token(aud="someone-else"))
+
+        with _patched(fake), _state():
+            assert await oauth_client.exchange_code_for_tokens("code", "state") is None
+        assert fake.count("/userinfo") == 0
+
+    async def test_token_header_algorithm_is_not_trusted(self, oauth_client):
+        now = int(time.time())
+        claims = {"iss": "https://accounts.google.com", "aud": CLIENT_ID, "sub": "x", "iat": now, "exp": now + 3600}
+        # 공개 키를 HMAC 비밀로 쓰는 alg 혼동 공격
+        public_pem = _private_key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        signing_input = b".".join(
+            base64.urlsafe_b64encode(json.dumps(part).encode()).rstrip(b"=")
+            for part in ({"alg": "HS256", "typ": "JWT", "kid": "k1"}, claims)
+        )
+        signature = base64.urlsafe_b64encode(hmac.new(public_pem, signing_input, hashlib.sha256).digest()).rstrip(b"=")
+        forged = (signing_input + b"." + signature).decode()
+        fake = FakeGoogle(id_token=forged)
+
+        with _patched(fake), _state():
+            assert await oauth_client.exchange_code_for_tokens("code", "state") is None
+
+    async def test_missing_claims_fall_back_to_userinfo(self, oauth_client):
+        fake = FakeGoogle(id_token=make_id_token(name=None))
+
+        with _patched(fake), _state():
+            result = await oauth_client.exchange_code_for_tokens("code", "state")
+
+        assert result["user_info"]["name"] == "Test User"
+        assert fake.count("/userinfo") == 1
+
+    async def test_unknown_kid_refetch_is_rate_limited(self, oauth_client):
+        fake = FakeGoogle(id_token=make_id_token(kid="rotated"))
+
+        with _patched(fake), _state():
+            assert await oauth_client.exchange_code_for_tokens("code", "state") is None
+            assert await oauth_client.exchange_code_for_tokens("code", "state") is None
+
+        assert fake.count("/certs") == 1
+
+    async def test_invalid_state_raises(self, oauth_client):
+        with _state({}):
+            with pytest.raises(ValueError):
+                await oauth_client.exchange_code_for_tokens("code", "state")
+
+
+class TestBoundedTTLStore:
+    """Test the in-memory OAuth state fallback."""
+
+    def test_use_once(self):
+        store = _BoundedTTLStore(max_entries=10)
+        store.set("s", {"a": 1}, 60)
+
+        assert store.pop("s") == (True, {"a": 1})
+        assert store.pop("s") == (False, None)
+
+    def test_size_is_capped(self):
+        store = _BoundedTTLStore(max_entries=3)
+        for i in range(10):
+            store.set(f"s{i}", i, 60)
+
+        assert len(store) == 3
+        assert list(store.values) == ["s7", "s8", "s9"]
+
+    def test_expired_entries_evicted_on_write(self):
+        store = _BoundedTTLStore(max_entries=100)
+        store.set("old", 1, 60)
+        store.expiry["old"] = time.time() - 1
+
+        store.set("new", 2, 60)
+
+        assert "old" not in store.values
+        assert store.pop("new") == (True, 2)
@@ -0,0 +1,205 @@
+"""
+Unit tests for the declarative index registry.
+
+Covers idempotent application, drift reporting and the removal of index
+checks from repository construction.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pymongo import ASCENDING, DESCENDING, TEXT
+
+from app.core.indexes import (
+    IndexSpec,
+    apply_indexes,
+    apply_indexes_async,
+    diff_collection,
+    index_registry,
+    load_domain_indexes,
+)
+from app.domains.users.repository import UserRepository
+from tests.conftest import AsyncCursor
+
+
+class _FakeCollection:
+    def __init__(self, indexes=None, rejected=()):
+        self.indexes = [{"name": "_id_", "key": {"_id": 1}}] + list(indexes or [])
+        self.rejected = set(rejected)
+        self.create_calls = 0
+
+    def list_indexes(self):
+        return list(self.indexes)
+
+    def create_indexes(self, models):
+        self.create_calls += 1
+        documents = [dict(model.document) for model in models]
+        for document in documents:
+            if document["name"] in self.rejected:
+                raise RuntimeError(f"Index build failed: {document['name']}")
+        self.indexes.extend(documents)
+        return [document["name"] for document in documents]
+
+    def create_index(self, keys, name=None, **options):
+        if name in self.rejected:
+            raise RuntimeError(f"Index build failed: {name}")
+        self.indexes.append({"name": name, "key": dict(keys), **options})
+        return name
+
+
+class _FakeDB(dict):
+    def __missing__(self, name):
+        self[name] = _FakeCollection()
+        return self[name]
+
+
+class _FakeAsyncCollection(_FakeCollection):
+    def list_indexes(self):
+        return AsyncCursor(self.indexes)
+
+    async def create_indexes(self, models):
+        return _FakeCollection.create_indexes(self, models)
+
+    async def create_index(self, keys, name=None, **options):
+        return _FakeCollection.create_index(self, keys, name=name, **options)
+
+
+class _FakeAsyncDB(dict):
+    def __missing__(self, name):
+        self[name] = _FakeAsyncCollection()
+        return self[name]
+
+
+class TestIndexSpec:
+    """Test index declarations."""
+
+    def test_default_name_matches_mongodb(self):
+        assert IndexSpec.build("users", "email").name == "email_1"
+        assert IndexSpec.build("users", [("provider", 1), ("external_id", 1)]).name == "provider_1_external_id_1"
+
+    def test_domain_modules_register_indexes(self):
+        load_domain_indexes()
+
+        assert {"users", "alerts", "announcements"} <= set(index_registry.domains())
+        users = {spec.name for spec in index_registry.specs(["users"])}
+        assert {"email_1", "provider_1_external_id_1", "is_active_1", "is_verified_1", "user_id_1"} == users
+
+
+class TestDiff:
+    """Test drift detection."""
+
+    def test_matches_by_key_not_name(self):
+        spec = IndexSpec.build("notifications", [("user_id", ASCENDING), ("content_id", ASCENDING)],
+                               name="uniq_user_content", unique=True)
+        existing = [{"name": "user_id_1_content_id_1", "key": {"user_id": 1, "content_id": 1}, "unique": True}]
+
+        drift = diff_collection("notifications", [spec], existing)
+
+        assert not drift.has_drift
+
+    def test_reports_option_mismatch_and_extra(self):
+        spec = IndexSpec.build("users", "email", unique=True)
+        existing = [
+            {"name": "_id_", "key": {"_id": 1}},
+            {"name": "email_1", "key": {"email": 1}},
+            {"name": "legacy_idx", "key": {"legacy": 1}},
+        ]
+
+        drift = diff_collection("users", [spec], existing)
+
+        assert drift.missing == []
+        assert drift.mismatched[0]["differences"]["unique"] == {"expected": True, "actual": False}
+        assert drift.extra == ["legacy_idx"]
+
+    def test_text_index_matches_stored_form(self):
+        spec = IndexSpec.build("contents", [("$**", TEXT)], name="idx_text_search")
+        existing = [{"name": "idx_text_search", "key": {"_fts": "text", "_ftsx": 1}, "weights": {"$**": 1}}]
+
+        assert not diff_collection("contents", [spec], existing).has_drift
+
+
+class TestApply:
+    """Test idempotent application."""
+
+    def test_creates_only_missing_in_one_call(self):
+        db = _FakeDB()
+        db["users"] = _FakeCollection([{"name": "email_1", "key": {"email": 1}, "unique": True}])
+
+        report = apply_indexes(db, domains=["users"])
+
+        assert "users.email_1" not in report.created
+        assert "users.is_active_1" in report.created
+        assert db["users"].create_calls == 1
+        assert not report.has_drift
+
+    def test_second_run_is_noop(self):
+        db = _FakeDB()
+        apply_indexes(db, domains=["users", "alerts"])
+
+        report = apply_indexes(db, domains=["users", "alerts"])
+
+        assert report.created == []
+        assert not report.has_drift
+        assert all(collection.create_calls == 1 for collection in db.values())
+
+    def test_check_only_does_not_create(self):
+        db = _FakeDB()
+
+        report = apply_indexes(db, domains=["users"], create_missing=False)
+
+        assert report.has_drift
+        assert db["users"].create_calls == 0
+
+    def test_list_failure_reported_per_collection(self):
+        db = _FakeDB()
+        db["users"] = MagicMock()
+        db["users"].list_indexes.side_effect = RuntimeError("not authorized")
+
+        report = apply_indexes(db, domains=["users"])
+
+        errors = {c.collection: c.errors for c in report.collections}
+        assert errors["users"] == ["not authorized"]
+        assert errors["user_settings"] == []
+
+    def test_failing_spec_does_not_block_the_others(self):
+        db = _FakeDB()
+        db["users"] = _FakeCollection(rejected={"email_1"})
+
+        report = apply_indexes(db, domains=["users"])
+
+        drift = next(c for c in report.collections if c.collection == "users")
+        assert "is_active_1" in drift.created and "email_1" not in drift.created
+        assert [m["name"] for m in drift.missing] == ["email_1"]
+        assert len(drift.errors) == 1 and drift.errors[0].startswith("email_1: ")
+
+    async def test_async_failing_spec_does_not_block_the_others(self):
+        db = _FakeAsyncDB()
+        db["users"] = _FakeAsyncCollection(rejected={"email_1"})
+
+        report = await apply_indexes_async(db, domains=["users"])
+
+        drift = next(c for c in report.collections if c.collection == "users")
+        assert "is_active_1" in drift.created
+        assert [m["name"] for m in drift.missing] == ["email_1"]
+        assert drift.errors[0].startswith("email_1: ")
+
+    async def test_async_apply(self):
+        db = _FakeAsyncDB()
+
+        first = await apply_indexes_async(db, domains=["alerts"])
+        second = await apply_indexes_async(db, domains=["alerts"])
+
+        assert "notifications.uniq_user_sub_content" in first.created
+        assert second.created == []
+
+
+class TestRequestPath:
+    """Index checks no longer run on repository construction."""
+
+    def test_user_repository_init_skips_index_checks(self):
+        db = MagicMock()
+
+        UserRepository(db_client=db)
+
+        db.users.list_indexes.assert_not_called()
+        db.users.create_index.assert_not_called()
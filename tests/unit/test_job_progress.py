@@ -0,0 +1,213 @@
+"""
+Unit tests for batch job progress events and the SSE stream reader.
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+from app.domains.announcements.batch_service import AnnouncementBatchService, BatchProgress
+from app.shared.jobs import (
+    JobProgress,
+    JobProgressPublisher,
+    PageChunk,
+    ProgressEvent,
+    format_sse,
+    progress_stream,
+    read_progress,
+)
+
+
+def _progress(**overrides):
+    values = dict(
+        current_page=20, total_pages=40, processed_items=2000, estimated_total=4000,
+        start_time=datetime.now(), elapsed_time=10.0, estimated_remaining_time=10.0,
+        job_id="job-1", pages_done=20, pages_this_run=20, new_items=150,
+        duplicate_items=1800, error_count=50,
+    )
+    values.update(overrides)
+    return BatchProgress(**values)
+
+
+def _entry(entry_id, status="running", pages_done=0):
+    event = ProgressEvent(job_id="job-1", status=status, pages_done=pages_done)
+    return entry_id, {"data": event.to_json()}
+
+
+class _RangeStore:
+    """Two 20-page ranges; ranges in ``held`` are leased by another worker"""
+
+    def __init__(self, held=()):
+        self.status = {1: "pending", 21: "pending"}
+        self.status.update({start: "leased" for start in held})
+
+    def ensure_job(self, job_id, kind, first_page, last_page, chunk_pages=None, params=None):
+        return {"_id": job_id, "first_page": 1, "last_page": 40}
+
+    def claim(self, job_id, worker_id=None):
+        for start, status in sorted(self.status.items()):
+            if status == "pending":
+                self.status[start] = "leased"
+                return PageChunk(job_id=job_id, start=start, end=start + 19, lease_token="t")
+        return None
+
+    def complete(self, chunk, counters=None):
+        self.status[chunk.start] = "done"
+        return True
+
+    def progress(self, job_id):
+        done = sum(20 for status in self.status.values() if status == "done")
+        return JobProgress(job_id=job_id, status="running", pages_done=done, total_pages=40)
+
+    def finish_if_done(self, job_id):
+        return all(status == "done" for status in self.status.values())
+
+
+def _batch_service(store):
+    api_client = Mock()
+    api_client.async_get_announcement_information = AsyncMock(return_value=Mock(success=True))
+    service = AnnouncementBatchService(Mock(), api_client, job_store=store)
+
+    async def process_page(semaphore, page, *args):
+        return 100, 10, 90, []
+
+    service._process_single_page = process_page
+    return service
+
+
+class _FakeStreamClient:
+    """xrevrange / xread over a list of entries (empty reads are heartbeats)"""
+
+    def __init__(self, entries, reads):
+        self.entries = entries
+        self.reads = list(reads)
+        self.cursors = []
+
+    async def xrevrange(self, stream, count=None):
+        return list(reversed(self.entries))[:count]
+
+    async def xread(self, streams, count=None, block=None):
+        self.cursors.append(next(iter(streams.values())))
+        batch = self.reads.pop(0) if self.reads else []
+        return [(next(iter(streams)), batch)] if batch else []
+
+
+class TestProgressEvent:
+    """Test rate / ETA calculation and SSE framing."""
+
+    def test_from_batch_reports_rates_error_rate_and_eta(self):
+        event = ProgressEvent.from_batch(_progress())
+
+        assert event.pages_per_second == 2.0
+        assert event.items_per_second == 200.0
+        assert event.error_rate == 0.025
+        assert event.eta_seconds == 10.0
+        assert (event.new_items, event.duplicate_items, event.errors) == (150, 1800, 50)
+        assert not event.finished
+
+    def test_no_items_means_zero_error_rate(self):
+        event = ProgressEvent.from_batch(_progress(processed_items=0, error_count=0, elapsed_time=0.0))
+
+        assert event.error_rate == 0.0
+        assert event.items_per_second == 0.0
+
+    def test_format_sse_frames_id_event_and_json_data(self):
+        event = ProgressEvent(job_id="job-1", status="completed", pages_done=40)
+
+        frame = format_sse(event, "1-0")
+
+        lines = frame.rstrip("\n").split("\n")
+        assert lines[:2] == ["id: 1-0", "event: progress"]
+        assert json.loads(lines[2][len("data: "):])["pages_done"] == 40
+        assert frame.endswith("\n\n")
+
+
+class TestJobProgressPublisher:
+    """Test that events are appended to a capped, expiring stream."""
+
+    async def test_publish_appends_and_sets_ttl(self):
+        pipe = Mock(execute=AsyncMock())
+        client = Mock(pipeline=Mock(return_value=pipe))
+        publisher = JobProgressPublisher(client=client, maxlen=50, ttl_seconds=60)
+
+        await publisher(_progress())
+
+        stream, fields = pipe.xadd.call_args[0]
+        assert stream == progress_stream("job-1")
+        assert ProgressEvent.from_json(fields["data"]).pages_done == 20
+        assert pipe.xadd.call_args[1] == {"maxlen": 50, "approximate": True}
+        pipe.expire.assert_called_once_with(stream, 60)
+
+    async def test_redis_errors_do_not_propagate(self):
+        pipe = Mock(execute=AsyncMock(side_effect=ConnectionError("down")))
+        publisher = JobProgressPublisher(client=Mock(pipeline=Mock(return_value=pipe)))
+
+        assert not await publisher.publish(ProgressEvent(job_id="job-1", status="running"))
+
+
+class TestReadProgress:
+    """Test late join, resume, heartbeats and termination."""
+
+    async def test_late_joiner_gets_latest_event_then_follows(self):
+        client = _FakeStreamClient(
+            entries=[_entry("1-0", pages_done=20), _entry("2-0", pages_done=40)],
+            reads=[[], [_entry("3-0", status="completed", pages_done=60)]],
+        )
+
+        received = [(i, e and e.pages_done) async for i, e in read_progress(client, "job-1", block_ms=1)]
+
+        assert received == [("2-0", 40), (None, None), ("3-0", 60)]
+        assert client.cursors == ["2-0", "2-0"]
+
+    async def test_last_event_id_resumes_without_replaying_latest(self):
+        client = _FakeStreamClient(
+            entries=[_entry("1-0"), _entry("2-0")],
+            reads=[[_entry("3-0", status="failed")]],
+        )
+
+        received = [i async for i, _ in read_progress(client, "job-1", last_event_id="1-0", block_ms=1)]
+
+        assert received == ["3-0"]
+        assert client.cursors == ["1-0"]
+
+    async def test_finished_job_closes_immediately(self):
+        client = _FakeStreamClient(entries=[_entry("5-0", status="completed")], reads=[])
+
+        received = [i async for i, _ in read_progress(client, "job-1", block_ms=1)]
+
+        assert received == ["5-0"]
+        assert client.cursors == []
+
+    async def test_idle_stream_times_out(self):
+        client = _FakeStreamClient(entries=[], reads=[])
+
+        received = [i async for i, _ in read_progress(client, "job-1", block_ms=1, idle_timeout=0.001)]
+
+        assert all(i is None for i in received)
+        assert client.cursors
+
+
+class TestBatchServiceProgressEvents:
+    """Test the progress reports emitted by collect_all_announcements."""
+
+    async def test_reports_per_range_and_final_completed(self):
+        service = _batch_service(_RangeStore())
+        reports = []
+        service.set_progress_callback(AsyncMock(side_effect=reports.append))
+
+        await service.collect_all_announcements(max_pages=40, job_id="job-1")
+
+        assert [r.status for r in reports] == ["running", "running", "completed"]
+        assert [r.pages_done for r in reports] == [20, 40, 40]
+        assert reports[-1].new_items == 400
+        assert reports[-1].pages_this_run == 40
+
+    async def test_unfinished_job_stays_running(self):
+        # 다른 워커가 두 번째 구간을 잡고 있음
+        service = _batch_service(_RangeStore(held=[21]))
+        reports = []
+        service.set_progress_callback(AsyncMock(side_effect=reports.append))
+
+        await service.collect_all_announcements(max_pages=40, job_id="job-1")
+
+        assert reports[-1].status == "running"
@@ -0,0 +1,90 @@
+"""
+Unit tests for lazy import helpers and the settings-driven router registry.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from app.core.lazy import LazyObject, import_string
+from app.core.router_registry import RouterSpec, enabled_router_specs, include_enabled_routers
+
+
+_router = APIRouter()
+
+
+@_router.get("/ping")
+async def _ping():
+    return {"ok": True}
+
+
+def _router_factory():
+    return _router
+
+
+def _broken_factory():
+    raise ImportError("optional dependency missing")
+
+
+class TestLazyObject:
+    """Test LazyObject proxy."""
+
+    def test_import_string(self):
+        assert import_string("os.path:join") is __import__("os").path.join
+        assert import_string("json") is __import__("json")
+
+    def test_loads_on_first_access(self):
+        proxy = LazyObject("json:dumps")
+        assert not proxy.is_loaded
+
+        assert proxy({"a": 1}) == '{"a": 1}'
+        assert proxy.is_loaded
+
+    def test_patch_through_proxy(self):
+        proxy = LazyObject(f"{__name__}:_router")
+
+        with patch.object(proxy, "prefix", "/patched"):
+            assert _router.prefix == "/patched"
+        assert _router.prefix == ""
+
+    def test_follows_patched_source(self):
+        proxy = LazyObject(f"{__name__}:_router_factory")
+
+        with patch(f"{__name__}._router_factory", return_value="mocked"):
+            assert proxy() == "mocked"
+        assert proxy() is _router
+
+
+class TestRouterRegistry:
+    """Test settings-driven router registration."""
+
+    SPECS = (
+        RouterSpec("direct", f"{__name__}:_router"),
+        RouterSpec("factory", f"{__name__}:_router_factory", prefix="/api"),
+        RouterSpec("flagged", f"{__name__}:_router", prefix="/flag", feature_flag="flag_on"),
+        RouterSpec("broken", f"{__name__}:_broken_factory", optional=True),
+    )
+
+    def test_enabled_specs_respect_settings_and_flags(self):
+        settings = SimpleNamespace(enabled_routers=["factory", "flagged"], flag_on=False)
+
+        assert [s.name for s in enabled_router_specs(settings, self.SPECS)] == ["factory"]
+
+    def test_include_mounts_in_declaration_order(self):
+        app = FastAPI()
+        settings = SimpleNamespace(enabled_routers=["flagged", "direct", "broken", "unknown"], flag_on=True)
+
+        mounted = include_enabled_routers(app, settings, self.SPECS)
+
+        assert mounted == ["direct", "flagged"]
+        paths = [r.path for r in app.routes if r.path.endswith("/ping")]
+        assert paths == ["/api/v1/ping", "/flag/ping"]
+
+    def test_required_router_failure_raises(self):
+        spec = RouterSpec("broken", f"{__name__}:_broken_factory")
+        settings = SimpleNamespace(enabled_routers=["broken"])
+
+        with pytest.raises(ImportError):
+            include_enabled_routers(FastAPI(), settings, [spec])
@@ -0,0 +1,201 @@
+"""
+Unit tests for the structured logging pipeline.
+
+Covers the orjson formatter, the deferred-formatting queue handler,
+per-logger rate capping and sampled DEBUG spans.
+"""
+
+import json
+import logging
+import queue
+from unittest.mock import patch
+
+import pytest
+
+from app.core.logging_config import (
+    ContextQueueHandler,
+    LoggerRateLimitFilter,
+    StructuredFormatter,
+    log_span,
+    set_correlation_id,
+    correlation_context,
+)
+
+
+def _make_record(name: str = "test.logger", level: int = logging.INFO,
+                 msg: str = "hello %s", args=("world",), **extra) -> logging.LogRecord:
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestStructuredFormatter:
+    """Test JSON output of StructuredFormatter."""
+
+    def teardown_method(self):
+        correlation_context.clear()
+
+    def test_formats_message_and_promoted_fields(self):
+        record = _make_record(duration_ms=12.5, status_code=200, path="/api/v1/x")
+        data = json.loads(StructuredFormatter().format(record))
+
+        assert data["message"] == "hello world"
+        assert data["level"] == "INFO"
+        assert data["logger_name"] == "test.logger"
+        assert data["duration_ms"] == 12.5
+        assert data["status_code"] == 200
+        assert data["extra"] == {"path": "/api/v1/x"}
+
+    def test_omits_empty_fields(self):
+        data = json.loads(StructuredFormatter().format(_make_record()))
+
+        assert "extra" not in data
+        assert "correlation_id" not in data
+        assert "request_id" not in data
+
+    def test_uses_context_captured_by_queue_handler(self):
+        set_correlation_id("corr-1")
+        record = ContextQueueHandler(queue.Queue()).prepare(_make_record())
+        correlation_context.clear()
+
+        data = json.loads(StructuredFormatter().format(record))
+
+        assert data["correlation_id"] == "corr-1"
+        assert data["message"] == "hello world"
+
+
+class TestContextQueueHandler:
+    """Test that records are enqueued unformatted but self-contained."""
+
+    def test_prepare_resolves_message_and_exception(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            import sys
+            record = _make_record(level=logging.ERROR)
+            record.exc_info = sys.exc_info()
+
+        prepared = ContextQueueHandler(queue.Queue()).prepare(record)
+
+        assert prepared.msg == "hello world"
+        assert prepared.args is None
+        assert prepared.exc_info is None
+        assert "ValueError: boom" in prepared.exc_text
+
+    def test_prepare_leaves_the_callers_record_untouched(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            import sys
+            record = _make_record(level=logging.ERROR)
+            record.exc_info = sys.exc_info()
+
+        prepared = ContextQueueHandler(queue.Queue()).prepare(record)
+
+        assert prepared is not record
+        assert (record.msg, record.args) == ("hello %s", ("world",))
+        assert record.exc_info is not None and record.exc_text is None
+        assert not hasattr(record, "_log_context")
+
+    def test_listener_delivers_records(self):
+        q = queue.Queue()
+        handler = ContextQueueHandler(q)
+        sink = _ListHandler()
+        listener = logging.handlers.QueueListener(q, sink, respect_handler_level=True)
+        listener.start()
+        try:
+            handler.handle(_make_record())
+        finally:
+            listener.stop()
+
+        assert [r.getMessage() for r in sink.records] == ["hello world"]
+
+
+class TestLoggerRateLimitFilter:
+    """Test per-logger token bucket behaviour."""
+
+    def test_caps_records_per_logger(self):
+        rate_filter = LoggerRateLimitFilter(rate_per_second=0.0001, burst=3)
+
+        passed = [rate_filter.filter(_make_record()) for _ in range(10)]
+
+        assert passed.count(True) == 3
+
+    def test_buckets_are_independent(self):
+        rate_filter = LoggerRateLimitFilter(rate_per_second=0.0001, burst=1)
+
+        assert rate_filter.filter(_make_record(name="hot.route"))
+        assert not rate_filter.filter(_make_record(name="hot.route"))
+        assert rate_filter.filter(_make_record(name="other.route"))
+
+    def test_warnings_are_exempt(self):
+        rate_filter = LoggerRateLimitFilter(rate_per_second=0.0001, burst=1)
+        rate_filter.filter(_make_record())
+
+        assert rate_filter.filter(_make_record(level=logging.WARNING))
+        assert rate_filter.filter(_make_record(level=logging.ERROR))
+
+    def test_reports_suppressed_count(self):
+        rate_filter = LoggerRateLimitFilter(rate_per_second=0.0001, burst=1)
+        rate_filter.filter(_make_record())
+        rate_filter.filter(_make_record())
+        rate_filter.filter(_make_record())
+
+        # Refill the bucket and let the next record through
+        rate_filter._buckets["test.logger"][0] = 1.0
+        record = _make_record()
+
+        assert rate_filter.filter(record)
+        assert record.suppressed_records == 2
+
+
+class TestLogSpan:
+    """Test sampled DEBUG span emission."""
+
+    @pytest.fixture
+    def span_logger(self):
+        logger = logging.getLogger("test.span")
+        sink = _ListHandler()
+        logger.addHandler(sink)
+        logger.propagate = False
+        yield logger, sink
+        logger.removeHandler(sink)
+        logger.propagate = True
+
+    def test_skipped_when_debug_disabled(self, span_logger):
+        logger, sink = span_logger
+        logger.setLevel(logging.INFO)
+
+        log_span(logger, "stage", 1.0, sample_rate=1.0)
+
+        assert sink.records == []
+
+    def test_emits_when_sampled(self, span_logger):
+        logger, sink = span_logger
+        logger.setLevel(logging.DEBUG)
+
+        log_span(logger, "stage", 1.23456, sample_rate=1.0, items=3)
+
+        assert len(sink.records) == 1
+        assert sink.records[0].operation == "stage"
+        assert sink.records[0].duration_ms == 1.235
+        assert sink.records[0].items == 3
+
+    def test_respects_sample_rate(self, span_logger):
+        logger, sink = span_logger
+        logger.setLevel(logging.DEBUG)
+
+        with patch("app.core.logging_config.random.random", return_value=0.5):
+            log_span(logger, "stage", 1.0, sample_rate=0.1)
+
+        assert sink.records == []
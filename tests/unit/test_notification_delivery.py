@@ -0,0 +1,289 @@
+"""
+Unit tests for the batched notification delivery worker, the shared token
+bucket and SMTP session reuse in EmailClient.
+"""
+
+import asyncio
+import smtplib
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from pymongo import UpdateOne
+
+from app.core.token_bucket import TokenBucket
+from app.domains.alerts.delivery import DeliveryStats, NotificationDeliveryWorker
+from app.domains.alerts.repository import quiet_hours_end
+from app.shared.clients.email_client import EmailClient
+from tests.conftest import AsyncCursor
+
+
+class _UnlimitedBucket:
+    def __init__(self):
+        self.requests = []
+
+    async def take(self, requested=1):
+        self.requests.append(requested)
+        return requested, 0.0
+
+
+def _notif(nid, user_id="u1", **fields):
+    return {
+        "_id": nid,
+        "user_id": user_id,
+        "subscription_id": "s1",
+        "domain": "announcements",
+        "content_id": "c1",
+        "channel": "email",
+        "score": 0.9,
+        **fields,
+    }
+
+
+@pytest.fixture
+def email_service():
+    service = Mock()
+    service.new_announcement_email = Mock(side_effect=lambda **kwargs: kwargs)
+    service.send_result = {"success": True, "message_id": "m"}
+    service.send_many = AsyncMock(side_effect=lambda messages: [dict(service.send_result) for _ in messages])
+    return service
+
+
+@pytest.fixture
+def worker(email_service):
+    db = MagicMock()
+    worker = NotificationDeliveryWorker(db, email_service=email_service, bucket=_UnlimitedBucket(), batch_size=10)
+    worker.notifications = Mock()
+    worker.notifications.bulk_write = AsyncMock()
+    worker._preload = AsyncMock(return_value={
+        "users": {"u1": {"email": "u1@example.com", "name": "U1"}, "u2": {"email": "u2@example.com"}},
+        "subscriptions": {"s1": {"keywords": ["ai"], "match_threshold": 0.5}},
+        "preferences": {},
+        "daily_counts": {},
+        "defaults": {"email_enabled": True, "new_announcements": True},
+        "contents": {"announcements": {"c1": {"title": "AI"}}},
+    })
+    return worker
+
+
+def _statuses(worker):
+    ops = [op for call in worker.notifications.bulk_write.call_args_list for op in call[0][0]]
+    return [(op._filter["_id"], op._doc["$set"]["status"]) for op in ops]
+
+
+class TestProcessBatch:
+    """Test per-batch decisions and the single bulk_write."""
+
+    async def test_sends_and_writes_once(self, worker, email_service):
+        stats = await worker.process_batch("tok", [_notif("n1"), _notif("n2", user_id="u2")])
+
+        assert (stats.sent, stats.failed, stats.skipped) == (2, 0, 0)
+        email_service.send_many.assert_awaited_once()
+        assert [m["user_email"] for m in email_service.send_many.await_args[0][0]] == ["u1@example.com", "u2@example.com"]
+        worker.notifications.bulk_write.assert_awaited_once()
+        assert _statuses(worker) == [("n1", "sent"), ("n2", "sent")]
+        assert worker.bucket.requests == [2]
+
+    async def test_updates_are_fenced_by_claim_token(self, worker):
+        await worker.process_batch("tok", [_notif("n1")])
+
+        op = worker.notifications.bulk_write.call_args[0][0][0]
+        assert isinstance(op, UpdateOne)
+        assert op._filter == {"_id": "n1", "claim_token": "tok"}
+        assert op._doc["$unset"] == {"claim_token": "", "claimed_at": ""}
+
+    async def test_applies_preferences_and_daily_limit(self, worker):
+        data = worker._preload.return_value
+        data["users"]["u3"] = {"email": "u3@example.com"}
+        data["preferences"] = {
+            "u2": {"email_enabled": False},
+            "u3": {"max_daily_notifications": 2},
+        }
+        data["daily_counts"] = {"u3": 1}
+
+        stats = await worker.process_batch("tok", [
+            _notif("n1", user_id="u2"),
+            _notif("n2", user_id="u3"),
+            _notif("n3", user_id="u3"),
+            _notif("n4", user_id="missing"),
+        ])
+
+        assert _statuses(worker) == [
+            ("n1", "skipped"),
+            ("n3", "skipped"),
+            ("n4", "failed"),
+            ("n2", "sent"),
+        ]
+        assert (stats.sent, stats.skipped, stats.failed) == (1, 2, 1)
+
+    async def test_quiet_hours_release_the_claim(self, worker):
+        worker._preload.return_value["preferences"] = {
+            "u1": {"quiet_hours_enabled": True, "quiet_hours_start": 0, "quiet_hours_end": 24},
+        }
+
+        stats = await worker.process_batch("tok", [_notif("n1")])
+
+        assert stats.deferred == 1
+        assert _statuses(worker) == [("n1", "queued")]
+        # 방해금지가 끝날 때까지 다시 claim 되지 않음
+        op = worker.notifications.bulk_write.call_args[0][0][0]
+        assert op._doc["$set"]["not_before"] > datetime.utcnow()
+
+    async def test_sent_slices_are_recorded_before_a_later_failure(self, worker, email_service):
+        worker.bucket.take = AsyncMock(return_value=(1, 0.0))
+        email_service.send_many.side_effect = [[{"success": True, "message_id": "m1"}], ConnectionError("smtp down")]
+
+        with pytest.raises(ConnectionError):
+            await worker.process_batch("tok", [_notif("n1"), _notif("n2", user_id="u2"), _notif("n3", user_id="u2")])
+
+        # n1 은 기록, 발송 중 실패한 n2 는 lease 만료까지 그대로, 시도하지 않은 n3 은 queued 로
+        assert _statuses(worker) == [("n1", "sent"), ("n3", "queued")]
+
+    async def test_failed_send_is_recorded(self, worker, email_service):
+        email_service.send_result = {"success": False, "error": "boom"}
+
+        stats = await worker.process_batch("tok", [_notif("n1")])
+
+        assert stats.failed == 1
+        op = worker.notifications.bulk_write.call_args[0][0][0]
+        assert op._doc["$set"]["delivery_info"]["error"] == "boom"
+
+
+class TestDefaults:
+    """Test that the worker builds its own collaborators."""
+
+    def test_default_email_service_is_instantiable(self):
+        from app.shared.services.email_service import EmailService
+
+        worker = NotificationDeliveryWorker(MagicMock(), bucket=_UnlimitedBucket())
+
+        assert isinstance(worker.email_service, EmailService)
+
+
+class TestClaimBatch:
+    """Test the claim protocol."""
+
+    async def test_claims_with_token_and_reloads(self):
+        worker = NotificationDeliveryWorker(MagicMock(), email_service=Mock(), bucket=_UnlimitedBucket(), batch_size=2)
+        worker.notifications = Mock()
+        worker.notifications.find = Mock(side_effect=[
+            AsyncCursor([{"_id": "n1"}, {"_id": "n2"}]),
+            AsyncCursor([_notif("n1")]),
+        ])
+        worker.notifications.update_many = AsyncMock()
+
+        token, claimed = await worker.claim_batch()
+
+        update_filter, update = worker.notifications.update_many.call_args[0]
+        assert update_filter["_id"] == {"$in": ["n1", "n2"]}
+        assert {"status": "queued", "not_before": {"$not": {"$gt": update["$set"]["claimed_at"]}}} in update_filter["$or"]
+        assert update["$set"]["claim_token"] == token
+        assert worker.notifications.find.call_args_list[1][0][0] == {"claim_token": token}
+        assert [n["_id"] for n in claimed] == ["n1"]
+
+    async def test_drain_stops_claiming_once_the_time_budget_is_spent(self):
+        worker = NotificationDeliveryWorker(MagicMock(), email_service=Mock(), bucket=_UnlimitedBucket())
+
+        async def slow_batch():
+            await asyncio.sleep(0.02)
+            return DeliveryStats(claimed=1, sent=1, batches=1)
+
+        worker.run_once = AsyncMock(side_effect=slow_batch)
+
+        stats = await worker.drain(max_batches=50, time_budget=0.03)
+
+        assert stats.batches == 2
+
+    async def test_drain_stops_when_nothing_is_claimed(self):
+        worker = NotificationDeliveryWorker(MagicMock(), email_service=Mock(), bucket=_UnlimitedBucket())
+        worker.claim_batch = AsyncMock(side_effect=[("t1", [_notif("n1")]), ("", [])])
+        worker.process_batch = AsyncMock(return_value=DeliveryStats(claimed=1, sent=1, batches=1))
+
+        stats = await worker.drain(max_batches=5)
+
+        assert stats.batches == 1
+        assert worker.claim_batch.await_count == 2
+
+
+class TestQuietHoursEnd:
+    """Test the deferral time for quiet hours."""
+
+    def test_overnight_window_ends_next_morning(self):
+        # 23:30 KST (14:30 UTC), 22-7시 방해금지 -> 다음날 07:00 KST (22:00 UTC)
+        now = datetime(2024, 3, 1, 14, 30, tzinfo=timezone.utc)
+        preferences = {"quiet_hours_start": 22, "quiet_hours_end": 7, "quiet_hours_timezone": "Asia/Seoul"}
+
+        assert quiet_hours_end(preferences, now) == datetime(2024, 3, 1, 22, 0)
+
+    def test_early_morning_ends_same_day(self):
+        # 03:00 KST (18:00 UTC 전날)
+        now = datetime(2024, 3, 1, 18, 0, tzinfo=timezone.utc)
+        preferences = {"quiet_hours_start": 22, "quiet_hours_end": 7, "quiet_hours_timezone": "Asia/Seoul"}
+
+        assert quiet_hours_end(preferences, now) == datetime(2024, 3, 1, 22, 0)
+
+
+class TestTokenBucket:
+    """Test partial grants and the local fallback."""
+
+    async def test_local_bucket_grants_up_to_capacity(self):
+        bucket = TokenBucket("test", rate=5)
+
+        granted, wait = await bucket.take(8)
+
+        assert granted == 5
+        assert 0 < wait <= 0.2
+
+    async def test_falls_back_when_redis_fails(self):
+        redis_client = Mock()
+        redis_client.register_script.return_value = AsyncMock(side_effect=ConnectionError("down"))
+        bucket = TokenBucket("test", rate=2, redis_client=redis_client)
+
+        assert (await bucket.take(1))[0] == 1
+
+    async def test_uses_redis_script_result(self):
+        script = AsyncMock(return_value=[3, 250])
+        redis_client = Mock()
+        redis_client.register_script.return_value = script
+        bucket = TokenBucket("alerts", rate=10, redis_client=redis_client)
+
+        assert await bucket.take(5) == (3, 0.25)
+        script.assert_awaited_once_with(keys=["token_bucket:alerts"], args=[10.0, 10.0, 5])
+
+
+class TestSmtpSessionReuse:
+    """Test that the SMTP provider keeps one session."""
+
+    def _settings(self):
+        return Mock(
+            smtp_host="smtp.example.com", smtp_port=587, smtp_use_tls=True,
+            smtp_username="user", smtp_password="pw", smtp_timeout_seconds=5,
+            smtp_from_email="noreply@example.com", smtp_from_name="알림",
+        )
+
+    def test_reuses_one_session(self):
+        with patch("app.shared.clients.email_client.smtplib.SMTP") as smtp_cls:
+            client = EmailClient("smtp", smtp_settings=self._settings())
+            for i in range(3):
+                assert client.send(f"u{i}@example.com", "s", "<p>hi</p>", "hi")["ok"]
+
+        assert smtp_cls.call_count == 1
+        assert smtp_cls.return_value.send_message.call_count == 3
+        smtp_cls.return_value.login.assert_called_once_with("user", "pw")
+
+    def test_reconnects_once_after_disconnect(self):
+        with patch("app.shared.clients.email_client.smtplib.SMTP") as smtp_cls:
+            smtp_cls.return_value.send_message.side_effect = [smtplib.SMTPServerDisconnected(), None]
+            client = EmailClient("smtp", smtp_settings=self._settings())
+
+            assert client.send("u@example.com", "s", "<p>hi</p>")["ok"]
+
+        assert smtp_cls.call_count == 2
+
+    def test_close_quits_session(self):
+        with patch("app.shared.clients.email_client.smtplib.SMTP") as smtp_cls:
+            client = EmailClient("smtp", smtp_settings=self._settings())
+            client.send("u@example.com", "s", "<p>hi</p>")
+            client.close()
+
+        smtp_cls.return_value.quit.assert_called_once()
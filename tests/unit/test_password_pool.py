@@ -0,0 +1,105 @@
+"""
+Unit tests for the bounded password hashing pool.
+
+Covers offloading, load shedding with 503 + Retry-After and transparent
+rehash-on-login after a cost change.
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from passlib.context import CryptContext
+
+from app.core.security import PasswordHasherBusy, PasswordHashPool
+from app.domains.users.models import AuthProvider, UserLogin
+from app.domains.users.service import UserService
+from app.shared.exceptions.custom_exceptions import ServiceUnavailableException
+
+
+def _context(rounds: int) -> CryptContext:
+    # sha256_crypt keeps the tests fast and independent of the bcrypt backend
+    return CryptContext(
+        schemes=["sha256_crypt"],
+        sha256_crypt__default_rounds=rounds,
+        sha256_crypt__min_rounds=rounds,
+        sha256_crypt__max_rounds=rounds,
+    )
+
+
+class TestPasswordHashPool:
+    """Test the pool itself."""
+
+    async def test_hash_and_verify_off_loop(self):
+        pool = PasswordHashPool(_context(1000), max_workers=1, max_pending=4)
+        try:
+            hashed = await pool.hash("secret")
+
+            assert await pool.verify("secret", hashed)
+            assert not await pool.verify("wrong", hashed)
+            assert pool.pending == 0
+        finally:
+            pool.shutdown()
+
+    async def test_sheds_load_when_saturated(self):
+        pool = PasswordHashPool(_context(1000), max_workers=1, max_pending=1, retry_after=3)
+        release = threading.Event()
+        try:
+            running = asyncio.ensure_future(pool.run(release.wait))
+            await asyncio.sleep(0.01)
+
+            with pytest.raises(PasswordHasherBusy) as exc:
+                await pool.hash("secret")
+            assert exc.value.retry_after == 3
+        finally:
+            release.set()
+            await running
+            pool.shutdown()
+
+        assert pool.pending == 0
+
+    async def test_verify_and_update_after_cost_change(self):
+        old_pool = PasswordHashPool(_context(1000), max_workers=1, max_pending=4)
+        new_pool = PasswordHashPool(_context(2000), max_workers=1, max_pending=4)
+        try:
+            old_hash = await old_pool.hash("secret")
+
+            verified, new_hash = await new_pool.verify_and_update("secret", old_hash)
+
+            assert verified
+            assert new_hash is not None and "rounds=2000" in new_hash
+            assert await new_pool.verify_and_update("secret", new_hash) == (True, None)
+        finally:
+            old_pool.shutdown()
+            new_pool.shutdown()
+
+
+class TestLoginWithPool:
+    """Test UserService login integration."""
+
+    @pytest.fixture
+    def service(self):
+        repository = Mock()
+        user = Mock(id="u1", email="a@example.com", password_hash="stored",
+                    is_active=True, provider=AuthProvider.LOCAL)
+        repository.get_by_email.return_value = user
+        return UserService(user_repository=repository)
+
+    async def test_rehash_persisted_on_login(self, service):
+        with patch("app.domains.users.service.verify_and_update_password_async",
+                   AsyncMock(return_value=(True, "rehashed"))), \
+                patch.object(service, "_to_user_response", return_value=None), \
+                patch("app.domains.users.service.TokenResponse"):
+            await service.login_local_user(UserLogin(email="a@example.com", password="Secret123!"))
+
+        service.user_repository.update_password_hash.assert_called_once_with("u1", "rehashed")
+
+    async def test_overload_returns_503_with_retry_after(self, service):
+        with patch("app.domains.users.service.verify_and_update_password_async",
+                   AsyncMock(side_effect=PasswordHasherBusy(2))):
+            with pytest.raises(ServiceUnavailableException) as exc:
+                await service.login_local_user(UserLogin(email="a@example.com", password="Secret123!"))
+
+        assert exc.value.status_code == 503
+        assert exc.value.headers["Retry-After"] == "2"
@@ -0,0 +1,208 @@
+"""
+Unit tests for the shared per-user preference cache.
+
+Covers the cache itself (copy-on-read, negative caching, batch lookups,
+write-through merge) and how the alerts and users repositories use it.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from app.core.preference_cache import PreferenceCache, preference_cache
+from app.domains.alerts.repository import AlertsRepository
+from app.domains.users.models import UserSettingsUpdate, UserInterestSettings
+from app.domains.users.repository import UserRepository
+from tests.conftest import AsyncCursor
+
+
+@pytest.fixture
+def alerts_repository():
+    collection = Mock()
+    collection.find_one = AsyncMock()
+    collection.update_one = AsyncMock()
+    collection.delete_one = AsyncMock()
+    db = MagicMock()
+    db.__getitem__.return_value = collection
+    repository = AlertsRepository(db)
+    repository.preferences = collection
+    return repository
+
+
+@pytest.fixture
+def users_repository():
+    db = Mock()
+    return UserRepository(db)
+
+
+class TestPreferenceCache:
+    """Test the cache primitives."""
+
+    def test_returns_copies(self):
+        cache = PreferenceCache(ttl_seconds=60)
+        cache.set("ns", "u1", {"keywords": ["ai"]})
+
+        found, value = cache.get("ns", "u1")
+        value["keywords"].append("bio")
+
+        assert found is True
+        assert cache.get("ns", "u1")[1] == {"keywords": ["ai"]}
+
+    def test_negative_entries(self):
+        cache = PreferenceCache(ttl_seconds=60)
+        cache.set("ns", "u1", None)
+
+        assert cache.get("ns", "u1") == (True, None)
+        assert cache.get("ns", "u2") == (False, None)
+
+    def test_expired_entries_are_misses(self, monkeypatch):
+        cache = PreferenceCache(ttl_seconds=10)
+        now = [1000.0]
+        monkeypatch.setattr("app.core.preference_cache.time.monotonic", lambda: now[0])
+        cache.set("ns", "u1", {"a": 1})
+
+        now[0] += 11
+
+        assert cache.get("ns", "u1") == (False, None)
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = PreferenceCache(ttl_seconds=60, max_entries=2)
+        cache.set("ns", "u1", {"a": 1})
+        cache.set("ns", "u2", {"a": 2})
+        cache.get("ns", "u1")
+        cache.set("ns", "u3", {"a": 3})
+
+        assert cache.get("ns", "u2") == (False, None)
+        assert cache.get("ns", "u1")[0] is True
+
+    def test_get_many_splits_hits_and_misses(self):
+        cache = PreferenceCache(ttl_seconds=60)
+        cache.set("ns", "u1", {"a": 1})
+        cache.set("ns", "u2", None)
+
+        hits, misses = cache.get_many("ns", ["u1", "u2", "u3", "u3", "u4"])
+
+        assert hits == {"u1": {"a": 1}, "u2": None}
+        assert misses == ["u3", "u4"]
+
+    def test_merge_updates_cached_document_only(self):
+        cache = PreferenceCache(ttl_seconds=60)
+        cache.set("ns", "u1", {"a": 1, "b": 2})
+
+        assert cache.merge("ns", "u1", {"b": 3}) is True
+        assert cache.get("ns", "u1")[1] == {"a": 1, "b": 3}
+        assert cache.merge("ns", "u2", {"b": 3}) is False
+        assert cache.get("ns", "u2") == (False, None)
+
+    def test_invalidate_all_namespaces(self):
+        cache = PreferenceCache(ttl_seconds=60)
+        cache.set("a", "u1", {})
+        cache.set("b", "u1", {})
+        cache.set("a", "u2", {})
+
+        cache.invalidate("u1")
+
+        assert len(cache) == 1
+
+    def test_disabled_cache(self):
+        cache = PreferenceCache(ttl_seconds=0)
+        cache.set("ns", "u1", {"a": 1})
+
+        assert cache.get("ns", "u1") == (False, None)
+        assert cache.get_many("ns", ["u1"]) == ({}, ["u1"])
+
+
+class TestAlertsPreferenceCaching:
+    """Test notification preference caching in the alerts repository."""
+
+    async def test_second_read_is_served_from_cache(self, alerts_repository):
+        alerts_repository.preferences.find_one.return_value = {"user_id": "u1", "email_enabled": True}
+
+        first = await alerts_repository.get_user_preferences("u1")
+        first["email_enabled"] = False
+        second = await alerts_repository.get_user_preferences("u1")
+
+        assert second["email_enabled"] is True
+        alerts_repository.preferences.find_one.assert_called_once_with({"user_id": "u1"})
+
+    async def test_missing_preferences_are_cached(self, alerts_repository):
+        alerts_repository.preferences.find_one.return_value = None
+
+        assert await alerts_repository.get_user_preferences("u1") is None
+        assert await alerts_repository.get_user_preferences("u1") is None
+        assert alerts_repository.preferences.find_one.call_count == 1
+
+    async def test_update_writes_through(self, alerts_repository):
+        alerts_repository.preferences.find_one.return_value = {"user_id": "u1", "email_enabled": True}
+        alerts_repository.preferences.update_one.return_value = Mock(matched_count=1)
+        await alerts_repository.get_user_preferences("u1")
+
+        assert await alerts_repository.update_user_preferences("u1", {"email_enabled": False})
+        prefs = await alerts_repository.get_user_preferences("u1")
+
+        assert prefs["email_enabled"] is False
+        assert alerts_repository.preferences.find_one.call_count == 1
+
+    async def test_upsert_of_uncached_user_reloads(self, alerts_repository):
+        preference_cache.set("notification_preferences", "u1", None)
+        alerts_repository.preferences.update_one.return_value = Mock(matched_count=0, upserted_id="x")
+        alerts_repository.preferences.find_one.return_value = {"user_id": "u1", "email_enabled": False}
+
+        await alerts_repository.upsert_user_preferences("u1", {"email_enabled": False})
+        prefs = await alerts_repository.get_user_preferences("u1")
+
+        assert prefs["email_enabled"] is False
+
+    async def test_get_many_queries_only_misses(self, alerts_repository):
+        preference_cache.set("notification_preferences", "u1", {"user_id": "u1"})
+        alerts_repository.preferences.find = Mock(return_value=AsyncCursor([{"user_id": "u2"}]))
+
+        result = await alerts_repository.get_many_user_preferences(["u1", "u2", "u3"])
+
+        assert result == {"u1": {"user_id": "u1"}, "u2": {"user_id": "u2"}, "u3": None}
+        alerts_repository.preferences.find.assert_called_once_with({"user_id": {"$in": ["u2", "u3"]}})
+        assert preference_cache.get("notification_preferences", "u3") == (True, None)
+
+    async def test_default_preferences_are_copies(self, alerts_repository):
+        defaults = await alerts_repository.get_default_preferences()
+        defaults["email_enabled"] = "changed"
+
+        assert (await alerts_repository.get_default_preferences())["email_enabled"] != "changed"
+
+
+class TestUserSettingsCaching:
+    """Test user settings caching in the users repository."""
+
+    def test_second_read_is_served_from_cache(self, users_repository):
+        users_repository.settings_collection.find_one.return_value = {
+            "_id": "oid", "user_id": "u1", "interests": {"additional_interests": ["ai"]},
+        }
+
+        users_repository.get_user_settings("u1")
+        settings = users_repository.get_user_settings("u1")
+
+        assert settings.interests.additional_interests == ["ai"]
+        assert users_repository.settings_collection.find_one.call_count == 1
+
+    def test_update_writes_through(self, users_repository):
+        users_repository.settings_collection.find_one.return_value = {"user_id": "u1"}
+        users_repository.get_user_settings("u1")
+
+        settings = users_repository.update_user_settings(
+            "u1", UserSettingsUpdate(interests=UserInterestSettings(additional_interests=["bio"]))
+        )
+
+        assert settings.interests.additional_interests == ["bio"]
+        assert users_repository.settings_collection.find_one.call_count == 1
+
+    def test_get_many_returns_defaults_for_unknown_users(self, users_repository):
+        users_repository.settings_collection.find.return_value = [
+            {"_id": "oid", "user_id": "u1", "interests": {"additional_interests": ["ai"]}},
+        ]
+
+        result = users_repository.get_many_user_settings(["u1", "u2"])
+
+        assert result["u1"].interests.additional_interests == ["ai"]
+        assert result["u2"].interests.additional_interests == []
+        users_repository.settings_collection.find.assert_called_once_with({"user_id": {"$in": ["u1", "u2"]}})
@@ -0,0 +1,132 @@
+"""
+Unit tests for the request-scoped timing collector.
+
+Tests span recording, the Server-Timing header rendering and the
+ServerTimingMiddleware integration.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.middleware import ServerTimingMiddleware
+from app.core.timing import (
+    RequestTimings,
+    get_request_timings,
+    record_span,
+    reset_request_timing,
+    start_request_timing,
+    timed,
+    timed_stage,
+)
+
+
+class TestRequestTimings:
+    """Test the collector itself."""
+
+    def test_accumulates_per_stage(self):
+        timings = RequestTimings()
+        timings.record("db", 1.5)
+        timings.record("db", 2.5)
+        timings.record("cache_get", 0.5)
+
+        assert timings.stages() == {"db": 4.0, "cache_get": 0.5}
+        assert timings.counts() == {"db": 2, "cache_get": 1}
+
+    def test_server_timing_header(self):
+        timings = RequestTimings()
+        timings.record("db", 1.234)
+
+        header = timings.server_timing_header()
+
+        assert header.startswith("db;dur=1.23, total;dur=")
+        assert timings.server_timing_header(include_total=False) == "db;dur=1.23"
+
+
+class TestContextBinding:
+    """Test contextvar binding and the recording helpers."""
+
+    def test_record_is_noop_without_collector(self):
+        assert get_request_timings() is None
+        record_span("db", 1.0)
+        with timed("serialize"):
+            pass
+
+    def test_timed_records_into_active_collector(self):
+        token = start_request_timing()
+        try:
+            with timed("serialize"):
+                pass
+            record_span("db", 2.0)
+            stages = get_request_timings().stages()
+        finally:
+            reset_request_timing(token)
+
+        assert set(stages) == {"serialize", "db"}
+        assert stages["db"] == 2.0
+        assert get_request_timings() is None
+
+    async def test_timed_stage_decorator_async(self):
+        @timed_stage("api")
+        async def call_upstream():
+            await asyncio.sleep(0)
+            return "ok"
+
+        token = start_request_timing()
+        try:
+            assert await call_upstream() == "ok"
+            stages = get_request_timings().stages()
+        finally:
+            reset_request_timing(token)
+
+        assert "api" in stages
+
+
+class TestServerTimingMiddleware:
+    """Test header emission through the middleware."""
+
+    @pytest.fixture
+    def app(self):
+        app = FastAPI()
+        app.add_middleware(ServerTimingMiddleware)
+
+        @app.get("/items/{item_id}")
+        def read_item(item_id: int):
+            record_span("db", 3.0)
+            with timed("serialize"):
+                payload = {"id": item_id}
+            return payload
+
+        return app
+
+    @pytest.fixture
+    def client(self, app):
+        with patch.object(settings, "server_timing_enabled", True):
+            yield TestClient(app)
+
+    def test_header_is_off_by_default(self, app):
+        assert settings.server_timing_enabled is False
+
+        response = TestClient(app).get("/items/1")
+
+        assert response.status_code == 200
+        assert "Server-Timing" not in response.headers
+
+    def test_adds_server_timing_header(self, client):
+        response = client.get("/items/1")
+
+        assert response.status_code == 200
+        header = response.headers["Server-Timing"]
+        assert "db;dur=3.00" in header
+        assert "serialize;dur=" in header
+        assert "total;dur=" in header
+
+    def test_collectors_are_not_shared_between_requests(self, client):
+        client.get("/items/1")
+        header = client.get("/items/2").headers["Server-Timing"]
+
+        assert "db;dur=3.00" in header
@@ -4,6 +4,7 @@ Unit tests for standard response formats and exception handlers.
 Tests the standardized HTTP response system and custom exception handling.
 """
 
+import json
 import pytest
 from datetime import datetime
 from fastapi import HTTPException
@@ -21,6 +22,10 @@ from app.shared.responses import (
     not_found_response,
     created_response,
     paginated_response,
+    paginated_envelope,
+    data_envelope,
+    fast_paginated_response,
+    raw_json_response,
     HTTPStatusCodes
 )
 from app.shared.exceptions.custom_exceptions import (
@@ -340,4 +345,67 @@ class TestResponseIntegration:
         assert '"page":10' in content
         assert '"total_pages":10' in content
         assert '"has_next":false' in content
-        assert '"has_previous":true' in content
\ No newline at end of file
+        assert '"has_previous":true' in content
+
+
+class TestFastEnvelope:
+    """Test the orjson envelope fast path."""
+    
+    def test_paginated_envelope_matches_model_dump(self):
+        """Envelope bytes have the same shape as PaginatedResponse.model_dump()."""
+        pagination = {
+            "total": 3, "page": 1, "size": 2, "total_pages": 2,
+            "has_next": True, "has_previous": False
+        }
+        items = [{"id": "1"}, {"id": "2"}]
+        
+        fast = json.loads(paginated_envelope(items, pagination, message="ok"))
+        expected = PaginatedResponse(items=items, pagination=pagination, message="ok").model_dump(mode="json")
+        
+        fast.pop("timestamp")
+        expected.pop("timestamp")
+        assert fast == expected
+    
+    def test_paginated_envelope_drops_extra_pagination_keys(self):
+        """Only PaginationMeta fields are serialized."""
+        pagination = {
+            "total": 0, "page": 1, "size": 20, "total_pages": 0,
+            "has_next": False, "has_previous": False, "next_page": None
+        }
+        
+        data = json.loads(paginated_envelope([], pagination))
+        
+        assert "next_page" not in data["pagination"]
+    
+    def test_data_envelope_handles_non_json_types(self):
+        """ObjectId-like and datetime values are encoded."""
+        class FakeObjectId:
+            def __str__(self):
+                return "abc123"
+        
+        data = json.loads(data_envelope({"id": FakeObjectId(), "at": datetime(2024, 1, 1)}, message="ok"))
+        
+        assert data["data"] == {"id": "abc123", "at": "2024-01-01T00:00:00"}
+        assert data["status"] == "success"
+    
+    def test_raw_response_sends_bytes_unchanged(self):
+        """Raw response body is exactly the prebuilt bytes."""
+        body = paginated_envelope([], {
+            "total": 0, "page": 1, "size": 20, "total_pages": 0,
+            "has_next": False, "has_previous": False
+        })
+        
+        response = raw_json_response(body)
+        
+        assert response.body == body
+        assert response.headers["content-type"] == "application/json"
+    
+    def test_fast_paginated_response_meta(self):
+        """Fast paginated factory computes the same metadata."""
+        response = fast_paginated_response(items=[{"id": "1"}], total=100, page=10, size=10)
+        
+        data = json.loads(response.body)
+        assert data["pagination"]["total_pages"] == 10
+        assert data["pagination"]["has_next"] is False
+        assert data["pagination"]["has_previous"] is True
+
@@ -0,0 +1,136 @@
+"""
+Unit tests for concurrent lifespan startup, warm-up and readiness.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import startup
+from app.core.startup import ReadinessState, StartupError, run_steps
+
+
+def _sleep(seconds, value=None, error=None):
+    async def step():
+        await asyncio.sleep(seconds)
+        if error:
+            raise error
+        return value
+    return step
+
+
+class TestRunSteps:
+    """Test concurrent step execution."""
+
+    async def test_steps_run_concurrently(self):
+        start = time.perf_counter()
+        results = await run_steps({"a": _sleep(0.2, 1), "b": _sleep(0.2, 2), "c": _sleep(0.2, 3)}, timeout=5)
+        elapsed = time.perf_counter() - start
+
+        assert [r.detail for r in results] == [1, 2, 3]
+        assert all(r.ok for r in results)
+        assert elapsed < 0.5
+
+    async def test_timeout_and_failure_are_recorded(self):
+        results = await run_steps(
+            {"slow": _sleep(5), "broken": _sleep(0, error=ValueError("boom")), "ok": _sleep(0, "done")},
+            timeout=0.1,
+        )
+        by_name = {r.name: r for r in results}
+
+        assert "timed out" in by_name["slow"].error
+        assert by_name["broken"].error == "boom"
+        assert by_name["ok"].ok
+
+    async def test_required_failure_raises(self):
+        with pytest.raises(StartupError, match="container"):
+            await run_steps({"container": _sleep(0, error=RuntimeError("bad config"))}, timeout=1, required=("container",))
+
+
+class TestIndexPhase:
+    """Test that index application runs after connect, under its own timeout."""
+
+    def test_index_step_needs_mongodb(self):
+        with patch.object(startup.settings, "mongodb_apply_indexes_on_startup", True):
+            assert "mongodb_indexes" in startup.index_steps(connected=["mongodb", "container"])
+            assert startup.index_steps(connected=["container"]) == {}
+        with patch.object(startup.settings, "mongodb_apply_indexes_on_startup", False):
+            assert startup.index_steps(connected=["mongodb"]) == {}
+
+    async def test_slow_index_build_is_not_bound_by_connect_timeout(self):
+        state = ReadinessState()
+        connect = {"mongodb": _sleep(0, "connected"), "container": _sleep(0, 5)}
+
+        with patch.object(startup, "readiness", state), \
+                patch.object(startup, "connect_steps", return_value=connect), \
+                patch.object(startup, "_apply_mongo_indexes", _sleep(0.2, ["announcements.idx"])), \
+                patch.object(startup.settings, "mongodb_apply_indexes_on_startup", True), \
+                patch.object(startup.settings, "startup_connect_timeout_seconds", 0.1), \
+                patch.object(startup.settings, "startup_index_timeout_seconds", 5.0):
+            results = await startup.start_dependencies()
+
+        by_name = {r.name: r for r in results}
+        assert by_name["mongodb_indexes"].ok
+        assert by_name["mongodb_indexes"].detail == ["announcements.idx"]
+        assert state.steps["mongodb_indexes"].ok
+
+
+class TestWarmUp:
+    """Test warm-up orchestration and readiness."""
+
+    async def test_ready_only_after_warm_up(self):
+        state = ReadinessState()
+        started = asyncio.Event()
+
+        async def warm():
+            started.set()
+            await asyncio.sleep(0.05)
+            return 3
+
+        with patch.object(startup, "readiness", state), \
+                patch.object(startup, "warmup_steps", return_value={"announcement_lists": warm}):
+            task = asyncio.create_task(startup.warm_up())
+            await started.wait()
+            assert not state.ready
+            await task
+
+        assert state.ready
+        assert state.to_dict()["steps"]["announcement_lists"]["detail"] == 3
+
+    async def test_failed_warm_up_still_becomes_ready(self):
+        state = ReadinessState()
+
+        with patch.object(startup, "readiness", state), \
+                patch.object(startup, "warmup_steps", return_value={"x": _sleep(0, error=RuntimeError("x"))}):
+            await startup.warm_up()
+
+        assert state.ready
+        assert state.steps["x"].ok is False
+
+    def test_announcement_warm_up_skipped_without_mongodb(self):
+        assert "announcement_lists" in startup.warmup_steps(connected=["mongodb", "redis"])
+        assert "announcement_lists" not in startup.warmup_steps(connected=["redis"])
+        assert "classification_tables" in startup.warmup_steps(connected=[])
+
+
+class TestReadinessEndpoint:
+    """Test /health/ready."""
+
+    def test_reports_503_until_ready(self):
+        from app.main import app
+
+        state = ReadinessState()
+        client = TestClient(app)
+        with patch("app.main.readiness", state):
+            state.begin()
+            response = client.get("/health/ready")
+            assert response.status_code == 503
+            assert response.json()["status"] == "starting"
+
+            state.mark_ready()
+            response = client.get("/health/ready")
+            assert response.status_code == 200
+            assert response.json()["ready"] is True
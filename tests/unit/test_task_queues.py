@@ -0,0 +1,208 @@
+"""
+Unit tests for the Celery queue topology, routing and per-queue stats.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+from app.core.config import settings
+from app.core.task_queues import (
+    INGESTION_QUEUE,
+    MAINTENANCE_QUEUE,
+    PRIORITY_STEPS,
+    SENT_AT_HEADER,
+    QueueProfile,
+    QueueStats,
+    TaskAnnotations,
+    build_task_routes,
+    collect_queue_stats,
+    get_profile,
+    priority_keys,
+    record_task_done,
+    route_for,
+    stamp_sent_at,
+    throughput_key,
+)
+
+NOW = 1_800_000_000.0
+
+
+class _FakePipeline:
+    """Records commands and answers them from in-memory lists / counters"""
+
+    def __init__(self, lists, counters):
+        self.lists, self.counters, self.ops = lists, counters, []
+
+    def llen(self, key):
+        self.ops.append(len(self.lists.get(key, [])))
+
+    def lindex(self, key, index):
+        items = self.lists.get(key, [])
+        self.ops.append(items[index] if items else None)
+
+    def mget(self, keys):
+        self.ops.append([self.counters.get(k) for k in keys])
+
+    def execute(self):
+        return self.ops
+
+
+def _message(sent_at):
+    return json.dumps({"body": "", "headers": {SENT_AT_HEADER: sent_at}})
+
+
+class TestTaskRoutes:
+    """Test routing of tasks to workload queues."""
+
+    def test_realtime_alerts_do_not_share_the_ingestion_queue(self):
+        notify = route_for("app.domains.alerts.tasks.send_notification")
+        ingest = route_for("app.domains.announcements.tasks.fetch_announcements_comprehensive")
+
+        assert notify["queue"] != ingest["queue"]
+        assert ingest["queue"] == INGESTION_QUEUE
+        assert notify["priority"] < ingest["priority"]
+
+    def test_task_priority_override_wins_over_glob(self):
+        assert route_for("app.core.tasks.system_health_check")["priority"] == 3
+        assert route_for("app.core.tasks.cleanup_old_task_results")["priority"] == 6
+
+    def test_exact_routes_are_matched_before_globs(self):
+        route = route_for("app.core.tasks.generate_system_statistics")
+
+        assert route["queue"] == "analytics"
+
+    def test_unrouted_tasks_fall_back_to_maintenance(self):
+        assert route_for("app.unknown.tasks.something", routes={})["queue"] == MAINTENANCE_QUEUE
+
+    def test_routes_carry_queue_priority(self):
+        profile = QueueProfile(
+            name="q1", workload="w", priority=4, concurrency=1, prefetch_multiplier=1,
+            soft_time_limit=10, time_limit=20, tasks=("a.tasks.*", "a.tasks.fast"),
+            task_priorities={"a.tasks.fast": 0},
+        )
+
+        routes = build_task_routes([profile])
+
+        assert list(routes) == ["a.tasks.fast", "a.tasks.*"]
+        assert routes["a.tasks.*"] == {"queue": "q1", "routing_key": "q1", "priority": 4}
+        assert routes["a.tasks.fast"]["priority"] == 0
+        assert "--concurrency=1" in profile.worker_command()
+
+
+class TestTaskAnnotations:
+    """Test that queue time limits are applied to the tasks themselves."""
+
+    def test_tasks_get_the_limits_of_their_queue(self):
+        annotations = TaskAnnotations({})
+
+        notify = annotations.get("app.domains.alerts.tasks.deliver_notifications")
+        ingest = annotations.get("app.domains.businesses.tasks.fetch_businesses")
+
+        assert (notify["soft_time_limit"], notify["time_limit"]) == (60, 120)
+        assert (ingest["soft_time_limit"], ingest["time_limit"]) == (1500, 1800)
+        assert annotations.get("app.unknown.tasks.something") is None
+
+    def test_overrides_win_and_wildcard_stays_separate(self):
+        annotations = TaskAnnotations({
+            "*": {"rate_limit": "100/m"},
+            "app.core.tasks.system_health_check": {"time_limit": 300},
+        })
+
+        assert annotations.get("app.core.tasks.system_health_check") == {"soft_time_limit": 600, "time_limit": 300}
+        assert annotations.annotate(SimpleNamespace(name="app.core.tasks.system_health_check"))["time_limit"] == 300
+        assert annotations.annotate_any() == {"rate_limit": "100/m"}
+
+    def test_delivery_budget_leaves_room_for_one_batch(self):
+        notify = get_profile(settings.alerts_notify_queue)
+        one_batch = settings.alerts_delivery_batch_size / settings.alerts_global_rps
+
+        assert settings.alerts_delivery_time_budget_seconds + one_batch < notify.soft_time_limit
+
+
+class TestQueueStats:
+    """Test per-queue length, lag and throughput from the Redis broker."""
+
+    def _profile(self, name="ingestion"):
+        return QueueProfile(
+            name=name, workload="ingestion", priority=5, concurrency=1, prefetch_multiplier=1,
+            soft_time_limit=10, time_limit=20, tasks=(),
+        )
+
+    def test_sums_priority_lists_and_measures_oldest_message(self):
+        keys = priority_keys("ingestion")
+        lists = {
+            keys[0]: [_message(NOW - 5), _message(NOW - 30)],
+            keys[5]: [_message(NOW - 90)],
+        }
+        counters = {throughput_key("ingestion", int(NOW // 60)): b"12", throughput_key("ingestion", int(NOW // 60) - 1): b"3"}
+        client = Mock(pipeline=Mock(return_value=_FakePipeline(lists, counters)))
+
+        [stats] = collect_queue_stats(client, [self._profile()], now=NOW)
+
+        assert len(keys) == len(PRIORITY_STEPS)
+        assert stats.length == 3
+        assert stats.lag_seconds == 90
+        assert stats.throughput_per_minute == 3.0
+
+    def test_empty_queue_has_no_lag(self):
+        client = Mock(pipeline=Mock(return_value=_FakePipeline({}, {})))
+
+        [stats] = collect_queue_stats(client, [self._profile()], now=NOW)
+
+        assert (stats.length, stats.lag_seconds, stats.throughput_per_minute) == (0, 0.0, 0.0)
+
+
+class TestQueueHooks:
+    """Test publish timestamp and completion counter hooks."""
+
+    def test_stamps_publish_time_once(self):
+        headers = {SENT_AT_HEADER: 1.0}
+        stamp_sent_at(headers=headers)
+        assert headers[SENT_AT_HEADER] == 1.0
+
+        fresh = {}
+        stamp_sent_at(headers=fresh)
+        assert fresh[SENT_AT_HEADER] > 0
+
+    def test_counts_completion_per_queue(self):
+        pipe = Mock()
+        client = Mock(pipeline=Mock(return_value=pipe))
+        task = Mock()
+        task.request.delivery_info = {"routing_key": "alerts.notify"}
+
+        with patch("app.core.task_queues.get_stats_client", return_value=client):
+            record_task_done(task=task)
+
+        key = pipe.incr.call_args[0][0]
+        assert key.startswith("celery:queue:done:alerts.notify:")
+        pipe.expire.assert_called_once()
+        pipe.execute.assert_called_once()
+
+    def test_counter_failure_is_ignored(self):
+        task = Mock()
+        task.request.delivery_info = {"routing_key": "ingestion"}
+        client = Mock(pipeline=Mock(side_effect=ConnectionError("down")))
+
+        with patch("app.core.task_queues.get_stats_client", return_value=client):
+            record_task_done(task=task)
+
+
+class TestListQueues:
+    """Test the task management queue listing."""
+
+    async def test_reports_lag_and_throughput_per_queue(self):
+        from app.scheduler import task_management_api as api
+
+        stats = [QueueStats(name=INGESTION_QUEUE, workload="ingestion", priority=5, length=7, lag_seconds=42.0, throughput_per_minute=2.5)]
+        inspect = Mock(active_queues=Mock(return_value={"w1": [{"name": INGESTION_QUEUE}], "w2": [{"name": INGESTION_QUEUE}]}))
+
+        with patch.object(api, "collect_queue_stats_async", AsyncMock(return_value=stats)), \
+                patch.object(api.celery_app.control, "inspect", return_value=inspect):
+            queues = {q.name: q for q in await api.list_queues()}
+
+        ingestion = queues[INGESTION_QUEUE]
+        assert (ingestion.length, ingestion.consumers, ingestion.lag_seconds) == (7, 2, 42.0)
+        assert ingestion.throughput_per_minute == 2.5
+        assert ingestion.time_limit == 1800
+        assert queues[MAINTENANCE_QUEUE].length == 0
@@ -22,7 +22,8 @@ from app.shared.version_adapters import (
     V2ResponseAdapter,
     AnnouncementV1Adapter,
     ResponseVersionAdapter,
-    VersionedResponseBuilder
+    VersionedResponseBuilder,
+    TransformationPlan
 )
 
 
@@ -581,6 +582,203 @@ class TestVersionedResponseBuilder:
         assert result is invalid_data
 
 
+class TestTransformationPlan:
+    """Test precompiled transformation plans."""
+    
+    def test_same_version_is_passthrough(self):
+        """Requested version equal to native version compiles to a no-op."""
+        builder = VersionedResponseBuilder()
+        v1 = APIVersion(major=1, minor=0, patch=0)
+        
+        plan = builder.get_plan(v1, v1, "/api/v1/announcements")
+        data = {"success": True, "data": {}}
+        
+        assert plan.is_passthrough
+        assert plan.apply(data) is data
+    
+    def test_plan_is_cached_per_route_and_version(self):
+        """Plans are compiled once per (route, source, target)."""
+        builder = VersionedResponseBuilder()
+        v1 = APIVersion(major=1, minor=0, patch=0)
+        v2 = APIVersion(major=2, minor=0, patch=0)
+        
+        first = builder.get_plan(v1, v2, "/api/v2/announcements")
+        second = builder.get_plan(v1, v2, "/api/v2/announcements")
+        
+        assert first is second
+        assert not first.is_passthrough
+        assert builder.get_plan(v1, v2, "/api/v2/users") is not first
+    
+    def test_compiled_plan_adapts_v2_to_v1(self):
+        """Compiled plan produces the same output as the adapter chain."""
+        builder = VersionedResponseBuilder()
+        v1 = APIVersion(major=1, minor=0, patch=0)
+        v2 = APIVersion(major=2, minor=0, patch=0)
+        data = {"success": True, "data": {"id": "123"}, "message": "ok"}
+        
+        result = builder.get_plan(v1, v2).apply(data)
+        
+        assert result == V1ResponseAdapter().transform(data)
+    
+    def test_registration_invalidates_cache(self):
+        """Registering mappings recompiles plans."""
+        response_adapter = ResponseVersionAdapter()
+        v1 = APIVersion(major=1, minor=0, patch=0)
+        v2 = APIVersion(major=2, minor=0, patch=0)
+        
+        assert response_adapter.compile_plan(v1, v2).is_passthrough
+        
+        response_adapter.register_field_mapping("v1", {"new_field": "old_field"})
+        plan = response_adapter.compile_plan(v1, v2)
+        
+        assert not plan.is_passthrough
+        assert plan.apply({"new_field": 1}) == {"old_field": 1}
+    
+    def test_route_scoped_adapter(self):
+        """Route-scoped adapters only apply under their prefix."""
+        response_adapter = ResponseVersionAdapter()
+        response_adapter.register_adapter(V1ResponseAdapter(), route_prefix="/api/v2/announcements")
+        v1 = APIVersion(major=1, minor=0, patch=0)
+        v2 = APIVersion(major=2, minor=0, patch=0)
+        
+        assert not response_adapter.compile_plan(v1, v2, "/api/v2/announcements/1").is_passthrough
+        assert response_adapter.compile_plan(v1, v2, "/api/v2/users").is_passthrough
+    
+    @staticmethod
+    def _versioned_app(extractor=None, registry=None):
+        from fastapi import FastAPI
+        from app.shared.version_middleware import APIVersionMiddleware
+        
+        app = FastAPI()
+        app.add_middleware(APIVersionMiddleware, version_extractor=extractor, version_registry=registry)
+        return app
+    
+    def test_middleware_passes_native_version_through(self):
+        """Versioned URL routes get a passthrough plan and an untouched body."""
+        from fastapi.testclient import TestClient
+        from app.shared.version_middleware import adapt_for_request
+        
+        app = self._versioned_app()
+        
+        @app.get("/api/v1/ping")
+        def ping(request: Request):
+            return adapt_for_request(request, {"success": True, "data": "pong"})
+        
+        response = TestClient(app).get("/api/v1/ping")
+        
+        assert response.json() == {"success": True, "data": "pong"}
+        assert response.headers["X-API-Version"] == "v1"
+    
+    def test_middleware_adapts_plain_routes(self):
+        """Routes outside VersionedAPIRouter are still adapted to the requested version."""
+        from fastapi.testclient import TestClient
+        
+        registry = VersionRegistry()
+        registry.register_version(APIVersion(major=1, minor=0, patch=0), is_default=True)
+        registry.register_version(APIVersion(major=2, minor=0, patch=0), is_latest=True)
+        extractor = VersionExtractor(registry, default_method=VersioningMethod.QUERY_PARAM)
+        app = self._versioned_app(extractor, registry)
+        
+        @app.get("/api/v2/items/{item_id}")
+        def item(item_id: str):
+            return {"success": True, "data": {"id": item_id}, "message": "ok"}
+        
+        response = TestClient(app).get("/api/v2/items/7?version=v1")
+        
+        assert response.status_code == 200
+        assert response.json()["status"] == "success"
+        assert response.json()["result"] == {"id": "7"}
+        assert int(response.headers["content-length"]) == len(response.content)
+    
+    @staticmethod
+    def _v1_default_app():
+        registry = VersionRegistry()
+        registry.register_version(APIVersion(major=1, minor=0, patch=0), is_default=True)
+        registry.register_version(APIVersion(major=2, minor=0, patch=0), is_latest=True)
+        extractor = VersionExtractor(registry, default_method=VersioningMethod.QUERY_PARAM)
+        return TestTransformationPlan._versioned_app(extractor, registry)
+    
+    def test_compressed_clients_get_the_adapted_body(self):
+        """Compression runs outside version adaptation (same order as app.main)."""
+        from fastapi.testclient import TestClient
+        from app.core.compression import CompressionMiddleware
+        from app.main import app as main_app
+        
+        app = self._v1_default_app()
+        app.add_middleware(CompressionMiddleware, minimum_size=16)
+        
+        @app.get("/api/v2/items")
+        def items():
+            return {"success": True, "data": [{"id": str(i)} for i in range(50)], "message": "ok"}
+        
+        response = TestClient(app).get("/api/v2/items?version=v1", headers={"Accept-Encoding": "gzip"})
+        
+        assert response.headers["content-encoding"] == "gzip"
+        assert set(response.json()) >= {"status", "result", "msg"}
+        assert main_app.user_middleware[0].cls is CompressionMiddleware
+    
+    def test_precompressed_bodies_are_decoded_and_adapted(self):
+        """Cached precompressed JSON is still adapted for older versions."""
+        import gzip
+        import json
+        from fastapi import Response
+        from fastapi.testclient import TestClient
+        
+        app = self._v1_default_app()
+        
+        @app.get("/api/v2/items")
+        def items():
+            body = gzip.compress(json.dumps({"success": True, "data": [], "message": "ok"}).encode())
+            return Response(body, media_type="application/json", headers={"Content-Encoding": "gzip"})
+        
+        response = TestClient(app).get("/api/v2/items?version=v1", headers={"Accept-Encoding": "gzip"})
+        
+        assert "content-encoding" not in response.headers
+        assert response.json()["status"] == "success" and response.json()["result"] == []
+    
+    def test_handler_adapted_payload_is_not_adapted_twice(self):
+        """adapt_for_request marks the body so the middleware leaves it alone."""
+        from fastapi.testclient import TestClient
+        from app.shared.version_middleware import adapt_for_request
+        
+        registry = VersionRegistry()
+        registry.register_version(APIVersion(major=1, minor=0, patch=0), is_default=True)
+        registry.register_version(APIVersion(major=2, minor=0, patch=0), is_latest=True)
+        extractor = VersionExtractor(registry, default_method=VersioningMethod.QUERY_PARAM)
+        app = self._versioned_app(extractor, registry)
+        
+        @app.get("/api/v2/items")
+        def items(request: Request):
+            # 핸들러가 이미 v1 형식으로 응답
+            adapt_for_request(request, {})
+            return {"status": "success", "result": [], "msg": "ok"}
+        
+        response = TestClient(app).get("/api/v2/items?version=v1")
+        
+        assert response.json() == {"status": "success", "result": [], "msg": "ok"}
+    
+    def test_plans_are_keyed_on_route_template(self):
+        """Distinct IDs on the same route share one cached plan."""
+        from fastapi.testclient import TestClient
+        
+        app = self._versioned_app()
+        
+        @app.get("/api/v1/things/{thing_id}")
+        def thing(thing_id: str):
+            return {"success": True, "data": thing_id}
+        
+        from app.shared.version_adapters import get_versioned_response_builder
+        
+        client = TestClient(app)
+        plan_cache = get_versioned_response_builder().adapter._plan_cache
+        for thing_id in range(20):
+            client.get(f"/api/v1/things/{thing_id}")
+        
+        routes = {key[0] for key in plan_cache}
+        assert "/api/v1/things/{thing_id}" in routes
+        assert not any(route and route.startswith("/api/v1/things/1") for route in routes)
+
+
 class TestIntegrationScenarios:
     """Test integration scenarios."""
     